@@ -0,0 +1,171 @@
+"""
+Read-through response cache for the public project catalog and project detail.
+
+Payloads are stored in the Django cache under keys that embed a catalog
+version number. Any write that changes what the catalog shows (create, edit,
+status transition) calls invalidate_catalog(), which bumps the version so all
+cached list pages and detail payloads are bypassed at once.
+
+The version key only invalidates every worker when they share the cache, so
+with more than one worker (WEB_CONCURRENCY) the catalog cache stays off
+unless CACHE_BACKEND is Redis or Memcached.
+
+Responses carry an ETag; a matching If-None-Match gets a 304 without touching
+Supabase or re-serialising the payload.
+"""
+
+import hashlib
+import json
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse, HttpResponseNotModified, JsonResponse
+
+from projects.deadline_scheduler import shared_cache_configured
+
+VERSION_KEY = 'catalog:version'
+
+
+class _CatalogCacheStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.not_modified = 0
+            self.invalidations = 0
+            self.last_invalidated_at = None
+            self.last_invalidation_reason = None
+            self._age_total = 0.0
+            self.max_age_served = 0.0
+
+    def hit(self, age, not_modified):
+        with self._lock:
+            self.hits += 1
+            if not_modified:
+                self.not_modified += 1
+            self._age_total += age
+            self.max_age_served = max(self.max_age_served, age)
+
+    def miss(self):
+        with self._lock:
+            self.misses += 1
+
+    def invalidated(self, reason):
+        with self._lock:
+            self.invalidations += 1
+            self.last_invalidated_at = time.time()
+            self.last_invalidation_reason = reason
+
+    def snapshot(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': round(self.hits / lookups, 4) if lookups else 0.0,
+                'not_modified': self.not_modified,
+                'invalidations': self.invalidations,
+                'last_invalidated_at': self.last_invalidated_at,
+                'last_invalidation_reason': self.last_invalidation_reason,
+                'avg_age_served_seconds': round(self._age_total / self.hits, 3) if self.hits else 0.0,
+                'max_age_served_seconds': round(self.max_age_served, 3),
+                'ttl_seconds': settings.CATALOG_CACHE_TTL,
+                'version': catalog_version(),
+            }
+
+
+_stats = _CatalogCacheStats()
+
+
+def get_catalog_cache_stats():
+    return _stats
+
+
+def catalog_cache_active():
+    """CATALOG_CACHE_ENABLED, unless several workers would each keep their own (LocMem) copy."""
+    return settings.CATALOG_CACHE_ENABLED and (settings.WEB_CONCURRENCY <= 1 or shared_cache_configured())
+
+
+def check_catalog_cache():
+    """Startup warning when the catalog cache is enabled but refused for lack of a shared cache."""
+    if settings.CATALOG_CACHE_ENABLED and not catalog_cache_active():
+        print(f"⚠️ Catalog cache disabled: {settings.WEB_CONCURRENCY} workers need CACHE_BACKEND set to "
+              "Redis or Memcached, or edits would stay stale in the other workers for CATALOG_CACHE_TTL")
+
+
+def catalog_version():
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        cache.add(VERSION_KEY, 1, timeout=None)
+        version = cache.get(VERSION_KEY, 1)
+    return version
+
+
+def invalidate_catalog(reason=''):
+    """Drop every cached catalog page and project detail."""
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.set(VERSION_KEY, 2, timeout=None)
+    _stats.invalidated(reason)
+
+
+def _etag(body):
+    return '"' + hashlib.sha1(body).hexdigest() + '"'
+
+
+def _etag_matches(request, etag):
+    header = request.headers.get('If-None-Match')
+    if not header:
+        return False
+    candidates = [value.strip() for value in header.split(',')]
+    return '*' in candidates or etag in candidates or f'W/{etag}' in candidates
+
+
+def _respond(request, body, etag):
+    if _etag_matches(request, etag):
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(body, content_type='application/json')
+    response['ETag'] = etag
+    response['Cache-Control'] = 'no-cache'
+    return response
+
+
+def cached_json_response(request, key, build_payload):
+    """
+    Serve key from the cache, or build, store and serve it.
+
+    build_payload() returns (payload, status). Only 200 responses are cached;
+    anything else is returned as-is.
+    """
+    if not catalog_cache_active():
+        payload, status = build_payload()
+        return JsonResponse(payload, status=status)
+
+    # Read the version before building so a concurrent invalidation can't be
+    # overwritten by a payload fetched before it
+    versioned_key = f'catalog:v{catalog_version()}:{key}'
+    entry = cache.get(versioned_key)
+    if entry is not None:
+        body, etag, cached_at = entry
+        not_modified = _etag_matches(request, etag)
+        _stats.hit(time.time() - cached_at, not_modified)
+        return _respond(request, body, etag)
+
+    _stats.miss()
+    payload, status = build_payload()
+    if status != 200:
+        return JsonResponse(payload, status=status)
+
+    body = json.dumps(payload, cls=DjangoJSONEncoder).encode('utf-8')
+    etag = _etag(body)
+    cache.set(versioned_key, (body, etag, time.time()), timeout=settings.CATALOG_CACHE_TTL)
+    return _respond(request, body, etag)
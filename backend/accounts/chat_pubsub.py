@@ -0,0 +1,342 @@
+"""
+Pub/sub fan-out for push-delivered chat messages.
+
+Views that store a chat message call publish_chat_message(); the SSE stream
+views (projects/chat_stream_views.py) subscribe to the chat's channel and
+forward each frame to their client. Frames are formatted once at publish
+time, so fan-out to N members costs N socket writes and nothing else.
+
+The backend is picked by CHAT_PUBSUB_BACKEND:
+
+- 'local' (default): in-process asyncio queues. Only reaches clients connected
+  to the same server process, which is all a single ASGI worker needs.
+- 'redis': PUBLISH/SUBSCRIBE over the Redis protocol at CHAT_PUBSUB_URL, for
+  several workers. Works against a real Redis or the stand-in server started
+  with `python manage.py run_pubsub_server`.
+"""
+
+import asyncio
+import json
+import socket
+import threading
+from contextlib import asynccontextmanager, suppress
+from urllib.parse import urlparse
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+
+from .pagination import encode_cursor
+
+# Put on a subscription queue when the upstream connection is gone
+CLOSED = object()
+
+
+class PubSubError(Exception):
+    """Error reply from a Redis-protocol server."""
+
+
+def team_chat_channel(team_assignment_id):
+    return f'team_chat:{team_assignment_id}'
+
+
+def assignment_chat_channel(assignment_id):
+    return f'assignment_chat:{assignment_id}'
+
+
+def sse_event(data, event_id=None, event='message'):
+    """Format one server-sent event; data is serialised to JSON."""
+    lines = []
+    if event_id:
+        lines.append(f'id: {event_id}')
+    lines.append(f'event: {event}')
+    lines.append('data: ' + json.dumps(data, cls=DjangoJSONEncoder))
+    return '\n'.join(lines) + '\n\n'
+
+
+def message_event(message):
+    """SSE frame for a stored chat message; its id is the message's pagination cursor."""
+    return sse_event(message, encode_cursor(message.get('created_at'), message.get('id')))
+
+
+def publish_chat_message(channel, message):
+    """
+    Push a stored chat message to everyone subscribed to channel.
+
+    Delivery is best effort: the message is already saved, so a pub/sub outage
+    is logged and clients catch up from Last-Event-ID when they reconnect.
+    """
+    try:
+        return get_broker().publish(channel, message_event(message))
+    except Exception as e:
+        print(f"⚠️ Could not publish to {channel}: {e}")
+        return 0
+
+
+class Subscription:
+    def __init__(self, queue):
+        self._queue = queue
+
+    async def next(self, timeout):
+        """Next frame, None after timeout seconds of silence, or CLOSED."""
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+def _offer(queue, frame):
+    # A client that stops reading shouldn't grow memory without bound; drop
+    # its oldest frame, it can recover from the history endpoint
+    if queue.full():
+        with suppress(asyncio.QueueEmpty):
+            queue.get_nowait()
+    queue.put_nowait(frame)
+
+
+class LocalBroker:
+    """In-process broker. publish() may be called from any thread."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = {}
+
+    def publish(self, channel, frame):
+        with self._lock:
+            subscribers = list(self._subscribers.get(channel, ()))
+        for loop, queue in subscribers:
+            with suppress(RuntimeError):  # subscriber's loop already closed
+                loop.call_soon_threadsafe(_offer, queue, frame)
+        return len(subscribers)
+
+    @asynccontextmanager
+    async def subscribe(self, channel):
+        entry = (asyncio.get_running_loop(), asyncio.Queue(maxsize=settings.CHAT_STREAM_QUEUE_SIZE))
+        with self._lock:
+            self._subscribers.setdefault(channel, set()).add(entry)
+        try:
+            yield Subscription(entry[1])
+        finally:
+            with self._lock:
+                subscribers = self._subscribers.get(channel)
+                if subscribers is not None:
+                    subscribers.discard(entry)
+                    if not subscribers:
+                        del self._subscribers[channel]
+
+    def subscriber_count(self, channel):
+        with self._lock:
+            return len(self._subscribers.get(channel, ()))
+
+
+# ---------------------------------------------------------------------------
+# Redis protocol (RESP2), just enough for PUBLISH / SUBSCRIBE
+# ---------------------------------------------------------------------------
+
+def encode_command(*parts):
+    """Encode parts as a RESP array; str/bytes become bulk strings, ints integers."""
+    out = [b'*%d\r\n' % len(parts)]
+    for part in parts:
+        if isinstance(part, int):
+            out.append(b':%d\r\n' % part)
+            continue
+        if isinstance(part, str):
+            part = part.encode('utf-8')
+        out.append(b'$%d\r\n%s\r\n' % (len(part), part))
+    return b''.join(out)
+
+
+async def read_reply(reader):
+    """Read one RESP value from an asyncio StreamReader."""
+    line = await reader.readline()
+    if not line:
+        raise ConnectionError('pub/sub connection closed')
+    kind, rest = line[:1], line[1:].rstrip(b'\r\n')
+    if kind == b'+':
+        return rest.decode()
+    if kind == b'-':
+        raise PubSubError(rest.decode())
+    if kind == b':':
+        return int(rest)
+    if kind == b'$':
+        length = int(rest)
+        if length < 0:
+            return None
+        return (await reader.readexactly(length + 2))[:-2]
+    if kind == b'*':
+        length = int(rest)
+        if length < 0:
+            return None
+        return [await read_reply(reader) for _ in range(length)]
+    raise PubSubError(f'Unexpected reply: {line!r}')
+
+
+class RedisBroker:
+    """
+    Broker backed by a Redis-protocol server.
+
+    Publishing keeps one blocking connection per thread (views are sync);
+    each subscription opens its own asyncio connection.
+    """
+
+    def __init__(self, url, timeout=2.0):
+        parsed = urlparse(url)
+        self.host = parsed.hostname or '127.0.0.1'
+        self.port = parsed.port or 6379
+        self.password = parsed.password
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+            conn = (sock, sock.makefile('rb'))
+            self._local.conn = conn
+            if self.password:
+                self._call(conn, 'AUTH', self.password)
+        return conn
+
+    def _close(self):
+        conn = getattr(self._local, 'conn', None)
+        self._local.conn = None
+        if conn:
+            with suppress(OSError):
+                conn[1].close()
+                conn[0].close()
+
+    @staticmethod
+    def _call(conn, *parts):
+        sock, reader = conn
+        sock.sendall(encode_command(*parts))
+        line = reader.readline()
+        if not line:
+            raise ConnectionError('pub/sub connection closed')
+        if line.startswith(b'-'):
+            raise PubSubError(line[1:].strip().decode())
+        return line[1:].strip().decode()
+
+    def publish(self, channel, frame):
+        # One retry covers a pooled connection the server has since dropped
+        for attempt in range(2):
+            try:
+                return int(self._call(self._connection(), 'PUBLISH', channel, frame))
+            except (OSError, ConnectionError):
+                self._close()
+                if attempt:
+                    raise
+
+    @asynccontextmanager
+    async def subscribe(self, channel):
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        queue = asyncio.Queue(maxsize=settings.CHAT_STREAM_QUEUE_SIZE)
+        pump = None
+        try:
+            if self.password:
+                writer.write(encode_command('AUTH', self.password))
+                await writer.drain()
+                await read_reply(reader)
+            writer.write(encode_command('SUBSCRIBE', channel))
+            await writer.drain()
+            await read_reply(reader)  # subscribe confirmation
+            pump = asyncio.ensure_future(self._pump(reader, queue))
+            yield Subscription(queue)
+        finally:
+            if pump:
+                pump.cancel()
+            writer.close()
+            with suppress(Exception):
+                await writer.wait_closed()
+
+    @staticmethod
+    async def _pump(reader, queue):
+        try:
+            while True:
+                reply = await read_reply(reader)
+                if isinstance(reply, list) and len(reply) == 3 and reply[0] == b'message':
+                    _offer(queue, reply[2].decode('utf-8'))
+        except (ConnectionError, asyncio.IncompleteReadError, PubSubError) as e:
+            print(f"⚠️ Pub/sub subscription lost: {e}")
+            _offer(queue, CLOSED)
+
+
+class LocalPubSubServer:
+    """
+    Minimal Redis-compatible pub/sub server (PUBLISH, SUBSCRIBE, UNSUBSCRIBE,
+    PING, AUTH, QUIT) for running several workers locally without Redis.
+    """
+
+    def __init__(self):
+        self._channels = {}
+
+    async def serve(self, host='127.0.0.1', port=6390):
+        server = await asyncio.start_server(self.handle, host, port)
+        async with server:
+            await server.serve_forever()
+
+    async def handle(self, reader, writer):
+        subscribed = set()
+        try:
+            while True:
+                try:
+                    command = await read_reply(reader)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    break
+                if not isinstance(command, list) or not command:
+                    writer.write(b'-ERR Protocol error\r\n')
+                    break
+                name, args = command[0].decode().upper(), command[1:]
+
+                if name == 'PUBLISH' and len(args) == 2:
+                    channel, frame = args
+                    receivers = list(self._channels.get(channel, ()))
+                    message = encode_command(b'message', channel, frame)
+                    for receiver in receivers:
+                        receiver.write(message)
+                    writer.write(b':%d\r\n' % len(receivers))
+                elif name == 'SUBSCRIBE' and args:
+                    for channel in args:
+                        self._channels.setdefault(channel, set()).add(writer)
+                        subscribed.add(channel)
+                        writer.write(encode_command(b'subscribe', channel, len(subscribed)))
+                elif name == 'UNSUBSCRIBE':
+                    for channel in args or list(subscribed):
+                        self._unsubscribe(writer, channel)
+                        subscribed.discard(channel)
+                        writer.write(encode_command(b'unsubscribe', channel, len(subscribed)))
+                elif name == 'PING':
+                    writer.write(b'+PONG\r\n')
+                elif name == 'AUTH':
+                    writer.write(b'+OK\r\n')
+                elif name == 'QUIT':
+                    writer.write(b'+OK\r\n')
+                    break
+                else:
+                    writer.write(f"-ERR unknown command '{name}'\r\n".encode())
+                await writer.drain()
+        finally:
+            for channel in subscribed:
+                self._unsubscribe(writer, channel)
+            writer.close()
+
+    def _unsubscribe(self, writer, channel):
+        writers = self._channels.get(channel)
+        if writers is not None:
+            writers.discard(writer)
+            if not writers:
+                del self._channels[channel]
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def get_broker():
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                if settings.CHAT_PUBSUB_BACKEND == 'redis':
+                    _broker = RedisBroker(settings.CHAT_PUBSUB_URL)
+                else:
+                    _broker = LocalBroker()
+    return _broker
@@ -0,0 +1,240 @@
+"""
+Prometheus text-format metrics for matching, design evaluation and the API.
+
+Two kinds of data end up on /metrics:
+
+- Hot-path measurements recorded here. Endpoint latency comes from
+  prometheus_middleware, labelled by URL route, method and status; the
+  histogram's _count doubles as the throughput counter. The @timed hooks on
+  rank_freelancers, SimpleMatcher.calculate_match_score,
+  evaluate_multiple_designs / evaluate_figma_submissions and the model
+  loaders record their own latency.
+- Values that already exist elsewhere, read only when /metrics is scraped:
+  Supabase call counts and latency (supabase_metrics), cache hit and miss
+  counts (catalog cache, past-project embeddings), and queue depths (view
+  counter backlog, embedding batchers, deadline timers).
+
+With METRICS_ENABLED=False the middleware is not installed, and a @timed
+function costs one settings lookup before calling straight through.
+
+Each worker process keeps its own numbers. With several workers, scrape
+each one, or read them as per-worker samples.
+"""
+
+import threading
+import time
+from functools import wraps
+
+from django.conf import settings
+
+PREFIX = 'devconnect_'
+
+# Histogram bucket upper bounds in seconds
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+# name -> (type, help) for everything recorded through this module
+METRICS = {
+    'http_request_duration_seconds': ('histogram', 'Time to serve a request, by URL route'),
+    'http_exceptions_total': ('counter', 'Requests that raised an unhandled exception'),
+    'matcher_duration_seconds': ('histogram', 'Time spent ranking or scoring applicants'),
+    'design_evaluation_duration_seconds': ('histogram', 'Time spent evaluating Figma submissions'),
+    'model_load_duration_seconds': ('histogram', 'Time to load a model into this process'),
+}
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(labels, extra=None):
+    pairs = list(labels) + ([extra] if extra else [])
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in pairs) + '}'
+
+
+class _Histogram:
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.buckets = [0] * len(bounds)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        for i, bound in enumerate(self.bounds):
+            if value <= bound:
+                self.buckets[i] += 1
+                break
+        self.count += 1
+        self.sum += value
+
+    def samples(self, name, labels):
+        cumulative = 0
+        for bound, count in zip(self.bounds, self.buckets):
+            cumulative += count
+            yield f'{name}_bucket{_labels(labels, ("le", f"{bound:g}"))} {cumulative}'
+        yield f'{name}_bucket{_labels(labels, ("le", "+Inf"))} {self.count}'
+        yield f'{name}_sum{_labels(labels)} {self.sum:.6f}'
+        yield f'{name}_count{_labels(labels)} {self.count}'
+
+
+class MetricsRegistry:
+    """Process-wide counters and histograms, keyed by metric name and label set."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.counters = {}
+            self.histograms = {}
+
+    def inc(self, name, amount=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    def observe(self, name, seconds, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = _Histogram(DURATION_BUCKETS)
+            histogram.observe(seconds)
+
+    def render(self):
+        """All metrics in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            for name, (kind, help_text) in METRICS.items():
+                series = self.histograms if kind == 'histogram' else self.counters
+                samples = sorted((labels, value) for (metric, labels), value in series.items() if metric == name)
+                if not samples:
+                    continue
+                lines.append(f'# HELP {PREFIX}{name} {help_text}')
+                lines.append(f'# TYPE {PREFIX}{name} {kind}')
+                for labels, value in samples:
+                    if kind == 'histogram':
+                        lines.extend(value.samples(PREFIX + name, labels))
+                    else:
+                        lines.append(f'{PREFIX}{name}{_labels(labels)} {value}')
+
+        for collect in COLLECTORS:
+            try:
+                lines.extend(collect())
+            except Exception as e:
+                print(f"⚠️ Metrics collector {collect.__name__} failed: {e}")
+        return '\n'.join(lines) + '\n'
+
+
+_registry = MetricsRegistry()
+
+
+def get_metrics_registry():
+    return _registry
+
+
+def timed(metric, **labels):
+    """
+    Decorator recording each call's duration in the `metric` histogram.
+    Calls pass straight through when METRICS_ENABLED is off.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not settings.METRICS_ENABLED:
+                return func(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _registry.observe(metric, time.perf_counter() - started, **labels)
+        return wrapper
+    return decorator
+
+
+# ---------------------------------------------------------------------------
+# Scrape-time collectors over state other modules already keep
+# ---------------------------------------------------------------------------
+
+def _family(name, kind, help_text, samples):
+    """Lines for one metric family from (labels dict, value) pairs."""
+    samples = list(samples)
+    if not samples:
+        return []
+    lines = [f'# HELP {PREFIX}{name} {help_text}', f'# TYPE {PREFIX}{name} {kind}']
+    for labels, value in samples:
+        lines.append(f'{PREFIX}{name}{_labels(sorted(labels.items()))} {value}')
+    return lines
+
+
+def collect_supabase():
+    from .supabase_metrics import LATENCY_BUCKETS_MS, get_supabase_metrics
+    snapshot = get_supabase_metrics().snapshot()
+
+    calls = []
+    for key, count in snapshot['operations'].items():
+        target, _, operation = key.rpartition('.')
+        calls.append(({'target': target, 'operation': operation}, count))
+    lines = _family('supabase_calls_total', 'counter', 'Supabase round-trips by table/RPC and operation', calls)
+    lines += _family('supabase_requests_over_budget_total', 'counter',
+                     'Requests that made more than SUPABASE_ROUND_TRIP_BUDGET Supabase calls',
+                     [({}, snapshot['requests_over_budget'])])
+
+    name = f'{PREFIX}supabase_call_duration_seconds'
+    histogram_lines = []
+    for target, histogram in snapshot['tables'].items():
+        labels = [('target', target)]
+        cumulative = 0
+        # supabase_metrics keeps per-bucket counts in ms; Prometheus wants cumulative seconds
+        for bound, count in zip(LATENCY_BUCKETS_MS, histogram['buckets'].values()):
+            cumulative += count
+            histogram_lines.append(f'{name}_bucket{_labels(labels, ("le", f"{bound / 1000:g}"))} {cumulative}')
+        histogram_lines.append(f'{name}_bucket{_labels(labels, ("le", "+Inf"))} {histogram["count"]}')
+        histogram_lines.append(f'{name}_sum{_labels(labels)} {histogram["sum_ms"] / 1000:.6f}')
+        histogram_lines.append(f'{name}_count{_labels(labels)} {histogram["count"]}')
+    if histogram_lines:
+        lines += [f'# HELP {name} Supabase round-trip latency by table/RPC', f'# TYPE {name} histogram']
+        lines += histogram_lines
+    return lines
+
+
+def collect_caches():
+    from .catalog_cache import get_catalog_cache_stats
+    from projects.past_projects import get_past_project_embeddings
+
+    catalog = get_catalog_cache_stats().snapshot()
+    portfolio = get_past_project_embeddings().snapshot()
+    caches = {'catalog': catalog, 'past_project_embeddings': portfolio}
+    lines = _family('cache_hits_total', 'counter', 'Cache lookups served from cache',
+                    [({'cache': cache}, stats['hits']) for cache, stats in caches.items()])
+    lines += _family('cache_misses_total', 'counter', 'Cache lookups that had to compute or fetch',
+                     [({'cache': cache}, stats['misses']) for cache, stats in caches.items()])
+    lines += _family('cache_hit_ratio', 'gauge', 'Share of lookups served from cache since start', [
+        ({'cache': cache}, round(stats['hits'] / (stats['hits'] + stats['misses']), 4))
+        for cache, stats in caches.items() if stats['hits'] + stats['misses']
+    ])
+    lines += _family('cache_entries', 'gauge', 'Entries held by in-process caches',
+                     [({'cache': 'past_project_embeddings'}, portfolio['entries'])])
+    return lines
+
+
+def collect_queues():
+    from .view_counters import get_view_counters
+    from projects.deadline_scheduler import get_deadline_scheduler
+    from projects.embedding_batcher import batcher_snapshots
+
+    depths = [({'queue': 'view_counters'}, get_view_counters().snapshot()['pending_rows'])]
+    depths.append(({'queue': 'deadline_timers'}, get_deadline_scheduler().snapshot()['armed_timers']))
+    batchers = batcher_snapshots()
+    depths += [({'queue': 'embedding_batcher', 'model': model}, stats['queued']) for model, stats in batchers.items()]
+    lines = _family('queue_depth', 'gauge', 'Items waiting in in-process queues', depths)
+    lines += _family('embedding_batches_total', 'counter', 'Batched encode calls run by embedding batchers',
+                     [({'model': model}, stats['batches']) for model, stats in batchers.items()])
+    lines += _family('embedding_texts_total', 'counter', 'Texts encoded by embedding batchers',
+                     [({'model': model}, stats['texts']) for model, stats in batchers.items()])
+    return lines
+
+
+COLLECTORS = [collect_supabase, collect_caches, collect_queues]
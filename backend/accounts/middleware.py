@@ -0,0 +1,109 @@
+"""
+Per-request Supabase round-trip accounting and endpoint latency metrics.
+
+supabase_timing_middleware adds a Server-Timing header summarising the
+Supabase calls a request made and warns when a request goes over
+SUPABASE_ROUND_TRIP_BUDGET calls. prometheus_middleware records each
+request's latency by URL route for /metrics.
+"""
+
+import time
+
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.utils.decorators import sync_and_async_middleware
+
+from .metrics import get_metrics_registry
+from .supabase_metrics import begin_request, end_request, get_supabase_metrics, server_timing_header
+
+
+def _finish(request, response, token):
+    stats = end_request(token)
+    if stats is None:
+        return response
+
+    budget = settings.SUPABASE_ROUND_TRIP_BUDGET
+    over_budget = stats.calls > budget
+    get_supabase_metrics().record_request(over_budget)
+
+    if stats.calls:
+        response['Server-Timing'] = server_timing_header(stats)
+
+    if over_budget:
+        breakdown = ', '.join(
+            f'{target} x{count}' for target, (count, _) in sorted(stats.by_target.items(), key=lambda item: -item[1][0])
+        )
+        print(
+            f"⚠️ {request.method} {request.path} made {stats.calls} Supabase calls "
+            f"(budget {budget}, {stats.total_ms:.0f}ms): {breakdown}"
+        )
+    return response
+
+
+@sync_and_async_middleware
+def supabase_timing_middleware(get_response):
+    if not settings.SUPABASE_METRICS_ENABLED:
+        raise MiddlewareNotUsed
+
+    if iscoroutinefunction(get_response):
+        async def middleware(request):
+            token = begin_request(request.method, request.path)
+            try:
+                response = await get_response(request)
+            except Exception:
+                end_request(token)
+                raise
+            return _finish(request, response, token)
+    else:
+        def middleware(request):
+            token = begin_request(request.method, request.path)
+            try:
+                response = get_response(request)
+            except Exception:
+                end_request(token)
+                raise
+            return _finish(request, response, token)
+
+    return middleware
+
+
+def _observe(request, status, started):
+    match = request.resolver_match
+    # The route pattern, not the path, so IDs don't explode the label set
+    route = match.route if match else 'unmatched'
+    get_metrics_registry().observe(
+        'http_request_duration_seconds', time.perf_counter() - started,
+        route=route, method=request.method, status=status
+    )
+
+
+@sync_and_async_middleware
+def prometheus_middleware(get_response):
+    if not settings.METRICS_ENABLED:
+        raise MiddlewareNotUsed
+
+    if iscoroutinefunction(get_response):
+        async def middleware(request):
+            started = time.perf_counter()
+            try:
+                response = await get_response(request)
+            except Exception:
+                get_metrics_registry().inc('http_exceptions_total', method=request.method)
+                _observe(request, 500, started)
+                raise
+            _observe(request, response.status_code, started)
+            return response
+    else:
+        def middleware(request):
+            started = time.perf_counter()
+            try:
+                response = get_response(request)
+            except Exception:
+                get_metrics_registry().inc('http_exceptions_total', method=request.method)
+                _observe(request, 500, started)
+                raise
+            _observe(request, response.status_code, started)
+            return response
+
+    return middleware
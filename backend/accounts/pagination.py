@@ -0,0 +1,134 @@
+"""
+Keyset (cursor) pagination helpers for Supabase/PostgREST queries.
+
+Cursors are opaque, URL-safe strings encoding the sort key of the last row
+returned, so the next page is fetched with an indexed range condition
+instead of an OFFSET scan.
+
+Polling "what's new since" with a keyset cursor skips rows whose sort value
+was assigned before the cursor but committed after it was handed out (a
+slow insert from another worker). poll_cursor() and apply_poll_window()
+handle that by re-reading an overlap window behind the newest row and
+dropping the ids the client already has, which the cursor carries.
+"""
+
+import base64
+import json
+from datetime import timedelta
+
+from django.utils.dateparse import parse_datetime
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+# Seconds re-read behind a poll cursor; longer than any insert takes to commit
+POLL_OVERLAP_SECONDS = 10
+
+
+def encode_cursor(*values):
+    """Encode sort-key values into an opaque cursor string."""
+    raw = json.dumps(list(values), separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor, expected_length=2):
+    """Decode a cursor produced by encode_cursor. Returns None if invalid."""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except (ValueError, TypeError):
+        return None
+    if not isinstance(values, list) or len(values) != expected_length:
+        return None
+    return values
+
+
+def parse_page_size(value, default=DEFAULT_PAGE_SIZE, maximum=MAX_PAGE_SIZE):
+    """Parse a ?limit= query value, clamped to [1, maximum]."""
+    try:
+        size = int(value)
+    except (TypeError, ValueError):
+        return default
+    return max(1, min(size, maximum))
+
+
+def _quote(value):
+    """Quote a value for use inside a PostgREST logic tree (or/and)."""
+    return '"' + str(value).replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+def apply_keyset(query, cursor_values, sort_column='created_at', id_column='id', descending=True):
+    """
+    Restrict a query to rows strictly after the cursor position.
+
+    For descending order this is
+        sort < s OR (sort = s AND id < i)
+    which PostgREST can serve from a (sort, id) index.
+    """
+    if not cursor_values:
+        return query
+    sort_value, id_value = cursor_values
+    op = 'lt' if descending else 'gt'
+    return query.or_(
+        f"{sort_column}.{op}.{_quote(sort_value)},"
+        f"and({sort_column}.eq.{_quote(sort_value)},{id_column}.{op}.{_quote(id_value)})"
+    )
+
+
+def paginate_rows(rows, page_size, sort_column='created_at', id_column='id'):
+    """
+    Split a page fetched with limit(page_size + 1) into (rows, next_cursor).
+    """
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        last = rows[-1]
+        return rows, encode_cursor(last[sort_column], last[id_column])
+    return rows, None
+
+
+def _moment(sort_value):
+    try:
+        return parse_datetime(str(sort_value))
+    except ValueError:
+        return None
+
+
+def poll_cursor(rows, previous=None, sort_column='created_at', id_column='id', overlap=POLL_OVERLAP_SECONDS):
+    """
+    Cursor for the next poll after `rows` (oldest first): the newest sort
+    value plus the ids delivered within `overlap` seconds of it. `previous`
+    is the decoded cursor the rows were polled with, if any.
+    """
+    if not rows:
+        return encode_cursor(*previous) if previous else None
+    newest = rows[-1][sort_column]
+    if previous and _moment(previous[0]) > _moment(newest):
+        # Only late-committed rows came back; don't move the cursor backwards
+        newest = previous[0]
+    start = _moment(newest) - timedelta(seconds=overlap)
+    seen = [row[id_column] for row in rows if _moment(row[sort_column]) >= start]
+    if previous and _moment(previous[0]) >= start:
+        # Ids from the earlier poll are still inside the window
+        seen = [object_id for object_id in previous[1] if object_id not in seen] + seen
+    return encode_cursor(newest, seen)
+
+
+def decode_poll_cursor(cursor):
+    """Decode a poll_cursor() string into [sort_value, seen_ids], or None if invalid."""
+    values = decode_cursor(cursor)
+    if values is None or not isinstance(values[1], list) or _moment(values[0]) is None:
+        return None
+    return values
+
+
+def apply_poll_window(query, cursor_values, sort_column='created_at', overlap=POLL_OVERLAP_SECONDS):
+    """Restrict a query to rows from `overlap` seconds before the cursor onwards."""
+    return query.gte(sort_column, (_moment(cursor_values[0]) - timedelta(seconds=overlap)).isoformat())
+
+
+def drop_seen(rows, cursor_values, id_column='id'):
+    """Remove re-read rows whose ids the poll cursor says the client already has."""
+    seen = set(cursor_values[1])
+    return [row for row in rows if row[id_column] not in seen]
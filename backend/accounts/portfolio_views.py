@@ -6,6 +6,7 @@ from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 import json
 from .supabase_client import get_supabase_client
+from .view_counters import PORTFOLIO_PROJECTS, get_view_counters, row_exists
 
 
 @csrf_exempt
@@ -22,6 +23,7 @@ def get_developer_portfolio(request, developer_id):
             'developer_id', developer_id
         ).order('featured', desc=True).order('created_at', desc=True).execute()
         
+        view_counters = get_view_counters()
         projects = []
         for project in result.data:
             projects.append({
@@ -34,7 +36,7 @@ def get_developer_portfolio(request, developer_id):
                 'project_url': project.get('project_url'),
                 'github_url': project.get('github_url'),
                 'featured': project.get('featured', False),
-                'views_count': project.get('views_count', 0),
+                'views_count': view_counters.live_count(PORTFOLIO_PROJECTS, project.get('id'), project.get('views_count', 0)),
                 'created_at': project.get('created_at'),
             })
         
@@ -198,6 +200,7 @@ def delete_portfolio_project(request, project_id):
         
         # Delete project
         supabase.table('portfolio_projects').delete().eq('id', project_id).execute()
+        get_view_counters().discard(PORTFOLIO_PROJECTS, project_id)
         
         return JsonResponse({'message': 'Portfolio project deleted successfully'})
     
@@ -208,29 +211,27 @@ def delete_portfolio_project(request, project_id):
 
 @csrf_exempt
 def increment_portfolio_views(request, project_id):
-    """Increment view count for a portfolio project."""
+    """
+    Increment view count for a portfolio project.
+
+    The view is buffered and written in the next batched flush. Unknown ids
+    get a 404; known ids are cached, so repeat views make no Supabase calls.
+    The returned count is approximate.
+    """
     if request.method != 'POST':
         return JsonResponse({'error': 'Method not allowed'}, status=405)
     try:
-        supabase = get_supabase_client()
-        
-        # Get current view count
-        result = supabase.table('portfolio_projects').select('views_count').eq(
-            'id', project_id
-        ).execute()
-        
-        if not result.data:
+        if not row_exists(PORTFOLIO_PROJECTS, project_id):
             return JsonResponse({'error': 'Project not found'}, status=404)
+
+        view_counters = get_view_counters()
+        view_counters.record(PORTFOLIO_PROJECTS, project_id)
         
-        current_views = result.data[0].get('views_count', 0)
-        
-        # Increment view count
-        supabase.table('portfolio_projects').update({
-            'views_count': current_views + 1
-        }).eq('id', project_id).execute()
-        
-        return JsonResponse({'message': 'View count incremented'})
+        return JsonResponse({
+            'message': 'View count incremented',
+            'pending_views': view_counters.buffered(PORTFOLIO_PROJECTS, project_id)
+        })
     
     except Exception as e:
         print(f"Increment views error: {str(e)}")
-        return JsonResponse({'error': str(e)}, status=500)
\ No newline at end of file
+        return JsonResponse({'error': str(e)}, status=500)
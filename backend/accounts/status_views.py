@@ -0,0 +1,64 @@
+from django.conf import settings
+from django.http import HttpResponse, JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+from .metrics import get_metrics_registry
+from .supabase_metrics import get_supabase_metrics
+from .catalog_cache import catalog_cache_active, get_catalog_cache_stats
+from .view_counters import get_view_counters
+
+LOCAL_ADDRESSES = ('127.0.0.1', '::1')
+
+def _is_local(request):
+    return request.META.get('REMOTE_ADDR') in LOCAL_ADDRESSES
+
+@csrf_exempt
+def supabase_metrics(request):
+    """Supabase latency histograms and slowest calls. Local requests only."""
+    if not _is_local(request):
+        return JsonResponse({'error': 'Forbidden'}, status=403)
+    
+    metrics = get_supabase_metrics()
+    if request.method == 'DELETE':
+        metrics.reset()
+        return JsonResponse({'status': 'reset'})
+    
+    return JsonResponse({
+        'enabled': settings.SUPABASE_METRICS_ENABLED,
+        'round_trip_budget': settings.SUPABASE_ROUND_TRIP_BUDGET,
+        **metrics.snapshot()
+    })
+
+@csrf_exempt
+def catalog_cache_metrics(request):
+    """Catalog cache hit ratio and staleness. Local requests only."""
+    if not _is_local(request):
+        return JsonResponse({'error': 'Forbidden'}, status=403)
+    
+    stats = get_catalog_cache_stats()
+    if request.method == 'DELETE':
+        stats.reset()
+        return JsonResponse({'status': 'reset'})
+    
+    return JsonResponse({'enabled': catalog_cache_active(), **stats.snapshot()})
+
+@csrf_exempt
+def view_counter_metrics(request):
+    """Buffered view counter backlog and flush history. Local requests only; POST flushes now."""
+    if not _is_local(request):
+        return JsonResponse({'error': 'Forbidden'}, status=403)
+    
+    view_counters = get_view_counters()
+    if request.method == 'POST':
+        return JsonResponse({'flushed_views': view_counters.flush()})
+    
+    return JsonResponse(view_counters.snapshot())
+
+@csrf_exempt
+def prometheus_metrics(request):
+    """All metrics in Prometheus text format. Local addresses and METRICS_ALLOWED_ADDRESSES only."""
+    if not _is_local(request) and request.META.get('REMOTE_ADDR') not in settings.METRICS_ALLOWED_ADDRESSES:
+        return JsonResponse({'error': 'Forbidden'}, status=403)
+    if not settings.METRICS_ENABLED:
+        return JsonResponse({'error': 'Metrics are disabled'}, status=404)
+    
+    return HttpResponse(get_metrics_registry().render(), content_type='text/plain; version=0.0.4; charset=utf-8')
@@ -1,8 +1,16 @@
 import os
 from supabase import create_client, Client
 from django.conf import settings
+from .supabase_metrics import InstrumentedClient
 
 def get_supabase_client() -> Client:
     url = settings.SUPABASE_URL
     key = settings.SUPABASE_SERVICE_ROLE_KEY
-    return create_client(url, key)
\ No newline at end of file
+    if settings.SUPABASE_STANDIN:
+        from .supabase_standin import get_standin_client
+        client = get_standin_client()
+    else:
+        client = create_client(url, key)
+    if settings.SUPABASE_METRICS_ENABLED:
+        return InstrumentedClient(client)
+    return client
\ No newline at end of file
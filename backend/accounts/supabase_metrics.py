@@ -0,0 +1,287 @@
+"""
+Round-trip instrumentation for Supabase calls.
+
+get_supabase_client() / get_async_supabase_client() hand out clients wrapped
+in InstrumentedClient, which times every table query, RPC, auth and storage
+call. Timings are collected in two places:
+
+- per request (a contextvar opened by supabase_timing_middleware in
+  accounts/middleware.py), used for the Server-Timing header and the
+  round-trip budget warning;
+- process-wide, as per-target latency histograms plus the slowest calls with
+  the view code that issued them, served by the local metrics endpoint.
+"""
+
+import contextvars
+import heapq
+import inspect
+import itertools
+import os
+import sys
+import threading
+import time
+
+# Histogram bucket upper bounds in milliseconds
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+SLOWEST_CALLS_LIMIT = 25
+
+# Builder methods that decide what kind of request a query is
+QUERY_OPERATIONS = {'select', 'insert', 'update', 'upsert', 'delete'}
+
+# Storage helpers that only build URLs locally
+LOCAL_STORAGE_METHODS = {'get_public_url'}
+
+_current_request = contextvars.ContextVar('supabase_request_stats', default=None)
+_this_dir = os.path.dirname(os.path.abspath(__file__))
+_wrapper_files = {
+    os.path.join(_this_dir, name)
+    for name in ('supabase_metrics.py', 'supabase_client.py', 'supabase_async.py')
+}
+
+
+class RequestStats:
+    """Supabase calls made while serving a single request."""
+
+    def __init__(self, method, path):
+        self.method = method
+        self.path = path
+        self.started = time.perf_counter()
+        self.calls = 0
+        self.total_ms = 0.0
+        self.by_target = {}
+
+    def add(self, target, duration_ms):
+        self.calls += 1
+        self.total_ms += duration_ms
+        count, total = self.by_target.get(target, (0, 0.0))
+        self.by_target[target] = (count + 1, total + duration_ms)
+
+
+class _Histogram:
+    def __init__(self):
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, duration_ms):
+        index = len(LATENCY_BUCKETS_MS)
+        for i, bound in enumerate(LATENCY_BUCKETS_MS):
+            if duration_ms <= bound:
+                index = i
+                break
+        self.buckets[index] += 1
+        self.count += 1
+        self.sum_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+
+    def as_dict(self):
+        labels = [f'le_{bound}' for bound in LATENCY_BUCKETS_MS] + ['le_inf']
+        return {
+            'count': self.count,
+            'sum_ms': round(self.sum_ms, 3),
+            'avg_ms': round(self.sum_ms / self.count, 3) if self.count else 0.0,
+            'max_ms': round(self.max_ms, 3),
+            'buckets': dict(zip(labels, self.buckets)),
+        }
+
+
+class SupabaseMetrics:
+    """Process-wide latency histograms and slowest-call traces."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sequence = itertools.count()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.histograms = {}
+            self.operations = {}
+            self.requests = 0
+            self.requests_over_budget = 0
+            self._slowest = []
+
+    def _qualifies_as_slow(self, duration_ms):
+        return len(self._slowest) < SLOWEST_CALLS_LIMIT or duration_ms > self._slowest[0][0]
+
+    def record(self, target, operation, duration_ms, trace_factory):
+        with self._lock:
+            histogram = self.histograms.get(target)
+            if histogram is None:
+                histogram = self.histograms[target] = _Histogram()
+            histogram.observe(duration_ms)
+
+            key = f'{target}.{operation}'
+            self.operations[key] = self.operations.get(key, 0) + 1
+
+            if self._qualifies_as_slow(duration_ms):
+                entry = (duration_ms, next(self._sequence), trace_factory())
+                if len(self._slowest) < SLOWEST_CALLS_LIMIT:
+                    heapq.heappush(self._slowest, entry)
+                else:
+                    heapq.heapreplace(self._slowest, entry)
+
+    def record_request(self, over_budget):
+        with self._lock:
+            self.requests += 1
+            if over_budget:
+                self.requests_over_budget += 1
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'requests_over_budget': self.requests_over_budget,
+                'tables': {target: h.as_dict() for target, h in sorted(self.histograms.items())},
+                'operations': dict(sorted(self.operations.items())),
+                'slowest_calls': [trace for _, _, trace in sorted(self._slowest, reverse=True)],
+            }
+
+
+_metrics = SupabaseMetrics()
+
+
+def get_supabase_metrics():
+    return _metrics
+
+
+def begin_request(method, path):
+    """Start collecting Supabase calls for the current request."""
+    return _current_request.set(RequestStats(method, path))
+
+
+def end_request(token):
+    stats = _current_request.get()
+    _current_request.reset(token)
+    return stats
+
+
+def _caller():
+    """First frame outside this module and site-packages: the code that issued the call."""
+    frame = sys._getframe(2)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename not in _wrapper_files and 'site-packages' not in filename:
+            return f'{os.path.relpath(filename)}:{frame.f_lineno} in {frame.f_code.co_name}'
+        frame = frame.f_back
+    return None
+
+
+def _record(target, operation, started, caller=None):
+    duration_ms = (time.perf_counter() - started) * 1000
+    request_stats = _current_request.get()
+    if request_stats is not None:
+        request_stats.add(target, duration_ms)
+
+    def trace():
+        return {
+            'target': target,
+            'operation': operation,
+            'duration_ms': round(duration_ms, 3),
+            'request': f'{request_stats.method} {request_stats.path}' if request_stats else None,
+            'caller': caller or _caller(),
+            'at': time.time(),
+        }
+
+    _metrics.record(target, operation, duration_ms, trace)
+
+
+def _timed_call(target, operation, func, *args, **kwargs):
+    started = time.perf_counter()
+    result = func(*args, **kwargs)
+    if inspect.isawaitable(result):
+        return _timed_await(target, operation, started, result, _caller())
+    _record(target, operation, started)
+    return result
+
+
+async def _timed_await(target, operation, started, awaitable, caller):
+    try:
+        return await awaitable
+    finally:
+        _record(target, operation, started, caller)
+
+
+class _InstrumentedQuery:
+    """Wraps a PostgREST request builder; execute() is timed."""
+
+    def __init__(self, builder, target, operation=None):
+        self._builder = builder
+        self._target = target
+        self._operation = operation
+
+    def execute(self):
+        return _timed_call(self._target, self._operation or 'select', self._builder.execute)
+
+    def __getattr__(self, name):
+        attr = getattr(self._builder, name)
+        if not callable(attr):
+            return attr
+
+        operation = self._operation or (name if name in QUERY_OPERATIONS else None)
+
+        def call(*args, **kwargs):
+            result = attr(*args, **kwargs)
+            if result is None or isinstance(result, (str, bytes, int, float, bool, dict, list)):
+                return result
+            return _InstrumentedQuery(result, self._target, operation)
+
+        return call
+
+
+class _InstrumentedNamespace:
+    """Wraps auth/storage objects; every method call is a timed round-trip."""
+
+    def __init__(self, obj, target):
+        self._obj = obj
+        self._target = target
+
+    def from_(self, bucket):
+        # storage.from_('bucket') only builds a bucket handle
+        return _InstrumentedNamespace(self._obj.from_(bucket), f'{self._target}.{bucket}')
+
+    def __getattr__(self, name):
+        attr = getattr(self._obj, name)
+        if name.startswith('_'):
+            return attr
+        if not callable(attr):
+            if attr is None or isinstance(attr, (str, bytes, int, float, bool, dict, list)):
+                return attr
+            return _InstrumentedNamespace(attr, f'{self._target}.{name}')
+        if name in LOCAL_STORAGE_METHODS:
+            return attr
+
+        def call(*args, **kwargs):
+            return _timed_call(self._target, name, attr, *args, **kwargs)
+
+        return call
+
+
+class InstrumentedClient:
+    """Drop-in wrapper around a supabase Client or AsyncClient."""
+
+    def __init__(self, client):
+        self._client = client
+        self.auth = _InstrumentedNamespace(client.auth, 'auth')
+        self.storage = _InstrumentedNamespace(client.storage, 'storage')
+
+    def table(self, table_name):
+        return _InstrumentedQuery(self._client.table(table_name), table_name)
+
+    from_ = table
+
+    def rpc(self, fn, params=None, *args, **kwargs):
+        return _InstrumentedQuery(self._client.rpc(fn, params, *args, **kwargs), f'rpc.{fn}', 'rpc')
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+
+def server_timing_header(stats):
+    """Format request stats as a Server-Timing header value."""
+    parts = [f'supabase;dur={stats.total_ms:.1f};desc="{stats.calls} calls"']
+    for target, (count, total_ms) in sorted(stats.by_target.items(), key=lambda item: -item[1][1]):
+        name = ''.join(ch if ch.isalnum() or ch in '-_' else '-' for ch in target)
+        parts.append(f'sb-{name};dur={total_ms:.1f};desc="{count}x"')
+    return ', '.join(parts)
@@ -1,4 +1,5 @@
 from .supabase_client import get_supabase_client
+from .catalog_cache import invalidate_catalog
 from django.http import JsonResponse
 import json
 
@@ -26,6 +27,8 @@ class SupabaseService:
         """Create project in Supabase"""
         try:
             response = self.supabase.table('projects').insert(project_data).execute()
+            if response.data:
+                invalidate_catalog('project created')
             return response.data[0] if response.data else None
         except Exception as e:
             print(f"Error creating project: {e}")
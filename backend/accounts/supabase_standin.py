@@ -0,0 +1,627 @@
+"""
+In-memory stand-in for the supabase-py client, for offline benchmarking.
+
+Implements the subset of the API this codebase uses:
+
+    table(name).select/insert/update/upsert/delete
+               .eq/neq/gt/gte/lt/lte/in_/is_/like/ilike/or_
+               .order/limit/range/execute
+    rpc(name, params).execute()          (functions registered on the store)
+    auth.get_user(token)
+    auth.admin.get_user_by_id/list_users/create_user/update_user_by_id
+    storage.from_(bucket).upload/get_public_url/list/remove/download
+
+Rows live in per-table lists on an InMemoryStore. Every network call can be
+delayed by a fixed latency (plus optional jitter) to model the round-trip to
+a real Supabase project. The same client serves sync and async callers:
+with asynchronous=True, execute() and the auth/storage calls return
+coroutines, matching supabase's AsyncClient.
+
+Enable it for the whole app with SUPABASE_STANDIN=True, or build a store and
+client directly in benchmarks; see accounts/supabase_standin_seed.py for the
+seeded data generator.
+"""
+
+import asyncio
+import fnmatch
+import random
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+
+def _now():
+    return datetime.now(timezone.utc).isoformat()
+
+
+# Column defaults the real schema fills in on insert
+TABLE_DEFAULTS = {
+    '*': {'id': lambda: str(uuid.uuid4()), 'created_at': _now},
+    'project_applications': {'applied_at': _now, 'status': lambda: 'pending'},
+    'projects': {'applications_count': lambda: 0, 'application_status_counts': dict},
+    'shared_files': {'shared_at': _now},
+    'shared_links': {'shared_at': _now},
+}
+
+
+class StandInError(Exception):
+    """Raised where PostgREST would return an error response."""
+
+
+class StandInResponse:
+    def __init__(self, data, count=None):
+        self.data = data
+        self.count = count
+
+
+class InMemoryStore:
+    """Tables, auth users, storage objects and RPC functions for the stand-in."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.tables = {}
+        self.users = {}
+        self.tokens = {}
+        self.buckets = {}
+        self.functions = {}
+        self._indexes = {}
+
+    # -- tables ------------------------------------------------------------
+
+    def rows(self, table):
+        return self.tables.setdefault(table, [])
+
+    def load(self, table, rows):
+        """Bulk-load rows without defaults or copying (used by the seeder)."""
+        with self._lock:
+            self.rows(table).extend(rows)
+            self._invalidate(table)
+
+    def index(self, table, column):
+        """{value: [rows]} for equality lookups, built on first use."""
+        key = (table, column)
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is None:
+                index = {}
+                for row in self.rows(table):
+                    index.setdefault(_index_key(row.get(column)), []).append(row)
+                self._indexes[key] = index
+            return index
+
+    def _invalidate(self, table):
+        for key in [key for key in self._indexes if key[0] == table]:
+            del self._indexes[key]
+
+    # -- auth --------------------------------------------------------------
+
+    def add_user(self, email, user_metadata=None, user_id=None):
+        user = SimpleNamespace(
+            id=user_id or str(uuid.uuid4()),
+            email=email,
+            user_metadata=dict(user_metadata or {}),
+            created_at=_now(),
+        )
+        with self._lock:
+            self.users[user.id] = user
+        return user
+
+    def issue_token(self, user_id):
+        """Create a bearer token that auth.get_user() resolves to user_id."""
+        token = f'standin-{uuid.uuid4().hex}'
+        with self._lock:
+            self.tokens[token] = user_id
+        return token
+
+    # -- rpc ---------------------------------------------------------------
+
+    def register_function(self, name, func):
+        """Register func(store, **params) to back rpc(name, params)."""
+        self.functions[name] = func
+
+
+def _index_key(value):
+    return str(value) if value is not None else None
+
+
+def _values_equal(left, right):
+    if left == right:
+        return True
+    if left is None or right is None:
+        return False
+    return str(left) == str(right)
+
+
+def _compare(left, right, op):
+    if left is None:
+        return False
+    try:
+        if isinstance(left, (int, float)) and not isinstance(right, (int, float)):
+            right = type(left)(right)
+        elif isinstance(left, str) and not isinstance(right, str):
+            right = str(right)
+        return op(left, right)
+    except (TypeError, ValueError):
+        return False
+
+
+def _like(value, pattern, case_sensitive=True):
+    if value is None:
+        return False
+    pattern = pattern.replace('%', '*').replace('_', '?')
+    if case_sensitive:
+        return fnmatch.fnmatchcase(str(value), pattern)
+    return fnmatch.fnmatchcase(str(value).lower(), pattern.lower())
+
+
+def _make_predicate(column, op, value):
+    if op == 'eq':
+        return lambda row: _values_equal(row.get(column), value)
+    if op == 'neq':
+        return lambda row: not _values_equal(row.get(column), value)
+    if op == 'gt':
+        return lambda row: _compare(row.get(column), value, lambda a, b: a > b)
+    if op == 'gte':
+        return lambda row: _compare(row.get(column), value, lambda a, b: a >= b)
+    if op == 'lt':
+        return lambda row: _compare(row.get(column), value, lambda a, b: a < b)
+    if op == 'lte':
+        return lambda row: _compare(row.get(column), value, lambda a, b: a <= b)
+    if op == 'in':
+        keys = {_index_key(v) for v in value}
+        return lambda row: _index_key(row.get(column)) in keys
+    if op == 'is':
+        target = {'null': None, 'true': True, 'false': False}.get(str(value).lower(), value)
+        return lambda row: row.get(column) is target
+    if op == 'like':
+        return lambda row: _like(row.get(column), value)
+    if op == 'ilike':
+        return lambda row: _like(row.get(column), value, case_sensitive=False)
+    raise StandInError(f'Unsupported filter operator: {op}')
+
+
+def _split_top_level(text):
+    """Split a PostgREST logic tree on commas outside parentheses and quotes."""
+    parts, depth, quoted, current = [], 0, False, []
+    i = 0
+    while i < len(text):
+        ch = text[i]
+        if ch == '\\' and quoted and i + 1 < len(text):
+            current.append(text[i:i + 2])
+            i += 2
+            continue
+        if ch == '"':
+            quoted = not quoted
+        elif not quoted and ch == '(':
+            depth += 1
+        elif not quoted and ch == ')':
+            depth -= 1
+        elif not quoted and depth == 0 and ch == ',':
+            parts.append(''.join(current))
+            current = []
+            i += 1
+            continue
+        current.append(ch)
+        i += 1
+    if current:
+        parts.append(''.join(current))
+    return [part.strip() for part in parts if part.strip()]
+
+
+def _unquote(raw):
+    if len(raw) >= 2 and raw[0] == raw[-1] == '"':
+        return raw[1:-1].replace('\\"', '"').replace('\\\\', '\\')
+    return raw
+
+
+def _parse_logic_tree(expression, combine=any):
+    """Parse an or_()/and() filter string into a row predicate."""
+    predicates = []
+    for part in _split_top_level(expression):
+        if part.startswith(('and(', 'or(')) and part.endswith(')'):
+            inner_combine = all if part.startswith('and(') else any
+            inner = part[part.index('(') + 1:-1]
+            predicates.append(_parse_logic_tree(inner, inner_combine))
+            continue
+
+        negate = False
+        column, op, raw = part.split('.', 2)
+        if op == 'not':
+            negate = True
+            op, raw = raw.split('.', 1)
+        if op == 'in':
+            value = [_unquote(v) for v in _split_top_level(raw[1:-1])]
+        else:
+            value = _unquote(raw)
+        predicate = _make_predicate(column, op, value)
+        predicates.append((lambda p: lambda row: not p(row))(predicate) if negate else predicate)
+
+    return lambda row: combine(predicate(row) for predicate in predicates)
+
+
+def _parse_columns(columns):
+    """Return (plain_columns or None for '*', [(alias, table, sub_columns)])."""
+    plain, embeds, star = [], [], False
+    for part in _split_top_level(columns or '*'):
+        if '(' in part and part.endswith(')'):
+            head, sub_columns = part[:-1].split('(', 1)
+            alias, _, table = head.partition(':')
+            embeds.append((alias.strip(), (table or alias).strip(), sub_columns))
+        elif part == '*':
+            star = True
+        else:
+            plain.append(part.split(':')[-1].strip())
+    return (None if star or not plain else plain), embeds
+
+
+class StandInQuery:
+    """PostgREST request builder over an InMemoryStore table."""
+
+    def __init__(self, client, table):
+        self._client = client
+        self._store = client.store
+        self._table = table
+        self._operation = 'select'
+        self._columns = '*'
+        self._count = None
+        self._payload = None
+        self._on_conflict = 'id'
+        self._filters = []
+        self._index_filter = None
+        self._order = []
+        self._limit = None
+        self._offset = 0
+        self._rpc = None
+
+    # -- operations --------------------------------------------------------
+
+    def select(self, columns='*', count=None, **kwargs):
+        if self._operation == 'select':
+            self._columns = columns
+        self._count = count
+        return self
+
+    def insert(self, data, **kwargs):
+        self._operation = 'insert'
+        self._payload = data
+        return self
+
+    def upsert(self, data, on_conflict='id', **kwargs):
+        self._operation = 'upsert'
+        self._payload = data
+        self._on_conflict = on_conflict or 'id'
+        return self
+
+    def update(self, data, **kwargs):
+        self._operation = 'update'
+        self._payload = data
+        return self
+
+    def delete(self, **kwargs):
+        self._operation = 'delete'
+        return self
+
+    # -- filters -----------------------------------------------------------
+
+    def _filter(self, column, op, value):
+        if op in ('eq', 'in') and self._index_filter is None:
+            self._index_filter = (column, op, value)
+        else:
+            self._filters.append(_make_predicate(column, op, value))
+        return self
+
+    def eq(self, column, value):
+        return self._filter(column, 'eq', value)
+
+    def neq(self, column, value):
+        return self._filter(column, 'neq', value)
+
+    def gt(self, column, value):
+        return self._filter(column, 'gt', value)
+
+    def gte(self, column, value):
+        return self._filter(column, 'gte', value)
+
+    def lt(self, column, value):
+        return self._filter(column, 'lt', value)
+
+    def lte(self, column, value):
+        return self._filter(column, 'lte', value)
+
+    def in_(self, column, values):
+        return self._filter(column, 'in', list(values))
+
+    def is_(self, column, value):
+        return self._filter(column, 'is', value)
+
+    def like(self, column, pattern):
+        return self._filter(column, 'like', pattern)
+
+    def ilike(self, column, pattern):
+        return self._filter(column, 'ilike', pattern)
+
+    def or_(self, filters, **kwargs):
+        self._filters.append(_parse_logic_tree(filters))
+        return self
+
+    def filter(self, column, operator, criteria):
+        return self._filter(column, operator, criteria)
+
+    # -- modifiers ---------------------------------------------------------
+
+    def order(self, column, desc=False, **kwargs):
+        self._order.append((column, desc))
+        return self
+
+    def limit(self, size, **kwargs):
+        self._limit = size
+        return self
+
+    def range(self, start, end, **kwargs):
+        self._offset = start
+        self._limit = end - start + 1
+        return self
+
+    # -- execution ---------------------------------------------------------
+
+    def execute(self):
+        return self._client._call(self._run)
+
+    def _candidates(self):
+        rows = self._store.rows(self._table)
+        if self._index_filter is None:
+            return list(rows)
+        column, op, value = self._index_filter
+        index = self._store.index(self._table, column)
+        if op == 'eq':
+            return list(index.get(_index_key(value), ()))
+        matched = []
+        for key in dict.fromkeys(_index_key(v) for v in value):
+            matched.extend(index.get(key, ()))
+        return matched
+
+    def _matching(self):
+        rows = self._candidates()
+        for predicate in self._filters:
+            rows = [row for row in rows if predicate(row)]
+        return rows
+
+    def _run(self):
+        if self._rpc is not None:
+            name, params = self._rpc
+            func = self._store.functions.get(name)
+            if func is None:
+                raise StandInError(f'Could not find the function public.{name}')
+            return StandInResponse(func(self._store, **(params or {})))
+
+        with self._store._lock:
+            if self._operation == 'select':
+                return self._run_select()
+            if self._operation == 'insert':
+                return StandInResponse(self._insert(self._payload))
+            if self._operation == 'upsert':
+                return StandInResponse(self._upsert(self._payload))
+            if self._operation == 'update':
+                return StandInResponse(self._update())
+            if self._operation == 'delete':
+                return StandInResponse(self._delete())
+        raise StandInError(f'Unsupported operation: {self._operation}')
+
+    def _run_select(self):
+        rows = self._matching()
+        count = len(rows) if self._count else None
+
+        for column, desc in reversed(self._order):
+            present = [row for row in rows if row.get(column) is not None]
+            missing = [row for row in rows if row.get(column) is None]
+            present.sort(key=lambda row: row[column], reverse=desc)
+            # PostgREST puts NULLs last for ascending and first for descending
+            rows = missing + present if desc else present + missing
+
+        if self._offset:
+            rows = rows[self._offset:]
+        if self._limit is not None:
+            rows = rows[:self._limit]
+
+        return StandInResponse([self._project(row) for row in rows], count)
+
+    def _project(self, row):
+        plain, embeds = _parse_columns(self._columns)
+        result = dict(row) if plain is None else {column: row.get(column) for column in plain}
+        for alias, table, sub_columns in embeds:
+            foreign_key = f'{alias}_id' if f'{alias}_id' in row else f'{table.rstrip("s")}_id'
+            matches = self._store.index(table, 'id').get(_index_key(row.get(foreign_key)), [])
+            embedded = StandInQuery(self._client, table).select(sub_columns)
+            result[alias] = embedded._project(matches[0]) if matches else None
+        return result
+
+    def _with_defaults(self, row):
+        row = dict(row)
+        for table in ('*', self._table):
+            for column, factory in TABLE_DEFAULTS.get(table, {}).items():
+                if column not in row:
+                    row[column] = factory()
+        return row
+
+    def _insert(self, payload):
+        rows = [self._with_defaults(row) for row in (payload if isinstance(payload, list) else [payload])]
+        self._store.rows(self._table).extend(rows)
+        self._store._invalidate(self._table)
+        return [dict(row) for row in rows]
+
+    def _upsert(self, payload):
+        results = []
+        for row in payload if isinstance(payload, list) else [payload]:
+            conflict_columns = [column.strip() for column in self._on_conflict.split(',')]
+            existing = [
+                candidate for candidate in self._store.rows(self._table)
+                if all(column in row and _values_equal(candidate.get(column), row[column]) for column in conflict_columns)
+            ]
+            if existing:
+                existing[0].update(row)
+                results.append(dict(existing[0]))
+                self._store._invalidate(self._table)
+            else:
+                results.extend(self._insert(row))
+        return results
+
+    def _update(self):
+        rows = self._matching()
+        for row in rows:
+            row.update(self._payload)
+        if rows:
+            self._store._invalidate(self._table)
+        return [dict(row) for row in rows]
+
+    def _delete(self):
+        doomed = self._matching()
+        if doomed:
+            doomed_ids = {id(row) for row in doomed}
+            self._store.tables[self._table] = [row for row in self._store.rows(self._table) if id(row) not in doomed_ids]
+            self._store._invalidate(self._table)
+        return [dict(row) for row in doomed]
+
+
+class _StandInAdmin:
+    def __init__(self, client):
+        self._client = client
+        self._store = client.store
+
+    def get_user_by_id(self, user_id):
+        return self._client._call(lambda: SimpleNamespace(user=self._store.users.get(user_id)))
+
+    def list_users(self, *args, **kwargs):
+        return self._client._call(lambda: list(self._store.users.values()))
+
+    def create_user(self, attributes):
+        def run():
+            user = self._store.add_user(attributes.get('email'), attributes.get('user_metadata'))
+            return SimpleNamespace(user=user)
+        return self._client._call(run)
+
+    def update_user_by_id(self, user_id, attributes):
+        def run():
+            user = self._store.users.get(user_id)
+            if user is None:
+                raise StandInError('User not found')
+            user.user_metadata.update(attributes.get('user_metadata') or {})
+            if attributes.get('email'):
+                user.email = attributes['email']
+            return SimpleNamespace(user=user)
+        return self._client._call(run)
+
+
+class _StandInAuth:
+    def __init__(self, client):
+        self._client = client
+        self._store = client.store
+        self.admin = _StandInAdmin(client)
+
+    def get_user(self, jwt=None):
+        def run():
+            user = self._store.users.get(self._store.tokens.get(jwt))
+            return SimpleNamespace(user=user) if user else None
+        return self._client._call(run)
+
+
+class _StandInBucket:
+    def __init__(self, client, bucket):
+        self._client = client
+        self._objects = client.store.buckets.setdefault(bucket, {})
+        self._bucket = bucket
+
+    def upload(self, path, file, file_options=None):
+        def run():
+            self._objects[path] = file
+            return SimpleNamespace(path=path, full_path=f'{self._bucket}/{path}')
+        return self._client._call(run)
+
+    def download(self, path):
+        return self._client._call(lambda: self._objects[path])
+
+    def remove(self, paths):
+        def run():
+            return [{'name': path} for path in paths if self._objects.pop(path, None) is not None]
+        return self._client._call(run)
+
+    def list(self, path=None, *args, **kwargs):
+        prefix = f'{path.rstrip("/")}/' if path else ''
+        return self._client._call(lambda: [{'name': name} for name in self._objects if name.startswith(prefix)])
+
+    def get_public_url(self, path, *args, **kwargs):
+        return f'http://standin.local/storage/v1/object/public/{self._bucket}/{path}'
+
+
+class _StandInStorage:
+    def __init__(self, client):
+        self._client = client
+
+    def from_(self, bucket):
+        return _StandInBucket(self._client, bucket)
+
+    def list_buckets(self):
+        return self._client._call(lambda: [SimpleNamespace(name=name) for name in self._client.store.buckets])
+
+
+class StandInClient:
+    """supabase Client / AsyncClient look-alike backed by an InMemoryStore."""
+
+    def __init__(self, store=None, latency_ms=0.0, jitter_ms=0.0, asynchronous=False, seed=None):
+        self.store = store if store is not None else InMemoryStore()
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.asynchronous = asynchronous
+        self._random = random.Random(seed)
+        self.auth = _StandInAuth(self)
+        self.storage = _StandInStorage(self)
+
+    def table(self, table_name):
+        return StandInQuery(self, table_name)
+
+    from_ = table
+
+    def rpc(self, fn, params=None, *args, **kwargs):
+        query = StandInQuery(self, None)
+        query._rpc = (fn, params)
+        return query
+
+    def _delay(self):
+        if not self.latency_ms and not self.jitter_ms:
+            return 0.0
+        jitter = self._random.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0.0
+        return max(0.0, self.latency_ms + jitter) / 1000.0
+
+    def _call(self, func):
+        """Run one simulated round-trip, sync or async to match the client."""
+        delay = self._delay()
+        if self.asynchronous:
+            async def run():
+                if delay:
+                    await asyncio.sleep(delay)
+                return func()
+            return run()
+        if delay:
+            time.sleep(delay)
+        return func()
+
+
+_store = None
+
+
+def get_standin_store():
+    """Process-wide store used when SUPABASE_STANDIN is enabled."""
+    global _store
+    if _store is None:
+        _store = InMemoryStore()
+    return _store
+
+
+def get_standin_client(asynchronous=False):
+    from django.conf import settings
+    return StandInClient(
+        get_standin_store(),
+        latency_ms=settings.SUPABASE_STANDIN_LATENCY_MS,
+        asynchronous=asynchronous,
+    )
@@ -0,0 +1,146 @@
+"""
+Seeded data generator for the in-memory Supabase stand-in.
+
+seed_store() fills an InMemoryStore with companies, developers, projects and
+applications shaped like the real tables, deterministically for a given seed,
+so endpoint benchmarks are repeatable at realistic sizes (the defaults are
+10k projects and 100k applications).
+"""
+
+import random
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+SKILLS = [
+    'Python', 'Django', 'JavaScript', 'TypeScript', 'React', 'Vue', 'Angular', 'Node.js',
+    'PostgreSQL', 'MongoDB', 'Redis', 'Docker', 'Kubernetes', 'AWS', 'GCP', 'Figma',
+    'Tailwind CSS', 'GraphQL', 'Flutter', 'Swift', 'Kotlin', 'Go', 'Rust', 'Java',
+    'Spring Boot', 'Machine Learning', 'TensorFlow', 'PyTorch', 'Next.js', 'FastAPI',
+]
+CATEGORIES = ['web_development', 'mobile_development', 'ui_ux_design', 'data_science', 'devops']
+COMPLEXITIES = ['beginner', 'intermediate', 'advanced', 'expert']
+PROJECT_STATUSES = [('open', 0.7), ('active', 0.1), ('in_progress', 0.1), ('completed', 0.1)]
+APPLICATION_STATUSES = [('pending', 0.75), ('shortlisted', 0.1), ('rejected', 0.12), ('selected', 0.03)]
+FIRST_NAMES = ['Alex', 'Sam', 'Jordan', 'Taylor', 'Riya', 'Arjun', 'Mei', 'Omar', 'Lena', 'Kofi']
+LAST_NAMES = ['Smith', 'Patel', 'Garcia', 'Chen', 'Okafor', 'Müller', 'Khan', 'Silva', 'Kim', 'Novak']
+
+
+def _uuid(rng):
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def _weighted(rng, choices):
+    values, weights = zip(*choices)
+    return rng.choices(values, weights)[0]
+
+
+def seed_store(store, projects=10_000, applications=100_000, companies=200, developers=5_000, seed=42):
+    """
+    Populate store and return a summary with sample ids for benchmarks.
+
+    Applications are unique per (project, developer) and the project counter
+    columns are filled to match, as the counters trigger would.
+    """
+    rng = random.Random(seed)
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    company_ids = []
+    company_profiles = []
+    for i in range(companies):
+        name = f'Company {i}'
+        user = store.add_user(
+            f'company{i}@example.com',
+            {'user_type': 'company', 'company_name': name},
+            user_id=_uuid(rng),
+        )
+        company_ids.append(user.id)
+        company_profiles.append({'id': _uuid(rng), 'user_id': user.id, 'company_name': name})
+
+    developer_ids = []
+    developer_profiles = []
+    for i in range(developers):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        user = store.add_user(
+            f'dev{i}@example.com',
+            {'user_type': 'developer', 'first_name': first, 'last_name': last},
+            user_id=_uuid(rng),
+        )
+        developer_ids.append(user.id)
+        years = rng.randint(0, 15)
+        developer_profiles.append({
+            'id': _uuid(rng),
+            'user_id': user.id,
+            'title': f'{rng.choice(SKILLS)} Developer',
+            'bio': '',
+            'skills': ', '.join(rng.sample(SKILLS, rng.randint(3, 8))),
+            'experience': f'{years} years of professional experience',
+            'years_experience': years,
+            'hourly_rate': rng.randint(15, 150),
+            'rating': round(rng.uniform(3.0, 5.0), 1),
+            'total_projects': rng.randint(0, 40),
+            'completed_projects': rng.randint(0, 30),
+            'success_rate': rng.randint(60, 100),
+            'availability': 'available',
+        })
+
+    project_rows = []
+    for i in range(projects):
+        budget_min = rng.randint(5, 50) * 100
+        created_at = now - timedelta(minutes=rng.randint(0, 365 * 24 * 60))
+        project_rows.append({
+            'id': _uuid(rng),
+            'company_id': rng.choice(company_ids),
+            'title': f'Project {i}',
+            'description': f'Build {rng.choice(CATEGORIES).replace("_", " ")} deliverables for project {i}.',
+            'category': rng.choice(CATEGORIES),
+            'complexity': rng.choice(COMPLEXITIES),
+            'tech_stack': rng.sample(SKILLS, rng.randint(2, 6)),
+            'budget_min': budget_min,
+            'budget_max': budget_min + rng.randint(5, 50) * 100,
+            'estimated_duration': f'{rng.randint(1, 12)} weeks',
+            'status': _weighted(rng, PROJECT_STATUSES),
+            'created_at': created_at.isoformat(),
+            'applications_count': 0,
+            'application_status_counts': {},
+        })
+
+    # Spread applications over projects, at most one per (project, developer)
+    application_rows = []
+    per_project = [0] * projects
+    for _ in range(applications):
+        per_project[rng.randrange(projects)] += 1
+    for project, count in zip(project_rows, per_project):
+        count = min(count, len(developer_ids))
+        created_at = datetime.fromisoformat(project['created_at'])
+        for developer_id in rng.sample(developer_ids, count):
+            status = _weighted(rng, APPLICATION_STATUSES)
+            application_rows.append({
+                'id': _uuid(rng),
+                'project_id': project['id'],
+                'developer_id': developer_id,
+                'cover_letter': 'I would love to work on this project.',
+                'proposed_rate': rng.randint(15, 150),
+                'estimated_duration': f'{rng.randint(1, 12)} weeks',
+                'status': status,
+                'applied_at': (created_at + timedelta(hours=rng.randint(1, 500))).isoformat(),
+                'match_score': rng.randint(30, 98),
+            })
+            project['applications_count'] += 1
+            counts = project['application_status_counts']
+            counts[status] = counts.get(status, 0) + 1
+
+    store.load('company_profiles', company_profiles)
+    store.load('developer_profiles', developer_profiles)
+    store.load('projects', project_rows)
+    store.load('project_applications', application_rows)
+
+    busiest_company = Counter(p['company_id'] for p in project_rows).most_common(1)[0][0]
+    return {
+        'company_ids': company_ids,
+        'developer_ids': developer_ids,
+        'busiest_company_id': busiest_company,
+        'sample_project_id': max(project_rows, key=lambda p: p['applications_count'])['id'],
+        'projects': len(project_rows),
+        'applications': len(application_rows),
+    }
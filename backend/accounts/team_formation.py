@@ -1,38 +1,284 @@
-from .supabase_service import get_supabase_client
-import json
+"""
+Team formation: pick the best combination of developers for a project.
 
-def suggest_optimal_team(project_id, required_skills, budget, team_size=3):
+Each developer's skills are mapped to skill IDs through the shared taxonomy
+(projects.skill_taxonomy) and encoded as a bitmask over the project's required
+skills. A team's value combines the share of required skills it covers
+(COVERAGE_WEIGHT) and its members' ratings (RATING_WEIGHT). Its cost is the
+members' hourly rates over HOURS_ESTIMATE hours and must fit the budget.
+
+The search is a depth-first branch-and-bound over candidates ordered by their
+individual value. Its upper bound for a branch is the coverage still reachable
+from the remaining candidates plus the best remaining ratings for the open
+slots. A greedy team seeds the lower bound. Candidates are first reduced per
+skill mask, dropping developers that enough others with the same skills beat
+on both rating and rate. The top_k best teams are kept. If time_limit runs out,
+the best found so far are returned and flagged as not proven optimal.
+"""
+
+import bisect
+import heapq
+import time
+
+from django.conf import settings
+
+from projects.skill_taxonomy import skill_ids, skill_name
+from .supabase_client import get_supabase_client
+
+HOURS_ESTIMATE = 40
+DEFAULT_HOURLY_RATE = 50
+COVERAGE_WEIGHT = 0.6
+RATING_WEIGHT = 0.4
+
+# How often (in search nodes) the time limit is checked
+_CLOCK_EVERY = 1024
+
+
+def parse_skills(value):
+    """developer_profiles.skills is a comma-separated string (or a list in newer rows)."""
+    if not value:
+        return []
+    if isinstance(value, str):
+        value = value.split(',')
+    return [skill.strip() for skill in value if skill and str(skill).strip()]
+
+
+def _popcount(mask):
+    return bin(mask).count('1')
+
+
+class Candidate:
+    __slots__ = ('id', 'name', 'skills', 'mask', 'rating', 'hourly_rate', 'cost', 'value')
+
+    def __init__(self, row, skill_bits):
+        self.id = row['id']
+        self.name = row.get('full_name') or ''
+        self.skills = parse_skills(row.get('skills'))
+        self.mask = 0
+        for skill_id in skill_ids(row.get('skills')):
+            self.mask |= skill_bits.get(skill_id, 0)
+        self.rating = float(row.get('rating') or 0)
+        self.hourly_rate = float(row.get('hourly_rate') or DEFAULT_HOURLY_RATE)
+        self.cost = self.hourly_rate * HOURS_ESTIMATE
+        self.value = 0.0
+
+
+class TeamSearch:
+    def __init__(self, required_skills, budget, team_size, top_k, time_limit):
+        # Required skill IDs in the order the project lists them
+        self.required = []
+        for skill in required_skills or []:
+            for skill_id in sorted(skill_ids([skill])):
+                if skill_id not in self.required:
+                    self.required.append(skill_id)
+        self.skill_bits = {skill: 1 << i for i, skill in enumerate(self.required)}
+        self.budget = float(budget) if budget else float('inf')
+        self.team_size = max(1, int(team_size))
+        self.top_k = max(1, int(top_k))
+        self.time_limit = time_limit
+        self.nodes = 0
+        self.timed_out = False
+
+    # Value of a team: coverage share of required skills plus summed ratings.
+    # With no required skills every team has full coverage and only ratings count.
+    def coverage_value(self, mask):
+        if not self.required:
+            return COVERAGE_WEIGHT
+        return COVERAGE_WEIGHT * _popcount(mask) / len(self.required)
+
+    def rating_value(self, rating_sum):
+        return RATING_WEIGHT * rating_sum / (5 * self.team_size)
+
+    def member_score(self, candidate):
+        skill_match = _popcount(candidate.mask) / len(self.required) if self.required else 1
+        return round(skill_match * COVERAGE_WEIGHT + (candidate.rating / 5) * RATING_WEIGHT, 4)
+
+    def reduce(self, candidates):
+        """
+        Drop candidates no top team needs. Within a skill mask, a developer
+        beaten on both rating and rate by at least team_size + top_k - 1
+        others can always be swapped for one of them.
+        """
+        by_mask = {}
+        for candidate in candidates:
+            if candidate.cost <= self.budget:
+                by_mask.setdefault(candidate.mask, []).append(candidate)
+
+        cap = self.team_size + self.top_k - 1
+        kept = []
+        for group in by_mask.values():
+            group.sort(key=lambda c: (-c.rating, c.cost))
+            # Costs of the candidates rated at least as high, seen so far
+            seen_costs = []
+            for candidate in group:
+                if bisect.bisect_right(seen_costs, candidate.cost) < cap:
+                    kept.append(candidate)
+                bisect.insort(seen_costs, candidate.cost)
+        return kept
+
+    def solve(self, candidates):
+        started = time.perf_counter()
+        deadline = started + self.time_limit if self.time_limit else None
+
+        for candidate in candidates:
+            candidate.value = self.coverage_value(candidate.mask) + self.rating_value(candidate.rating)
+        pool = sorted(self.reduce(candidates), key=lambda c: (-c.value, c.cost))
+        n = len(pool)
+
+        masks = [c.mask for c in pool]
+        ratings = [c.rating for c in pool]
+        costs = [c.cost for c in pool]
+        # Suffix aggregates for the bound: skills reachable from i on, and the
+        # best ratings among candidates i.. (one per open slot)
+        suffix_mask = [0] * (n + 1)
+        for i in range(n - 1, -1, -1):
+            suffix_mask[i] = suffix_mask[i + 1] | masks[i]
+        suffix_top = [[] for _ in range(n + 1)]
+        for i in range(n - 1, -1, -1):
+            suffix_top[i] = heapq.nlargest(self.team_size, suffix_top[i + 1] + [ratings[i]])
+        suffix_top_sums = [[0.0] * (self.team_size + 1) for _ in range(n + 1)]
+        for i in range(n + 1):
+            running = 0.0
+            for slots, rating in enumerate(suffix_top[i], start=1):
+                running += rating
+                suffix_top_sums[i][slots] = running
+            for slots in range(len(suffix_top[i]) + 1, self.team_size + 1):
+                suffix_top_sums[i][slots] = running
+
+        # Min-heap of (value, -cost, members) holding the best top_k teams
+        best = []
+        seen = set()
+
+        def offer(value, cost, members):
+            key = tuple(sorted(members))
+            if key in seen:
+                return
+            entry = (round(value, 9), -cost, key)
+            if len(best) < self.top_k:
+                heapq.heappush(best, entry)
+                seen.add(key)
+            elif entry > best[0]:
+                seen.discard(heapq.heapreplace(best, entry)[2])
+                seen.add(key)
+
+        def threshold():
+            return best[0][0] if len(best) == self.top_k else -1.0
+
+        # Greedy seed: repeatedly add the affordable candidate with the biggest gain
+        members, mask, rating_sum, cost = [], 0, 0.0, 0.0
+        for _ in range(min(self.team_size, n)):
+            choice, choice_gain = None, -1.0
+            for i in range(n):
+                if i in members or cost + costs[i] > self.budget:
+                    continue
+                gain = self.coverage_value(mask | masks[i]) - self.coverage_value(mask) + self.rating_value(ratings[i])
+                if gain > choice_gain:
+                    choice, choice_gain = i, gain
+            if choice is None:
+                break
+            members.append(choice)
+            mask |= masks[choice]
+            rating_sum += ratings[choice]
+            cost += costs[choice]
+        if members:
+            offer(self.coverage_value(mask) + self.rating_value(rating_sum), cost, members)
+
+        def search(start, members, mask, rating_sum, cost):
+            slots = self.team_size - len(members)
+            for i in range(start, n):
+                self.nodes += 1
+                if deadline and self.nodes % _CLOCK_EVERY == 0 and time.perf_counter() > deadline:
+                    self.timed_out = True
+                    return
+                # Suffix bounds only shrink as i grows, so once a branch
+                # can't beat the k-th best team nothing after it can either
+                bound = self.coverage_value(mask | suffix_mask[i]) + self.rating_value(rating_sum + suffix_top_sums[i][slots])
+                if bound <= threshold():
+                    return
+                if cost + costs[i] > self.budget:
+                    continue
+                new_mask = mask | masks[i]
+                new_rating = rating_sum + ratings[i]
+                new_cost = cost + costs[i]
+                members.append(i)
+                offer(self.coverage_value(new_mask) + self.rating_value(new_rating), new_cost, members)
+                if slots > 1:
+                    search(i + 1, members, new_mask, new_rating, new_cost)
+                members.pop()
+                if self.timed_out:
+                    return
+
+        search(0, [], 0, 0.0, 0.0)
+
+        teams = [
+            self._team_payload([pool[i] for i in key], value)
+            for value, _, key in sorted(best, reverse=True)
+        ]
+        return teams, {
+            'candidates': len(candidates),
+            'candidates_after_reduction': n,
+            'nodes_explored': self.nodes,
+            'optimal': not self.timed_out,
+            'elapsed_ms': round((time.perf_counter() - started) * 1000, 2)
+        }
+
+    def _team_payload(self, members, value):
+        mask = 0
+        for member in members:
+            mask |= member.mask
+        skills = []
+        for member in members:
+            for skill in member.skills:
+                if skill not in skills:
+                    skills.append(skill)
+        return {
+            'team': [
+                {
+                    'id': member.id,
+                    'name': member.name,
+                    'skills': member.skills,
+                    'hourly_rate': member.hourly_rate,
+                    'rating': member.rating,
+                    'score': self.member_score(member)
+                }
+                for member in members
+            ],
+            'total_cost': sum(member.cost for member in members),
+            'skills_coverage': skills,
+            'covered_skills': [skill_name(skill) for skill in self.required if mask & self.skill_bits[skill]],
+            'missing_skills': [skill_name(skill) for skill in self.required if not mask & self.skill_bits[skill]],
+            'team_score': round(value, 4)
+        }
+
+
+def find_teams(developers, required_skills, budget, team_size=3, top_k=3, time_limit=None):
+    """Solve over developer_profiles rows. Returns (teams best-first, search stats)."""
+    search = TeamSearch(required_skills, budget, team_size, top_k, time_limit)
+    candidates = [Candidate(row, search.skill_bits) for row in developers]
+    return search.solve(candidates)
+
+
+def suggest_optimal_team(project_id, required_skills, budget, team_size=3, top_k=3):
     """Generate optimal team combinations for a project"""
     supabase = get_supabase_client()
-    
+
     # Get available developers
     developers = supabase.table('developer_profiles').select('*').execute()
-    
-    # Score developers based on skills match
-    scored_devs = []
-    for dev in developers.data:
-        skills = dev.get('skills', '').split(',')
-        skill_match = len(set(required_skills) & set(skills)) / len(required_skills)
-        
-        scored_devs.append({
-            'id': dev['id'],
-            'name': dev.get('full_name', ''),
-            'skills': skills,
-            'hourly_rate': dev.get('hourly_rate', 50),
-            'rating': dev.get('rating', 0),
-            'score': skill_match * 0.6 + (dev.get('rating', 0) / 5) * 0.4
-        })
-    
-    # Sort by score and create team combinations
-    scored_devs.sort(key=lambda x: x['score'], reverse=True)
-    
-    # Generate top team combination
-    team = scored_devs[:team_size]
-    total_cost = sum(dev['hourly_rate'] for dev in team) * 40  # 40 hours estimate
-    
-    return {
-        'team': team,
-        'total_cost': total_cost,
-        'skills_coverage': list(set().union(*[dev['skills'] for dev in team])),
-        'team_score': sum(dev['score'] for dev in team) / len(team)
-    }
\ No newline at end of file
+
+    teams, stats = find_teams(
+        developers.data or [], required_skills, budget, team_size, top_k, settings.TEAM_FORMATION_TIME_LIMIT
+    )
+    if not teams:
+        return {
+            'team': [],
+            'total_cost': 0,
+            'skills_coverage': [],
+            'covered_skills': [],
+            'missing_skills': [skill_name(skill_id) for skill_id in sorted(skill_ids(required_skills))],
+            'team_score': 0,
+            'alternatives': [],
+            'search': stats
+        }
+
+    # Best team at the top level (the shape the frontend reads), the rest as alternatives
+    return {**teams[0], 'alternatives': teams[1:], 'search': stats}
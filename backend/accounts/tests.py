@@ -1,3 +1,95 @@
-from django.test import TestCase
+import itertools
+import random
 
-# Create your tests here.
+from django.test import SimpleTestCase
+
+from .pagination import decode_cursor, decode_poll_cursor, drop_seen, encode_cursor, poll_cursor
+from .team_formation import Candidate, TeamSearch, find_teams
+
+
+class TeamFormationTests(SimpleTestCase):
+    SKILLS = ['React', 'Node.js', 'Python', 'Docker', 'PostgreSQL', 'Figma']
+
+    def developers(self, rng, count):
+        return [
+            {
+                'id': f'dev-{i}',
+                'full_name': f'Developer {i}',
+                'skills': ', '.join(rng.sample(self.SKILLS, rng.randint(1, 3))),
+                'rating': rng.choice([0, 3, 3.5, 4, 4.5, 5]),
+                'hourly_rate': rng.choice([20, 35, 50, 80]),
+            }
+            for i in range(count)
+        ]
+
+    def brute_force(self, developers, required_skills, budget, team_size, top_k):
+        """Team scores of every affordable team, best top_k first."""
+        search = TeamSearch(required_skills, budget, team_size, top_k, None)
+        candidates = [Candidate(row, search.skill_bits) for row in developers]
+        values = []
+        for size in range(1, team_size + 1):
+            for team in itertools.combinations(candidates, size):
+                if sum(member.cost for member in team) > search.budget:
+                    continue
+                mask = 0
+                for member in team:
+                    mask |= member.mask
+                value = search.coverage_value(mask) + search.rating_value(sum(member.rating for member in team))
+                values.append(round(value, 4))
+        return sorted(values, reverse=True)[:top_k]
+
+    def test_exact_search_matches_brute_force(self):
+        rng = random.Random(7)
+        for _ in range(30):
+            developers = self.developers(rng, rng.randint(1, 9))
+            required = rng.sample(self.SKILLS, rng.randint(0, 4))
+            budget = rng.choice([None, 2000, 4000, 7000])
+            team_size = rng.randint(1, 4)
+            top_k = rng.randint(1, 3)
+
+            teams, stats = find_teams(developers, required, budget, team_size, top_k)
+            self.assertTrue(stats['optimal'])
+            self.assertEqual(
+                [team['team_score'] for team in teams],
+                self.brute_force(developers, required, budget, team_size, top_k),
+                f"required={required} budget={budget} team_size={team_size} top_k={top_k}"
+            )
+
+    def test_no_affordable_developer(self):
+        developers = [{'id': 'dev-0', 'skills': 'React', 'rating': 5, 'hourly_rate': 100}]
+        teams, _ = find_teams(developers, ['React'], budget=1000)
+        self.assertEqual(teams, [])
+
+
+class CursorTests(SimpleTestCase):
+    def test_cursor_round_trip(self):
+        values = ['2026-10-19T10:00:00.123456+00:00', 'a1b2c3d4-0000-4000-8000-000000000000']
+        cursor = encode_cursor(*values)
+        self.assertNotIn('=', cursor)
+        self.assertEqual(decode_cursor(cursor), values)
+
+    def test_invalid_cursors(self):
+        for cursor in ['not-base64!', encode_cursor('only one value'), encode_cursor(1, 2, 3), '']:
+            self.assertIsNone(decode_cursor(cursor))
+        self.assertIsNone(decode_poll_cursor(encode_cursor('not a timestamp', [])))
+        self.assertIsNone(decode_poll_cursor(encode_cursor('2026-10-19T10:00:00+00:00', 'id')))
+
+    def test_poll_cursor_keeps_ids_inside_the_overlap_window(self):
+        rows = [
+            {'id': 'old', 'created_at': '2026-10-19T10:00:00+00:00'},
+            {'id': 'recent', 'created_at': '2026-10-19T10:00:55+00:00'},
+            {'id': 'newest', 'created_at': '2026-10-19T10:01:00+00:00'},
+        ]
+        cursor_values = decode_poll_cursor(poll_cursor(rows, overlap=10))
+        self.assertEqual(cursor_values, ['2026-10-19T10:01:00+00:00', ['recent', 'newest']])
+
+        # A message committed late, behind the cursor, is returned once
+        late = {'id': 'late', 'created_at': '2026-10-19T10:00:58+00:00'}
+        rows = drop_seen([rows[1], late, rows[2]], cursor_values)
+        self.assertEqual(rows, [late])
+        cursor_values = decode_poll_cursor(poll_cursor(rows, previous=cursor_values, overlap=10))
+        self.assertEqual(cursor_values, ['2026-10-19T10:01:00+00:00', ['recent', 'newest', 'late']])
+
+    def test_empty_poll_keeps_the_cursor(self):
+        previous = ['2026-10-19T10:01:00+00:00', ['newest']]
+        self.assertEqual(decode_poll_cursor(poll_cursor([], previous=previous)), previous)
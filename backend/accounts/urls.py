@@ -16,6 +16,7 @@ urlpatterns = [
     path('company/projects/<str:project_id>/edit/', views.edit_project, name='edit_project'),
     path('company/projects/<str:project_id>/applications/', views.get_project_applications, name='get_project_applications'),
     path('projects/<str:project_id>/apply/', views.apply_to_project, name='apply_to_project'),
+    path('projects/<str:project_id>/views/', views.record_project_view, name='record_project_view'),
     path('developers/', views.get_developers, name='get_developers'),
     path('developer/<str:developer_email>/profile/', views.get_developer_profile, name='get_developer_profile'),
     
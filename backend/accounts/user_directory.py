@@ -0,0 +1,87 @@
+"""
+Cached display-name directory for Supabase auth users.
+
+Chat and team views show a sender/member name for every row, and
+notifications are addressed by email. Resolving each user through
+auth.admin.get_user_by_id costs a round-trip per row, so names and emails are
+kept in a process-wide TTL cache and only unknown ids hit the admin API.
+"""
+
+import threading
+
+from cachetools import TTLCache
+from django.conf import settings
+
+_lock = threading.Lock()
+_names = None
+
+
+def _cache():
+    global _names
+    if _names is None:
+        _names = TTLCache(maxsize=settings.USER_DIRECTORY_MAX_SIZE, ttl=settings.USER_DIRECTORY_TTL)
+    return _names
+
+
+def display_name(user, default='Unknown'):
+    """'First Last' from user metadata, falling back to the email."""
+    if not user:
+        return default
+    user_meta = user.user_metadata or {}
+    return f"{user_meta.get('first_name', '')} {user_meta.get('last_name', '')}".strip() or user.email or default
+
+
+def remember(user):
+    """Prime the directory with a user object already in hand."""
+    if user:
+        with _lock:
+            _cache()[user.id] = (display_name(user), user.email)
+
+
+def forget(user_id):
+    """Drop a cached name, e.g. after the user edits their profile."""
+    with _lock:
+        _cache().pop(user_id, None)
+
+
+def _lookup(supabase, user_ids):
+    """{user_id: (display name, email)} for the ids that resolve, fetching only uncached ones."""
+    entries = {}
+    missing = []
+    with _lock:
+        cache = _cache()
+        for user_id in dict.fromkeys(user_ids):
+            if not user_id:
+                continue
+            entry = cache.get(user_id)
+            if entry is None:
+                missing.append(user_id)
+            else:
+                entries[user_id] = entry
+
+    for user_id in missing:
+        try:
+            response = supabase.auth.admin.get_user_by_id(user_id)
+            user = response.user if response else None
+        except Exception as e:
+            print(f"⚠️ Could not resolve user {user_id}: {e}")
+            user = None
+        if user:
+            remember(user)
+            entries[user_id] = (display_name(user), user.email)
+
+    return entries
+
+
+def get_display_names(supabase, user_ids, default='Unknown'):
+    """Return {user_id: display name}, fetching only ids not already cached."""
+    entries = _lookup(supabase, user_ids)
+    return {
+        user_id: (entries[user_id][0] if user_id in entries else default)
+        for user_id in dict.fromkeys(user_ids) if user_id
+    }
+
+
+def get_emails(supabase, user_ids):
+    """Return {user_id: email} for the ids that resolve, fetching only ids not already cached."""
+    return {user_id: email for user_id, (_, email) in _lookup(supabase, user_ids).items() if email}
@@ -0,0 +1,203 @@
+"""
+Write-behind view counters for portfolio projects and catalog projects.
+
+Recording a view only bumps an in-memory delta. A background thread flushes
+the accumulated deltas every VIEW_COUNTER_FLUSH_INTERVAL seconds (or sooner
+once VIEW_COUNTER_MAX_PENDING rows are dirty) in a single
+increment_view_counts RPC, which adds them atomically in SQL. The request path
+makes no Supabase calls, and concurrent flushes from several workers can't
+overwrite each other.
+
+The RPC (supabase migration 20261019000005) is required. Without it a flush
+fails and keeps its deltas rather than doing a read-modify-write that would
+lose other workers' increments. Because the flush is one statement, it
+either writes the whole batch or none of it, so a retry never counts a row
+twice.
+
+Counts shown to users are approximate: the stored value plus whatever this
+process still has buffered. Each worker keeps and flushes its own buffer;
+views buffered by a process that dies before its next flush are lost.
+
+row_exists() lets endpoints turn away ids that don't exist before buffering
+anything. A positive answer is cached for EXISTS_TTL seconds, so repeat
+views of the same row still make no Supabase calls.
+"""
+
+import atexit
+import threading
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .supabase_client import get_supabase_client
+
+PORTFOLIO_PROJECTS = 'portfolio_projects'
+PROJECTS = 'projects'
+COUNTED_TABLES = (PORTFOLIO_PROJECTS, PROJECTS)
+
+# Seconds a row is remembered as existing by row_exists()
+EXISTS_TTL = 300
+
+
+def is_valid_id(object_id):
+    """Row ids are UUIDs; anything else would fail the whole batched flush."""
+    try:
+        uuid.UUID(str(object_id))
+        return True
+    except ValueError:
+        return False
+
+
+def _exists_key(table, object_id):
+    return f'views:exists:{table}:{object_id}'
+
+
+def row_exists(table, object_id):
+    """Whether `table` has a row with this id; positive answers are cached."""
+    if not is_valid_id(object_id):
+        return False
+    key = _exists_key(table, object_id)
+    if cache.get(key):
+        return True
+    response = get_supabase_client().table(table).select('id').eq('id', str(object_id)).limit(1).execute()
+    if not response.data:
+        return False
+    cache.set(key, True, EXISTS_TTL)
+    return True
+
+
+class ViewCounterBuffer:
+    def __init__(self, flush_interval, max_pending):
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending = {}
+        self._in_flight = {}
+        self._wake = threading.Event()
+        self._thread = None
+        # False once the increment_view_counts RPC turned out to be missing
+        self._rpc_available = True
+        self.flushes = 0
+        self.flushed_views = 0
+        self.failed_flushes = 0
+        self.last_flush_at = None
+        self.last_flush_ms = None
+
+    def record(self, table, object_id, count=1):
+        key = (table, str(object_id))
+        with self._lock:
+            self._pending[key] = self._pending.get(key, 0) + count
+            dirty = len(self._pending)
+        self._ensure_flusher()
+        if dirty >= self.max_pending:
+            self._wake.set()
+
+    def buffered(self, table, object_id):
+        """Views recorded here that the database may not reflect yet."""
+        key = (table, str(object_id))
+        with self._lock:
+            return self._pending.get(key, 0) + self._in_flight.get(key, 0)
+
+    def live_count(self, table, object_id, stored):
+        return (stored or 0) + self.buffered(table, object_id)
+
+    def discard(self, table, object_id):
+        """Drop buffered views for a deleted row."""
+        cache.delete(_exists_key(table, object_id))
+        with self._lock:
+            self._pending.pop((table, str(object_id)), None)
+
+    def flush(self):
+        """Write all buffered deltas. Returns the number of views written."""
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return 0
+                batch, self._pending = self._pending, {}
+                self._in_flight = batch
+
+            start = time.perf_counter()
+            try:
+                self._write(batch)
+            except Exception as e:
+                # Nothing was written (single atomic RPC): put the deltas back for the next flush
+                with self._lock:
+                    for key, count in batch.items():
+                        self._pending[key] = self._pending.get(key, 0) + count
+                    self._in_flight = {}
+                    self.failed_flushes += 1
+                print(f"⚠️ View counter flush failed ({len(batch)} rows kept for retry): {e}")
+                return 0
+
+            written = sum(batch.values())
+            with self._lock:
+                self._in_flight = {}
+                self.flushes += 1
+                self.flushed_views += written
+                self.last_flush_at = time.time()
+                self.last_flush_ms = round((time.perf_counter() - start) * 1000, 2)
+            return written
+
+    def _write(self, batch):
+        counts = {table: {} for table in COUNTED_TABLES}
+        for (table, object_id), count in batch.items():
+            counts[table][object_id] = count
+
+        try:
+            get_supabase_client().rpc('increment_view_counts', {'p_counts': counts}).execute()
+        except Exception as e:
+            if getattr(e, 'code', None) == 'PGRST202':
+                self._rpc_available = False
+                raise RuntimeError(
+                    "increment_view_counts RPC is not installed; apply supabase migration "
+                    "20261019000005_increment_view_counts.sql (views are kept until it exists)"
+                ) from e
+            raise
+        self._rpc_available = True
+
+    def _ensure_flusher(self):
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name='view-counter-flusher', daemon=True)
+            self._thread.start()
+        atexit.register(self.flush)
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'pending_rows': len(self._pending),
+                'pending_views': sum(self._pending.values()),
+                'in_flight_views': sum(self._in_flight.values()),
+                'flushes': self.flushes,
+                'flushed_views': self.flushed_views,
+                'failed_flushes': self.failed_flushes,
+                'last_flush_at': self.last_flush_at,
+                'last_flush_ms': self.last_flush_ms,
+                'flush_interval_seconds': self.flush_interval,
+                'rpc_available': self._rpc_available,
+            }
+
+
+_buffer = None
+_buffer_lock = threading.Lock()
+
+
+def get_view_counters():
+    global _buffer
+    if _buffer is None:
+        with _buffer_lock:
+            if _buffer is None:
+                _buffer = ViewCounterBuffer(settings.VIEW_COUNTER_FLUSH_INTERVAL, settings.VIEW_COUNTER_MAX_PENDING)
+    return _buffer
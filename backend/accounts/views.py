@@ -4,8 +4,14 @@ from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 import json
 from datetime import datetime
+from asgiref.sync import sync_to_async
 from .supabase_client import get_supabase_client
+from .supabase_async import execute_all, get_async_supabase_client, get_user_from_token
 from .supabase_service import SupabaseService
+from .pagination import apply_keyset, decode_cursor, paginate_rows, parse_page_size
+from .catalog_cache import cached_json_response, invalidate_catalog
+from .view_counters import PROJECTS, get_view_counters, row_exists
+from projects.past_projects import group_supabase_past_projects, supabase_past_projects_query
 
 @csrf_exempt
 def register_developer(request):
@@ -123,6 +129,8 @@ def register_company(request):
                 }
                 
                 supabase.table('company_profiles').insert(profile_data).execute()
+                # Catalog entries show the company name from company_profiles
+                invalidate_catalog('company profile created')
                 
                 return JsonResponse({
                     'message': 'Company registered successfully',
@@ -249,50 +257,93 @@ def get_user_profile(request):
     
     return JsonResponse({'error': 'Method not allowed'}, status=405)
 
+VISIBLE_PROJECT_STATUSES = ['open', 'active', 'published']
+
+PROJECT_LIST_COLUMNS = (
+    'id, title, description, budget_min, budget_max, category, complexity, '
+    'tech_stack, estimated_duration, created_at, company_id'
+)
+
+COMPANY_PROJECT_COLUMNS = (
+    'id, title, description, budget_min, budget_max, category, complexity, tech_stack, '
+    'estimated_duration, status, created_at, applications_count, application_status_counts'
+)
+
+
+def get_company_names(supabase, company_ids):
+    """Resolve company display names for many companies in one query."""
+    company_ids = list({cid for cid in company_ids if cid})
+    if not company_ids:
+        return {}
+    try:
+        response = supabase.table('company_profiles').select('user_id, company_name').in_('user_id', company_ids).execute()
+        return {
+            row['user_id']: row.get('company_name') or 'Company'
+            for row in (response.data or [])
+        }
+    except Exception as e:
+        print(f"Error resolving company names: {e}")
+        return {}
+
+
+def build_project_catalog(page_size, cursor_values):
+    """One catalog page as a (payload, status) pair for the response cache."""
+    supabase = get_supabase_client()
+
+    # Status filter, projection and keyset all run in the database
+    query = supabase.table('projects').select(PROJECT_LIST_COLUMNS).in_('status', VISIBLE_PROJECT_STATUSES)
+    query = apply_keyset(query, cursor_values)
+    response = query.order('created_at', desc=True).order('id', desc=True).limit(page_size + 1).execute()
+
+    projects, next_cursor = paginate_rows(response.data or [], page_size)
+    company_names = get_company_names(supabase, [p['company_id'] for p in projects])
+
+    projects_data = []
+    for project in projects:
+        projects_data.append({
+            'id': project['id'],
+            'title': project['title'],
+            'description': project['description'],
+            'budget_min': float(project['budget_min']) if project['budget_min'] else 0,
+            'budget_max': float(project['budget_max']) if project['budget_max'] else 0,
+            'category': project['category'],
+            'complexity': project['complexity'],
+            'tech_stack': project['tech_stack'] if isinstance(project['tech_stack'], list) else [],
+            'estimated_duration': project['estimated_duration'],
+            'created_at': project['created_at'],
+            'company': company_names.get(project['company_id'], 'Company')
+        })
+
+    return {
+        'projects': projects_data,
+        'next_cursor': next_cursor,
+        'has_more': next_cursor is not None
+    }, 200
+
 @csrf_exempt
 def get_projects(request):
+    """
+    Browse open projects, newest first.
+
+    Query params:
+    - limit: page size (default 20, max 100)
+    - cursor: next_cursor from the previous page
+
+    Pages are served from the catalog cache and support If-None-Match.
+    """
     if request.method == 'GET':
         try:
-            supabase = get_supabase_client()
-            
-            # Get all projects from Supabase (remove status filter temporarily)
-            response = supabase.table('projects').select('*').execute()
-            all_projects = response.data if response.data else []
-            
-            print(f"Total projects in database: {len(all_projects)}")
-            if all_projects:
-                print(f"Sample project statuses: {[p.get('status') for p in all_projects[:3]]}")
-            
-            # Filter for open projects
-            projects = [p for p in all_projects if p.get('status') in ['open', 'active', 'published']]
-            
-            projects_data = []
-            for project in projects:
-                # Get company info
-                try:
-                    company_response = supabase.auth.admin.get_user_by_id(project['company_id'])
-                    company_name = "Company"
-                    if company_response.user and company_response.user.user_metadata:
-                        company_name = company_response.user.user_metadata.get('first_name', 'Company')
-                except:
-                    company_name = "Company"
-                
-                projects_data.append({
-                    'id': project['id'],
-                    'title': project['title'],
-                    'description': project['description'],
-                    'budget_min': float(project['budget_min']) if project['budget_min'] else 0,
-                    'budget_max': float(project['budget_max']) if project['budget_max'] else 0,
-                    'category': project['category'],
-                    'complexity': project['complexity'],
-                    'tech_stack': project['tech_stack'] if isinstance(project['tech_stack'], list) else [],
-                    'estimated_duration': project['estimated_duration'],
-                    'created_at': project['created_at'],
-                    'company': company_name
-                })
-            
-            print(f"Returning {len(projects_data)} visible projects from Supabase")
-            return JsonResponse({'projects': projects_data})
+            page_size = parse_page_size(request.GET.get('limit'))
+            cursor = request.GET.get('cursor')
+            cursor_values = decode_cursor(cursor)
+            if cursor and cursor_values is None:
+                return JsonResponse({'projects': [], 'error': 'Invalid cursor'}, status=400)
+
+            return cached_json_response(
+                request,
+                f'list:{page_size}:{cursor or ""}',
+                lambda: build_project_catalog(page_size, cursor_values)
+            )
         except Exception as e:
             print(f"Get projects error: {str(e)}")
             import traceback
@@ -301,6 +352,25 @@ def get_projects(request):
     
     return JsonResponse({'error': 'Method not allowed'}, status=405)
 
+@csrf_exempt
+def record_project_view(request, project_id):
+    """Count a view of a catalog project. Buffered; known ids make no Supabase calls."""
+    if request.method != 'POST':
+        return JsonResponse({'error': 'Method not allowed'}, status=405)
+    try:
+        if not row_exists(PROJECTS, project_id):
+            return JsonResponse({'error': 'Project not found'}, status=404)
+    except Exception as e:
+        print(f"Record project view error: {str(e)}")
+        return JsonResponse({'error': str(e)}, status=500)
+    
+    view_counters = get_view_counters()
+    view_counters.record(PROJECTS, project_id)
+    return JsonResponse({
+        'message': 'View recorded',
+        'pending_views': view_counters.buffered(PROJECTS, project_id)
+    })
+
 @csrf_exempt
 def get_company_projects(request):
     if request.method == 'GET':
@@ -317,16 +387,12 @@ def get_company_projects(request):
             if not user_response.user:
                 return JsonResponse({'error': 'Invalid token'}, status=401)
             
-            # Get projects from Supabase
-            projects_response = supabase.table('projects').select('*').eq('company_id', user_response.user.id).execute()
+            # Single query: application counters are maintained on the projects row
+            projects_response = supabase.table('projects').select(COMPANY_PROJECT_COLUMNS).eq('company_id', user_response.user.id).execute()
             projects = projects_response.data if projects_response.data else []
             
             projects_data = []
             for project in projects:
-                # Count applications for this project
-                applications_response = supabase.table('project_applications').select('id').eq('project_id', project['id']).execute()
-                applications_count = len(applications_response.data) if applications_response.data else 0
-                
                 projects_data.append({
                     'id': project['id'],
                     'title': project['title'],
@@ -339,7 +405,8 @@ def get_company_projects(request):
                     'estimated_duration': project['estimated_duration'],
                     'status': project['status'],
                     'created_at': project['created_at'],
-                    'applications_count': applications_count
+                    'applications_count': project.get('applications_count') or 0,
+                    'application_status_counts': project.get('application_status_counts') or {}
                 })
             
             return JsonResponse({'projects': projects_data})
@@ -352,34 +419,38 @@ def get_company_projects(request):
     
     return JsonResponse({'error': 'Method not allowed'}, status=405)
 
+def build_project_detail(project_id):
+    """Project detail as a (payload, status) pair for the response cache."""
+    supabase = get_supabase_client()
+    
+    # Get project from Supabase
+    project_response = supabase.table('projects').select('*').eq('id', project_id).execute()
+    if not project_response.data:
+        return {'error': 'Project not found'}, 404
+    
+    project = project_response.data[0]
+    
+    return {
+        'project': {
+            'id': project['id'],
+            'title': project['title'],
+            'description': project['description'],
+            'category': project['category'],
+            'complexity': project['complexity'],
+            'budget_min': float(project['budget_min']) if project['budget_min'] else 0,
+            'budget_max': float(project['budget_max']) if project['budget_max'] else 0,
+            'estimated_duration': project['estimated_duration'],
+            'tech_stack': project['tech_stack'],
+            'status': project['status'],
+            'created_at': project['created_at']
+        }
+    }, 200
+
 @csrf_exempt
 def edit_project(request, project_id):
     if request.method == 'GET':
         try:
-            supabase = get_supabase_client()
-            
-            # Get project from Supabase
-            project_response = supabase.table('projects').select('*').eq('id', project_id).execute()
-            if not project_response.data:
-                return JsonResponse({'error': 'Project not found'}, status=404)
-            
-            project = project_response.data[0]
-            
-            return JsonResponse({
-                'project': {
-                    'id': project['id'],
-                    'title': project['title'],
-                    'description': project['description'],
-                    'category': project['category'],
-                    'complexity': project['complexity'],
-                    'budget_min': float(project['budget_min']) if project['budget_min'] else 0,
-                    'budget_max': float(project['budget_max']) if project['budget_max'] else 0,
-                    'estimated_duration': project['estimated_duration'],
-                    'tech_stack': project['tech_stack'],
-                    'status': project['status'],
-                    'created_at': project['created_at']
-                }
-            })
+            return cached_json_response(request, f'detail:{project_id}', lambda: build_project_detail(project_id))
             
         except Exception as e:
             print(f"Get project error: {str(e)}")
@@ -440,6 +511,7 @@ def edit_project(request, project_id):
             if not response.data:
                 return JsonResponse({'error': 'Project not found or unauthorized'}, status=404)
             
+            invalidate_catalog('project edited')
             project = response.data[0]
             
             return JsonResponse({
@@ -465,8 +537,40 @@ def edit_project(request, project_id):
     
     return JsonResponse({'error': 'Method not allowed'}, status=405)
 
+def _score_application(project, app_data):
+    """Run the fine-tuned matcher for a new application (CPU-bound, sync)."""
+    try:
+        from projects.simple_fine_tuned_matcher import SimpleMatcher
+        
+        # Initialize matcher and calculate scores
+        matcher = SimpleMatcher()
+        match_result = matcher.calculate_match_score(project, app_data)
+        
+        # Convert to integers for database
+        scores = {
+            'match_score': int(round(match_result['overall_score'])),
+            'skill_match_score': int(round(match_result['component_scores']['skill_match'])),
+            'experience_fit_score': int(round(match_result['component_scores']['experience_fit'])),
+            'portfolio_quality_score': int(round(match_result['component_scores']['portfolio_quality'])),
+            'ai_reasoning': match_result['reasoning']
+        }
+        
+        print(f"✅ Calculated AI scores for application {app_data['id']}: {scores['match_score']}%")
+        return scores
+        
+    except Exception as e:
+        print(f"⚠️ Error calculating AI scores, using defaults: {e}")
+        # Fallback to basic scores if matcher fails
+        return {
+            'match_score': 75,
+            'skill_match_score': 80,
+            'experience_fit_score': 70,
+            'portfolio_quality_score': 75,
+            'ai_reasoning': "Overall match: 75%. Good skill alignment and experience fit."
+        }
+
 @csrf_exempt
-def apply_to_project(request, project_id):
+async def apply_to_project(request, project_id):
     if request.method == 'POST':
         try:
             data = json.loads(request.body)
@@ -475,27 +579,29 @@ def apply_to_project(request, project_id):
             if not auth_header:
                 return JsonResponse({'error': 'No authorization token'}, status=401)
             
-            token = auth_header.replace('Bearer ', '')
-            supabase = get_supabase_client()
+            supabase = await get_async_supabase_client()
             
-            user_response = supabase.auth.get_user(token)
-            if not user_response.user:
+            user = await get_user_from_token(supabase, auth_header)
+            if not user:
                 return JsonResponse({'error': 'Invalid token'}, status=401)
             
-            # Check if project exists
-            project_response = supabase.table('projects').select('*').eq('id', project_id).execute()
+            # Project, duplicate check and developer profile are independent
+            project_response, existing_app_response, profile_response, past_projects_response = await execute_all(
+                supabase.table('projects').select('*').eq('id', project_id),
+                supabase.table('project_applications').select('id').eq('project_id', project_id).eq('developer_id', user.id),
+                supabase.table('developer_profiles').select('*').eq('user_id', user.id),
+                supabase_past_projects_query(supabase, [user.id]),
+            )
             if not project_response.data:
                 return JsonResponse({'error': 'Project not found'}, status=404)
             
-            # Check if already applied
-            existing_app_response = supabase.table('project_applications').select('id').eq('project_id', project_id).eq('developer_id', user_response.user.id).execute()
             if existing_app_response.data:
                 return JsonResponse({'error': 'You have already applied to this project'}, status=400)
             
             # Create application data
             application_data = {
                 'project_id': project_id,
-                'developer_id': user_response.user.id,
+                'developer_id': user.id,
                 'cover_letter': data.get('coverLetter', ''),
                 'proposed_rate': float(data.get('proposedBudget', 0)) if data.get('proposedBudget') else None,
                 'estimated_duration': data.get('timeline', ''),
@@ -503,79 +609,34 @@ def apply_to_project(request, project_id):
             }
             
             # Create application
-            app_response = supabase.table('project_applications').insert(application_data).execute()
+            app_response = await supabase.table('project_applications').insert(application_data).execute()
             if not app_response.data:
                 return JsonResponse({'error': 'Failed to create application'}, status=500)
             
             application = app_response.data[0]
             
-            # Calculate AI match scores using fine-tuned model
-            try:
-                from projects.simple_fine_tuned_matcher import SimpleMatcher
-                
-                # Get project data
-                project = project_response.data[0]
-                
-                # Get developer profile
-                profile_response = supabase.table('developer_profiles').select('*').eq('user_id', user_response.user.id).execute()
-                developer_profile = profile_response.data[0] if profile_response.data else {}
-                
-                # Initialize matcher and calculate scores
-                matcher = SimpleMatcher()
-                
-                # Prepare application data for scoring
-                app_data = {
-                    'id': application['id'],
-                    'developer_id': user_response.user.id,
-                    'cover_letter': application_data['cover_letter'],
-                    'proposed_rate': application_data.get('proposed_rate'),
-                    'estimated_duration': application_data.get('estimated_duration'),
-                    'developer_profile': developer_profile
-                }
-                
-                # Calculate match score
-                match_result = matcher.calculate_match_score(project, app_data)
-                
-                # Convert to integers for database
-                match_score = int(round(match_result['overall_score']))
-                skill_match = int(round(match_result['component_scores']['skill_match']))
-                experience_fit = int(round(match_result['component_scores']['experience_fit']))
-                portfolio_quality = int(round(match_result['component_scores']['portfolio_quality']))
-                ai_reasoning = match_result['reasoning']
-                
-                print(f"✅ Calculated AI scores for application {application['id']}: {match_score}%")
-                
-            except Exception as e:
-                print(f"⚠️ Error calculating AI scores, using defaults: {e}")
-                # Fallback to basic scores if matcher fails
-                match_score = 75
-                skill_match = 80
-                experience_fit = 70
-                portfolio_quality = 75
-                ai_reasoning = f"Overall match: {match_score}%. Good skill alignment and experience fit."
-            
-            # Update application with scores
-            update_payload = {
-                'match_score': match_score,
-                'skill_match_score': skill_match,
-                'experience_fit_score': experience_fit,
-                'portfolio_quality_score': portfolio_quality,
-                'ai_reasoning': ai_reasoning
+            # Prepare application data for scoring
+            app_data = {
+                'id': application['id'],
+                'developer_id': user.id,
+                'cover_letter': application_data['cover_letter'],
+                'proposed_rate': application_data.get('proposed_rate'),
+                'estimated_duration': application_data.get('estimated_duration'),
+                'developer_profile': profile_response.data[0] if profile_response.data else {},
+                'past_projects': group_supabase_past_projects(past_projects_response.data).get(user.id)
             }
             
-            # Debug: Print types to ensure they're all integers
-            print(f"📊 Update payload types:")
-            for key, value in update_payload.items():
-                print(f"   {key}: {value} (type: {type(value).__name__})")
+            # Calculate AI match scores off the event loop
+            update_payload = await sync_to_async(_score_application, thread_sensitive=False)(project_response.data[0], app_data)
             
-            supabase.table('project_applications').update(update_payload).eq('id', application['id']).execute()
+            await supabase.table('project_applications').update(update_payload).eq('id', application['id']).execute()
             
             return JsonResponse({
                 'message': 'Application submitted successfully',
                 'application': {
                     'id': application['id'],
                     'project_id': project_id,
-                    'match_score': match_score,
+                    'match_score': update_payload['match_score'],
                     'status': application['status'],
                     'applied_at': application['applied_at']
                 }
@@ -904,8 +965,9 @@ def get_team_suggestions(request):
             required_skills = data.get('required_skills', [])
             budget = data.get('budget', 5000)
             team_size = data.get('team_size', 3)
+            top_k = data.get('top_k', 3)
             
-            suggestions = suggest_optimal_team(project_id, required_skills, budget, team_size)
+            suggestions = suggest_optimal_team(project_id, required_skills, budget, team_size, top_k)
             return JsonResponse({'success': True, 'suggestions': suggestions})
         except Exception as e:
             return JsonResponse({'success': False, 'error': str(e)})
@@ -968,6 +1030,7 @@ def create_project(request):
             if not response.data:
                 return JsonResponse({'error': 'Failed to create project'}, status=500)
             
+            invalidate_catalog('project created')
             project = response.data[0]
             
             return JsonResponse({
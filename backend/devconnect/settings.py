@@ -25,6 +25,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # Outermost, so endpoint latency includes every other middleware
+    'accounts.middleware.prometheus_middleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -33,6 +35,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'accounts.middleware.supabase_timing_middleware',
 ]
 
 ROOT_URLCONF = 'devconnect.urls'
@@ -63,6 +66,16 @@ DATABASES = {
     }
 }
 
+# Cache (catalog responses). Point CACHE_BACKEND/CACHE_LOCATION at a shared
+# backend (e.g. Redis or Memcached) when running more than one worker so
+# invalidations reach every process.
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.getenv('CACHE_LOCATION', 'devconnect'),
+    }
+}
+
 # Use default Django User model to avoid conflicts
 # AUTH_USER_MODEL = 'accounts.User'  # Commented out to use default
 
@@ -114,4 +127,98 @@ CORS_ALLOW_HEADERS = [
 # Supabase Configuration
 SUPABASE_URL = os.getenv('SUPABASE_URL')
 SUPABASE_KEY = os.getenv('SUPABASE_KEY')
-SUPABASE_SERVICE_ROLE_KEY = os.getenv('SUPABASE_SERVICE_ROLE_KEY')
\ No newline at end of file
+SUPABASE_SERVICE_ROLE_KEY = os.getenv('SUPABASE_SERVICE_ROLE_KEY')
+
+# Supabase round-trip instrumentation (accounts/supabase_metrics.py)
+SUPABASE_METRICS_ENABLED = os.getenv('SUPABASE_METRICS_ENABLED', 'True').lower() == 'true'
+# Warn when a single request makes more Supabase calls than this
+SUPABASE_ROUND_TRIP_BUDGET = int(os.getenv('SUPABASE_ROUND_TRIP_BUDGET', '10'))
+
+# In-memory Supabase stand-in for offline benchmarking (accounts/supabase_standin.py)
+SUPABASE_STANDIN = os.getenv('SUPABASE_STANDIN', 'False').lower() == 'true'
+SUPABASE_STANDIN_LATENCY_MS = float(os.getenv('SUPABASE_STANDIN_LATENCY_MS', '0'))
+
+# Public project catalog response cache (accounts/catalog_cache.py)
+# Only used with a shared CACHE_BACKEND when WEB_CONCURRENCY > 1
+CATALOG_CACHE_ENABLED = os.getenv('CATALOG_CACHE_ENABLED', 'True').lower() == 'true'
+CATALOG_CACHE_TTL = int(os.getenv('CATALOG_CACHE_TTL', '300'))
+
+# Cached user display names for chat/team views (accounts/user_directory.py)
+USER_DIRECTORY_TTL = int(os.getenv('USER_DIRECTORY_TTL', '600'))
+USER_DIRECTORY_MAX_SIZE = int(os.getenv('USER_DIRECTORY_MAX_SIZE', '10000'))
+
+# Push delivery for chats (accounts/chat_pubsub.py, projects/chat_stream_views.py)
+# 'local' fans out inside one process; 'redis' goes through CHAT_PUBSUB_URL
+# (a Redis server or `python manage.py run_pubsub_server`)
+CHAT_PUBSUB_BACKEND = os.getenv('CHAT_PUBSUB_BACKEND', 'local')
+CHAT_PUBSUB_URL = os.getenv('CHAT_PUBSUB_URL', 'redis://127.0.0.1:6390')
+# Seconds between keep-alive comments on an idle stream
+CHAT_STREAM_HEARTBEAT = float(os.getenv('CHAT_STREAM_HEARTBEAT', '15'))
+# Frames buffered per connected client before the oldest is dropped
+CHAT_STREAM_QUEUE_SIZE = int(os.getenv('CHAT_STREAM_QUEUE_SIZE', '100'))
+
+# Write-behind view counters (accounts/view_counters.py)
+VIEW_COUNTER_FLUSH_INTERVAL = float(os.getenv('VIEW_COUNTER_FLUSH_INTERVAL', '10'))
+# Flush early once this many rows have buffered views
+VIEW_COUNTER_MAX_PENDING = int(os.getenv('VIEW_COUNTER_MAX_PENDING', '1000'))
+
+# Assignment deadline reminders (projects/deadline_scheduler.py)
+# Opt-in. Starts only under runserver or gunicorn/uvicorn/daphne, and outside
+# runserver only with a Redis or Memcached CACHE_BACKEND (reminder dedup across workers)
+DEADLINE_SCHEDULER_ENABLED = os.getenv('DEADLINE_SCHEDULER_ENABLED', 'False').lower() == 'true'
+# Timer wheel resolution in seconds; reminders fire within one tick of their offset
+DEADLINE_SCHEDULER_TICK = int(os.getenv('DEADLINE_SCHEDULER_TICK', '60'))
+DEADLINE_REMINDER_OFFSETS_HOURS = [
+    float(hours) for hours in os.getenv('DEADLINE_REMINDER_OFFSETS_HOURS', '72,24,1').split(',') if hours.strip()
+]
+
+# Team formation search (accounts/team_formation.py)
+# Seconds before the branch-and-bound returns the best teams found so far
+TEAM_FORMATION_TIME_LIMIT = float(os.getenv('TEAM_FORMATION_TIME_LIMIT', '2.0'))
+
+# Per-developer past-project embeddings used by the matchers (projects/past_projects.py)
+PAST_PROJECT_EMBEDDING_CACHE_SIZE = int(os.getenv('PAST_PROJECT_EMBEDDING_CACHE_SIZE', '20000'))
+
+# Two-stage ranking: cross-encoder rerank of the matchers' top-K (projects/reranker.py)
+RERANK_ENABLED = os.getenv('RERANK_ENABLED', 'False').lower() == 'true'
+RERANK_MODEL = os.getenv('RERANK_MODEL', 'cross-encoder/ms-marco-MiniLM-L-6-v2')
+RERANK_TOP_K = int(os.getenv('RERANK_TOP_K', '20'))
+# Shrink K so the cross-encoder batch fits in this many milliseconds
+RERANK_LATENCY_BUDGET_MS = float(os.getenv('RERANK_LATENCY_BUDGET_MS', '300'))
+# Share of the final score taken from the cross-encoder
+RERANK_WEIGHT = float(os.getenv('RERANK_WEIGHT', '0.5'))
+
+# Micro-batched sentence embeddings for concurrent scoring (projects/embedding_batcher.py)
+EMBEDDING_BATCHER_ENABLED = os.getenv('EMBEDDING_BATCHER_ENABLED', 'True').lower() == 'true'
+# How long the first queued encode waits for others to join its batch
+EMBEDDING_BATCH_WINDOW_MS = float(os.getenv('EMBEDDING_BATCH_WINDOW_MS', '5'))
+EMBEDDING_MAX_BATCH_SIZE = int(os.getenv('EMBEDDING_MAX_BATCH_SIZE', '64'))
+
+# Startup import-time budget for Django setup plus the URLconf, enforced by
+# projects/tests.py (projects/startup_profile.py, manage.py report_cold_start)
+IMPORT_TIME_BUDGET_MS = float(os.getenv('IMPORT_TIME_BUDGET_MS', '2500'))
+
+# Shared model server for all web workers (projects/model_server.py, manage.py run_model_server)
+MODEL_SERVER_ENABLED = os.getenv('MODEL_SERVER_ENABLED', 'False').lower() == 'true'
+MODEL_SERVER_SOCKET = os.getenv('MODEL_SERVER_SOCKET', '/tmp/devconnect-models.sock')
+MODEL_SERVER_TIMEOUT = float(os.getenv('MODEL_SERVER_TIMEOUT', '30'))
+MODEL_SERVER_CLIP = os.getenv('MODEL_SERVER_CLIP', 'True').lower() == 'true'
+# Seconds between checks of the model directories for changed files (0 disables)
+MODEL_SERVER_WATCH_INTERVAL = float(os.getenv('MODEL_SERVER_WATCH_INTERVAL', '10'))
+# Seconds a replaced model set stays up for in-flight requests after a reload
+MODEL_SERVER_RELOAD_GRACE = float(os.getenv('MODEL_SERVER_RELOAD_GRACE', '30'))
+
+# Copy-on-write model preloading and per-worker thread limits (projects/model_preload.py)
+# Load and warm models in ProjectsConfig.ready(); run gunicorn with --preload so workers share them.
+# Background threads (deadline scheduler) then start in each worker after the fork, not in the master
+MODEL_PRELOAD_ENABLED = os.getenv('MODEL_PRELOAD_ENABLED', 'False').lower() == 'true'
+MODEL_PRELOAD_MODELS = [name.strip() for name in os.getenv('MODEL_PRELOAD_MODELS', 'sbert,clip').split(',') if name.strip()]
+# Worker processes per host (gunicorn reads the same variable); threads per worker = cores // this
+WEB_CONCURRENCY = int(os.getenv('WEB_CONCURRENCY', '1'))
+# Explicit torch/OpenMP threads per worker; 0 derives it from WEB_CONCURRENCY
+MODEL_THREADS_PER_WORKER = int(os.getenv('MODEL_THREADS_PER_WORKER', '0'))
+
+# Prometheus metrics at /metrics (accounts/metrics.py)
+METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'True').lower() == 'true'
+# Scraper addresses allowed besides localhost
+METRICS_ALLOWED_ADDRESSES = [addr.strip() for addr in os.getenv('METRICS_ALLOWED_ADDRESSES', '').split(',') if addr.strip()]
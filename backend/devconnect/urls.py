@@ -1,10 +1,15 @@
 from django.contrib import admin
 from django.urls import path, include
 from accounts.test_views import test_db_connection
+from accounts.status_views import catalog_cache_metrics, prometheus_metrics, supabase_metrics, view_counter_metrics
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/auth/', include('accounts.urls')),
     path('api/projects/', include('projects.urls')),
     path('test-db/', test_db_connection, name='test-db'),
+    path('metrics', prometheus_metrics, name='prometheus-metrics'),
+    path('metrics/supabase/', supabase_metrics, name='supabase-metrics'),
+    path('metrics/catalog-cache/', catalog_cache_metrics, name='catalog-cache-metrics'),
+    path('metrics/view-counters/', view_counter_metrics, name='view-counter-metrics'),
 ]
\ No newline at end of file
@@ -0,0 +1,79 @@
+"""
+Incrementally maintained application counters.
+
+Project.applications_count holds the total number of applications and
+Project.application_status_counts holds a {status: count} map. Both are
+adjusted whenever an application is created, changes status or is deleted,
+so dashboards and stats never need to count rows in project_applications.
+
+The Supabase tables are kept in sync by the trigger in
+supabase/migrations/20261019000002_project_application_counters.sql.
+"""
+
+from django.db import transaction
+from django.db.models import F
+
+from .models import Project
+
+COUNTED_STATUSES = ('pending', 'shortlisted', 'figma_pending', 'figma_submitted', 'rejected', 'selected')
+
+
+def adjust_application_counts(project_id, status_deltas, total_delta=0):
+    """
+    Apply {status: delta} and a total delta to a project's counters.
+
+    The status map is updated under a row lock so concurrent status changes
+    on the same project don't lose updates.
+    """
+    status_deltas = {status: delta for status, delta in status_deltas.items() if status and delta}
+    if not status_deltas and not total_delta:
+        return
+
+    with transaction.atomic():
+        project = Project.objects.select_for_update().only('id', 'application_status_counts').get(id=project_id)
+        counts = dict(project.application_status_counts or {})
+        for status, delta in status_deltas.items():
+            counts[status] = max(0, counts.get(status, 0) + delta)
+
+        update = {'application_status_counts': counts}
+        if total_delta:
+            update['applications_count'] = F('applications_count') + total_delta
+        Project.objects.filter(id=project_id).update(**update)
+
+
+def record_application_created(project_id, status):
+    adjust_application_counts(project_id, {status: 1}, total_delta=1)
+
+
+def record_application_deleted(project_id, status):
+    adjust_application_counts(project_id, {status: -1}, total_delta=-1)
+
+
+def record_status_change(project_id, old_status, new_status):
+    if old_status == new_status:
+        return
+    adjust_application_counts(project_id, {old_status: -1, new_status: 1})
+
+
+def record_bulk_status_change(project_id, old_status_counts, new_status):
+    """
+    Account for a queryset .update(status=...) which bypasses model save().
+
+    old_status_counts is {previous_status: number_of_rows_moved}.
+    """
+    deltas = {}
+    moved = 0
+    for old_status, count in old_status_counts.items():
+        if old_status == new_status or not count:
+            continue
+        deltas[old_status] = deltas.get(old_status, 0) - count
+        moved += count
+    if moved:
+        deltas[new_status] = deltas.get(new_status, 0) + moved
+        adjust_application_counts(project_id, deltas)
+
+
+def get_status_counts(project):
+    """Return a complete {status: count} map for a project, zero-filled."""
+    counts = project.application_status_counts or {}
+    return {status: counts.get(status, 0) for status in COUNTED_STATUSES}
@@ -1,5 +1,61 @@
+import os
+import sys
+
 from django.apps import AppConfig
+from django.conf import settings
+
+
+# Servers the app is deployed under; anything else (tests, scripts, celery) never starts background work
+SERVER_PROGRAMS = ('gunicorn', 'uvicorn', 'daphne', 'hypercorn')
+
+
+def _is_runserver():
+    if not sys.argv or os.path.basename(sys.argv[0]) != 'manage.py':
+        return False
+    if len(sys.argv) < 2 or sys.argv[1] != 'runserver':
+        return False
+    # With the autoreloader only the child process (RUN_MAIN) serves
+    return os.environ.get('RUN_MAIN') == 'true' or '--noreload' in sys.argv
+
+
+def _serving_requests():
+    """True under runserver or a known WSGI/ASGI server, not in tests, scripts or other commands."""
+    if _is_runserver():
+        return True
+    if not sys.argv or not sys.argv[0]:
+        return False
+    # `gunicorn ...` or `python -m gunicorn` (argv[0] is .../gunicorn/__main__.py)
+    parts = os.path.normpath(sys.argv[0]).split(os.sep)
+    return any(program in parts for program in SERVER_PROGRAMS)
 
 
 class ProjectsConfig(AppConfig):
     name = 'projects'
+
+    def ready(self):
+        if not _serving_requests():
+            return
+
+        # Before any model loads: per-worker torch/OpenMP/MKL thread limits
+        from .model_preload import configure_threads, preload_models
+        configure_threads()
+        if settings.MODEL_PRELOAD_ENABLED:
+            # Under `gunicorn --preload` this runs in the master, so workers share the weights
+            preload_models()
+
+        from accounts.catalog_cache import check_catalog_cache
+        check_catalog_cache()
+
+        if settings.DEADLINE_SCHEDULER_ENABLED:
+            from .deadline_scheduler import get_deadline_scheduler, shared_cache_configured
+            if not _is_runserver() and not shared_cache_configured():
+                # Every worker runs a scheduler; only a shared cache makes each reminder go out once
+                print("⚠️ Deadline scheduler not started: set CACHE_BACKEND to Redis or Memcached "
+                      "so workers don't each send every reminder")
+                return
+            if settings.MODEL_PRELOAD_ENABLED and not _is_runserver():
+                # This is the `gunicorn --preload` master: a thread started here would be dead
+                # in every worker, so each worker starts its own scheduler right after the fork
+                os.register_at_fork(after_in_child=lambda: get_deadline_scheduler().start())
+            else:
+                get_deadline_scheduler().start()
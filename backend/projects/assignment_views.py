@@ -10,6 +10,9 @@ import json
 
 from .supabase_service import ProjectSupabaseService
 from accounts.supabase_client import get_supabase_client
+from accounts.catalog_cache import invalidate_catalog
+from accounts.chat_pubsub import assignment_chat_channel, publish_chat_message
+from .deadline_scheduler import SINGLE, get_deadline_scheduler
 
 
 class ProjectAssignmentViewSet(viewsets.ViewSet):
@@ -52,6 +55,8 @@ class ProjectAssignmentViewSet(viewsets.ViewSet):
             if not assignment:
                 return Response({'error': 'Failed to create assignment'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
             
+            get_deadline_scheduler().set_assignment_deadlines(SINGLE, assignment)
+            
             # Create chat
             chat = self.service.create_chat(assignment['id'])
             
@@ -73,6 +78,7 @@ class ProjectAssignmentViewSet(viewsets.ViewSet):
             
             # Update project status
             self.supabase.table('projects').update({'status': 'in_progress'}).eq('id', project_id).execute()
+            invalidate_catalog('project in_progress')
             
             return Response(assignment, status=status.HTTP_201_CREATED)
             
@@ -140,6 +146,9 @@ class ProjectAssignmentViewSet(viewsets.ViewSet):
             if not message:
                 return Response({'error': 'Failed to create message'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
             
+            # Push to the other side if they have the chat stream open
+            publish_chat_message(assignment_chat_channel(pk), message)
+            
             return Response(message, status=status.HTTP_201_CREATED)
             
         except Exception as e:
@@ -260,6 +269,9 @@ class ProjectAssignmentViewSet(viewsets.ViewSet):
             # Update project status
             new_status = 'completed' if approved else 'review'
             self.supabase.table('projects').update({'status': new_status}).eq('id', assignment['project_id']).execute()
+            invalidate_catalog(f'project {new_status}')
+            if approved:
+                get_deadline_scheduler().remove_assignment(SINGLE, pk)
             
             # Send system message
             status_text = "approved" if approved else "needs revisions"
@@ -291,46 +303,9 @@ class ProjectAssignmentViewSet(viewsets.ViewSet):
             # Get assignments for this developer
             assignments = self.service.get_developer_assignments(developer_id)
             
-            # Process assignments to add calculated fields
-            processed_assignments = []
-            for assignment in assignments:
-                # Calculate days remaining
-                from datetime import datetime, timezone
-                now = datetime.now(timezone.utc)
-                
-                try:
-                    # Parse datetime strings and ensure they're timezone-aware
-                    figma_deadline_str = assignment['figma_deadline']
-                    submission_deadline_str = assignment['submission_deadline']
-                    
-                    # Remove 'Z' and add timezone info if needed
-                    if figma_deadline_str.endswith('Z'):
-                        figma_deadline_str = figma_deadline_str[:-1] + '+00:00'
-                    if submission_deadline_str.endswith('Z'):
-                        submission_deadline_str = submission_deadline_str[:-1] + '+00:00'
-                    
-                    figma_deadline = datetime.fromisoformat(figma_deadline_str)
-                    submission_deadline = datetime.fromisoformat(submission_deadline_str)
-                    
-                    # Ensure both datetimes are timezone-aware
-                    if figma_deadline.tzinfo is None:
-                        figma_deadline = figma_deadline.replace(tzinfo=timezone.utc)
-                    if submission_deadline.tzinfo is None:
-                        submission_deadline = submission_deadline.replace(tzinfo=timezone.utc)
-                    
-                    figma_days = max(0, (figma_deadline - now).days)
-                    submission_days = max(0, (submission_deadline - now).days)
-                    
-                except Exception as e:
-                    print(f"Error calculating days for assignment {assignment.get('id')}: {e}")
-                    figma_days = 0
-                    submission_days = 0
-                
-                processed_assignments.append({
-                    **assignment,
-                    'figma_days_remaining': figma_days,
-                    'submission_days_remaining': submission_days
-                })
+            # Days remaining come from the deadline scheduler, which keeps the
+            # parsed deadlines instead of re-parsing them per request
+            processed_assignments = get_deadline_scheduler().annotate(SINGLE, assignments)
             
             return Response(processed_assignments)
         except Exception as e:
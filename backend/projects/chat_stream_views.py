@@ -0,0 +1,151 @@
+"""
+Chat Stream Views - Server-sent event streams for assignment and team chats
+
+A client keeps one long-lived GET open per chat and receives each message as
+it is sent, instead of polling the chat history. These are async views meant
+to be served by the ASGI application (devconnect/asgi.py).
+
+EventSource can't set headers, so the access token may also be passed as
+?token=. Each event id is the message's pagination cursor: when the browser
+reconnects it sends the last one back as Last-Event-ID and the messages it
+missed are replayed before live delivery resumes.
+"""
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import JsonResponse, StreamingHttpResponse
+
+from accounts.chat_pubsub import CLOSED, assignment_chat_channel, get_broker, message_event, team_chat_channel
+from accounts.pagination import apply_keyset, decode_cursor
+from accounts.supabase_async import execute_all, get_async_supabase_client, get_user_from_token
+from accounts.supabase_client import get_supabase_client
+from accounts.user_directory import get_display_names
+
+REPLAY_LIMIT = 200
+
+
+async def _authenticate(request, supabase):
+    auth_header = request.headers.get('Authorization')
+    if not auth_header and request.GET.get('token'):
+        auth_header = f"Bearer {request.GET['token']}"
+    return await get_user_from_token(supabase, auth_header)
+
+
+async def _replay(supabase, table, chat_id, cursor, with_sender_names):
+    """Frames for messages stored after cursor (a previous event id), oldest first."""
+    cursor_values = decode_cursor(cursor)
+    if cursor_values is None:
+        return []
+    query = supabase.table(table).select('*').eq('chat_id', chat_id)
+    query = apply_keyset(query, cursor_values, descending=False)
+    response = await query.order('created_at').order('id').limit(REPLAY_LIMIT).execute()
+    rows = response.data or []
+    if with_sender_names and rows:
+        names = await sync_to_async(get_display_names, thread_sensitive=False)(
+            get_supabase_client(), [row['sender_id'] for row in rows]
+        )
+        rows = [{**row, 'sender_name': names.get(row['sender_id'], 'Unknown')} for row in rows]
+    return [message_event(row) for row in rows]
+
+
+async def _event_stream(channel, replay):
+    # Subscribe before replaying so nothing sent in between is lost; the
+    # client drops the odd duplicate by event id
+    async with get_broker().subscribe(channel) as subscription:
+        yield b'retry: 3000\n\n'
+        for frame in await replay():
+            yield frame.encode('utf-8')
+        while True:
+            frame = await subscription.next(timeout=settings.CHAT_STREAM_HEARTBEAT)
+            if frame is CLOSED:
+                break
+            if frame is None:
+                # Comment line keeps proxies from timing out an idle stream
+                yield b': keep-alive\n\n'
+                continue
+            yield frame.encode('utf-8')
+
+
+def _stream_response(channel, replay):
+    response = StreamingHttpResponse(_event_stream(channel, replay), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
+async def stream_team_chat(request, pk):
+    """Stream new messages of a team assignment's chat to a member or the owning company"""
+    if request.method != 'GET':
+        return JsonResponse({'error': 'Method not allowed'}, status=405)
+    try:
+        supabase = await get_async_supabase_client()
+        user = await _authenticate(request, supabase)
+        if not user:
+            return JsonResponse({'error': 'Invalid token'}, status=401)
+
+        assignment_response, member_response, chat_response = await execute_all(
+            supabase.table('team_assignments').select('company_id').eq('id', pk),
+            supabase.table('team_assignment_members').select('developer_id').eq('team_assignment_id', pk).eq('developer_id', user.id),
+            supabase.table('team_chats').select('id').eq('team_assignment_id', pk),
+        )
+        if not assignment_response.data:
+            return JsonResponse({'error': 'Assignment not found'}, status=404)
+        if assignment_response.data[0]['company_id'] != user.id and not member_response.data:
+            return JsonResponse({'error': 'Unauthorized'}, status=403)
+        if not chat_response.data:
+            return JsonResponse({'error': 'Chat not found'}, status=404)
+
+        chat_id = chat_response.data[0]['id']
+        last_event_id = request.headers.get('Last-Event-ID')
+
+        async def replay():
+            if not last_event_id:
+                return []
+            return await _replay(supabase, 'team_chat_messages', chat_id, last_event_id, with_sender_names=True)
+
+        return _stream_response(team_chat_channel(pk), replay)
+
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        return JsonResponse({'error': str(e)}, status=500)
+
+
+async def stream_assignment_chat(request, pk):
+    """Stream new messages of a single-developer assignment's chat to its developer or company"""
+    if request.method != 'GET':
+        return JsonResponse({'error': 'Method not allowed'}, status=405)
+    try:
+        supabase = await get_async_supabase_client()
+        user = await _authenticate(request, supabase)
+        if not user:
+            return JsonResponse({'error': 'Invalid token'}, status=401)
+
+        assignment_response, chat_response = await execute_all(
+            supabase.table('project_assignments').select('developer_id, project_id').eq('id', pk),
+            supabase.table('project_chats').select('id').eq('assignment_id', pk),
+        )
+        if not assignment_response.data:
+            return JsonResponse({'error': 'Assignment not found'}, status=404)
+
+        assignment = assignment_response.data[0]
+        if assignment['developer_id'] != user.id:
+            project_response = await supabase.table('projects').select('company_id').eq('id', assignment['project_id']).execute()
+            if not project_response.data or project_response.data[0]['company_id'] != user.id:
+                return JsonResponse({'error': 'Unauthorized'}, status=403)
+        if not chat_response.data:
+            return JsonResponse({'error': 'Chat not found'}, status=404)
+
+        chat_id = chat_response.data[0]['id']
+        last_event_id = request.headers.get('Last-Event-ID')
+
+        async def replay():
+            if not last_event_id:
+                return []
+            return await _replay(supabase, 'chat_messages', chat_id, last_event_id, with_sender_names=False)
+
+        return _stream_response(assignment_chat_channel(pk), replay)
+
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        return JsonResponse({'error': str(e)}, status=500)
@@ -0,0 +1,185 @@
+"""
+Vectorized component scoring for whole applicant pools.
+
+The five transparency scores every matcher reports are skill_match,
+experience_fit, portfolio_quality, proposal_quality and rate_fit. This module
+computes them for all of a project's applicants at once.
+
+Each applicant becomes one row of NumPy columns: a skill bitset over the
+project's required skills, years, rating, success rate, total projects,
+proposal word count and proposed rate. Every score is then a handful of array
+operations. The formulas, and their floating point evaluation order, are the
+ones the matchers used per applicant, so the dicts returned are identical to
+the old per-applicant results.
+
+FreelancerMatcher, FineTunedMatcher and SimpleMatcher all score through here:
+one row for a single application, the whole pool when ranking.
+"""
+
+import numpy as np
+from django.core.exceptions import ObjectDoesNotExist
+
+from .skill_taxonomy import skill_ids
+
+COMPONENTS = ('skill_match', 'experience_fit', 'portfolio_quality', 'proposal_quality', 'rate_fit')
+
+# Byte popcount table for counting bits in the packed skill bitsets
+_POPCOUNT_8 = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+def _float_or_none(value, default):
+    """float(value or default); None when the value can't be converted."""
+    try:
+        return float(value or default)
+    except (TypeError, ValueError, ArithmeticError):
+        return None
+
+
+class ApplicantColumns:
+    """Column arrays for one project's applicants."""
+
+    def __init__(self, required_skills, budget_min, budget_max):
+        self.required = sorted(skill_ids(required_skills))
+        self.bits = {skill_id: i for i, skill_id in enumerate(self.required)}
+        self.words = max(1, (len(self.required) + 63) // 64)
+        budget_min = _float_or_none(budget_min, 0)
+        budget_max = _float_or_none(budget_max, 1000)
+        if budget_min is None or budget_max is None:
+            self.budget_mid = None
+        else:
+            self.budget_mid = (budget_min + budget_max) / 2 if budget_max > 0 else 1000
+        self._rows = []
+
+    def add(self, skills, years, rating, success_rate, total_projects, cover_letter, proposed_rate):
+        mask = 0
+        for skill_id in skill_ids(skills):
+            bit = self.bits.get(skill_id)
+            if bit is not None:
+                mask |= 1 << bit
+        self._rows.append((
+            [(mask >> (64 * word)) & 0xFFFFFFFFFFFFFFFF for word in range(self.words)],
+            years or 0,
+            _float_or_none(rating, 0) or 0.0,
+            _float_or_none(success_rate, 50) or 50.0,
+            total_projects or 0,
+            len((cover_letter or '').split()),
+            _float_or_none(proposed_rate, 0),
+        ))
+
+    def add_profile(self, developer, application):
+        """An ORM DeveloperProfile and ProjectApplication."""
+        self.add(developer.skills, developer.years_experience, developer.rating, developer.success_rate,
+                 developer.total_projects, application.cover_letter, application.proposed_rate)
+
+    def add_supabase(self, developer_profile, application_data):
+        """developer_profiles and project_applications rows (SimpleMatcher's dicts)."""
+        self.add(developer_profile.get('skills', ''), developer_profile.get('years_experience', 0),
+                 developer_profile.get('rating', 0), developer_profile.get('success_rate', 50),
+                 developer_profile.get('total_projects', 0), application_data.get('cover_letter', ''),
+                 application_data.get('proposed_rate', 0))
+
+    def __len__(self):
+        return len(self._rows)
+
+    def score(self):
+        """{component: float64 array} for every applicant added."""
+        n = len(self._rows)
+        if not n:
+            return {name: np.zeros(0) for name in COMPONENTS}
+
+        masks, years, rating, success_rate, total_projects, words, rates = zip(*self._rows)
+        years = np.array(years, dtype=np.float64)
+        rating = np.array(rating, dtype=np.float64)
+        success_rate = np.array(success_rate, dtype=np.float64)
+        total_projects = np.array(total_projects, dtype=np.float64)
+        words = np.array(words, dtype=np.float64)
+        rate_valid = np.array([rate is not None for rate in rates])
+        rates = np.array([rate if rate is not None else 0.0 for rate in rates], dtype=np.float64)
+
+        # 1. Skill match: matched required skills / required skills
+        if self.required:
+            bitsets = np.array(masks, dtype=np.uint64).reshape(n, self.words)
+            matched = _POPCOUNT_8[bitsets.view(np.uint8)].reshape(n, -1).sum(axis=1).astype(np.float64)
+            skill_match = matched / len(self.required) * 100
+        else:
+            skill_match = np.full(n, 50.0)
+
+        # 2. Experience fit: 0-10 years -> 0-100
+        experience_fit = np.minimum(years * 10, 100)
+
+        # 3. Portfolio quality: rating 50%, success rate 30%, project count 20%
+        portfolio_quality = (
+            (rating / 5.0 * 100) * 0.5 +
+            success_rate * 0.3 +
+            np.minimum(total_projects * 5, 100) * 0.2
+        )
+
+        # 4. Proposal quality by word count
+        proposal_quality = np.select(
+            [words < 50, words < 100],
+            [words * 0.8, 40 + (words - 50) * 0.8],
+            np.minimum(80 + (words - 100) / 10, 100)
+        )
+
+        # 5. Rate fit against the budget midpoint
+        mid = self.budget_mid
+        if mid is not None and mid > 0:
+            over = np.maximum(0, 100 - ((rates - mid) / mid * 100))
+            rate_fit = np.where(rates <= mid, 100.0, over)
+            rate_fit = np.where(rate_valid & (rates > 0), rate_fit, 50.0)
+        else:
+            rate_fit = np.full(n, 50.0)
+
+        return {
+            'skill_match': skill_match,
+            'experience_fit': experience_fit,
+            'portfolio_quality': portfolio_quality,
+            'proposal_quality': proposal_quality,
+            'rate_fit': rate_fit,
+        }
+
+    def score_dicts(self):
+        """Per-applicant {component: float} dicts, in the order applicants were added."""
+        columns = {name: values.tolist() for name, values in self.score().items()}
+        return [
+            {name: columns[name][i] for name in COMPONENTS}
+            for i in range(len(self._rows))
+        ]
+
+
+def score_applications(project, applications):
+    """Component scores for ORM ProjectApplications (developer profile preloaded)."""
+    columns = ApplicantColumns(project.tech_stack, project.budget_min, project.budget_max)
+    for application in applications:
+        columns.add_profile(application.developer.developerprofile, application)
+    return columns.score_dicts()
+
+
+def scorable_applications(applications):
+    """
+    Applications whose developer has a profile. The rest are reported and
+    dropped here, so one of them can't fail a pooled pass.
+    """
+    scorable = []
+    for application in applications:
+        try:
+            application.developer.developerprofile
+        except ObjectDoesNotExist:
+            print(f"  ⚠ Skipping application {application.id}: developer has no profile")
+            continue
+        scorable.append(application)
+    return scorable
+
+
+def score_application(project, developer, application):
+    columns = ApplicantColumns(project.tech_stack, project.budget_min, project.budget_max)
+    columns.add_profile(developer, application)
+    return columns.score_dicts()[0]
+
+
+def score_supabase_application(project_data, developer_profile, application_data):
+    columns = ApplicantColumns(
+        project_data.get('tech_stack', []), project_data.get('budget_min', 0), project_data.get('budget_max', 1000)
+    )
+    columns.add_supabase(developer_profile, application_data)
+    return columns.score_dicts()[0]
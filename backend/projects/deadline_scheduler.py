@@ -0,0 +1,463 @@
+"""
+In-process deadline scheduler for assignment reminders.
+
+The Figma and submission deadlines of team and single-developer assignments
+are held in a hierarchical timer wheel. It has four levels of 64 slots over
+DEADLINE_SCHEDULER_TICK-second ticks; with the default one-minute tick it
+spans about 31 years. Scheduling, rescheduling and cancelling are O(1). Each
+tick touches one slot, and a timer moves down a level at most three times
+before it fires.
+
+Every deadline keeps one timer, armed for its next reminder offset
+(DEADLINE_REMINDER_OFFSETS_HOURS, e.g. 72, 24 and 1 hours before). When it
+fires, members get an inbox notification and a system message in the
+assignment chat, and the timer is re-armed for the next offset. A final timer
+at the deadline itself drops the entry, so memory tracks pending deadlines
+only.
+
+The wheel is loaded from Supabase when the scheduler starts. Views that create
+assignments or change deadlines keep it current, and days-remaining values
+are served from it instead of re-parsing ISO strings per request. A process
+whose scheduler was never started tracks nothing and computes days-remaining
+from the row. Completed or deleted assignments are dropped when their next
+reminder comes due.
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.cache import cache
+
+SINGLE = 'single'
+TEAM = 'team'
+SOURCE_TABLES = {SINGLE: 'project_assignments', TEAM: 'team_assignments'}
+DEADLINE_FIELDS = ('figma_deadline', 'submission_deadline')
+DEADLINE_LABELS = {'figma_deadline': 'Figma design', 'submission_deadline': 'final project'}
+
+WHEEL_BITS = 6
+WHEEL_SIZE = 1 << WHEEL_BITS
+WHEEL_MASK = WHEEL_SIZE - 1
+WHEEL_LEVELS = 4
+MAX_TICKS = 1 << (WHEEL_BITS * WHEEL_LEVELS)
+
+LOAD_PAGE_SIZE = 1000
+
+logger = logging.getLogger(__name__)
+
+# Backends where cache.add() is an atomic cross-process lock, so one worker wins each reminder
+SHARED_CACHE_BACKENDS = (
+    'django.core.cache.backends.redis.RedisCache',
+    'django.core.cache.backends.memcached.PyMemcacheCache',
+    'django.core.cache.backends.memcached.PyLibMCCache',
+)
+
+
+class _Timer:
+    __slots__ = ('key', 'expires', 'payload', 'slot')
+
+
+class TimerWheel:
+    """
+    Hierarchical timing wheel of keyed timers, in integer ticks.
+
+    Not thread-safe; DeadlineScheduler serialises access.
+    """
+
+    def __init__(self, current_tick):
+        # Next tick advance() will process
+        self.current = current_tick
+        self._levels = [[{} for _ in range(WHEEL_SIZE)] for _ in range(WHEEL_LEVELS)]
+        self._timers = {}
+
+    def __len__(self):
+        return len(self._timers)
+
+    def __contains__(self, key):
+        return key in self._timers
+
+    def schedule(self, key, expires, payload=None):
+        """Arm (or re-arm) key to fire at tick expires."""
+        timer = self._timers.get(key)
+        if timer is None:
+            timer = _Timer()
+            timer.key = key
+            self._timers[key] = timer
+        else:
+            del timer.slot[key]
+        timer.expires = expires
+        timer.payload = payload
+        self._place(timer)
+
+    def cancel(self, key):
+        timer = self._timers.pop(key, None)
+        if timer is None:
+            return False
+        del timer.slot[key]
+        return True
+
+    def _place(self, timer):
+        delta = timer.expires - self.current
+        if delta < 0:
+            # Already due: fire on the tick being processed next
+            slot = self._levels[0][self.current & WHEEL_MASK]
+        else:
+            if delta >= MAX_TICKS:
+                timer.expires = self.current + MAX_TICKS - 1
+                delta = MAX_TICKS - 1
+            level = 0
+            while delta >= 1 << (WHEEL_BITS * (level + 1)):
+                level += 1
+            slot = self._levels[level][(timer.expires >> (WHEEL_BITS * level)) & WHEEL_MASK]
+        slot[timer.key] = timer
+        timer.slot = slot
+
+    def _cascade(self, level, index):
+        timers = self._levels[level][index]
+        self._levels[level][index] = {}
+        for timer in timers.values():
+            self._place(timer)
+
+    def advance(self, target_tick):
+        """Process ticks up to and including target_tick; return [(key, payload)] of fired timers."""
+        if not self._timers:
+            self.current = max(self.current, target_tick + 1)
+            return []
+
+        fired = []
+        while self.current <= target_tick:
+            index = self.current & WHEEL_MASK
+            if index == 0:
+                # Level 0 wrapped: pull the next slot of each higher level down
+                for level in range(1, WHEEL_LEVELS):
+                    level_index = (self.current >> (WHEEL_BITS * level)) & WHEEL_MASK
+                    self._cascade(level, level_index)
+                    if level_index:
+                        break
+            slot = self._levels[0][index]
+            if slot:
+                self._levels[0][index] = {}
+                for timer in slot.values():
+                    del self._timers[timer.key]
+                    fired.append((timer.key, timer.payload))
+            self.current += 1
+        return fired
+
+
+@lru_cache(maxsize=65536)
+def _parse_iso(value):
+    parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return int(parsed.timestamp())
+
+
+def parse_deadline(value):
+    """ISO string, datetime or epoch seconds -> epoch seconds, or None. ISO parses are cached."""
+    if not value:
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return int(value.timestamp())
+    try:
+        return _parse_iso(value)
+    except ValueError:
+        return None
+
+
+class DeadlineScheduler:
+    def __init__(self, tick_seconds, offsets_hours):
+        self.tick_seconds = tick_seconds
+        # Seconds before the deadline, furthest first
+        self.offsets = sorted({int(hours * 3600) for hours in offsets_hours if hours > 0}, reverse=True)
+        self._lock = threading.Lock()
+        self._wheel = TimerWheel(self._tick(time.time()))
+        # (source, assignment_id, field) -> deadline epoch seconds
+        self._deadlines = {}
+        self._thread = None
+        self._stop = threading.Event()
+        # Set by start(). Until then nothing would fire or prune tracked
+        # entries, so set_deadline() ignores them and start() loads them all.
+        self.tracking = False
+        self.loaded_at = None
+        self.reminders_sent = 0
+        self.dispatch_errors = 0
+
+    def _tick(self, epoch):
+        return int(epoch // self.tick_seconds)
+
+    def _arm(self, key, deadline, now):
+        """Schedule key's next reminder after now, or the expiry marker once reminders are used up."""
+        for step, offset in enumerate(self.offsets):
+            if deadline - offset > now:
+                self._wheel.schedule(key, self._tick(deadline - offset), step)
+                return
+        if deadline > now:
+            self._wheel.schedule(key, self._tick(deadline), len(self.offsets))
+        else:
+            self._wheel.cancel(key)
+            self._deadlines.pop(key, None)
+
+    def set_deadline(self, source, assignment_id, field, value, now=None):
+        """Track (or move) a deadline; None clears it. A no-op until tracking is on."""
+        if not self.tracking:
+            return
+        key = (source, str(assignment_id), field)
+        deadline = parse_deadline(value)
+        now = now if now is not None else time.time()
+        with self._lock:
+            if deadline is None or deadline <= now:
+                self._wheel.cancel(key)
+                self._deadlines.pop(key, None)
+                return
+            if self._deadlines.get(key) == deadline:
+                return
+            self._deadlines[key] = deadline
+            self._arm(key, deadline, now)
+
+    def set_assignment_deadlines(self, source, assignment):
+        """Track both deadlines of an assignment row."""
+        for field in DEADLINE_FIELDS:
+            if field in assignment:
+                self.set_deadline(source, assignment['id'], field, assignment[field])
+
+    def remove_assignment(self, source, assignment_id):
+        """Stop tracking an assignment's deadlines (completed or deleted)."""
+        with self._lock:
+            for field in DEADLINE_FIELDS:
+                key = (source, str(assignment_id), field)
+                self._wheel.cancel(key)
+                self._deadlines.pop(key, None)
+
+    def days_remaining(self, source, assignment_id, field, value=None, now=None):
+        """
+        Whole days until the deadline, floored at 0.
+
+        value is the row's current ISO deadline; when it differs from what is
+        tracked (changed by another worker) a started scheduler picks it up.
+        """
+        now = now if now is not None else time.time()
+        deadline = parse_deadline(value) if value is not None else None
+        if deadline is not None:
+            if self.tracking:
+                with self._lock:
+                    tracked = self._deadlines.get((source, str(assignment_id), field))
+                if tracked != deadline and deadline > now:
+                    self.set_deadline(source, assignment_id, field, deadline, now)
+        else:
+            with self._lock:
+                deadline = self._deadlines.get((source, str(assignment_id), field))
+        if deadline is None:
+            return 0
+        return max(0, int((deadline - now) // 86400))
+
+    def annotate(self, source, assignments):
+        """Add figma_days_remaining / submission_days_remaining to assignment rows."""
+        now = time.time()
+        return [
+            {
+                **assignment,
+                'figma_days_remaining': self.days_remaining(source, assignment['id'], 'figma_deadline', assignment.get('figma_deadline'), now),
+                'submission_days_remaining': self.days_remaining(source, assignment['id'], 'submission_deadline', assignment.get('submission_deadline'), now),
+            }
+            for assignment in assignments
+        ]
+
+    def run_due(self, now=None):
+        """Fire everything due by now. Returns the number of reminders dispatched."""
+        now = now if now is not None else time.time()
+        reminders = []
+        with self._lock:
+            for key, step in self._wheel.advance(self._tick(now)):
+                deadline = self._deadlines.get(key)
+                if deadline is None:
+                    continue
+                if step < len(self.offsets):
+                    reminders.append((key, deadline, step))
+                self._arm(key, deadline, now)
+
+        for key, deadline, step in reminders:
+            # The shared cache (required outside runserver) lets only one worker send each reminder
+            dedup_key = f'deadline-reminder:{key[0]}:{key[1]}:{key[2]}:{deadline}:{step}'
+            if not cache.add(dedup_key, 1, timeout=self.offsets[step] + 3600):
+                continue
+            try:
+                if send_deadline_reminder(*key, deadline):
+                    self.reminders_sent += 1
+                else:
+                    # Deleted or completed: stop tracking the assignment
+                    self.remove_assignment(key[0], key[1])
+            except Exception:
+                self.dispatch_errors += 1
+                logger.exception("Deadline reminder for %s failed", key)
+        return len(reminders)
+
+    def load(self):
+        """Track every future deadline stored in Supabase."""
+        from accounts.supabase_client import get_supabase_client
+
+        supabase = get_supabase_client()
+        now_iso = datetime.now(timezone.utc).isoformat()
+        loaded = 0
+        for source, table in SOURCE_TABLES.items():
+            start = 0
+            while True:
+                response = supabase.table(table).select('id, figma_deadline, submission_deadline').gt(
+                    'submission_deadline', now_iso
+                ).order('id').range(start, start + LOAD_PAGE_SIZE - 1).execute()
+                rows = response.data or []
+                for row in rows:
+                    self.set_assignment_deadlines(source, row)
+                loaded += len(rows)
+                if len(rows) < LOAD_PAGE_SIZE:
+                    break
+                start += LOAD_PAGE_SIZE
+        self.loaded_at = time.time()
+        print(f"⏰ Deadline scheduler tracking {len(self._deadlines)} deadlines from {loaded} assignments")
+
+    def start(self):
+        with self._lock:
+            if self._thread is not None:
+                return
+            self.tracking = True
+            self._thread = threading.Thread(target=self._run, name='deadline-scheduler', daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        try:
+            self.load()
+        except Exception as e:
+            print(f"⚠️ Deadline scheduler could not load deadlines: {e}")
+        while not self._stop.wait(self.tick_seconds):
+            try:
+                self.run_due()
+            except Exception as e:
+                print(f"⚠️ Deadline scheduler tick failed: {e}")
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'tracked_deadlines': len(self._deadlines),
+                'armed_timers': len(self._wheel),
+                'tick_seconds': self.tick_seconds,
+                'reminder_offsets_hours': [offset / 3600 for offset in self.offsets],
+                'running': self._thread is not None and self._thread.is_alive(),
+                'loaded_at': self.loaded_at,
+                'reminders_sent': self.reminders_sent,
+                'dispatch_errors': self.dispatch_errors,
+            }
+
+
+def shared_cache_configured():
+    """True when the default cache is shared by all workers (reminder dedup needs it)."""
+    return settings.CACHES['default']['BACKEND'] in SHARED_CACHE_BACKENDS
+
+
+def _hours_left(deadline):
+    hours = max(0, round((deadline - time.time()) / 3600))
+    if hours >= 48:
+        return f"{round(hours / 24)} days"
+    return f"{hours} hour{'s' if hours != 1 else ''}"
+
+
+def _completed(assignment):
+    return (assignment.get('project') or {}).get('status') == 'completed'
+
+
+def send_deadline_reminder(source, assignment_id, field, deadline):
+    """
+    Post a chat system message and inbox notifications for an upcoming
+    deadline. Returns False, sending nothing, when the assignment was deleted
+    or its project completed.
+    """
+    from accounts.chat_pubsub import assignment_chat_channel, publish_chat_message, team_chat_channel
+    from accounts.supabase_client import get_supabase_client
+    from accounts.user_directory import get_emails
+    from .notification_inbox import build_notification, notify_many
+
+    supabase = get_supabase_client()
+    label = DEADLINE_LABELS[field]
+    due = datetime.fromtimestamp(deadline, timezone.utc)
+    text = f"⏰ Reminder: the {label} is due in {_hours_left(deadline)} ({due.strftime('%B %d, %Y %H:%M')} UTC)."
+
+    if source == TEAM:
+        assignment_response = supabase.table('team_assignments').select(
+            'id, company_id, team_name, project:project_id (status)'
+        ).eq('id', assignment_id).execute()
+        if not assignment_response.data or _completed(assignment_response.data[0]):
+            return False
+        assignment = assignment_response.data[0]
+        members_response = supabase.table('team_assignment_members').select('developer_id').eq('team_assignment_id', assignment_id).execute()
+        recipient_ids = [member['developer_id'] for member in members_response.data or []]
+        chat_response = supabase.table('team_chats').select('id').eq('team_assignment_id', assignment_id).execute()
+        if chat_response.data:
+            message_response = supabase.table('team_chat_messages').insert({
+                'chat_id': chat_response.data[0]['id'],
+                'sender_id': assignment['company_id'],
+                'message': text,
+                'message_type': 'system',
+                'created_at': datetime.now(timezone.utc).isoformat()
+            }).execute()
+            if message_response.data:
+                publish_chat_message(team_chat_channel(assignment_id), {**message_response.data[0], 'sender_name': 'DevConnect'})
+        title = f"{label.capitalize()} due soon for {assignment.get('team_name') or 'your team'}"
+    else:
+        assignment_response = supabase.table('project_assignments').select(
+            'id, developer_id, project:project_id (company_id, status)'
+        ).eq('id', assignment_id).execute()
+        if not assignment_response.data or _completed(assignment_response.data[0]):
+            return False
+        assignment = assignment_response.data[0]
+        recipient_ids = [assignment['developer_id']]
+        # Posted as the company, like the team reminder, never as the developer
+        company_id = (assignment.get('project') or {}).get('company_id')
+        chat_response = supabase.table('project_chats').select('id').eq('assignment_id', assignment_id).execute()
+        if chat_response.data and company_id:
+            message_response = supabase.table('chat_messages').insert({
+                'chat_id': chat_response.data[0]['id'],
+                'sender_id': company_id,
+                'message': text,
+                'message_type': 'system'
+            }).execute()
+            if message_response.data:
+                publish_chat_message(assignment_chat_channel(assignment_id), message_response.data[0])
+        title = f"{label.capitalize()} due soon"
+
+    emails = get_emails(supabase, recipient_ids)
+    notify_many([
+        build_notification(
+            email,
+            'deadline_reminder',
+            title,
+            text,
+            source_id=assignment_id,
+            data={'assignment_type': source, 'assignment_id': assignment_id, 'field': field, 'deadline': due.isoformat()}
+        )
+        for email in emails.values()
+    ])
+    return True
+
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def get_deadline_scheduler():
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = DeadlineScheduler(
+                    settings.DEADLINE_SCHEDULER_TICK,
+                    settings.DEADLINE_REMINDER_OFFSETS_HOURS
+                )
+    return _scheduler
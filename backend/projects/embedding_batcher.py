@@ -0,0 +1,191 @@
+"""
+Micro-batching front end for a sentence-embedding model.
+
+Concurrent scoring requests each encode one or two sentences. Run directly,
+that is one tiny forward pass per call. EmbeddingBatcher queues those calls
+instead. A worker thread gathers them for up to EMBEDDING_BATCH_WINDOW_MS
+after the first one arrives, or until EMBEDDING_MAX_BATCH_SIZE texts are
+waiting. It runs a single batched encode(), then hands each caller back its
+own rows.
+
+A wider window gives bigger batches and more throughput, at the cost of up
+to one window of added latency per call. `python manage.py
+benchmark_embedding_batcher` measures both against direct calls.
+
+encode() accepts the same call shapes the matchers use on SentenceTransformer
+(a str returns one vector, a list returns one row per text), so a batcher can
+stand in for the model.
+"""
+
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+from django.conf import settings
+
+from .ml_imports import sentence_transformers
+
+
+# Queued by stop(); the worker exits when it reaches it
+_STOP = object()
+
+
+class _Request:
+    __slots__ = ('texts', 'future')
+
+    def __init__(self, texts):
+        self.texts = texts
+        self.future = Future()
+
+
+class EmbeddingBatcher:
+    """Queue of encode requests served by one batching worker thread."""
+
+    def __init__(self, model, window_ms: float, max_batch_size: int):
+        self.model = model
+        self.window = window_ms / 1000
+        self.max_batch_size = max_batch_size
+        self._queue = queue.Queue()
+        self._carry = None  # request that didn't fit the previous batch
+        self._lock = threading.Lock()
+        self._worker = None
+        self.batches = 0
+        self.texts = 0
+        self.largest_batch = 0
+
+    def start(self):
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name='embedding-batcher', daemon=True)
+                self._worker.start()
+
+    def stop(self):
+        """Let the worker exit once the requests queued so far are served."""
+        self._queue.put(_STOP)
+
+    def encode(self, sentences: Union[str, List[str]], convert_to_tensor: bool = False, **kwargs) -> np.ndarray:
+        """
+        Embed through the shared batch. Model keyword arguments
+        (convert_to_tensor, batch_size, show_progress_bar...) are accepted for
+        compatibility and ignored: the worker always returns NumPy rows.
+        """
+        single = isinstance(sentences, str)
+        texts = [sentences] if single else list(sentences)
+        if not texts:
+            return np.zeros((0, 0))
+        if self._worker is None:
+            self.start()
+
+        request = _Request(texts)
+        self._queue.put(request)
+        embeddings = request.future.result()
+        return embeddings[0] if single else embeddings
+
+    def _next_batch(self) -> Optional[List[_Request]]:
+        """
+        Block for the first request, then gather until the window closes or
+        the batch is full. None once stop() has been called.
+        """
+        first = self._carry or self._queue.get()
+        self._carry = None
+        if first is _STOP:
+            return None
+        batch, size = [first], len(first.texts)
+        deadline = time.monotonic() + self.window
+        while size < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                request = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if request is _STOP or size + len(request.texts) > self.max_batch_size:
+                self._carry = request
+                break
+            batch.append(request)
+            size += len(request.texts)
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            texts = [text for request in batch for text in request.texts]
+            try:
+                embeddings = np.asarray(self.model.encode(
+                    texts,
+                    batch_size=len(texts),
+                    convert_to_numpy=True,
+                    show_progress_bar=False
+                ))
+            except Exception as e:
+                for request in batch:
+                    request.future.set_exception(e)
+                continue
+
+            self.batches += 1
+            self.texts += len(texts)
+            self.largest_batch = max(self.largest_batch, len(texts))
+            offset = 0
+            for request in batch:
+                request.future.set_result(embeddings[offset:offset + len(request.texts)])
+                offset += len(request.texts)
+
+    def snapshot(self) -> Dict:
+        return {
+            'batches': self.batches,
+            'texts': self.texts,
+            'mean_batch_size': round(self.texts / self.batches, 2) if self.batches else 0,
+            'largest_batch': self.largest_batch,
+            'queued': self._queue.qsize(),
+            'window_ms': self.window * 1000,
+            'max_batch_size': self.max_batch_size,
+        }
+
+
+# model path -> batcher, so every matcher instance shares one loaded model
+_batchers = {}
+_batchers_lock = threading.Lock()
+
+
+def _reset_after_fork():
+    # Worker threads don't survive a fork (model preloading); each child starts its own
+    global _batchers_lock
+    _batchers_lock = threading.Lock()
+    for batcher in _batchers.values():
+        batcher._queue = queue.Queue()
+        batcher._lock = threading.Lock()
+        batcher._carry = None
+        batcher._worker = None
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def batcher_snapshots() -> Dict[str, Dict]:
+    """snapshot() of every batcher in this process, by model directory name."""
+    return {os.path.basename(model_dir.rstrip('/')): batcher.snapshot() for model_dir, batcher in list(_batchers.items())}
+
+
+def get_embedding_batcher(model_dir: Optional[str] = None) -> EmbeddingBatcher:
+    """Process-wide batcher over the SentenceTransformer at model_dir (fine_tuned_model by default)."""
+    model_dir = model_dir or os.path.join(settings.BASE_DIR, 'fine_tuned_model')
+    batcher = _batchers.get(model_dir)
+    if batcher is None:
+        with _batchers_lock:
+            batcher = _batchers.get(model_dir)
+            if batcher is None:
+                batcher = EmbeddingBatcher(
+                    sentence_transformers.SentenceTransformer(model_dir),
+                    settings.EMBEDDING_BATCH_WINDOW_MS,
+                    settings.EMBEDDING_MAX_BATCH_SIZE,
+                )
+                batcher.start()
+                _batchers[model_dir] = batcher
+    return batcher
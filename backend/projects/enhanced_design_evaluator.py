@@ -4,18 +4,19 @@ Provides more accurate and detailed evaluation of Figma designs
 """
 
 import re
+import numpy as np
 import requests
 from io import BytesIO
 from typing import List, Dict, Any
 
-try:
-    import torch
-    import open_clip
-    from PIL import Image
-    import numpy as np
-    OPENCLIP_AVAILABLE = True
-except ImportError:
-    OPENCLIP_AVAILABLE = False
+from django.conf import settings
+
+# torch/open_clip are imported on first use, not when figma_views loads
+from projects.ml_imports import Image, is_available, open_clip, torch
+from projects.model_server import get_model_client
+from accounts.metrics import timed
+
+OPENCLIP_AVAILABLE = is_available('torch', 'open_clip', 'PIL')
 
 
 class EnhancedDesignEvaluator:
@@ -25,15 +26,22 @@ class EnhancedDesignEvaluator:
     """
     
     def __init__(self):
-        if not OPENCLIP_AVAILABLE:
-            raise ImportError("OpenCLIP not installed")
-        
         self.model = None
         self.preprocess = None
         self.tokenizer = None
+        # With the model server, CLIP runs there and nothing is loaded here
+        self.remote = get_model_client() if settings.MODEL_SERVER_ENABLED else None
+        if self.remote:
+            self.device = "model_server"
+            return
+        
+        if not OPENCLIP_AVAILABLE:
+            raise ImportError("OpenCLIP not installed")
+        
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
         self._initialize_model()
     
+    @timed('model_load_duration_seconds', model='openclip_enhanced')
     def _initialize_model(self):
         """Initialize OpenCLIP model"""
         self.model, _, self.preprocess = open_clip.create_model_and_transforms(
@@ -48,6 +56,10 @@ class EnhancedDesignEvaluator:
     def load_image_from_url(self, image_url):
         """Load and preprocess image from URL"""
         try:
+            if self.remote:
+                # The server's normalised image embedding stands in for the tensor
+                return self.remote.clip_image(image_url)
+            
             response = requests.get(image_url, timeout=10)
             response.raise_for_status()
             image = Image.open(BytesIO(response.content)).convert('RGB')
@@ -114,6 +126,11 @@ class EnhancedDesignEvaluator:
     def compute_visual_text_similarity(self, image_tensor, text):
         """Compute CLIP similarity score"""
         try:
+            if self.remote:
+                # Prompt embeddings are cached by the client
+                similarity = float(np.dot(image_tensor, self.remote.clip_text([text])[0]))
+                return max(0, min(100, (similarity + 1) / 2 * 100))
+            
             text_tokens = self.tokenizer([text]).to(self.device)
             
             with torch.no_grad():
@@ -263,6 +280,7 @@ class EnhancedDesignEvaluator:
         
         return sum(scores) / len(scores)
     
+    @timed('design_evaluation_duration_seconds', evaluator='enhanced')
     def evaluate_multiple_designs(self, project_description, submissions):
         """
         Evaluate multiple design submissions and rank them
@@ -345,7 +363,7 @@ _enhanced_evaluator = None
 
 def get_enhanced_evaluator():
     """Get or create enhanced evaluator instance"""
-    if not OPENCLIP_AVAILABLE:
+    if not OPENCLIP_AVAILABLE and not settings.MODEL_SERVER_ENABLED:
         raise ImportError("OpenCLIP not installed")
     
     global _enhanced_evaluator
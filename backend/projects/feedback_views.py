@@ -2,10 +2,34 @@ from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 from .models import Project, ProjectSubmission, SubmissionFeedback, ProjectAssignment
+from .notification_inbox import build_notification, mark_sources_read, notify_many
+from .rating_aggregates import average_ratings, get_rating_aggregate, rating_distribution, record_feedback_batch
 from accounts.supabase_service import SupabaseService
 import json
-from django.db.models import Avg, Count, Q
-from django.db import models
+import logging
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+
+def feedback_notification(feedback):
+    """Inbox entry telling the developer about new feedback"""
+    return build_notification(
+        feedback.developer.email,
+        'feedback',
+        f"New feedback on {feedback.project.title}",
+        feedback.feedback_text,
+        source_id=feedback.id,
+        data={'project_id': feedback.project_id, 'rating': feedback.rating}
+    )
+
+
+def send_feedback_notifications(feedbacks):
+    """Inbox entries for new feedback; the feedback itself is already saved, so failures are only logged"""
+    try:
+        notify_many([feedback_notification(feedback) for feedback in feedbacks])
+    except Exception:
+        logger.exception("Could not send feedback notifications")
 
 
 @csrf_exempt
@@ -53,6 +77,8 @@ def submit_feedback(request):
             professionalism_rating=data.get('professionalism_rating')
         )
         
+        send_feedback_notifications([feedback])
+        
         # Update developer's average rating in Supabase
         update_developer_rating(submission.developer.email)
         
@@ -84,33 +110,36 @@ def submit_team_feedback(request):
         project_id = data.get('project_id')
         team_feedbacks = data.get('team_feedbacks', [])  # Array of feedback objects
         
-        created_feedbacks = []
-        
+        # Load every member's assignment and submission, and any feedback
+        # already given, up front instead of per member
+        developer_emails = [feedback_data.get('developer_email') for feedback_data in team_feedbacks]
+        assignments = {
+            assignment.developer.email: assignment
+            for assignment in ProjectAssignment.objects.filter(
+                project_id=project_id,
+                developer__email__in=developer_emails
+            ).select_related('developer', 'project__company', 'submission')
+        }
+        already_reviewed = set(SubmissionFeedback.objects.filter(
+            submission__assignment__in=assignments.values()
+        ).values_list('submission_id', 'developer_id'))
+        
+        new_feedbacks = []
         for feedback_data in team_feedbacks:
-            developer_email = feedback_data.get('developer_email')
-            
-            # Get developer's submission
+            assignment = assignments.get(feedback_data.get('developer_email'))
+            if not assignment:
+                continue
             try:
-                assignment = ProjectAssignment.objects.get(
-                    project_id=project_id,
-                    developer__email=developer_email
-                )
                 submission = assignment.submission
-            except (ProjectAssignment.DoesNotExist, ProjectSubmission.DoesNotExist):
+            except ProjectSubmission.DoesNotExist:
                 continue
             
-            # Check if feedback already exists
-            existing = SubmissionFeedback.objects.filter(
-                submission=submission,
-                developer=assignment.developer
-            ).first()
-            
-            if existing:
+            # Skip members who already have feedback
+            if (submission.id, assignment.developer_id) in already_reviewed:
                 continue
             
-            # Create feedback
-            feedback = SubmissionFeedback.objects.create(
-                project_id=project_id,
+            new_feedbacks.append(SubmissionFeedback(
+                project=assignment.project,
                 submission=submission,
                 developer=assignment.developer,
                 company=assignment.project.company,
@@ -120,12 +149,18 @@ def submit_team_feedback(request):
                 quality_rating=feedback_data.get('quality_rating'),
                 timeliness_rating=feedback_data.get('timeliness_rating'),
                 professionalism_rating=feedback_data.get('professionalism_rating')
-            )
-            
-            created_feedbacks.append(feedback.id)
-            
-            # Update developer rating
-            update_developer_rating(developer_email)
+            ))
+        
+        with transaction.atomic():
+            created = SubmissionFeedback.objects.bulk_create(new_feedbacks)
+            # bulk_create skips save(), so update the rating aggregates here
+            record_feedback_batch(created)
+        send_feedback_notifications(created)
+        created_feedbacks = [feedback.id for feedback in created]
+        
+        # Update developer ratings
+        for feedback in created:
+            update_developer_rating(feedback.developer.email)
         
         return JsonResponse({
             'success': True,
@@ -169,28 +204,12 @@ def get_developer_feedback(request, developer_email):
                 'created_at': feedback.created_at.isoformat()
             })
         
-        # Calculate average ratings
-        avg_ratings = SubmissionFeedback.objects.filter(
-            developer__email=developer_email
-        ).aggregate(
-            avg_rating=Avg('rating'),
-            avg_communication=Avg('communication_rating'),
-            avg_quality=Avg('quality_rating'),
-            avg_timeliness=Avg('timeliness_rating'),
-            avg_professionalism=Avg('professionalism_rating'),
-            total_reviews=Count('id')
-        )
+        # Averages come from the maintained aggregate, not the feedback rows
+        aggregate = get_rating_aggregate(developer_email)
         
         return JsonResponse({
             'feedbacks': feedback_list,
-            'average_ratings': {
-                'overall': round(avg_ratings['avg_rating'] or 0, 2),
-                'communication': round(avg_ratings['avg_communication'] or 0, 2),
-                'quality': round(avg_ratings['avg_quality'] or 0, 2),
-                'timeliness': round(avg_ratings['avg_timeliness'] or 0, 2),
-                'professionalism': round(avg_ratings['avg_professionalism'] or 0, 2),
-                'total_reviews': avg_ratings['total_reviews']
-            }
+            'average_ratings': average_ratings(aggregate)
         })
         
     except Exception as e:
@@ -235,6 +254,7 @@ def mark_feedback_read(request, feedback_id):
         feedback = SubmissionFeedback.objects.get(id=feedback_id)
         feedback.is_read = True
         feedback.save()
+        mark_sources_read('feedback', [feedback.id])
         
         return JsonResponse({'success': True, 'message': 'Feedback marked as read'})
         
@@ -255,29 +275,13 @@ def get_developer_rating_summary(request, developer_email):
         if not developer:
             return JsonResponse({'error': 'Developer not found'}, status=404)
         
-        # Get rating statistics
-        stats = SubmissionFeedback.objects.filter(
-            developer__email=developer_email
-        ).aggregate(
-            avg_rating=Avg('rating'),
-            total_reviews=Count('id'),
-            five_star=Count('id', filter=models.Q(rating=5)),
-            four_star=Count('id', filter=models.Q(rating=4)),
-            three_star=Count('id', filter=models.Q(rating=3)),
-            two_star=Count('id', filter=models.Q(rating=2)),
-            one_star=Count('id', filter=models.Q(rating=1))
-        )
+        # One lookup of the maintained aggregate
+        aggregate = get_rating_aggregate(developer_email)
         
         return JsonResponse({
-            'average_rating': round(stats['avg_rating'] or 0, 2),
-            'total_reviews': stats['total_reviews'],
-            'rating_distribution': {
-                '5': stats['five_star'],
-                '4': stats['four_star'],
-                '3': stats['three_star'],
-                '2': stats['two_star'],
-                '1': stats['one_star']
-            }
+            'average_rating': average_ratings(aggregate)['overall'],
+            'total_reviews': aggregate.total_reviews if aggregate else 0,
+            'rating_distribution': rating_distribution(aggregate)
         })
         
     except Exception as e:
@@ -287,20 +291,14 @@ def get_developer_rating_summary(request, developer_email):
 def update_developer_rating(developer_email):
     """Update developer's average rating in Supabase"""
     try:
-        avg_rating = SubmissionFeedback.objects.filter(
-            developer__email=developer_email
-        ).aggregate(avg_rating=Avg('rating'))['avg_rating']
-        
-        total_reviews = SubmissionFeedback.objects.filter(
-            developer__email=developer_email
-        ).count()
+        aggregate = get_rating_aggregate(developer_email)
         
-        if avg_rating:
+        if aggregate and aggregate.total_reviews:
             supabase = SupabaseService()
             supabase.update_developer_rating(
                 developer_email,
-                round(avg_rating, 2),
-                total_reviews
+                average_ratings(aggregate)['overall'],
+                aggregate.total_reviews
             )
     except Exception as e:
         print(f"Error updating developer rating: {e}")
@@ -9,10 +9,16 @@ from django.views.decorators.csrf import csrf_exempt
 from django.utils import timezone
 from datetime import timedelta
 import json
+import logging
 
 from projects.openclip_service import get_openclip_evaluator
 from projects.enhanced_design_evaluator import get_enhanced_evaluator
 from accounts.supabase_service import get_supabase_client
+from accounts.catalog_cache import invalidate_catalog
+from projects.rejection_service import reject_unselected_supabase_applicants
+from projects.notification_inbox import build_notification, notify_many
+
+logger = logging.getLogger(__name__)
 
 
 def get_user_from_token(request):
@@ -106,8 +112,25 @@ def shortlist_top_three(request, project_id):
                 'figma_deadline': figma_deadline
             })
     
+    # Invite the shortlisted developers through their notification inbox
+    try:
+        notify_many([
+            build_notification(
+                developer['developer_email'],
+                'shortlist_invite',
+                f"You're shortlisted for {project.get('title')}",
+                f"Submit your Figma design before {figma_deadline[:10]}.",
+                source_id=developer['shortlist_id'],
+                data={'project_id': project_id, 'shortlist_id': developer['shortlist_id'], 'figma_deadline': figma_deadline}
+            )
+            for developer in shortlisted
+        ])
+    except Exception:
+        logger.exception("Could not send shortlist invites for project %s", project_id)
+    
     # Update project status
     supabase.table('projects').update({'status': 'shortlisting'}).eq('id', project_id).execute()
+    invalidate_catalog('project shortlisting')
     
     return JsonResponse({
         'message': 'Top 3 applicants shortlisted successfully',
@@ -638,35 +661,13 @@ def assign_after_figma(request, project_id):
     # Update application status to selected
     supabase.table('project_applications').update({'status': 'selected'}).eq('id', shortlist['application_id']).execute()
     
-    # Reject other applications and send rejection notifications
-    from .rejection_notifications import send_rejection_notifications
-    import requests
-    
-    # Get all applications for this project
-    all_apps_response = supabase.table('project_applications').select('developer_id').eq('project_id', project_id).execute()
-    all_developer_ids = [app['developer_id'] for app in all_apps_response.data] if all_apps_response.data else []
-    
-    # Update rejected applications
-    supabase.table('project_applications').update({'status': 'rejected'}).eq('project_id', project_id).neq('id', shortlist['application_id']).execute()
-    
-    # Send rejection notifications to non-selected developers
-    try:
-        rejection_response = requests.post(
-            'http://127.0.0.1:8000/api/projects/rejections/send/',
-            json={
-                'project_id': project_id,
-                'selected_developer_ids': [developer_id]
-            }
-        )
-        if rejection_response.status_code == 200:
-            print(f"   ✅ Rejection notifications sent")
-        else:
-            print(f"   ⚠️  Failed to send rejection notifications: {rejection_response.text}")
-    except Exception as e:
-        print(f"   ⚠️  Error sending rejection notifications: {e}")
+    # Reject the other applications in one update and notify them with one inbox insert
+    rejected = reject_unselected_supabase_applicants(supabase, project, [developer_id])
+    print(f"   ✅ Rejected {rejected} other applicants")
     
     # Update project status
     supabase.table('projects').update({'status': 'in_progress'}).eq('id', project_id).execute()
+    invalidate_catalog('project in_progress')
     
     # Get developer info for response
     dev_name = 'Developer'
@@ -5,24 +5,29 @@ Uses ONLY the custom fine-tuned sentence transformer model with graceful fallbac
 
 import os
 import numpy as np
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 
 from django.conf import settings
 from accounts.models import DeveloperProfile
 from django.contrib.auth import get_user_model
 from projects.models import Project, ProjectApplication
+from projects.skill_taxonomy import skill_ids, skill_names
+from projects.component_scoring import scorable_applications, score_application, score_applications
+from projects.ml_imports import is_available, sentence_transformers
+from projects.reranker import rerank_results
+from projects.past_projects import get_past_project_embeddings, prefetch_past_projects
+from projects.model_server import FINE_TUNED, ModelServerError, get_model_client
+from accounts.metrics import timed
 
 User = get_user_model()
 
-# Try to import SentenceTransformer with graceful handling
-try:
-    from sentence_transformers import SentenceTransformer
-    SENTENCE_TRANSFORMERS_AVAILABLE = True
-except ImportError as e:
-    print(f"⚠️ SentenceTransformers not available: {e}")
-    SentenceTransformer = None
-    SENTENCE_TRANSFORMERS_AVAILABLE = False
+PAST_PROJECTS_LIMIT = 5
+
+# sentence_transformers is imported when the first matcher is built, not at URLconf load
+SENTENCE_TRANSFORMERS_AVAILABLE = is_available('sentence_transformers')
+if not SENTENCE_TRANSFORMERS_AVAILABLE:
+    print("⚠️ SentenceTransformers not available")
 
 
 class FineTunedMatcher:
@@ -44,10 +49,14 @@ class FineTunedMatcher:
         self._load_scorer()
         self._print_status_summary()
     
+    @timed('model_load_duration_seconds', model='fine_tuned_sbert')
     def _load_model(self):
         """Load the fine-tuned SBERT model with graceful fallbacks."""
         print("📦 Loading Fine-tuned SBERT Model...")
         
+        if settings.MODEL_SERVER_ENABLED and self._load_remote_model():
+            return
+        
         if not SENTENCE_TRANSFORMERS_AVAILABLE:
             print("   ❌ SentenceTransformers library not available")
             print("   📋 Will use component-based scoring as fallback")
@@ -59,7 +68,7 @@ class FineTunedMatcher:
             print(f"   ⚠️ Fine-tuned model not found at: {self.model_dir}")
             print("   📋 Will try to use default SBERT model")
             try:
-                self.model = SentenceTransformer('all-MiniLM-L6-v2')
+                self.model = sentence_transformers.SentenceTransformer('all-MiniLM-L6-v2')
                 print("   ✅ Default SBERT model loaded as fallback")
                 self.model_status = "default_sbert"
                 return
@@ -72,14 +81,14 @@ class FineTunedMatcher:
         print(f"   📁 Found fine-tuned model directory: {self.model_dir}")
         
         try:
-            self.model = SentenceTransformer(self.model_dir)
+            self.model = sentence_transformers.SentenceTransformer(self.model_dir)
             print("   ✅ Fine-tuned SBERT model loaded successfully!")
             self.model_status = "fine_tuned_loaded"
         except Exception as e:
             print(f"   ❌ Failed to load fine-tuned model: {e}")
             print("   🔄 Trying default SBERT model as fallback...")
             try:
-                self.model = SentenceTransformer('all-MiniLM-L6-v2')
+                self.model = sentence_transformers.SentenceTransformer('all-MiniLM-L6-v2')
                 print("   ✅ Default SBERT model loaded as fallback")
                 self.model_status = "default_sbert"
             except Exception as e2:
@@ -87,6 +96,21 @@ class FineTunedMatcher:
                 self.model = None
                 self.model_status = "no_model"
     
+    def _load_remote_model(self) -> bool:
+        """Encode through the shared model server; False if it can't be reached."""
+        client = get_model_client()
+        try:
+            health = client.health()
+        except ModelServerError as e:
+            print(f"   ⚠️ Model server unavailable ({e}), loading the model in this process")
+            return False
+        
+        source = health.get('models', {}).get(FINE_TUNED)
+        self.model = client.encoder(FINE_TUNED)
+        self.model_status = "fine_tuned_loaded" if source == self.model_dir else "default_sbert"
+        print(f"   ✅ Using model server at {client.socket_path} ({source or 'still loading'})")
+        return True
+    
     def _load_scorer(self):
         """Load the custom scorer with graceful fallbacks."""
         print("🎯 Loading Custom Scorer...")
@@ -185,10 +209,11 @@ class FineTunedMatcher:
         }
     
     def _prepare_text_pairs(self, project: Project, developer: DeveloperProfile, 
-                           application: ProjectApplication) -> List[tuple]:
+                           application: ProjectApplication, past_projects: Optional[str] = None) -> List[tuple]:
         """
         Prepare text pairs for the fine-tuned model.
         Returns list of (project_text, developer_text) tuples.
+        past_projects is the prefetched portfolio text; fetched here when None.
         """
         
         # Main project description
@@ -212,7 +237,8 @@ class FineTunedMatcher:
         proposal_text = application.cover_letter
         
         # Past projects context
-        past_projects = self._get_developer_past_projects(developer.user)
+        if past_projects is None:
+            past_projects = self._get_developer_past_projects(developer.user)
         
         # Create multiple text pairs for comprehensive matching
         text_pairs = [
@@ -231,22 +257,19 @@ class FineTunedMatcher:
     def _get_developer_past_projects(self, user: User) -> str:
         """Get developer's past project descriptions."""
         try:
-            past_projects = []
-            completed_apps = ProjectApplication.objects.filter(
-                developer=user,
-                status='selected'
-            ).select_related('project')[:5]  # Last 5 projects
-            
-            for app in completed_apps:
-                past_projects.append(f"{app.project.title}: {app.project.description}")
-            
-            return '. '.join(past_projects) if past_projects else ""
+            past = prefetch_past_projects([user.id], limit=PAST_PROJECTS_LIMIT).get(user.id)
+            return past.text(with_titles=True, separator='. ') if past else ""
         except Exception as e:
             print(f"⚠ Error fetching past projects: {e}")
             return ""
     
-    def _calculate_similarity_scores(self, text_pairs: List[tuple]) -> List[float]:
-        """Calculate similarity scores for text pairs using the available model."""
+    def _calculate_similarity_scores(self, text_pairs: List[tuple],
+                                     known_embeddings: Optional[Dict[str, np.ndarray]] = None) -> List[float]:
+        """
+        Calculate similarity scores for text pairs using the available model.
+        known_embeddings maps texts already embedded (cached portfolios) to their vectors.
+        """
+        known_embeddings = known_embeddings or {}
         if not self.model:
             print("   ⚠️ No SBERT model available for similarity calculation")
             return [0.5] * len(text_pairs)  # Neutral scores
@@ -260,7 +283,9 @@ class FineTunedMatcher:
             try:
                 # Encode both texts using available model
                 embedding1 = self.model.encode(text1, convert_to_tensor=False)
-                embedding2 = self.model.encode(text2, convert_to_tensor=False)
+                embedding2 = known_embeddings.get(text2)
+                if embedding2 is None:
+                    embedding2 = self.model.encode(text2, convert_to_tensor=False)
                 
                 # Calculate cosine similarity
                 similarity = np.dot(embedding1, embedding2) / (
@@ -274,10 +299,12 @@ class FineTunedMatcher:
         return scores
     
     def _predict_match_score(self, project: Project, developer: DeveloperProfile,
-                           application: ProjectApplication) -> int:
+                           application: ProjectApplication,
+                           portfolio: Optional[Tuple[str, Optional[np.ndarray]]] = None) -> int:
         """
         Predict match score using the best available method.
         Returns score from 0-100.
+        portfolio is the prefetched (past projects text, cached embedding), if any.
         """
         
         # Priority 1: Custom scorer (if available)
@@ -296,8 +323,13 @@ class FineTunedMatcher:
         if self.model:
             try:
                 print(f"   🤖 Using SBERT model ({getattr(self, 'model_status', 'unknown')})")
-                text_pairs = self._prepare_text_pairs(project, developer, application)
-                similarity_scores = self._calculate_similarity_scores(text_pairs)
+                past_projects, known_embeddings = None, None
+                if portfolio is not None:
+                    past_projects, embedding = portfolio
+                    if past_projects and embedding is not None:
+                        known_embeddings = {past_projects: embedding}
+                text_pairs = self._prepare_text_pairs(project, developer, application, past_projects)
+                similarity_scores = self._calculate_similarity_scores(text_pairs, known_embeddings)
                 
                 # Weight different similarity aspects
                 weights = [0.3, 0.25, 0.2, 0.15, 0.1]
@@ -340,8 +372,8 @@ class FineTunedMatcher:
         bonus = 0.0
         
         # Skill match bonus
-        required_skills = set(skill.strip().lower() for skill in project.tech_stack)
-        developer_skills = set(skill.strip().lower() for skill in developer.skills.split(','))
+        required_skills = skill_ids(project.tech_stack)
+        developer_skills = skill_ids(developer.skills)
         
         if len(required_skills) > 0:
             skill_overlap = len(required_skills & developer_skills) / len(required_skills)
@@ -376,6 +408,7 @@ class FineTunedMatcher:
         
         return bonus
     
+    @timed('matcher_duration_seconds', matcher='fine_tuned', operation='rank_freelancers')
     def rank_freelancers(self, project: Project, top_n: int = 5) -> List[Dict]:
         """
         Rank all freelancers who applied to a project using the fine-tuned model.
@@ -402,16 +435,29 @@ class FineTunedMatcher:
             print("   ⚠️ Will use component-based scoring")
         results = []
         
-        for application in applications:
+        # Component scores for transparency, whole pool in one vectorized pass.
+        # If a pooled pass fails, each applicant is scored on their own below.
+        applications = scorable_applications(applications)
+        try:
+            pool_component_scores = score_applications(project, applications)
+        except Exception as e:
+            print(f"  ⚠ Pooled component scoring failed ({e}), scoring applicants one by one")
+            pool_component_scores = [None] * len(applications)
+        try:
+            portfolios = self._pool_portfolios(applications)
+        except Exception as e:
+            print(f"  ⚠ Could not prefetch past projects ({e}), fetching per applicant")
+            portfolios = [None] * len(applications)
+        
+        for application, component_scores, portfolio in zip(applications, pool_component_scores, portfolios):
             try:
                 developer = application.developer.developerprofile
+                if component_scores is None:
+                    component_scores = score_applications(project, [application])[0]
                 print(f"  Evaluating: {developer.user.get_full_name()}")
                 
                 # Get match score from fine-tuned model
-                overall_score = self._predict_match_score(project, developer, application)
-                
-                # Calculate component scores for transparency
-                component_scores = self._calculate_component_scores(project, developer, application)
+                overall_score = self._predict_match_score(project, developer, application, portfolio)
                 
                 results.append({
                     'application_id': application.id,
@@ -442,75 +488,44 @@ class FineTunedMatcher:
         # Sort by overall score descending
         results.sort(key=lambda x: x['overall_score'], reverse=True)
         
+        # Stage two: cross-encoder over the top-K (project, proposal) pairs
+        results = rerank_results(project, results, applications)
+        
         print(f"\n✅ Fine-tuned ranking complete:")
         for i, r in enumerate(results[:top_n], 1):
             print(f"  {i}. {r['developer_name']}: {r['overall_score']}/100")
         
         return results[:top_n]
     
+    def _pool_portfolios(self, applications: List[ProjectApplication]) -> List[Tuple[str, Optional[np.ndarray]]]:
+        """
+        (past projects text, embedding) per application: one grouped query for
+        the pool, embeddings from the per-developer cache.
+        """
+        past_projects = prefetch_past_projects(
+            [application.developer_id for application in applications], limit=PAST_PROJECTS_LIMIT
+        )
+        texts = []
+        for application in applications:
+            past = past_projects.get(application.developer_id)
+            texts.append((past, past.text(with_titles=True, separator='. ')) if past else None)
+        
+        embeddings = [None] * len(applications)
+        if self.model:
+            try:
+                embeddings = get_past_project_embeddings().embed(
+                    f"fine_tuned:{getattr(self, 'model_status', 'unknown')}",
+                    [entry if entry and entry[1] else None for entry in texts],
+                    lambda batch: self.model.encode(batch, convert_to_tensor=False, show_progress_bar=False)
+                )
+            except Exception as e:
+                print(f"   ⚠️ Error embedding past projects: {e}")
+        return [(entry[1] if entry else '', embedding) for entry, embedding in zip(texts, embeddings)]
+    
     def _calculate_component_scores(self, project: Project, developer: DeveloperProfile,
                                    application: ProjectApplication) -> Dict[str, float]:
         """Calculate component scores for transparency (same as original matcher)."""
-        
-        # Skill match
-        required_skills = set(skill.strip().lower() for skill in project.tech_stack)
-        developer_skills = set(skill.strip().lower() for skill in developer.skills.split(','))
-        
-        if len(required_skills) > 0:
-            skill_overlap = len(required_skills & developer_skills) / len(required_skills)
-            skill_match = skill_overlap * 100
-        else:
-            skill_match = 50.0
-        
-        # Experience fit
-        years_exp = developer.years_experience or 0
-        experience_fit = min(years_exp * 10, 100)
-        
-        # Portfolio quality
-        rating = float(developer.rating or 0)
-        total_projects = developer.total_projects or 0
-        success_rate = float(developer.success_rate or 50)
-        
-        portfolio_quality = (
-            (rating / 5.0 * 100) * 0.5 +
-            success_rate * 0.3 +
-            min(total_projects * 5, 100) * 0.2
-        )
-        
-        # Proposal quality
-        proposal_length = len(application.cover_letter.split())
-        if proposal_length < 50:
-            proposal_quality = proposal_length * 0.8
-        elif proposal_length < 100:
-            proposal_quality = 40 + (proposal_length - 50) * 0.8
-        else:
-            proposal_quality = min(80 + (proposal_length - 100) / 10, 100)
-        
-        # Rate fit
-        try:
-            proposed_rate = float(application.proposed_rate) if application.proposed_rate else 0
-            budget_min = float(project.budget_min) if project.budget_min else 0
-            budget_max = float(project.budget_max) if project.budget_max else 1000
-            budget_mid = (budget_min + budget_max) / 2 if budget_max > 0 else 1000
-            
-            if budget_mid > 0 and proposed_rate > 0:
-                if proposed_rate <= budget_mid:
-                    rate_fit = 100.0
-                else:
-                    overage_pct = (proposed_rate - budget_mid) / budget_mid
-                    rate_fit = max(0, 100 - (overage_pct * 100))
-            else:
-                rate_fit = 50.0
-        except:
-            rate_fit = 50.0
-        
-        return {
-            'skill_match': float(skill_match),
-            'experience_fit': float(experience_fit),
-            'portfolio_quality': float(portfolio_quality),
-            'proposal_quality': float(proposal_quality),
-            'rate_fit': float(rate_fit),
-        }
+        return score_application(project, developer, application)
     
     def get_match_details(self, application: ProjectApplication) -> Optional[Dict]:
         """Get detailed match analysis for a specific application."""
@@ -522,12 +537,12 @@ class FineTunedMatcher:
             component_scores = self._calculate_component_scores(project, developer, application)
             
             # Skill analysis
-            required_skills = set(skill.strip().lower() for skill in project.tech_stack)
-            developer_skills = set(skill.strip().lower() for skill in developer.skills.split(','))
+            required_skills = skill_ids(project.tech_stack)
+            developer_skills = skill_ids(developer.skills)
             
-            matching_skills = sorted(list(required_skills & developer_skills))
-            missing_skills = sorted(list(required_skills - developer_skills))
-            extra_skills = sorted(list(developer_skills - required_skills))
+            matching_skills = skill_names(required_skills & developer_skills)
+            missing_skills = skill_names(required_skills - developer_skills)
+            extra_skills = skill_names(developer_skills - required_skills)
             
             return {
                 'overall_score': overall_score,
@@ -0,0 +1,97 @@
+"""
+Management command to compare the sequential and async Supabase access paths.
+Usage: python manage.py benchmark_async_fanout --assignments 5 --team_size 4 --latency_ms 50
+
+Every simulated Supabase round-trip sleeps for --latency_ms, so the numbers
+reflect round-trip depth rather than network variance.
+"""
+
+import asyncio
+import time
+
+from django.core.management.base import BaseCommand
+
+from accounts.supabase_standin import InMemoryStore, StandInClient
+from projects.team_assignment_views import load_developer_team_assignments
+
+
+def _seed(store, assignments, team_size):
+    developer = store.add_user('dev-0@example.com', {'first_name': 'Dev', 'last_name': '0'})
+    for a in range(assignments):
+        company = store.add_user(f'company-{a}@example.com', {'company_name': f'Company {a}'})
+        store.load('projects', [{'id': f'project-{a}', 'title': f'Project {a}', 'company_id': company.id}])
+        store.load('team_assignments', [{'id': f'assignment-{a}', 'project_id': f'project-{a}'}])
+        store.load('shared_files', [{'id': f'file-{a}', 'assignment_id': 'assignment-0'}])
+        store.load('shared_links', [{'id': f'link-{a}', 'assignment_id': 'assignment-0'}])
+        for m in range(team_size):
+            member = developer if m == 0 else store.add_user(f'dev-{a}-{m}@example.com', {'first_name': 'Dev', 'last_name': str(m)})
+            store.load('team_assignment_members', [{'team_assignment_id': f'assignment-{a}', 'developer_id': member.id}])
+    return developer.id
+
+
+def _sequential_team_assignments(supabase, developer_id):
+    """The per-row access pattern the synchronous view used."""
+    members_response = supabase.table('team_assignment_members').select('*').eq('developer_id', developer_id).execute()
+    results = []
+    for member in members_response.data:
+        assignment = supabase.table('team_assignments').select('*').eq('id', member['team_assignment_id']).execute().data[0]
+        project = supabase.table('projects').select('title, company_id').eq('id', assignment['project_id']).execute().data[0]
+        supabase.auth.admin.get_user_by_id(project['company_id'])
+        all_members = supabase.table('team_assignment_members').select('*').eq('team_assignment_id', assignment['id']).execute()
+        for team_member in all_members.data:
+            supabase.auth.admin.get_user_by_id(team_member['developer_id'])
+        results.append(assignment)
+    return results
+
+
+class Command(BaseCommand):
+    help = 'Benchmark sequential vs concurrent Supabase fan-out under simulated latency'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--assignments', type=int, default=5, help='Team assignments for the developer')
+        parser.add_argument('--team_size', type=int, default=4, help='Members per team')
+        parser.add_argument('--latency_ms', type=float, default=50.0, help='Simulated round-trip latency')
+
+    def handle(self, *args, **options):
+        store = InMemoryStore()
+        developer_id = _seed(store, options['assignments'], options['team_size'])
+
+        sync_client = StandInClient(store, latency_ms=options['latency_ms'])
+        async_client = StandInClient(store, latency_ms=options['latency_ms'], asynchronous=True)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"\n📊 Simulated round-trip: {options['latency_ms']:.0f}ms, "
+            f"{options['assignments']} assignments x {options['team_size']} members\n"
+        ))
+
+        start = time.perf_counter()
+        _sequential_team_assignments(sync_client, developer_id)
+        sequential_team = time.perf_counter() - start
+
+        start = time.perf_counter()
+        asyncio.run(load_developer_team_assignments(async_client, developer_id))
+        async_team = time.perf_counter() - start
+
+        start = time.perf_counter()
+        sync_client.table('shared_files').select('*').eq('assignment_id', 'assignment-0').execute()
+        sync_client.table('shared_links').select('*').eq('assignment_id', 'assignment-0').execute()
+        sequential_files = time.perf_counter() - start
+
+        async def _files():
+            await asyncio.gather(
+                async_client.table('shared_files').select('*').eq('assignment_id', 'assignment-0').execute(),
+                async_client.table('shared_links').select('*').eq('assignment_id', 'assignment-0').execute(),
+            )
+
+        start = time.perf_counter()
+        asyncio.run(_files())
+        async_files = time.perf_counter() - start
+
+        self._report('get_developer_team_assignments', sequential_team, async_team)
+        self._report('get_shared_files', sequential_files, async_files)
+
+    def _report(self, name, sequential, concurrent):
+        speedup = sequential / concurrent if concurrent else 0
+        self.stdout.write(f'{name}:')
+        self.stdout.write(f'   sequential: {sequential * 1000:8.1f}ms')
+        self.stdout.write(f'   async:      {concurrent * 1000:8.1f}ms  ({speedup:.1f}x)\n')
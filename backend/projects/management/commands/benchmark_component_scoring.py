@@ -0,0 +1,122 @@
+"""
+Management command to benchmark vectorized component scoring against the per-applicant loop.
+Usage: python manage.py benchmark_component_scoring --applicants 10000
+
+Synthetic Supabase-shaped applicants are scored both ways. The per-applicant
+reference is the formula the matchers ran before component_scoring existed; the
+command fails if any applicant's dict differs.
+"""
+
+import random
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from projects.component_scoring import ApplicantColumns
+from projects.skill_taxonomy import skill_ids
+
+SKILLS = ['React', 'Node.js', 'Python', 'Django', 'TypeScript', 'PostgreSQL', 'Docker', 'AWS', 'Figma', 'Go', 'Rust']
+
+
+def _reference_scores(project_data, developer_profile, application_data):
+    """The per-applicant component scoring the matchers used to run."""
+    required_skills = skill_ids(project_data.get('tech_stack', []))
+    developer_skills = skill_ids(developer_profile.get('skills', ''))
+    if len(required_skills) > 0:
+        skill_match = len(required_skills & developer_skills) / len(required_skills) * 100
+    else:
+        skill_match = 50.0
+
+    years_exp = developer_profile.get('years_experience', 0) or 0
+    experience_fit = min(years_exp * 10, 100)
+
+    rating = float(developer_profile.get('rating', 0) or 0)
+    total_projects = developer_profile.get('total_projects', 0) or 0
+    success_rate = float(developer_profile.get('success_rate', 50) or 50)
+    portfolio_quality = (
+        (rating / 5.0 * 100) * 0.5 +
+        success_rate * 0.3 +
+        min(total_projects * 5, 100) * 0.2
+    )
+
+    proposal_length = len(application_data.get('cover_letter', '').split())
+    if proposal_length < 50:
+        proposal_quality = proposal_length * 0.8
+    elif proposal_length < 100:
+        proposal_quality = 40 + (proposal_length - 50) * 0.8
+    else:
+        proposal_quality = min(80 + (proposal_length - 100) / 10, 100)
+
+    proposed_rate = float(application_data.get('proposed_rate', 0) or 0)
+    budget_min = float(project_data.get('budget_min', 0) or 0)
+    budget_max = float(project_data.get('budget_max', 1000) or 1000)
+    budget_mid = (budget_min + budget_max) / 2 if budget_max > 0 else 1000
+    if budget_mid > 0 and proposed_rate > 0:
+        if proposed_rate <= budget_mid:
+            rate_fit = 100.0
+        else:
+            overage_pct = (proposed_rate - budget_mid) / budget_mid
+            rate_fit = max(0, 100 - (overage_pct * 100))
+    else:
+        rate_fit = 50.0
+
+    return {
+        'skill_match': float(skill_match),
+        'experience_fit': float(experience_fit),
+        'portfolio_quality': float(portfolio_quality),
+        'proposal_quality': float(proposal_quality),
+        'rate_fit': float(rate_fit),
+    }
+
+
+def _applicants(count, rng):
+    applicants = []
+    for _ in range(count):
+        profile = {
+            'skills': ', '.join(rng.sample(SKILLS, rng.randint(0, 6))),
+            'years_experience': rng.choice([None, 0, 1, 3, 5, 8, 12, 20]),
+            'rating': rng.choice([None, 0, 3.5, 4.2, 4.8, 5]),
+            'success_rate': rng.choice([None, 0, 60, 85, 97.5, 100]),
+            'total_projects': rng.choice([None, 0, 2, 10, 25, 40]),
+        }
+        application = {
+            'cover_letter': ' '.join(['word'] * rng.randint(0, 400)),
+            'proposed_rate': rng.choice([None, 0, 20, 45, 60, 90, 150, 400]),
+        }
+        applicants.append((profile, application))
+    return applicants
+
+
+class Command(BaseCommand):
+    help = 'Benchmark vectorized component scoring for a project applicant pool'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--applicants', type=int, default=10000)
+        parser.add_argument('--seed', type=int, default=11)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        project = {'tech_stack': ['React', 'Node.js', 'PostgreSQL', 'Docker'], 'budget_min': 40, 'budget_max': 80}
+        applicants = _applicants(options['applicants'], rng)
+
+        start = time.perf_counter()
+        reference = [_reference_scores(project, profile, application) for profile, application in applicants]
+        loop_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        columns = ApplicantColumns(project['tech_stack'], project['budget_min'], project['budget_max'])
+        for profile, application in applicants:
+            columns.add_supabase(profile, application)
+        load_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        vectorized = columns.score_dicts()
+        score_seconds = time.perf_counter() - start
+
+        mismatches = sum(1 for expected, actual in zip(reference, vectorized) if expected != actual)
+        self.stdout.write(f"Applicants:           {len(applicants)}")
+        self.stdout.write(f"Per-applicant loop:   {loop_seconds * 1000:.1f} ms")
+        self.stdout.write(f"Vectorized:           {(load_seconds + score_seconds) * 1000:.1f} ms "
+                          f"(columns {load_seconds * 1000:.1f} ms, scoring {score_seconds * 1000:.1f} ms)")
+        if mismatches:
+            raise CommandError(f"{mismatches} applicants scored differently")
+        self.stdout.write(self.style.SUCCESS('Identical component scores for every applicant'))
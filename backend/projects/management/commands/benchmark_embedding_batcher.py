@@ -0,0 +1,104 @@
+"""
+Management command to benchmark micro-batched embedding against direct encode calls.
+Usage: python manage.py benchmark_embedding_batcher --threads 32 --requests 2000 --windows 0,2,5,10
+
+--threads callers each encode --texts texts per request, like concurrent
+apply_to_project scoring. The requests run once with direct model.encode()
+calls, then once through an EmbeddingBatcher per batching window. Each run
+reports throughput and latency percentiles.
+"""
+
+import os
+import random
+import threading
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from projects.embedding_batcher import EmbeddingBatcher
+
+WORDS = (
+    'react node python django api dashboard mobile design payments realtime chat analytics '
+    'experienced developer built scalable platform delivered clients testing deployment cloud'
+).split()
+
+
+def _percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def _run(encode, requests, threads):
+    """Spread requests over threads; returns (seconds, per-request latencies)."""
+    latencies = []
+    lock = threading.Lock()
+    chunks = [requests[i::threads] for i in range(threads)]
+
+    def worker(chunk):
+        local = []
+        for texts in chunk:
+            start = time.perf_counter()
+            encode(texts)
+            local.append(time.perf_counter() - start)
+        with lock:
+            latencies.extend(local)
+
+    pool = [threading.Thread(target=worker, args=(chunk,)) for chunk in chunks]
+    start = time.perf_counter()
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    return time.perf_counter() - start, latencies
+
+
+class Command(BaseCommand):
+    help = 'Benchmark throughput and latency of batched vs direct sentence embedding'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--model', default=os.path.join(settings.BASE_DIR, 'fine_tuned_model'),
+                            help='SentenceTransformer path or name')
+        parser.add_argument('--threads', type=int, default=32)
+        parser.add_argument('--requests', type=int, default=2000)
+        parser.add_argument('--texts', type=int, default=2, help='Texts per encode request')
+        parser.add_argument('--windows', default='0,2,5,10', help='Batching windows to try, in ms')
+        parser.add_argument('--max_batch', type=int, default=settings.EMBEDDING_MAX_BATCH_SIZE)
+        parser.add_argument('--seed', type=int, default=5)
+
+    def handle(self, *args, **options):
+        try:
+            from sentence_transformers import SentenceTransformer
+            model = SentenceTransformer(options['model'])
+        except Exception as e:
+            raise CommandError(f"Could not load {options['model']}: {e}")
+
+        rng = random.Random(options['seed'])
+        requests = [
+            [' '.join(rng.choices(WORDS, k=rng.randint(8, 60))) for _ in range(options['texts'])]
+            for _ in range(options['requests'])
+        ]
+        model.encode(requests[0], show_progress_bar=False)  # warm-up
+
+        def report(label, seconds, latencies, extra=''):
+            self.stdout.write(
+                f"{label:<16} {len(latencies) / seconds:8.1f} req/s   "
+                f"p50 {_percentile(latencies, 50) * 1000:7.1f} ms   "
+                f"p95 {_percentile(latencies, 95) * 1000:7.1f} ms   "
+                f"p99 {_percentile(latencies, 99) * 1000:7.1f} ms{extra}"
+            )
+
+        seconds, latencies = _run(
+            lambda texts: model.encode(texts, convert_to_numpy=True, show_progress_bar=False),
+            requests, options['threads']
+        )
+        report('direct', seconds, latencies)
+
+        for window in [float(w) for w in options['windows'].split(',') if w.strip()]:
+            batcher = EmbeddingBatcher(model, window, options['max_batch'])
+            batcher.start()
+            seconds, latencies = _run(batcher.encode, requests, options['threads'])
+            stats = batcher.snapshot()
+            report(f"batched {window:g} ms", seconds, latencies,
+                   f"   mean batch {stats['mean_batch_size']} (max {stats['largest_batch']})")
+        self.stdout.write(self.style.SUCCESS('Done'))
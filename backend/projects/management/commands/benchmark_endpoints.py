@@ -0,0 +1,80 @@
+"""
+Management command to benchmark API endpoints against the in-memory Supabase stand-in.
+Usage: python manage.py benchmark_endpoints --projects 10000 --applications 100000 --latency_ms 50
+
+No network or Supabase project is needed: the stand-in is seeded in-process
+and every Supabase round-trip is delayed by --latency_ms.
+"""
+
+import re
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.test import Client, override_settings
+
+from accounts.supabase_standin import get_standin_store
+from accounts.supabase_standin_seed import seed_store
+
+CALLS_PATTERN = re.compile(r'desc="(\d+) calls"')
+
+
+class Command(BaseCommand):
+    help = 'Benchmark endpoints end-to-end on seeded in-memory Supabase data'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--projects', type=int, default=10_000, help='Projects to seed')
+        parser.add_argument('--applications', type=int, default=100_000, help='Applications to seed')
+        parser.add_argument('--latency_ms', type=float, default=50.0, help='Simulated round-trip latency')
+        parser.add_argument('--repeat', type=int, default=5, help='Requests per endpoint')
+        parser.add_argument('--seed', type=int, default=42, help='Random seed for the data generator')
+
+    def handle(self, *args, **options):
+        store = get_standin_store()
+
+        start = time.perf_counter()
+        summary = seed_store(store, projects=options['projects'], applications=options['applications'], seed=options['seed'])
+        self.stdout.write(self.style.SUCCESS(
+            f"\n✅ Seeded {summary['projects']} projects / {summary['applications']} applications "
+            f"in {time.perf_counter() - start:.1f}s\n"
+        ))
+
+        project_id = summary['sample_project_id']
+        project_owner = store.index('projects', 'id')[project_id][0]['company_id']
+        company_token = store.issue_token(summary['busiest_company_id'])
+        owner_token = store.issue_token(project_owner)
+        developer_token = store.issue_token(summary['developer_ids'][0])
+
+        endpoints = [
+            ('project catalog', '/api/auth/projects/', None),
+            ('company dashboard', '/api/auth/company/projects/', company_token),
+            ('project applications', f'/api/auth/company/projects/{project_id}/applications/', owner_token),
+            ('developer team assignments', '/api/projects/team-assignments/get_developer_team_assignments/', developer_token),
+        ]
+
+        with override_settings(
+            SUPABASE_STANDIN=True,
+            SUPABASE_STANDIN_LATENCY_MS=options['latency_ms'],
+            ALLOWED_HOSTS=['testserver', 'localhost'],
+        ):
+            client = Client()
+            self.stdout.write(f"📊 {options['latency_ms']:.0f}ms per round-trip, {options['repeat']} requests each\n")
+            for name, url, token in endpoints:
+                self._run(client, name, url, token, options['repeat'])
+
+    def _run(self, client, name, url, token, repeat):
+        headers = {'Authorization': f'Bearer {token}'} if token else {}
+        timings, calls, status_code = [], 0, None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            response = client.get(url, headers=headers)
+            timings.append((time.perf_counter() - start) * 1000)
+            status_code = response.status_code
+            match = CALLS_PATTERN.search(response.get('Server-Timing', ''))
+            calls = int(match.group(1)) if match else 0
+
+        self.stdout.write(f'{name} [{status_code}]: {url}')
+        self.stdout.write(
+            f'   p50 {statistics.median(timings):8.1f}ms   max {max(timings):8.1f}ms   '
+            f'supabase calls/request: {calls}\n'
+        )
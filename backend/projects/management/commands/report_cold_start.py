@@ -0,0 +1,50 @@
+"""
+Management command to report worker cold-start time.
+Usage: python manage.py report_cold_start --path /metrics/supabase/ --top 15
+
+Spawns fresh interpreters and reports:
+
+- how long each boot phase takes (interpreter, django.setup(), URLconf
+  import), up to the first served request;
+- the slowest imports according to `python -X importtime`;
+- any heavy ML module that was imported at startup.
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from projects.ml_imports import HEAVY_MODULES
+from projects.startup_profile import cold_start, import_profile
+
+
+class Command(BaseCommand):
+    help = 'Report cold-start time to first served request and the slowest startup imports'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--path', default='/metrics/supabase/', help='Request served after boot')
+        parser.add_argument('--top', type=int, default=15, help='Slowest imports to list')
+        parser.add_argument('--runs', type=int, default=3, help='Cold starts to time (best is reported)')
+
+    def handle(self, *args, **options):
+        try:
+            runs = [cold_start(options['path']) for _ in range(max(1, options['runs']))]
+            profile = import_profile()
+        except RuntimeError as e:
+            raise CommandError(str(e))
+
+        best = min(runs, key=lambda run: run['total'])
+        self.stdout.write(f"Cold start to first request ({best['path']} -> {best['status']}), best of {len(runs)}:")
+        for phase in ('interpreter_start', 'django_setup', 'urlconf_import', 'first_request', 'total'):
+            self.stdout.write(f"  {phase:<18} {best[phase] * 1000:8.1f} ms")
+
+        self.stdout.write(f"\nBoot imports: {profile.total_ms:.0f} ms (budget {settings.IMPORT_TIME_BUDGET_MS:.0f} ms)")
+        self.stdout.write(f"{'module':<50} {'self ms':>9} {'cumul ms':>9}")
+        for name, self_ms, cumulative_ms in profile.slowest(options['top']):
+            self.stdout.write(f"{name:<50} {self_ms:9.1f} {cumulative_ms:9.1f}")
+
+        heavy = profile.loaded(HEAVY_MODULES)
+        if heavy:
+            self.stdout.write(self.style.WARNING(f"\nHeavy ML modules imported at startup: {', '.join(heavy[:10])}"))
+        if profile.total_ms > settings.IMPORT_TIME_BUDGET_MS:
+            self.stdout.write(self.style.WARNING('Boot imports are over budget'))
+        self.stdout.write(self.style.SUCCESS('Done'))
@@ -0,0 +1,48 @@
+"""
+Management command to report resident vs shared memory of web workers.
+Usage: python manage.py report_worker_memory --master $(cat /run/gunicorn.pid)
+
+Lists the master and each of its workers with RSS, PSS and the shared and
+private parts of their memory (from /proc/<pid>/smaps_rollup). With
+MODEL_PRELOAD_ENABLED and `gunicorn --preload`, most of a worker's RSS should
+be shared model weights. The PSS total is the real footprint of the whole
+group.
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from projects.model_preload import memory_report, memory_usage, worker_threads
+
+
+class Command(BaseCommand):
+    help = 'Report resident vs shared memory of a server master and its workers'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--master', type=int, help='PID of the gunicorn/uvicorn master')
+        parser.add_argument('--pids', default='', help='Comma-separated PIDs to report instead')
+
+    def handle(self, *args, **options):
+        if options['pids']:
+            rows = [memory_usage(int(pid)) for pid in options['pids'].split(',') if pid.strip()]
+            rows = [row for row in rows if row]
+        elif options['master']:
+            rows = memory_report(options['master'])
+        else:
+            raise CommandError('Pass --master <pid> or --pids <pid,...>')
+        if not rows:
+            raise CommandError('No readable /proc/<pid>/smaps_rollup for those processes (Linux only)')
+
+        self.stdout.write(
+            f"{'pid':>8} {'rss MB':>9} {'pss MB':>9} {'shared MB':>10} {'private MB':>11} {'shared':>7}"
+        )
+        for row in rows:
+            self.stdout.write(
+                f"{row['pid']:>8} {row['rss_mb']:>9.0f} {row['pss_mb']:>9.0f} "
+                f"{row['shared_mb']:>10.0f} {row['private_mb']:>11.0f} {row['shared_pct']:>6.1f}%"
+            )
+        self.stdout.write(
+            f"\nSum of RSS {sum(row['rss_mb'] for row in rows):.0f} MB, "
+            f"actual footprint (PSS) {sum(row['pss_mb'] for row in rows):.0f} MB, "
+            f"{worker_threads()} math thread(s) per worker"
+        )
+        self.stdout.write(self.style.SUCCESS('Done'))
@@ -0,0 +1,52 @@
+"""
+Management command to run the shared model server for all web workers.
+Usage: python manage.py run_model_server --socket /tmp/devconnect-models.sock
+
+With MODEL_SERVER_ENABLED=True, the matchers and Figma evaluators encode
+through this process and load no models of their own. Use --check to print a
+running server's health, and --reload to make it load fresh models (kill -HUP
+<pid> does the same).
+"""
+
+import json
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from projects.model_server import ModelServer, ModelServerClient, ModelServerError
+
+
+class Command(BaseCommand):
+    help = 'Run the UNIX-socket model server that hosts the sentence and CLIP models'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--socket', default=settings.MODEL_SERVER_SOCKET, help='UNIX socket path')
+        parser.add_argument('--no-clip', action='store_true', help="Don't load OpenCLIP")
+        parser.add_argument('--check', action='store_true', help="Print a running server's health and exit")
+        parser.add_argument('--reload', action='store_true', help='Ask a running server to reload its models')
+
+    def handle(self, *args, **options):
+        if options['check'] or options['reload']:
+            client = ModelServerClient(options['socket'], settings.MODEL_SERVER_TIMEOUT)
+            try:
+                result = client.reload() if options['reload'] else client.health()
+            except ModelServerError as e:
+                raise CommandError(str(e))
+            self.stdout.write(json.dumps(result, indent=2))
+            self.stdout.write(self.style.SUCCESS('Done'))
+            return
+
+        server = ModelServer(
+            options['socket'],
+            clip=settings.MODEL_SERVER_CLIP and not options['no_clip'],
+            watch_interval=settings.MODEL_SERVER_WATCH_INTERVAL,
+            reload_grace=settings.MODEL_SERVER_RELOAD_GRACE,
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"\n🧠 Model server listening on {options['socket']} (Ctrl+C to stop)\n"
+        ))
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        self.stdout.write('\n👋 Model server stopped')
@@ -0,0 +1,30 @@
+"""
+Management command to run the local Redis-compatible pub/sub server for chat push.
+Usage: python manage.py run_pubsub_server --host 127.0.0.1 --port 6390
+
+Point the app at it with CHAT_PUBSUB_BACKEND=redis and
+CHAT_PUBSUB_URL=redis://127.0.0.1:6390 when running more than one worker.
+"""
+
+import asyncio
+
+from django.core.management.base import BaseCommand
+
+from accounts.chat_pubsub import LocalPubSubServer
+
+
+class Command(BaseCommand):
+    help = 'Run a local Redis-compatible PUBLISH/SUBSCRIBE server for chat push delivery'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--host', default='127.0.0.1', help='Interface to bind')
+        parser.add_argument('--port', type=int, default=6390, help='Port to listen on')
+
+    def handle(self, *args, **options):
+        self.stdout.write(self.style.SUCCESS(
+            f"\n📡 Pub/sub server listening on {options['host']}:{options['port']} (Ctrl+C to stop)\n"
+        ))
+        try:
+            asyncio.run(LocalPubSubServer().serve(options['host'], options['port']))
+        except KeyboardInterrupt:
+            self.stdout.write('\n👋 Pub/sub server stopped')
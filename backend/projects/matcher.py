@@ -412,11 +412,11 @@ Matches freelancers to projects based on:
 import os
 import pickle
 import json
+import threading
 import numpy as np
 from typing import List, Dict, Tuple, Optional
 from pathlib import Path
 
-from sentence_transformers import SentenceTransformer
 from django.conf import settings
 
 from accounts.models import DeveloperProfile
@@ -424,6 +424,89 @@ from django.contrib.auth import get_user_model
 
 User = get_user_model()
 from projects.models import Project, ProjectApplication
+from projects.skill_taxonomy import normalize_skill_list, skill_ids
+from projects.component_scoring import scorable_applications, score_application, score_applications
+from projects.ml_imports import sentence_transformers
+from projects.reranker import rerank_results
+from projects.past_projects import get_past_project_embeddings, prefetch_past_projects
+from projects.model_server import get_model_client, sentence_model_sources
+from accounts.metrics import timed
+
+FEATURE_COUNT = 14
+EMBEDDING_BATCH_SIZE = 64
+PAST_PROJECTS_LIMIT = 10
+# Classifier score bin -> match score
+BIN_TO_SCORE = {0: 25, 1: 50, 2: 75, 3: 95}
+
+# model_dir -> loaded artifacts, shared by every matcher in the process
+_artifacts = {}
+_artifacts_lock = threading.Lock()
+
+
+def _validate_artifacts(gb_model, rf_model, scaler, metadata):
+    """
+    Why the artifacts can't score our features, or None if they can.
+
+    model_metadata.json's feature_dim is the artifact contract: the scaler and
+    both classifiers must have been fitted on that many columns, and it must be
+    the FEATURE_COUNT columns _extract_feature_matrix builds.
+    """
+    declared = metadata.get('n_features', metadata.get('feature_dim'))
+    for name, estimator in (('feature scaler', scaler), ('GB classifier', gb_model), ('RF classifier', rf_model)):
+        n_features = getattr(estimator, 'n_features_in_', None)
+        if n_features is None:
+            continue
+        if declared is None:
+            declared = n_features
+        elif n_features != int(declared):
+            return f"{name} was fitted on {n_features} features, model_metadata.json declares {declared}"
+    if declared is not None and int(declared) != FEATURE_COUNT:
+        return f"Artifacts were trained on {declared} features, matcher produces {FEATURE_COUNT}; retrain them on the current features"
+    bins = metadata.get('score_bins')
+    if bins and len(bins) - 1 != len(BIN_TO_SCORE):
+        return f"model_metadata.json has {len(bins) - 1} score bins, matcher maps {len(BIN_TO_SCORE)}"
+    return None
+
+
+def load_model_artifacts(model_dir: str) -> Dict:
+    """
+    Load gb_classifier.pkl, rf_classifier.pkl and feature_scaler.pkl once per
+    process and check them against model_metadata.json. When they're missing
+    or don't fit the matcher's features the result carries an 'error' instead.
+    """
+    if model_dir in _artifacts:
+        return _artifacts[model_dir]
+    with _artifacts_lock:
+        if model_dir in _artifacts:
+            return _artifacts[model_dir]
+        
+        artifacts = {'gb_model': None, 'rf_model': None, 'scaler': None, 'metadata': {}, 'error': None}
+        paths = {name: os.path.join(model_dir, name) for name in (
+            'gb_classifier.pkl', 'rf_classifier.pkl', 'feature_scaler.pkl', 'model_metadata.json'
+        )}
+        try:
+            if not all(os.path.exists(path) for path in paths.values()):
+                artifacts['error'] = f"Model files not found in {model_dir}"
+            else:
+                with open(paths['model_metadata.json'], 'r') as f:
+                    artifacts['metadata'] = json.load(f)
+                with open(paths['gb_classifier.pkl'], 'rb') as f:
+                    gb_model = pickle.load(f)
+                with open(paths['rf_classifier.pkl'], 'rb') as f:
+                    rf_model = pickle.load(f)
+                with open(paths['feature_scaler.pkl'], 'rb') as f:
+                    scaler = pickle.load(f)
+                
+                artifacts['error'] = _validate_artifacts(gb_model, rf_model, scaler, artifacts['metadata'])
+                if not artifacts['error']:
+                    artifacts.update(gb_model=gb_model, rf_model=rf_model, scaler=scaler)
+                    print("✓ Models loaded successfully")
+                    print(f"  Feature dimensions: {FEATURE_COUNT}")
+        except Exception as e:
+            artifacts['error'] = f"Error loading models: {e}"
+        
+        _artifacts[model_dir] = artifacts
+        return artifacts
 
 
 class FreelancerMatcher:
@@ -439,45 +522,29 @@ class FreelancerMatcher:
         self._initialize_embedder()
     
     def _load_models(self):
-        """Load pre-trained classifiers and scaler from pickle files."""
-        try:
-            gb_path = os.path.join(self.model_dir, 'gb_classifier.pkl')
-            rf_path = os.path.join(self.model_dir, 'rf_classifier.pkl')
-            scaler_path = os.path.join(self.model_dir, 'feature_scaler.pkl')
-            metadata_path = os.path.join(self.model_dir, 'model_metadata.json')
-            
-            # Check if files exist
-            if not all(os.path.exists(p) for p in [gb_path, rf_path, scaler_path, metadata_path]):
-                print(f"⚠ Model files not found in {self.model_dir}. Using fallback scoring.")
-                self.models_loaded = False
-                return
-            
-            with open(gb_path, 'rb') as f:
-                self.gb_model = pickle.load(f)
-            
-            with open(rf_path, 'rb') as f:
-                self.rf_model = pickle.load(f)
-            
-            with open(scaler_path, 'rb') as f:
-                self.scaler = pickle.load(f)
-            
-            with open(metadata_path, 'r') as f:
-                self.metadata = json.load(f)
-            
-            self.models_loaded = True
-            print("✓ Models loaded successfully")
-            print(f"  Expected feature dimensions: {self.metadata.get('n_features', 'unknown')}")
-            
-        except Exception as e:
-            print(f"⚠ Error loading models: {e}")
+        """Attach the process-wide classifier artifacts (loaded and validated once)."""
+        artifacts = load_model_artifacts(self.model_dir)
+        self.metadata = artifacts['metadata']
+        if artifacts['error']:
+            print(f"⚠ {artifacts['error']}")
             print("  Using fallback component-based scoring")
             self.models_loaded = False
+            return
+        
+        self.gb_model = artifacts['gb_model']
+        self.rf_model = artifacts['rf_model']
+        self.scaler = artifacts['scaler']
+        self.models_loaded = True
     
+    @timed('model_load_duration_seconds', model='legacy_embedder')
     def _initialize_embedder(self):
         """Initialize BERT embedder for semantic similarity."""
         try:
             model_name = getattr(self, 'metadata', {}).get('embedding_model_name', 'all-MiniLM-L6-v2')
-            self.embedder = SentenceTransformer(model_name)
+            if settings.MODEL_SERVER_ENABLED and model_name in sentence_model_sources():
+                self.embedder = get_model_client().encoder(model_name)
+            else:
+                self.embedder = sentence_transformers.SentenceTransformer(model_name)
             print(f"✓ BERT embedder initialized: {model_name}")
         except Exception as e:
             print(f"⚠ Error initializing embedder: {e}")
@@ -488,90 +555,115 @@ class FreelancerMatcher:
         """
         Extract features from project-freelancer-application triplet.
         """
-        
-        # Prepare text inputs
+        return self._extract_feature_matrix(project, [(developer, application)])[0]
+    
+    def _classifier_features(self, project: Project, pairs: List[Tuple[DeveloperProfile, ProjectApplication]]) -> Optional[np.ndarray]:
+        """Feature rows for the classifiers, or None without them (nothing would read the rows)."""
+        if not self.models_loaded:
+            return None
+        return self._extract_feature_matrix(project, pairs)
+    
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        return np.asarray(self.embedder.encode(
+            texts,
+            batch_size=EMBEDDING_BATCH_SIZE,
+            convert_to_numpy=True,
+            show_progress_bar=False
+        ), dtype=np.float64)
+    
+    def _embed_similarities(self, project_text: str, texts: List[Optional[str]],
+                            embeddings: List[Optional[np.ndarray]] = ()) -> np.ndarray:
+        """
+        Cosine similarity to the project text of each text, then of each
+        precomputed embedding (None -> 0). Texts are encoded in one batch.
+        """
+        present = [i for i, text in enumerate(texts) if text is not None]
+        encoded = self._encode([project_text] + [texts[i] for i in present])
+        project_emb = encoded[0]
+        
+        rows = np.zeros((len(texts) + len(embeddings), len(project_emb)))
+        rows[present] = encoded[1:]
+        for i, embedding in enumerate(embeddings):
+            if embedding is not None:
+                rows[len(texts) + i] = embedding
+        norms = np.linalg.norm(rows, axis=1) * np.linalg.norm(project_emb)
+        dots = rows @ project_emb
+        return np.divide(dots, norms, out=np.zeros_like(dots), where=norms != 0)
+    
+    def _extract_feature_matrix(self, project: Project, pairs: List[Tuple[DeveloperProfile, ProjectApplication]]) -> np.ndarray:
+        """
+        Feature rows (len(pairs) x FEATURE_COUNT) for many (developer, application)
+        pairs of one project. Past projects come from one grouped query, and
+        portfolio embeddings from the per-developer cache.
+        """
+        n = len(pairs)
         project_text = f"{project.title} {project.description} {' '.join(project.tech_stack)}"
-        developer_text = f"{developer.title} {developer.bio} {developer.skills}"
-        past_projects_text = self._get_developer_past_projects(developer.user)
-        proposal_text = application.cover_letter
+        developer_texts = [f"{developer.title} {developer.bio} {developer.skills}" for developer, _ in pairs]
+        proposal_texts = [application.cover_letter for _, application in pairs]
+        past_projects = prefetch_past_projects([developer.user_id for developer, _ in pairs], limit=PAST_PROJECTS_LIMIT)
         
-        # 1. Get BERT embeddings (if available)
-        if self.embedder is not None:
+        # 1. Semantic similarities to the project (neutral 0.5 without an embedder)
+        project_developer_sim = project_proposal_sim = project_portfolio_sim = np.full(n, 0.5)
+        if self.embedder:
             try:
-                project_emb = self.embedder.encode(project_text)
-                developer_emb = self.embedder.encode(developer_text)
-                proposal_emb = self.embedder.encode(proposal_text)
-                past_projects_emb = self.embedder.encode(past_projects_text) if past_projects_text else np.zeros_like(project_emb)
+                portfolios = []
+                for developer, _ in pairs:
+                    past = past_projects.get(developer.user_id)
+                    text = past.text() if past else ''
+                    # No past projects -> zero portfolio similarity, as with a zero embedding
+                    portfolios.append((past, text) if text else None)
+                portfolio_embeddings = get_past_project_embeddings().embed('freelancer_matcher', portfolios, self._encode)
                 
-                # Calculate cosine similarities
-                project_developer_sim = self._cosine_similarity(project_emb, developer_emb)
-                project_proposal_sim = self._cosine_similarity(project_emb, proposal_emb)
-                project_portfolio_sim = self._cosine_similarity(project_emb, past_projects_emb)
+                similarities = self._embed_similarities(project_text, developer_texts + proposal_texts, portfolio_embeddings)
+                project_developer_sim = similarities[:n]
+                project_proposal_sim = similarities[n:2 * n]
+                project_portfolio_sim = similarities[2 * n:]
             except Exception as e:
                 print(f"⚠ Error computing embeddings: {e}")
-                project_developer_sim = 0.5
-                project_proposal_sim = 0.5
-                project_portfolio_sim = 0.5
-                project_emb = np.zeros(384)
-                developer_emb = np.zeros(384)
-        else:
-            project_developer_sim = 0.5
-            project_proposal_sim = 0.5
-            project_portfolio_sim = 0.5
-            project_emb = np.zeros(384)
-            developer_emb = np.zeros(384)
-        
-        # 2. Skill overlap calculation
-        required_skills = set(self._normalize_skills(project.tech_stack))
-        developer_skills = set(self._normalize_skills(developer.skills.split(',')))
-        
-        skill_overlap = len(required_skills & developer_skills) / max(len(required_skills), 1)
-        missing_skills = len(required_skills - developer_skills)
-        extra_skills = len(developer_skills - required_skills)
-        
-        # 3. Experience matching
-        years_exp = developer.years_experience or 0
-        experience_score = min(years_exp / 10, 1.0)
-        
-        # 4. Proposal quality metrics
-        proposal_length = len(proposal_text.split())
-        proposal_detailed = 1 if proposal_length > 50 else 0
-        proposal_quality_score = min(proposal_length / 500, 1.0)
-        
-        # 5. Performance metrics
-        rating_score = float(developer.rating or 0) / 5.0
-        success_rate_score = float(developer.success_rate or 50) / 100.0
-        
-        # 6. Availability and rate matching
-        proposed_rate = float(application.proposed_rate) if application.proposed_rate else 0
+        
+        # 2. Skill overlap
+        required_skills = skill_ids(project.tech_stack)
+        required_count = max(len(required_skills), 1)
+        overlap, missing, extra = np.zeros(n), np.zeros(n), np.zeros(n)
+        for i, (developer, _) in enumerate(pairs):
+            developer_skills = skill_ids(developer.skills.split(','))
+            overlap[i] = len(required_skills & developer_skills) / required_count
+            missing[i] = len(required_skills - developer_skills) / required_count
+            extra[i] = len(developer_skills - required_skills) / max(len(developer_skills), 1)
+        
+        # 3. Experience, 4. proposal and 5. performance columns
+        years_exp = np.array([developer.years_experience or 0 for developer, _ in pairs], dtype=np.float64)
+        proposal_length = np.array([len(text.split()) for text in proposal_texts], dtype=np.float64)
+        rating = np.array([float(developer.rating or 0) for developer, _ in pairs])
+        success_rate = np.array([float(developer.success_rate or 50) for developer, _ in pairs])
+        
+        # 6. Rate fit against the budget midpoint
+        proposed_rate = np.array([float(application.proposed_rate) if application.proposed_rate else 0 for _, application in pairs])
         budget_min = float(project.budget_min) if project.budget_min else 0
         budget_max = float(project.budget_max) if project.budget_max else 1000
         budget_mid = (budget_min + budget_max) / 2 if budget_max > 0 else 1000
-        
         if budget_mid > 0:
-            rate_fit = 1.0 if proposed_rate <= budget_mid else max(0, 1 - (proposed_rate - budget_mid) / budget_mid)
+            rate_fit = np.where(proposed_rate <= budget_mid, 1.0, np.maximum(0, 1 - (proposed_rate - budget_mid) / budget_mid))
         else:
-            rate_fit = 0.5
-        
-        # Combine all features (14 scalar features only for simplicity)
-        features = np.array([
-            project_developer_sim,      # Overall similarity
-            project_proposal_sim,        # Proposal relevance
-            project_portfolio_sim,       # Portfolio relevance
-            skill_overlap,               # Skill match ratio
-            missing_skills / max(len(required_skills), 1),  # Missing skills ratio
-            extra_skills / max(len(developer_skills), 1),   # Extra skills ratio
-            years_exp / 20,              # Normalized experience
-            experience_score,            # Experience fit
-            proposal_length / 1000,      # Normalized proposal length
-            float(proposal_detailed),    # Proposal quality flag
-            proposal_quality_score,      # Proposal quality score
-            rating_score,                # Developer rating
-            success_rate_score,          # Success rate
-            rate_fit,                    # Rate fit score
+            rate_fit = np.full(n, 0.5)
+        
+        # Same 14 columns, in the same order, as the training features
+        return np.column_stack([
+            project_developer_sim,            # Overall similarity
+            project_proposal_sim,             # Proposal relevance
+            project_portfolio_sim,            # Portfolio relevance
+            overlap,                          # Skill match ratio
+            missing,                          # Missing skills ratio
+            extra,                            # Extra skills ratio
+            years_exp / 20,                   # Normalized experience
+            np.minimum(years_exp / 10, 1.0),  # Experience fit
+            proposal_length / 1000,           # Normalized proposal length
+            (proposal_length > 50).astype(np.float64),  # Proposal quality flag
+            np.minimum(proposal_length / 500, 1.0),     # Proposal quality score
+            rating / 5.0,                     # Developer rating
+            success_rate / 100.0,             # Success rate
+            rate_fit,                         # Rate fit score
         ])
-        
-        return features
     
     def _cosine_similarity(self, vec1: np.ndarray, vec2: np.ndarray) -> float:
         """Calculate cosine similarity between two vectors."""
@@ -584,29 +676,13 @@ class FreelancerMatcher:
         return float(np.dot(vec1, vec2) / (norm1 * norm2))
     
     def _normalize_skills(self, skills) -> List[str]:
-        """Normalize skill strings to lowercase and split."""
-        if isinstance(skills, list):
-            return [s.strip().lower() for s in skills if s.strip()]
-        elif isinstance(skills, str):
-            return [s.strip().lower() for s in skills.replace(',', ' ').split() if s.strip()]
-        return []
+        """Canonical skill names from the shared taxonomy (so "React.js" matches "react")."""
+        return normalize_skill_list(skills)
     
     def _get_developer_past_projects(self, user: User) -> str:
         """Get developer's past project descriptions from applications."""
-        try:
-            past_projects = []
-            completed_apps = ProjectApplication.objects.filter(
-                developer=user,
-                status='selected'
-            ).select_related('project')[:10]
-            
-            for app in completed_apps:
-                past_projects.append(app.project.description)
-            
-            return ' '.join(past_projects) if past_projects else ""
-        except Exception as e:
-            print(f"⚠ Error fetching past projects: {e}")
-            return ""
+        past = prefetch_past_projects([user.id], limit=PAST_PROJECTS_LIMIT).get(user.id)
+        return past.text() if past else ""
     
     def _predict_match_score(self, features: np.ndarray, component_scores: Dict[str, float]) -> int:
         """
@@ -614,116 +690,82 @@ class FreelancerMatcher:
         
         Returns score from 0-100.
         """
+        return self._predict_match_scores(None if features is None else features.reshape(1, -1), [component_scores])[0]
+    
+    def _predict_match_scores(self, features: np.ndarray, component_scores: List[Dict[str, float]]) -> List[int]:
+        """
+        Scores for a whole feature matrix: the scaler and both classifiers run
+        once over all rows instead of once per applicant.
+        """
         
         # ALWAYS use component scores as primary method
         # This ensures transparent, explainable scoring
-        weighted_score = (
-            component_scores['skill_match'] * 0.35 +
-            component_scores['experience_fit'] * 0.25 +
-            component_scores['portfolio_quality'] * 0.20 +
-            component_scores['proposal_quality'] * 0.15 +
-            component_scores['rate_fit'] * 0.05
-        )
-        
-        print(f"  Component breakdown: Skill={component_scores['skill_match']:.1f}, "
-              f"Exp={component_scores['experience_fit']:.1f}, "
-              f"Portfolio={component_scores['portfolio_quality']:.1f}, "
-              f"Proposal={component_scores['proposal_quality']:.1f}, "
-              f"Rate={component_scores['rate_fit']:.1f}")
-        print(f"  → Weighted score: {weighted_score:.1f}")
+        weighted_scores = np.array([
+            scores['skill_match'] * 0.35 +
+            scores['experience_fit'] * 0.25 +
+            scores['portfolio_quality'] * 0.20 +
+            scores['proposal_quality'] * 0.15 +
+            scores['rate_fit'] * 0.05
+            for scores in component_scores
+        ])
         
         # If models are loaded, use them to adjust the score
-        if self.models_loaded:
+        if self.models_loaded and len(weighted_scores):
             try:
-                features_scaled = self.scaler.transform(features.reshape(1, -1))
+                features_scaled = self.scaler.transform(features)
                 
-                gb_bin = self.gb_model.predict(features_scaled)[0]
-                rf_bin = self.rf_model.predict(features_scaled)[0]
+                gb_bins = self.gb_model.predict(features_scaled)
+                rf_bins = self.rf_model.predict(features_scaled)
                 
-                bin_to_score = {0: 25, 1: 50, 2: 75, 3: 95}
-                gb_score = bin_to_score.get(gb_bin, 50)
-                rf_score = bin_to_score.get(rf_bin, 50)
-                
-                ml_score = (gb_score + rf_score) / 2
+                gb_scores = np.array([BIN_TO_SCORE.get(int(b), 50) for b in gb_bins])
+                rf_scores = np.array([BIN_TO_SCORE.get(int(b), 50) for b in rf_bins])
+                ml_scores = (gb_scores + rf_scores) / 2
                 
                 # Blend ML score with component score (70% component, 30% ML)
-                final_score = weighted_score * 0.7 + ml_score * 0.3
-                print(f"  → ML adjustment: {ml_score:.1f}, Final: {final_score:.1f}")
+                final_scores = weighted_scores * 0.7 + ml_scores * 0.3
+                print(f"  → ML adjustment applied to {len(final_scores)} applicants in one batch")
                 
-                return int(round(final_score))
+                return [int(round(score)) for score in final_scores]
             except Exception as e:
                 print(f"⚠ ML prediction failed: {e}, using component score")
         
-        return int(round(weighted_score))
+        return [int(round(score)) for score in weighted_scores]
     
     def _calculate_component_scores(self, project: Project, developer: DeveloperProfile,
                                    application: ProjectApplication) -> Dict[str, float]:
         """Calculate individual component scores for transparency."""
-        
-        # 1. Skill match (0-100)
-        required_skills = set(self._normalize_skills(project.tech_stack))
-        developer_skills = set(self._normalize_skills(developer.skills.split(',')))
-        
-        if len(required_skills) > 0:
-            skill_overlap = len(required_skills & developer_skills) / len(required_skills)
-            skill_match = skill_overlap * 100
-        else:
-            skill_match = 50.0  # Neutral if no requirements
-        
-        # 2. Experience fit (0-100)
-        years_exp = developer.years_experience or 0
-        # Map 0-10 years to 0-100 score
-        experience_fit = min(years_exp * 10, 100)
-        
-        # 3. Portfolio quality (0-100)
-        rating = float(developer.rating or 0)
-        total_projects = developer.total_projects or 0
-        success_rate = float(developer.success_rate or 50)
-        
-        # Weighted average: rating 50%, success rate 30%, project count 20%
-        portfolio_quality = (
-            (rating / 5.0 * 100) * 0.5 +
-            success_rate * 0.3 +
-            min(total_projects * 5, 100) * 0.2
-        )
-        
-        # 4. Proposal quality (0-100)
-        proposal_length = len(application.cover_letter.split())
-        # Good proposal: 100-300 words = 80-100 score
-        if proposal_length < 50:
-            proposal_quality = proposal_length * 0.8  # 0-40 score
-        elif proposal_length < 100:
-            proposal_quality = 40 + (proposal_length - 50) * 0.8  # 40-80 score
-        else:
-            proposal_quality = min(80 + (proposal_length - 100) / 10, 100)  # 80-100 score
-        
-        # 5. Rate fit (0-100)
-        proposed_rate = float(application.proposed_rate) if application.proposed_rate else 0
-        budget_min = float(project.budget_min) if project.budget_min else 0
-        budget_max = float(project.budget_max) if project.budget_max else 1000
-        budget_mid = (budget_min + budget_max) / 2 if budget_max > 0 else 1000
-        
-        if budget_mid > 0 and proposed_rate > 0:
-            if proposed_rate <= budget_mid:
-                rate_fit = 100.0
-            else:
-                # Penalty for exceeding budget
-                overage_pct = (proposed_rate - budget_mid) / budget_mid
-                rate_fit = max(0, 100 - (overage_pct * 100))
-        else:
-            rate_fit = 50.0  # Neutral if no budget info
-        
-        scores = {
-            'skill_match': float(skill_match),
-            'experience_fit': float(experience_fit),
-            'portfolio_quality': float(portfolio_quality),
-            'proposal_quality': float(proposal_quality),
-            'rate_fit': float(rate_fit),
-        }
-        
+        scores = score_application(project, developer, application)
         print(f"  Raw component scores: {scores}")
         return scores
     
+    def _score_rows(self, project: Project, pool: List[Tuple[DeveloperProfile, ProjectApplication]]) -> List[Tuple]:
+        """Vectorized component scores, one embedding batch and one classifier pass over pool."""
+        applications = [application for _, application in pool]
+        component_scores = score_applications(project, applications)
+        features = self._classifier_features(project, pool)
+        overall_scores = self._predict_match_scores(features, component_scores)
+        return list(zip(applications, [developer for developer, _ in pool], component_scores, overall_scores))
+    
+    def _score_pool(self, project: Project, pool: List[Tuple[DeveloperProfile, ProjectApplication]]) -> List[Tuple]:
+        """
+        (application, developer, component_scores, overall_score) per applicant.
+        The whole pool is scored at once; if that fails, each applicant is
+        scored alone so one bad row is skipped instead of failing the ranking.
+        """
+        try:
+            return self._score_rows(project, pool)
+        except Exception as e:
+            print(f"  ⚠ Pooled scoring failed ({e}), scoring applicants one by one")
+        
+        scored = []
+        for developer, application in pool:
+            try:
+                scored.extend(self._score_rows(project, [(developer, application)]))
+            except Exception as e:
+                print(f"  ⚠ Error processing application {application.id}: {e}")
+        return scored
+    
+    @timed('matcher_duration_seconds', matcher='legacy', operation='rank_freelancers')
     def rank_freelancers(self, project: Project, top_n: int = 5) -> List[Dict]:
         """
         Rank all freelancers who applied to a project.
@@ -741,15 +783,11 @@ class FreelancerMatcher:
         print(f"\n📊 Ranking {applications.count()} freelancers for project: {project.title}")
         results = []
         
-        for application in applications:
+        applications = scorable_applications(applications)
+        pool = [(application.developer.developerprofile, application) for application in applications]
+        
+        for application, developer, component_scores, overall_score in self._score_pool(project, pool):
             try:
-                developer = application.developer.developerprofile
-                print(f"\n  Evaluating: {developer.user.get_full_name()}")
-                
-                component_scores = self._calculate_component_scores(project, developer, application)
-                features = self._extract_features(project, developer, application)
-                overall_score = self._predict_match_score(features, component_scores)
-                
                 results.append({
                     'application_id': application.id,
                     'developer_id': developer.user.id,
@@ -772,6 +810,9 @@ class FreelancerMatcher:
         
         results.sort(key=lambda x: x['overall_score'], reverse=True)
         
+        # Stage two: cross-encoder over the top-K (project, proposal) pairs
+        results = rerank_results(project, results, applications)
+        
         print(f"\n✅ Ranked {len(results)} freelancers")
         for i, r in enumerate(results[:top_n], 1):
             print(f"  {i}. {r['developer_name']}: {r['overall_score']}/100")
@@ -785,8 +826,8 @@ class FreelancerMatcher:
         
         try:
             component_scores = self._calculate_component_scores(project, developer, application)
-            features = self._extract_features(project, developer, application)
-            overall_score = self._predict_match_score(features, component_scores)
+            features = self._classifier_features(project, [(developer, application)])
+            overall_score = self._predict_match_score(None if features is None else features[0], component_scores)
             
             required_skills = set(self._normalize_skills(project.tech_stack))
             developer_skills = set(self._normalize_skills(developer.skills.split(',')))
@@ -0,0 +1,35 @@
+# Generated migration for maintained application counters
+
+from django.db import migrations, models
+
+
+def backfill_application_counts(apps, schema_editor):
+    Project = apps.get_model('projects', 'Project')
+    ProjectApplication = apps.get_model('projects', 'ProjectApplication')
+
+    counts = {}
+    for row in ProjectApplication.objects.values('project_id', 'status').annotate(total=models.Count('id')):
+        counts.setdefault(row['project_id'], {})[row['status']] = row['total']
+
+    for project in Project.objects.all().only('id'):
+        status_counts = counts.get(project.id, {})
+        Project.objects.filter(id=project.id).update(
+            applications_count=sum(status_counts.values()),
+            application_status_counts=status_counts,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0006_rejection_notifications'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='application_status_counts',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.RunPython(backfill_application_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,58 @@
+# Generated migration for maintained developer rating aggregates
+
+from django.db import migrations, models
+import django.db.models.deletion
+from django.conf import settings
+
+
+STAR_FIELDS = {1: 'one_star', 2: 'two_star', 3: 'three_star', 4: 'four_star', 5: 'five_star'}
+
+
+def backfill_rating_aggregates(apps, schema_editor):
+    SubmissionFeedback = apps.get_model('projects', 'SubmissionFeedback')
+    DeveloperRatingAggregate = apps.get_model('projects', 'DeveloperRatingAggregate')
+
+    rows = SubmissionFeedback.objects.values('developer_id').annotate(
+        total_reviews=models.Count('id'),
+        rating_sum=models.Sum('rating'),
+        communication_sum=models.Sum('communication_rating'),
+        quality_sum=models.Sum('quality_rating'),
+        timeliness_sum=models.Sum('timeliness_rating'),
+        professionalism_sum=models.Sum('professionalism_rating'),
+        **{field: models.Count('id', filter=models.Q(rating=stars)) for stars, field in STAR_FIELDS.items()}
+    )
+    DeveloperRatingAggregate.objects.bulk_create([
+        DeveloperRatingAggregate(**{key: value or 0 for key, value in row.items()})
+        for row in rows
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('projects', '0007_project_application_status_counts'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DeveloperRatingAggregate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('total_reviews', models.IntegerField(default=0)),
+                ('rating_sum', models.IntegerField(default=0)),
+                ('communication_sum', models.IntegerField(default=0)),
+                ('quality_sum', models.IntegerField(default=0)),
+                ('timeliness_sum', models.IntegerField(default=0)),
+                ('professionalism_sum', models.IntegerField(default=0)),
+                ('one_star', models.IntegerField(default=0)),
+                ('two_star', models.IntegerField(default=0)),
+                ('three_star', models.IntegerField(default=0)),
+                ('four_star', models.IntegerField(default=0)),
+                ('five_star', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('developer', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='rating_aggregate', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.RunPython(backfill_rating_aggregates, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,68 @@
+"""
+Lazy accessors for the heavy ML libraries.
+
+torch, open_clip and sentence_transformers take seconds to import. Modules
+that only need them once a model is actually used bind a LazyModule
+instead. The real import happens on the first attribute access, so loading
+the URLconf, running a management command or booting a worker doesn't pay
+for endpoints that never touch a model.
+
+is_available() answers "is it installed?" from the import system's finder,
+without importing anything. tests.ImportTimeBudgetTests keeps this
+true: it fails when a heavy module is imported at URLconf load, or when
+that load goes over IMPORT_TIME_BUDGET_MS.
+"""
+
+import importlib
+import importlib.util
+import threading
+from functools import lru_cache
+
+# Never imported at startup; checked by the import-time test
+HEAVY_MODULES = ('torch', 'open_clip', 'sentence_transformers', 'transformers', 'sklearn')
+
+
+@lru_cache(maxsize=None)
+def _installed(name):
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def is_available(*names) -> bool:
+    """True when every named top-level package is installed (nothing is imported)."""
+    return all(_installed(name) for name in names)
+
+
+class LazyModule:
+    """Stands in for a module and imports it on first attribute access."""
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    self._module = importlib.import_module(self._name)
+        return self._module
+
+    @property
+    def loaded(self) -> bool:
+        return self._module is not None
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __repr__(self):
+        state = 'loaded' if self._module is not None else 'not loaded'
+        return f"<LazyModule {self._name} ({state})>"
+
+
+torch = LazyModule('torch')
+open_clip = LazyModule('open_clip')
+Image = LazyModule('PIL.Image')
+sentence_transformers = LazyModule('sentence_transformers')
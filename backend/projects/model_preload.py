@@ -0,0 +1,210 @@
+"""
+Copy-on-write model preloading and per-worker CPU thread limits.
+
+This is the boot mode for deployments without the model server sidecar.
+Run `gunicorn --preload devconnect.wsgi` with MODEL_PRELOAD_ENABLED=True and
+ProjectsConfig.ready() does the following in the master process, before
+workers fork:
+
+1. It loads the fine-tuned SBERT (matchers) and OpenCLIP (Figma evaluator)
+   into their process-wide singletons.
+2. It runs one dummy encode through each, so lazy initialisation is done
+   before the first real request.
+3. It calls gc.freeze(), so the collector never writes to the pages holding
+   the model objects.
+
+Forked workers then share the weights copy-on-write. They don't each hold a
+private copy.
+
+Preloading starts no threads of its own. Background threads from other
+features, such as the deadline scheduler, are started in each worker after
+the fork, because a thread started in the master would be dead in every
+worker.
+
+Thread governance applies to every serving process, preloaded or not.
+Without it, each of N workers starts one torch/OpenMP/MKL thread per core and
+N workers oversubscribe the CPU N times over. configure_threads() gives each
+worker cores // WEB_CONCURRENCY threads, through the OMP/MKL/OpenBLAS
+environment (read when those libraries load) and torch.set_num_threads. It is
+applied again in each child after a fork. Warm-up in the master runs on a
+single thread, so no OpenMP pool exists at fork time.
+
+memory_report() reads /proc/<pid>/smaps_rollup to show how much of each
+worker's RSS is shared. `python manage.py report_worker_memory --master <pid>`
+prints it.
+"""
+
+import gc
+import os
+import sys
+import time
+from typing import Dict, List
+
+from django.conf import settings
+
+from .ml_imports import is_available, torch
+
+THREAD_ENV_VARS = ('OMP_NUM_THREADS', 'MKL_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'NUMEXPR_NUM_THREADS')
+
+_preloaded = False
+
+
+def available_cores() -> int:
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def worker_threads() -> int:
+    """Compute threads each worker may use: MODEL_THREADS_PER_WORKER, or cores ÷ WEB_CONCURRENCY."""
+    if settings.MODEL_THREADS_PER_WORKER > 0:
+        return settings.MODEL_THREADS_PER_WORKER
+    return max(1, available_cores() // max(1, settings.WEB_CONCURRENCY))
+
+
+def _set_torch_threads(threads: int):
+    torch.set_num_threads(threads)
+    try:
+        # Only TorchScript fork/async ops use the inter-op pool; requests never need more than one
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        pass  # already started in this process; it can only be set once
+
+
+def configure_threads(threads: int = None) -> int:
+    """Cap the math libraries of this process (and later forks) at `threads`."""
+    threads = threads or worker_threads()
+    for name in THREAD_ENV_VARS:
+        # An explicit operator setting wins
+        os.environ.setdefault(name, str(threads))
+    # Fast tokenizers' own thread pool deadlocks in forked children once used
+    os.environ.setdefault('TOKENIZERS_PARALLELISM', 'false')
+
+    if is_available('threadpoolctl') and 'numpy' in sys.modules:
+        # BLAS loaded before the environment was set: limit it in place
+        from threadpoolctl import threadpool_limits
+        threadpool_limits(threads)
+    if 'torch' in sys.modules:
+        _set_torch_threads(threads)
+    return threads
+
+
+def _after_fork_in_child():
+    if 'torch' in sys.modules:
+        _set_torch_threads(worker_threads())
+
+
+def _warm_sbert():
+    from .fine_tuned_matcher import get_fine_tuned_matcher
+    matcher = get_fine_tuned_matcher()
+    if matcher.model is not None:
+        matcher.model.encode(['warm-up project description'], convert_to_tensor=False, show_progress_bar=False)
+
+    model_dir = os.path.join(settings.BASE_DIR, 'fine_tuned_model')
+    if settings.EMBEDDING_BATCHER_ENABLED and os.path.exists(model_dir):
+        # SimpleMatcher's shared model. Encode on the model directly; each
+        # worker restarts the batcher thread after the fork.
+        from .embedding_batcher import get_embedding_batcher
+        get_embedding_batcher(model_dir).model.encode(['warm-up'], show_progress_bar=False)
+
+
+def _warm_clip():
+    from .enhanced_design_evaluator import OPENCLIP_AVAILABLE, get_enhanced_evaluator
+    if not OPENCLIP_AVAILABLE:
+        print("   ⚠️ OpenCLIP not installed, skipping CLIP preload")
+        return
+    evaluator = get_enhanced_evaluator()
+    blank = torch.zeros(1, 3, 224, 224).to(evaluator.device)
+    evaluator.compute_visual_text_similarity(blank, 'a user interface design')
+
+
+PRELOADERS = {'sbert': _warm_sbert, 'clip': _warm_clip}
+
+
+def preload_models() -> Dict[str, float]:
+    """Load and warm MODEL_PRELOAD_MODELS in this process; returns seconds per model."""
+    global _preloaded
+    if _preloaded:
+        return {}
+    _preloaded = True
+
+    if settings.MODEL_SERVER_ENABLED:
+        print("ℹ️ MODEL_SERVER_ENABLED: models live in the model server, nothing to preload")
+        return {}
+
+    threads = worker_threads()
+    configure_threads(threads)
+    # Warm up single-threaded so no OpenMP pool is running when workers fork
+    if is_available('torch'):
+        _set_torch_threads(1)
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+    print(f"📦 Preloading models for copy-on-write sharing ({threads} thread(s) per worker)...")
+    timings = {}
+    for name in settings.MODEL_PRELOAD_MODELS:
+        preload = PRELOADERS.get(name)
+        if preload is None:
+            print(f"   ⚠️ Unknown preload model '{name}' (expected one of {', '.join(PRELOADERS)})")
+            continue
+        start = time.perf_counter()
+        try:
+            preload()
+        except Exception as e:
+            print(f"   ❌ Preloading {name} failed: {e}")
+            continue
+        timings[name] = time.perf_counter() - start
+        print(f"   ✅ {name} loaded and warmed in {timings[name]:.1f}s")
+
+    # Objects allocated so far are never collected, so GC never writes to their pages after the fork
+    gc.freeze()
+    usage = memory_usage(os.getpid())
+    if usage:
+        print(f"   🧠 Master RSS after preload: {usage['rss_mb']:.0f} MB")
+    return timings
+
+
+def memory_usage(pid: int) -> Dict:
+    """Resident, proportional, shared and private memory of a process in MB, or {} if unreadable."""
+    try:
+        with open(f'/proc/{pid}/smaps_rollup') as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return {}
+
+    kb = {}
+    for line in lines[1:]:
+        parts = line.split()
+        if len(parts) >= 2 and parts[0].endswith(':') and parts[1].isdigit():
+            kb[parts[0][:-1]] = int(parts[1])
+    shared = kb.get('Shared_Clean', 0) + kb.get('Shared_Dirty', 0)
+    private = kb.get('Private_Clean', 0) + kb.get('Private_Dirty', 0)
+    return {
+        'pid': pid,
+        'rss_mb': kb.get('Rss', 0) / 1024,
+        'pss_mb': kb.get('Pss', 0) / 1024,
+        'shared_mb': shared / 1024,
+        'private_mb': private / 1024,
+        'shared_pct': round(100 * shared / kb['Rss'], 1) if kb.get('Rss') else 0.0,
+    }
+
+
+def child_pids(parent: int) -> List[int]:
+    """Direct children of a process (the workers of a gunicorn master)."""
+    children = []
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat') as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # The ppid follows the ")"-terminated command name
+        if int(stat.rsplit(')', 1)[1].split()[1]) == parent:
+            children.append(int(entry))
+    return sorted(children)
+
+
+def memory_report(master_pid: int) -> List[Dict]:
+    """memory_usage() of a master and each of its workers, master first."""
+    return [usage for usage in map(memory_usage, [master_pid] + child_pids(master_pid)) if usage]
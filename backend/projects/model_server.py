@@ -0,0 +1,513 @@
+"""
+Local model server shared by every web worker.
+
+Without it, each gunicorn/uvicorn worker loads its own fine-tuned SBERT,
+MiniLM and OpenCLIP ViT-B-32, so memory grows with the worker count. With
+MODEL_SERVER_ENABLED, one `python manage.py run_model_server` process
+hosts them. The matchers and Figma evaluators call it over the UNIX socket
+MODEL_SERVER_SOCKET, and workers load no models at all.
+
+Protocol. Every message is a frame: a 4-byte big-endian length, then the
+payload.
+
+- Request payload: one opcode byte, then the body.
+- Response payload: one status byte (0 ok, 1 error), then the body.
+- Text lists are packed as a u32 count, then each string as u32 length plus
+  UTF-8.
+- Embeddings come back as u32 rows, u32 dim and little-endian float32 rows.
+  384 floats are 1.5 KB on the wire, instead of ~8 KB of JSON.
+
+    ENCODE      model name, texts   -> sentence embeddings
+    CLIP_TEXT   texts               -> L2-normalised CLIP text embeddings
+    CLIP_IMAGE  image URLs          -> L2-normalised CLIP image embeddings
+    HEALTH                          -> JSON: readiness, loaded models, counters
+    RELOAD                          -> JSON: reload started or not
+
+Each model sits behind an EmbeddingBatcher, so requests from different
+workers arriving within one batching window share a forward pass.
+
+Reload: SIGHUP, a RELOAD request, or a changed file under a local model
+directory (polled every MODEL_SERVER_WATCH_INTERVAL seconds) loads a fresh
+model set in the background. Requests keep using the old set until the new
+one is ready, then switch. The old set is released after
+MODEL_SERVER_RELOAD_GRACE seconds.
+"""
+
+import json
+import os
+import signal
+import socket
+import socketserver
+import struct
+import threading
+import time
+from collections import OrderedDict
+from io import BytesIO
+from typing import Dict, List, Optional
+
+import numpy as np
+import requests
+from django.conf import settings
+
+from .embedding_batcher import EmbeddingBatcher
+from .ml_imports import Image, open_clip, sentence_transformers, torch
+
+OP_ENCODE = 1
+OP_CLIP_TEXT = 2
+OP_CLIP_IMAGE = 3
+OP_HEALTH = 4
+OP_RELOAD = 5
+
+STATUS_OK = 0
+STATUS_ERROR = 1
+
+FINE_TUNED = 'fine_tuned'
+DEFAULT_SBERT = 'all-MiniLM-L6-v2'
+CLIP_TEXT = 'clip_text'
+CLIP_IMAGE = 'clip_image'
+
+MAX_FRAME_BYTES = 64 * 1024 * 1024
+
+_LENGTH = struct.Struct('>I')
+_MATRIX = struct.Struct('<II')
+
+
+class ModelServerError(Exception):
+    """Error reply from the model server, or the server is unreachable."""
+
+
+# ---------------------------------------------------------------------------
+# Wire format
+# ---------------------------------------------------------------------------
+
+def pack_strings(strings: List[str]) -> bytes:
+    out = [_LENGTH.pack(len(strings))]
+    for string in strings:
+        data = string.encode('utf-8')
+        out.append(_LENGTH.pack(len(data)))
+        out.append(data)
+    return b''.join(out)
+
+
+def unpack_strings(data: bytes, offset: int = 0):
+    """(strings, offset after them)."""
+    (count,) = _LENGTH.unpack_from(data, offset)
+    offset += _LENGTH.size
+    strings = []
+    for _ in range(count):
+        (length,) = _LENGTH.unpack_from(data, offset)
+        offset += _LENGTH.size
+        strings.append(data[offset:offset + length].decode('utf-8'))
+        offset += length
+    return strings, offset
+
+
+def pack_matrix(matrix) -> bytes:
+    matrix = np.ascontiguousarray(matrix, dtype='<f4')
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+    return _MATRIX.pack(*matrix.shape) + matrix.tobytes()
+
+
+def unpack_matrix(data: bytes) -> np.ndarray:
+    rows, dim = _MATRIX.unpack_from(data, 0)
+    return np.frombuffer(data, dtype='<f4', count=rows * dim, offset=_MATRIX.size).reshape(rows, dim)
+
+
+def send_frame(sock, payload: bytes):
+    sock.sendall(_LENGTH.pack(len(payload)) + payload)
+
+
+def recv_frame(reader) -> Optional[bytes]:
+    """Next frame from a buffered reader; None on a clean EOF."""
+    header = reader.read(_LENGTH.size)
+    if not header:
+        return None
+    if len(header) < _LENGTH.size:
+        raise ConnectionError('model server connection closed mid-frame')
+    (length,) = _LENGTH.unpack(header)
+    if length > MAX_FRAME_BYTES:
+        raise ConnectionError(f'frame of {length} bytes exceeds the limit')
+    payload = reader.read(length)
+    if len(payload) < length:
+        raise ConnectionError('model server connection closed mid-frame')
+    return payload
+
+
+# ---------------------------------------------------------------------------
+# Server side
+# ---------------------------------------------------------------------------
+
+def sentence_model_sources() -> Dict[str, str]:
+    """Sentence models the server hosts: name -> path or hub name."""
+    fine_tuned_dir = os.path.join(settings.BASE_DIR, 'fine_tuned_model')
+    return {
+        # Same fallback as FineTunedMatcher when the fine-tuned model is missing
+        FINE_TUNED: fine_tuned_dir if os.path.exists(fine_tuned_dir) else DEFAULT_SBERT,
+        DEFAULT_SBERT: DEFAULT_SBERT,
+    }
+
+
+class ClipEncoder:
+    """OpenCLIP ViT-B-32 (laion2b_s34b_b79k) with batched text and image encoding."""
+
+    def __init__(self):
+        self.device = 'cuda' if torch.cuda.is_available() else 'cpu'
+        self.model, _, self.preprocess = open_clip.create_model_and_transforms(
+            'ViT-B-32',
+            pretrained='laion2b_s34b_b79k'
+        )
+        self.tokenizer = open_clip.get_tokenizer('ViT-B-32')
+        self.model = self.model.to(self.device)
+        self.model.eval()
+
+    @staticmethod
+    def _normalise(features) -> np.ndarray:
+        features = features / features.norm(dim=-1, keepdim=True)
+        return features.float().cpu().numpy()
+
+    def encode_text(self, texts: List[str], **kwargs) -> np.ndarray:
+        with torch.no_grad():
+            return self._normalise(self.model.encode_text(self.tokenizer(texts).to(self.device)))
+
+    def load_image(self, url: str):
+        """Download and preprocess one image. Runs in the caller's thread, never the batcher's."""
+        response = requests.get(url, timeout=10)
+        response.raise_for_status()
+        return self.preprocess(Image.open(BytesIO(response.content)).convert('RGB'))
+
+    def encode_image(self, images: List, **kwargs) -> np.ndarray:
+        """Embed already preprocessed image tensors."""
+        with torch.no_grad():
+            return self._normalise(self.model.encode_image(torch.stack(images).to(self.device)))
+
+
+class _Encoder:
+    """Adapts a bound encode method to the interface EmbeddingBatcher calls."""
+
+    def __init__(self, encode):
+        self.encode = encode
+
+
+class ModelSet:
+    """One generation of loaded models, each behind its own batcher."""
+
+    def __init__(self, generation: int, sentence_sources: Dict[str, str], clip: bool):
+        self.generation = generation
+        self.sources = dict(sentence_sources)
+        self.loaded_at = time.time()
+        self.batchers = {}
+        self.clip = None
+        window, max_batch = settings.EMBEDDING_BATCH_WINDOW_MS, settings.EMBEDDING_MAX_BATCH_SIZE
+
+        loaded = {}
+        for name, source in sentence_sources.items():
+            if source not in loaded:
+                print(f"📦 Loading sentence model {name}: {source}")
+                loaded[source] = sentence_transformers.SentenceTransformer(source)
+            self.batchers[name] = EmbeddingBatcher(loaded[source], window, max_batch)
+        if clip:
+            print("📦 Loading OpenCLIP ViT-B-32")
+            self.clip = ClipEncoder()
+            self.batchers[CLIP_TEXT] = EmbeddingBatcher(_Encoder(self.clip.encode_text), window, max_batch)
+            # Only preprocessed tensors reach this batcher; downloads happen in the request threads
+            self.batchers[CLIP_IMAGE] = EmbeddingBatcher(_Encoder(self.clip.encode_image), window, max_batch)
+        for batcher in self.batchers.values():
+            batcher.start()
+
+    def stop(self):
+        for batcher in self.batchers.values():
+            batcher.stop()
+
+
+def _fingerprint(sources: Dict[str, str]) -> Optional[float]:
+    """Newest mtime under the local model directories (hub names are ignored)."""
+    newest = None
+    for source in set(sources.values()):
+        if not os.path.isdir(source):
+            continue
+        for root, _, files in os.walk(source):
+            for name in files:
+                try:
+                    mtime = os.path.getmtime(os.path.join(root, name))
+                except OSError:
+                    continue
+                newest = mtime if newest is None else max(newest, mtime)
+    return newest
+
+
+class ModelServer:
+    """Threaded UNIX-socket server around the current ModelSet."""
+
+    def __init__(self, socket_path: str, clip: bool = True, watch_interval: float = 10, reload_grace: float = 30):
+        self.socket_path = socket_path
+        self.clip = clip
+        self.watch_interval = watch_interval
+        self.reload_grace = reload_grace
+        self.models = None
+        self.started_at = time.time()
+        self.requests = 0
+        self.errors = 0
+        self.reloading = False
+        self.last_reload_error = None
+        self._generation = 0
+        self._fingerprint = None
+        self._reload_lock = threading.Lock()
+        self._server = None
+
+    # -- models ------------------------------------------------------------
+
+    def _load(self):
+        sources = sentence_model_sources()
+        fingerprint = _fingerprint(sources)
+        try:
+            models = ModelSet(self._generation + 1, sources, self.clip)
+        except Exception as e:
+            self.last_reload_error = str(e)
+            print(f"❌ Model load failed, keeping generation {self._generation}: {e}")
+            return
+
+        previous, self.models = self.models, models
+        self._generation = models.generation
+        self._fingerprint = fingerprint
+        self.last_reload_error = None
+        print(f"✅ Model generation {models.generation} ready")
+        if previous is not None:
+            # Requests already holding the old set finish on it before it stops
+            timer = threading.Timer(self.reload_grace, previous.stop)
+            timer.daemon = True
+            timer.start()
+
+    def reload(self) -> bool:
+        """Start loading a new model set in the background; False if one is already loading."""
+        with self._reload_lock:
+            if self.reloading:
+                return False
+            self.reloading = True
+
+        def run():
+            try:
+                self._load()
+            finally:
+                self.reloading = False
+
+        threading.Thread(target=run, name='model-reload', daemon=True).start()
+        return True
+
+    def _watch(self):
+        while True:
+            time.sleep(self.watch_interval)
+            if self.models is None or self.reloading:
+                continue
+            fingerprint = _fingerprint(self.models.sources)
+            if fingerprint != self._fingerprint:
+                print("🔄 Model files changed, reloading")
+                self.reload()
+
+    def health(self) -> Dict:
+        models = self.models
+        return {
+            'ready': models is not None,
+            'reloading': self.reloading,
+            'generation': models.generation if models else 0,
+            'loaded_at': models.loaded_at if models else None,
+            'models': dict(models.sources) if models else {},
+            'clip': bool(models and CLIP_TEXT in models.batchers),
+            'batchers': {name: batcher.snapshot() for name, batcher in models.batchers.items()} if models else {},
+            'requests': self.requests,
+            'errors': self.errors,
+            'uptime_seconds': round(time.time() - self.started_at, 1),
+            'last_reload_error': self.last_reload_error,
+            'pid': os.getpid(),
+        }
+
+    # -- requests ------------------------------------------------------------
+
+    def _batcher(self, name: str, models: Optional[ModelSet] = None) -> EmbeddingBatcher:
+        models = models or self.models
+        if models is None:
+            raise ModelServerError('models are still loading')
+        batcher = models.batchers.get(name)
+        if batcher is None:
+            raise ModelServerError(f'model {name!r} is not hosted here')
+        return batcher
+
+    def respond(self, payload: bytes) -> bytes:
+        self.requests += 1
+        try:
+            op, body = payload[0], payload[1:]
+            if op == OP_ENCODE:
+                (name,), offset = unpack_strings(body)
+                texts, _ = unpack_strings(body, offset)
+                result = pack_matrix(self._batcher(name).encode(texts))
+            elif op == OP_CLIP_TEXT:
+                result = pack_matrix(self._batcher(CLIP_TEXT).encode(unpack_strings(body)[0]))
+            elif op == OP_CLIP_IMAGE:
+                models = self.models
+                batcher = self._batcher(CLIP_IMAGE, models)
+                # A bad or slow URL only fails or delays this request, not the others in its batch
+                images = [models.clip.load_image(url) for url in unpack_strings(body)[0]]
+                result = pack_matrix(batcher.encode(images))
+            elif op == OP_HEALTH:
+                result = json.dumps(self.health()).encode('utf-8')
+            elif op == OP_RELOAD:
+                result = json.dumps({'reload_started': self.reload()}).encode('utf-8')
+            else:
+                raise ModelServerError(f'unknown opcode {op}')
+            return bytes([STATUS_OK]) + result
+        except Exception as e:
+            self.errors += 1
+            return bytes([STATUS_ERROR]) + str(e).encode('utf-8')
+
+    def serve_forever(self):
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+        server_ref = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                while True:
+                    try:
+                        payload = recv_frame(self.rfile)
+                    except ConnectionError:
+                        return
+                    if payload is None:
+                        return
+                    send_frame(self.connection, server_ref.respond(payload))
+
+        class Server(socketserver.ThreadingUnixStreamServer):
+            daemon_threads = True
+            # Every worker thread opens its own connection; the default backlog of 5 refuses bursts
+            request_queue_size = 256
+
+        self._server = Server(self.socket_path, Handler)
+        os.chmod(self.socket_path, 0o660)
+
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGHUP, lambda *_: self.reload())
+            signal.signal(signal.SIGTERM, lambda *_: threading.Thread(target=self._server.shutdown, daemon=True).start())
+
+        # Serve health checks while the first generation loads
+        self.reload()
+        if self.watch_interval > 0:
+            threading.Thread(target=self._watch, name='model-watch', daemon=True).start()
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+
+
+# ---------------------------------------------------------------------------
+# Client side
+# ---------------------------------------------------------------------------
+
+class RemoteEncoder:
+    """Stands in for a SentenceTransformer; encode() goes to the model server."""
+
+    def __init__(self, client, model: str):
+        self.client = client
+        self.model = model
+
+    def encode(self, sentences, convert_to_tensor: bool = False, **kwargs) -> np.ndarray:
+        single = isinstance(sentences, str)
+        embeddings = self.client.encode(self.model, [sentences] if single else list(sentences))
+        return embeddings[0] if single else embeddings
+
+
+class ModelServerClient:
+    """
+    Blocking client with one connection per thread. A dropped connection is
+    reopened and retried once.
+    """
+
+    def __init__(self, socket_path: str, timeout: float = 30, text_cache_size: int = 4096):
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._local = threading.local()
+        # CLIP prompts repeat across every design evaluated; keep their embeddings
+        self._text_cache = OrderedDict()
+        self._text_cache_size = text_cache_size
+        self._text_cache_lock = threading.Lock()
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            sock.connect(self.socket_path)
+            conn = (sock, sock.makefile('rb'))
+            self._local.conn = conn
+        return conn
+
+    def _close(self):
+        conn = getattr(self._local, 'conn', None)
+        self._local.conn = None
+        if conn:
+            for closable in (conn[1], conn[0]):
+                try:
+                    closable.close()
+                except OSError:
+                    pass
+
+    def _call(self, op: int, body: bytes = b'') -> bytes:
+        for attempt in range(2):
+            try:
+                sock, reader = self._connection()
+                send_frame(sock, bytes([op]) + body)
+                payload = recv_frame(reader)
+                if payload is None:
+                    raise ConnectionError('model server closed the connection')
+                break
+            except (OSError, ConnectionError) as e:
+                self._close()
+                if attempt:
+                    raise ModelServerError(f'model server unreachable at {self.socket_path}: {e}')
+        if payload[0] != STATUS_OK:
+            raise ModelServerError(payload[1:].decode('utf-8', 'replace'))
+        return payload[1:]
+
+    def encode(self, model: str, texts: List[str]) -> np.ndarray:
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+        return unpack_matrix(self._call(OP_ENCODE, pack_strings([model]) + pack_strings(texts)))
+
+    def clip_text(self, texts: List[str]) -> np.ndarray:
+        with self._text_cache_lock:
+            cached = {text: self._text_cache[text] for text in texts if text in self._text_cache}
+        missing = [text for text in dict.fromkeys(texts) if text not in cached]
+        if missing:
+            embeddings = unpack_matrix(self._call(OP_CLIP_TEXT, pack_strings(missing)))
+            with self._text_cache_lock:
+                for text, embedding in zip(missing, embeddings):
+                    cached[text] = self._text_cache[text] = embedding
+                while len(self._text_cache) > self._text_cache_size:
+                    self._text_cache.popitem(last=False)
+        return np.stack([cached[text] for text in texts])
+
+    def clip_image(self, url: str) -> np.ndarray:
+        return unpack_matrix(self._call(OP_CLIP_IMAGE, pack_strings([url])))[0]
+
+    def health(self) -> Dict:
+        return json.loads(self._call(OP_HEALTH))
+
+    def reload(self) -> Dict:
+        return json.loads(self._call(OP_RELOAD))
+
+    def encoder(self, model: str) -> RemoteEncoder:
+        return RemoteEncoder(self, model)
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_model_client() -> ModelServerClient:
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = ModelServerClient(settings.MODEL_SERVER_SOCKET, settings.MODEL_SERVER_TIMEOUT)
+    return _client
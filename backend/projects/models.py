@@ -1,4 +1,4 @@
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 from datetime import timedelta
@@ -68,6 +68,7 @@ class Project(models.Model):
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='draft')
     views_count = models.IntegerField(default=0)
     applications_count = models.IntegerField(default=0)
+    application_status_counts = models.JSONField(default=dict, blank=True)
     
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -109,6 +110,35 @@ class ProjectApplication(models.Model):
     
     class Meta:
         unique_together = ('project', 'developer')
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_status = instance.__dict__.get('status')
+        return instance
+    
+    def save(self, *args, **kwargs):
+        from .application_counters import record_application_created, record_status_change
+        
+        is_new = self._state.adding
+        previous_status = getattr(self, '_loaded_status', None)
+        # The row and the project's application counters commit together
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if is_new:
+                record_application_created(self.project_id, self.status)
+            elif previous_status is not None and previous_status != self.status:
+                record_status_change(self.project_id, previous_status, self.status)
+        self._loaded_status = self.status
+    
+    def delete(self, *args, **kwargs):
+        from .application_counters import record_application_deleted
+        
+        project_id, status = self.project_id, self.status
+        with transaction.atomic():
+            result = super().delete(*args, **kwargs)
+            record_application_deleted(project_id, status)
+        return result
 
 
 class FigmaShortlist(models.Model):
@@ -282,10 +312,69 @@ class SubmissionFeedback(models.Model):
     class Meta:
         ordering = ['-created_at']
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_ratings = instance.rating_values()
+        return instance
+    
+    def rating_values(self):
+        from .rating_aggregates import RATED_FIELDS
+        return {field: self.__dict__.get(field) for field in RATED_FIELDS}
+    
+    def save(self, *args, **kwargs):
+        from .rating_aggregates import record_feedback_changed, record_feedback_created
+        
+        is_new = self._state.adding
+        previous = getattr(self, '_loaded_ratings', None)
+        super().save(*args, **kwargs)
+        
+        # Keep the developer's rating aggregate in step with this row
+        current = self.rating_values()
+        if is_new:
+            record_feedback_created(self.developer_id, current)
+        elif previous is not None and previous != current:
+            record_feedback_changed(self.developer_id, previous, current)
+        self._loaded_ratings = current
+    
+    def delete(self, *args, **kwargs):
+        from .rating_aggregates import record_feedback_deleted
+        
+        developer_id, values = self.developer_id, self.rating_values()
+        result = super().delete(*args, **kwargs)
+        record_feedback_deleted(developer_id, values)
+        return result
+    
     def __str__(self):
         return f"Feedback for {self.developer.email} - {self.project.title}"
 
 
+class DeveloperRatingAggregate(models.Model):
+    """Running totals of a developer's feedback, maintained as feedback is added or removed"""
+    developer = models.OneToOneField(User, on_delete=models.CASCADE, related_name='rating_aggregate')
+    
+    total_reviews = models.IntegerField(default=0)
+    
+    # Sums of each rating dimension over all reviews
+    rating_sum = models.IntegerField(default=0)
+    communication_sum = models.IntegerField(default=0)
+    quality_sum = models.IntegerField(default=0)
+    timeliness_sum = models.IntegerField(default=0)
+    professionalism_sum = models.IntegerField(default=0)
+    
+    # Histogram of the overall rating
+    one_star = models.IntegerField(default=0)
+    two_star = models.IntegerField(default=0)
+    three_star = models.IntegerField(default=0)
+    four_star = models.IntegerField(default=0)
+    five_star = models.IntegerField(default=0)
+    
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    def __str__(self):
+        return f"Rating aggregate for {self.developer.email} ({self.total_reviews} reviews)"
+
+
 class RejectionNotification(models.Model):
     """Automatic rejection notifications sent to non-selected applicants"""
     project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name='rejection_notifications')
@@ -302,4 +391,4 @@ class RejectionNotification(models.Model):
         ordering = ['-sent_at']
     
     def __str__(self):
-        return f"Rejection notification for {self.developer.email} - {self.project.title}"
\ No newline at end of file
+        return f"Rejection notification for {self.developer.email} - {self.project.title}"
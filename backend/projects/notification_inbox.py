@@ -0,0 +1,133 @@
+"""
+Unified notification inbox with maintained unread counters.
+
+Feedback, rejections, Figma shortlist invites and deadline changes and
+reminders are all written to the Supabase notifications table, addressed by
+recipient email. notification_counters keeps the unread total per
+(recipient, kind). A trigger (supabase migration 20261019000006) adjusts it
+with every insert and is_read change, so a badge poll reads a few counter
+rows instead of counting or serialising notifications.
+"""
+
+from accounts.pagination import apply_keyset
+from accounts.supabase_client import get_supabase_client
+
+from .models import RejectionNotification, SubmissionFeedback
+
+KINDS = ('feedback', 'rejection', 'shortlist_invite', 'deadline_change', 'deadline_reminder')
+
+# Legacy per-feature rows whose is_read flag mirrors the inbox entry
+SOURCE_MODELS = {
+    'feedback': SubmissionFeedback,
+    'rejection': RejectionNotification,
+}
+
+
+def normalize_email(email):
+    return (email or '').strip().lower()
+
+
+def build_notification(recipient_email, kind, title, message='', source_id='', data=None):
+    """A notifications row, for notify_many()."""
+    return {
+        'recipient_email': normalize_email(recipient_email),
+        'kind': kind,
+        'title': title[:200],
+        'message': message or '',
+        'source_id': str(source_id or ''),
+        'data': data or {}
+    }
+
+
+def notify_many(notifications):
+    """Insert notification rows in one request; the trigger bumps their recipients' counters."""
+    notifications = [notification for notification in notifications if notification['recipient_email']]
+    if not notifications:
+        return []
+    response = get_supabase_client().table('notifications').insert(notifications).execute()
+    return response.data or []
+
+
+def notify(recipient_email, kind, title, message='', source_id='', data=None):
+    created = notify_many([build_notification(recipient_email, kind, title, message, source_id, data)])
+    return created[0] if created else None
+
+
+def unread_counts(recipient_email):
+    """{kind: unread count} for every kind, zero-filled. One query."""
+    counts = dict.fromkeys(KINDS, 0)
+    response = get_supabase_client().table('notification_counters').select('kind, unread_count').eq(
+        'recipient_email', normalize_email(recipient_email)
+    ).execute()
+    counts.update({row['kind']: row['unread_count'] for row in response.data or []})
+    return counts
+
+
+def list_notifications(recipient_email, page_size, cursor_values=None, unread_only=False, kinds=None):
+    """
+    A page of the recipient's notifications, newest first.
+
+    cursor_values is a decoded (created_at, id) cursor from the previous page.
+    Returns (notifications, has_more).
+    """
+    query = get_supabase_client().table('notifications').select('*').eq(
+        'recipient_email', normalize_email(recipient_email)
+    )
+    if unread_only:
+        query = query.eq('is_read', False)
+    if kinds:
+        query = query.in_('kind', list(kinds))
+    query = apply_keyset(query, cursor_values, descending=True)
+
+    rows = query.order('created_at', desc=True).order('id', desc=True).limit(page_size + 1).execute().data or []
+    return rows[:page_size], len(rows) > page_size
+
+
+def _flip(query):
+    """Run an is_read update restricted to unread rows and mirror it on the source rows. Returns rows flipped."""
+    # Only rows still unread are updated and returned, so two concurrent
+    # mark-reads never both count (or decrement for) the same row
+    rows = query.eq('is_read', False).execute().data or []
+    for kind, model in SOURCE_MODELS.items():
+        source_ids = [row['source_id'] for row in rows if row['kind'] == kind and row['source_id'].isdigit()]
+        if source_ids:
+            model.objects.filter(id__in=source_ids).update(is_read=True)
+    return len(rows)
+
+
+def _mark_read_query():
+    return get_supabase_client().table('notifications').update({'is_read': True})
+
+
+def mark_read(recipient_email, ids=None, kinds=None):
+    """Mark the recipient's unread notifications read: all of them, or only ids / kinds."""
+    if ids is not None and not ids:
+        return 0
+    query = _mark_read_query().eq('recipient_email', normalize_email(recipient_email))
+    if ids is not None:
+        query = query.in_('id', ids)
+    if kinds:
+        query = query.in_('kind', list(kinds))
+    return _flip(query)
+
+
+def mark_ids_read(kind, ids):
+    """Mark notifications of one kind read by inbox id, for endpoints addressed by id alone."""
+    return _flip(_mark_read_query().eq('kind', kind).in_('id', list(ids)))
+
+
+def mark_sources_read(kind, source_ids):
+    """Keep the inbox in step when a legacy endpoint marks feedback/rejections read."""
+    return _flip(_mark_read_query().eq('kind', kind).in_('source_id', [str(source_id) for source_id in source_ids]))
+
+
+def notification_payload(notification):
+    return {
+        'id': notification['id'],
+        'kind': notification['kind'],
+        'title': notification['title'],
+        'message': notification['message'],
+        'data': notification['data'],
+        'is_read': notification['is_read'],
+        'created_at': notification['created_at']
+    }
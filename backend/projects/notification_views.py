@@ -0,0 +1,103 @@
+from django.http import JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_http_methods
+from .notification_inbox import KINDS, list_notifications, mark_read, notification_payload, unread_counts
+from accounts.pagination import decode_cursor, encode_cursor, parse_page_size
+import json
+
+
+def _requested_kinds(value):
+    kinds = [kind for kind in (value or '').split(',') if kind]
+    unknown = [kind for kind in kinds if kind not in KINDS]
+    return kinds, unknown
+
+
+@csrf_exempt
+@require_http_methods(["GET"])
+def get_notifications(request, user_email):
+    """
+    Get a user's notifications across feedback, rejections, shortlist invites
+    and deadline changes, newest first.
+
+    Query params:
+    - limit: page size (default 20, max 100)
+    - cursor: next_cursor from the previous page
+    - unread: 'true' for unread only
+    - kind: comma-separated kinds to include
+    """
+    try:
+        page_size = parse_page_size(request.GET.get('limit'))
+        cursor = request.GET.get('cursor')
+        cursor_values = decode_cursor(cursor)
+        if cursor and cursor_values is None:
+            return JsonResponse({'error': 'Invalid cursor'}, status=400)
+
+        kinds, unknown = _requested_kinds(request.GET.get('kind'))
+        if unknown:
+            return JsonResponse({'error': f'Unknown kind: {", ".join(unknown)}'}, status=400)
+
+        notifications, has_more = list_notifications(
+            user_email,
+            page_size,
+            cursor_values,
+            unread_only=request.GET.get('unread', '').lower() == 'true',
+            kinds=kinds
+        )
+
+        last = notifications[-1] if notifications else None
+        return JsonResponse({
+            'notifications': [notification_payload(notification) for notification in notifications],
+            'next_cursor': encode_cursor(last['created_at'], last['id']) if (last and has_more) else None,
+            'has_more': has_more
+        })
+
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=500)
+
+
+@csrf_exempt
+@require_http_methods(["GET"])
+def get_unread_count(request, user_email):
+    """Badge count: the maintained unread counters, no notification rows are read"""
+    try:
+        counts = unread_counts(user_email)
+        return JsonResponse({
+            'unread_count': sum(counts.values()),
+            'by_kind': counts
+        })
+
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=500)
+
+
+@csrf_exempt
+@require_http_methods(["POST"])
+def mark_notifications_read(request, user_email):
+    """
+    Mark notifications read in one update.
+
+    Body: {"ids": [...]} for specific notifications, {"kind": "rejection"} for
+    one kind, or {} for everything.
+    """
+    try:
+        data = json.loads(request.body or '{}')
+        ids = data.get('ids')
+        if ids is not None and not isinstance(ids, list):
+            return JsonResponse({'error': 'ids must be a list'}, status=400)
+
+        kinds, unknown = _requested_kinds(data.get('kind'))
+        if unknown:
+            return JsonResponse({'error': f'Unknown kind: {", ".join(unknown)}'}, status=400)
+
+        updated = mark_read(user_email, ids=ids, kinds=kinds)
+        counts = unread_counts(user_email)
+
+        return JsonResponse({
+            'success': True,
+            'marked_read': updated,
+            'unread_count': sum(counts.values()),
+            'by_kind': counts
+        })
+
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=500)
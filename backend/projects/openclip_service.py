@@ -4,18 +4,20 @@ Uses CLIP model to compute similarity between design images and text description
 """
 
 import re
+import numpy as np
 import requests
 from io import BytesIO
 
-# Try to import OpenCLIP dependencies
-try:
-    import torch
-    import open_clip
-    from PIL import Image
-    OPENCLIP_AVAILABLE = True
-except ImportError as e:
-    OPENCLIP_AVAILABLE = False
-    print(f"⚠️ OpenCLIP not available: {e}")
+from django.conf import settings
+
+# OpenCLIP dependencies: torch/open_clip are imported on first use, not when figma_views loads
+from projects.ml_imports import Image, is_available, open_clip, torch
+from projects.model_server import get_model_client
+from accounts.metrics import timed
+
+OPENCLIP_AVAILABLE = is_available('torch', 'open_clip', 'PIL')
+if not OPENCLIP_AVAILABLE:
+    print("⚠️ OpenCLIP not available")
     print("   Install with: pip install open-clip-torch pillow torchvision")
 
 
@@ -23,18 +25,25 @@ class OpenCLIPEvaluator:
     """Evaluates Figma designs using OpenCLIP model"""
     
     def __init__(self):
+        self.model = None
+        self.preprocess = None
+        self.tokenizer = None
+        # With the model server, CLIP runs there and nothing is loaded here
+        self.remote = get_model_client() if settings.MODEL_SERVER_ENABLED else None
+        if self.remote:
+            self.device = "model_server"
+            return
+        
         if not OPENCLIP_AVAILABLE:
             raise ImportError(
                 "OpenCLIP is not installed. "
                 "Install with: pip install open-clip-torch pillow torchvision"
             )
         
-        self.model = None
-        self.preprocess = None
-        self.tokenizer = None
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
         self._initialize_model()
     
+    @timed('model_load_duration_seconds', model='openclip')
     def _initialize_model(self):
         """Initialize OpenCLIP model"""
         try:
@@ -90,6 +99,13 @@ class OpenCLIPEvaluator:
         Returns a score between 0 and 1.
         """
         try:
+            if self.remote:
+                image_features = self.remote.clip_image(image_url)
+                text_features = self.remote.clip_text([text_description])[0]
+                # Both come back L2-normalised
+                similarity = float(np.dot(image_features, text_features))
+                return max(0, min(100, (similarity + 1) / 2 * 100))
+            
             # Load and preprocess image
             image_tensor = self.load_image_from_url(image_url)
             
@@ -117,6 +133,7 @@ class OpenCLIPEvaluator:
             print(f"❌ Error computing similarity: {e}")
             raise
     
+    @timed('design_evaluation_duration_seconds', evaluator='openclip')
     def evaluate_figma_submissions(self, project_description, submissions):
         """
         Evaluate multiple Figma submissions and rank them.
@@ -188,7 +205,7 @@ _evaluator_instance = None
 
 def get_openclip_evaluator():
     """Get or create OpenCLIP evaluator instance"""
-    if not OPENCLIP_AVAILABLE:
+    if not OPENCLIP_AVAILABLE and not settings.MODEL_SERVER_ENABLED:
         raise ImportError(
             "OpenCLIP is not installed. "
             "Install with: pip install open-clip-torch pillow torchvision"
@@ -0,0 +1,173 @@
+"""
+Developers' selected past projects for a whole applicant pool.
+
+Ranking used to query each applicant's selected applications separately
+and re-embed the same portfolio text for every ranking. The ORM matchers now
+call prefetch_past_projects(), and the dict-based SimpleMatcher calls
+fetch_supabase_past_projects(). Either one loads every applicant's
+selections in one grouped query.
+
+Portfolio embeddings are cached per developer together with the IDs of the
+selections they were built from. A cached embedding is reused until the
+developer gets a new selection; edits to an old project's description don't
+invalidate it.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from django.conf import settings
+
+
+class PastProjects:
+    """One developer's selected projects."""
+
+    __slots__ = ('developer_id', 'signature', 'projects')
+
+    def __init__(self, developer_id, signature: Tuple, projects: List[Tuple[str, str]]):
+        self.developer_id = developer_id
+        # Application IDs of the selections; changes only when a new one is added
+        self.signature = signature
+        self.projects = projects  # (title, description)
+
+    def text(self, with_titles: bool = False, separator: str = ' ') -> str:
+        if with_titles:
+            return separator.join(f"{title}: {description}" for title, description in self.projects)
+        return separator.join(description for _, description in self.projects)
+
+
+def _group(rows: Iterable[Tuple], limit: int) -> Dict:
+    """(developer_id, application_id, title, description) rows -> {developer_id: PastProjects}."""
+    grouped = {}
+    for developer_id, application_id, title, description in rows:
+        items = grouped.setdefault(developer_id, [])
+        if len(items) < limit:
+            items.append((application_id, title or '', description or ''))
+    return {
+        developer_id: PastProjects(
+            developer_id,
+            tuple(application_id for application_id, _, _ in items),
+            [(title, description) for _, title, description in items],
+        )
+        for developer_id, items in grouped.items()
+    }
+
+
+def prefetch_past_projects(developer_ids: Iterable, limit: int = 10) -> Dict:
+    """{user id: PastProjects} for every developer with a selected application, in one query."""
+    from projects.models import ProjectApplication
+
+    developer_ids = list(set(developer_ids))
+    if not developer_ids:
+        return {}
+    try:
+        rows = ProjectApplication.objects.filter(
+            developer_id__in=developer_ids,
+            status='selected'
+        ).order_by('developer_id', 'id').values_list('developer_id', 'id', 'project__title', 'project__description')
+        return _group(rows, limit)
+    except Exception as e:
+        print(f"⚠ Error fetching past projects: {e}")
+        return {}
+
+
+def supabase_past_projects_query(supabase, developer_ids: Iterable):
+    """Selected applications of the developers, with their project's title and description."""
+    return supabase.table('project_applications') \
+        .select('id, developer_id, projects(title, description)') \
+        .in_('developer_id', list(developer_ids)) \
+        .eq('status', 'selected') \
+        .order('id')
+
+
+def group_supabase_past_projects(rows: List[Dict], limit: int = 5) -> Dict:
+    """supabase_past_projects_query() rows -> {developer_id: PastProjects}."""
+    grouped = []
+    for row in rows or []:
+        project = row.get('projects') or {}
+        grouped.append((row['developer_id'], row['id'], project.get('title'), project.get('description')))
+    return _group(grouped, limit)
+
+
+def fetch_supabase_past_projects(supabase, developer_ids: Iterable, limit: int = 5) -> Dict:
+    """Supabase counterpart of prefetch_past_projects(), keyed by developer_id."""
+    developer_ids = [developer_id for developer_id in set(developer_ids) if developer_id]
+    if not developer_ids:
+        return {}
+    try:
+        response = supabase_past_projects_query(supabase, developer_ids).execute()
+        return group_supabase_past_projects(response.data, limit)
+    except Exception as e:
+        print(f"⚠ Error fetching past projects: {e}")
+        return {}
+
+
+class PastProjectEmbeddings:
+    """
+    Portfolio embeddings keyed by (namespace, developer_id), where the
+    namespace names the model and text format. Least recently used entries
+    are evicted past max_entries.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # key -> (signature, embedding)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def embed(self, namespace: str, portfolios: List[Optional[Tuple[PastProjects, str]]],
+              encode: Callable[[List[str]], np.ndarray]) -> List[Optional[np.ndarray]]:
+        """
+        Embeddings for (PastProjects, text) items, None for None. Texts with no
+        current cache entry are encoded together in one encode() call.
+        """
+        results = [None] * len(portfolios)
+        pending = {}
+        with self._lock:
+            for i, portfolio in enumerate(portfolios):
+                if portfolio is None:
+                    continue
+                past, text = portfolio
+                key = (namespace, past.developer_id)
+                entry = self._entries.get(key)
+                if entry is not None and entry[0] == past.signature:
+                    self._entries.move_to_end(key)
+                    results[i] = entry[1]
+                    self.hits += 1
+                else:
+                    pending.setdefault(key, (past.signature, text, []))[2].append(i)
+                    self.misses += 1
+
+        if pending:
+            embeddings = encode([text for _, text, _ in pending.values()])
+            with self._lock:
+                for (key, (signature, _, indexes)), embedding in zip(pending.items(), embeddings):
+                    embedding = np.asarray(embedding, dtype=np.float64)
+                    self._entries[key] = (signature, embedding)
+                    self._entries.move_to_end(key)
+                    for i in indexes:
+                        results[i] = embedding
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return results
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+
+_embeddings = None
+_embeddings_lock = threading.Lock()
+
+
+def get_past_project_embeddings() -> PastProjectEmbeddings:
+    """Process-wide portfolio embedding cache."""
+    global _embeddings
+    if _embeddings is None:
+        with _embeddings_lock:
+            if _embeddings is None:
+                _embeddings = PastProjectEmbeddings(settings.PAST_PROJECT_EMBEDDING_CACHE_SIZE)
+    return _embeddings
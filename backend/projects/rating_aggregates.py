@@ -0,0 +1,119 @@
+"""
+Incrementally maintained developer rating aggregates.
+
+DeveloperRatingAggregate holds, per developer, the number of reviews, the sum
+of every rating dimension and a 1-5 star histogram of the overall rating. Each
+feedback row adds to it when created and subtracts when deleted, so feedback
+listings and rating summaries read one row instead of aggregating
+SubmissionFeedback, and DeveloperProfile.rating (used by the matchers) is
+refreshed from it in the same transaction.
+"""
+
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import F
+
+from accounts.models import DeveloperProfile
+from .models import DeveloperRatingAggregate
+
+# SubmissionFeedback field -> aggregate sum field
+SUM_FIELDS = {
+    'rating': 'rating_sum',
+    'communication_rating': 'communication_sum',
+    'quality_rating': 'quality_sum',
+    'timeliness_rating': 'timeliness_sum',
+    'professionalism_rating': 'professionalism_sum',
+}
+RATED_FIELDS = tuple(SUM_FIELDS)
+
+STAR_FIELDS = {1: 'one_star', 2: 'two_star', 3: 'three_star', 4: 'four_star', 5: 'five_star'}
+
+
+def _add_deltas(deltas, values, sign):
+    deltas['total_reviews'] = deltas.get('total_reviews', 0) + sign
+    for field, sum_field in SUM_FIELDS.items():
+        deltas[sum_field] = deltas.get(sum_field, 0) + sign * int(values.get(field) or 0)
+    star_field = STAR_FIELDS.get(int(values.get('rating') or 0))
+    if star_field:
+        deltas[star_field] = deltas.get(star_field, 0) + sign
+
+
+def apply_rating_changes(changes):
+    """
+    Apply [(developer_id, rating_values, sign)] to the aggregates.
+
+    Changes are folded per developer first, so a batch costs one UPDATE per
+    developer however many feedback rows it covers.
+    """
+    per_developer = {}
+    for developer_id, values, sign in changes:
+        _add_deltas(per_developer.setdefault(developer_id, {}), values, sign)
+    if not per_developer:
+        return
+
+    with transaction.atomic():
+        DeveloperRatingAggregate.objects.bulk_create(
+            [DeveloperRatingAggregate(developer_id=developer_id) for developer_id in per_developer],
+            ignore_conflicts=True
+        )
+        for developer_id, deltas in per_developer.items():
+            deltas = {field: delta for field, delta in deltas.items() if delta}
+            if deltas:
+                DeveloperRatingAggregate.objects.filter(developer_id=developer_id).update(
+                    **{field: F(field) + delta for field, delta in deltas.items()}
+                )
+
+        # Matchers read DeveloperProfile.rating directly
+        for aggregate in DeveloperRatingAggregate.objects.filter(developer_id__in=per_developer):
+            DeveloperProfile.objects.filter(user_id=aggregate.developer_id).update(
+                rating=Decimal(str(_average(aggregate, 'rating_sum')))
+            )
+
+
+def record_feedback_created(developer_id, values):
+    apply_rating_changes([(developer_id, values, 1)])
+
+
+def record_feedback_deleted(developer_id, values):
+    apply_rating_changes([(developer_id, values, -1)])
+
+
+def record_feedback_changed(developer_id, old_values, new_values):
+    apply_rating_changes([(developer_id, old_values, -1), (developer_id, new_values, 1)])
+
+
+def record_feedback_batch(feedbacks):
+    """Account for SubmissionFeedback rows inserted with bulk_create, which bypasses save()."""
+    apply_rating_changes([(feedback.developer_id, feedback.rating_values(), 1) for feedback in feedbacks])
+
+
+def _average(aggregate, sum_field):
+    if not aggregate or not aggregate.total_reviews:
+        return 0
+    return round(getattr(aggregate, sum_field) / aggregate.total_reviews, 2)
+
+
+def get_rating_aggregate(developer_email):
+    """The developer's aggregate in a single query, or None if they have no reviews yet."""
+    return DeveloperRatingAggregate.objects.filter(developer__email=developer_email).first()
+
+
+def average_ratings(aggregate):
+    """Per-dimension means in the shape get_developer_feedback returns."""
+    return {
+        'overall': _average(aggregate, 'rating_sum'),
+        'communication': _average(aggregate, 'communication_sum'),
+        'quality': _average(aggregate, 'quality_sum'),
+        'timeliness': _average(aggregate, 'timeliness_sum'),
+        'professionalism': _average(aggregate, 'professionalism_sum'),
+        'total_reviews': aggregate.total_reviews if aggregate else 0
+    }
+
+
+def rating_distribution(aggregate):
+    """{'5': count, ..., '1': count} star histogram."""
+    return {
+        str(stars): (getattr(aggregate, field) if aggregate else 0)
+        for stars, field in sorted(STAR_FIELDS.items(), reverse=True)
+    }
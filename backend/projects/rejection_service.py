@@ -0,0 +1,203 @@
+"""
+In-process rejection notifications for applicants who were not selected.
+
+Closing a project rejects every remaining applicant in a fixed number of
+queries regardless of how many there are:
+
+- reject_unselected_applicants() for ORM projects: one read of the pending
+  applications with their users, one bulk status update, a bulk_create for
+  the notifications and one insert of their inbox entries.
+- reject_unselected_supabase_applicants() for projects that only exist in
+  Supabase (the Figma shortlist flow): one read of the pending applications,
+  one bulk status update and one insert of the inbox entries, with
+  applicant names and emails from the cached user directory.
+
+Both run in the request. A failed notification insert is logged and does
+not undo the rejections.
+"""
+
+import logging
+import random
+from collections import Counter
+
+from django.db import transaction
+
+from accounts.user_directory import get_display_names, get_emails
+
+from .application_counters import record_bulk_status_change
+from .models import Project, ProjectApplication, RejectionNotification
+from .notification_inbox import build_notification, notify_many
+
+logger = logging.getLogger(__name__)
+
+
+# Encouraging rejection messages
+REJECTION_MESSAGES = [
+    {
+        "title": "Thank you for your application",
+        "message": """Dear {developer_name},
+
+Thank you for taking the time to apply for the "{project_title}" project. We truly appreciate your interest and the effort you put into your application.
+
+After careful consideration, we have decided to move forward with other candidates whose experience more closely aligns with the specific requirements of this project.
+
+Please don't feel discouraged! Your skills and experience are valuable, and we encourage you to continue applying for other projects on DevConnect. Every application is a learning opportunity, and the right project for you is out there.
+
+We wish you the best of luck in your future endeavors and hope to see you succeed on our platform.
+
+Best regards,
+The DevConnect Team"""
+    },
+    {
+        "title": "Update on your application",
+        "message": """Hi {developer_name},
+
+We wanted to reach out regarding your application for "{project_title}".
+
+While we were impressed by your profile and experience, we've decided to proceed with candidates who have more specific expertise in the technologies required for this particular project.
+
+This decision doesn't reflect on your abilities as a developer. The competition was strong, and we had to make difficult choices based on very specific project requirements.
+
+Keep building your portfolio, continue applying, and stay positive! Your perfect project match is waiting for you on DevConnect.
+
+Stay motivated and keep coding!
+
+Warm regards,
+DevConnect Team"""
+    },
+    {
+        "title": "Application status update",
+        "message": """Hello {developer_name},
+
+Thank you for your interest in the "{project_title}" project.
+
+After reviewing all applications, we've chosen to work with other developers for this specific project. This was a challenging decision given the quality of applications we received.
+
+Remember: rejection is redirection! This simply means there's a better opportunity waiting for you. Use this as motivation to:
+- Continue enhancing your skills
+- Build more impressive portfolio projects
+- Apply to projects that align even better with your expertise
+
+Your talent and dedication will lead you to the right project. Don't give up!
+
+Best wishes,
+The DevConnect Team"""
+    }
+]
+
+
+def _compose_message(developer_name, project_title):
+    message_template = random.choice(REJECTION_MESSAGES)
+    return message_template['title'], message_template['message'].format(
+        developer_name=developer_name,
+        project_title=project_title
+    )
+
+
+def reject_unselected_applicants(project_id, selected_developer_ids=()):
+    """
+    Reject every applicant of project_id not in selected_developer_ids and
+    notify them. Returns [{'developer_email', 'notification_id'}].
+
+    Raises Project.DoesNotExist for an unknown project.
+    """
+    project = Project.objects.get(id=project_id)
+
+    # One query for the applications together with their users and any
+    # notification they already received
+    applications = list(
+        ProjectApplication.objects.filter(project=project)
+        .exclude(developer_id__in=selected_developer_ids)
+        .exclude(status='rejected')  # Don't send duplicate rejections
+        .select_related('developer', 'rejection_notification')
+    )
+    if not applications:
+        return []
+
+    previous_statuses = Counter(application.status for application in applications)
+    new_notifications = []
+    for application in applications:
+        if hasattr(application, 'rejection_notification'):
+            continue
+        title, message = _compose_message(application.developer.get_full_name() or 'Developer', project.title)
+        new_notifications.append(RejectionNotification(
+            project=project,
+            application=application,
+            developer=application.developer,
+            title=title,
+            message=message
+        ))
+
+    with transaction.atomic():
+        ProjectApplication.objects.filter(id__in=[application.id for application in applications]).update(status='rejected')
+        record_bulk_status_change(project.id, previous_statuses, 'rejected')
+        created = RejectionNotification.objects.bulk_create(new_notifications)
+
+    _send_rejections(project.id, [
+        build_notification(
+            notification.developer.email,
+            'rejection',
+            notification.title,
+            notification.message,
+            source_id=notification.id,
+            data={'project_id': project.id, 'project_title': project.title}
+        )
+        for notification in created
+    ])
+    return [
+        {'developer_email': notification.developer.email, 'notification_id': notification.id}
+        for notification in created
+    ]
+
+
+def reject_unselected_supabase_applicants(supabase, project, selected_developer_ids=()):
+    """
+    Reject every application of a Supabase project (a `projects` row) that
+    isn't from selected_developer_ids or already rejected, and put a rejection
+    in each applicant's inbox. Returns the number of applications rejected.
+    """
+    selected = set(selected_developer_ids)
+    pending_response = supabase.table('project_applications').select('id, developer_id').eq(
+        'project_id', project['id']
+    ).neq('status', 'rejected').execute()
+    # Already-rejected applications are skipped, so nobody is notified twice
+    applications = [
+        application for application in pending_response.data or []
+        if application['developer_id'] not in selected
+    ]
+    if not applications:
+        return 0
+
+    supabase.table('project_applications').update({'status': 'rejected'}).in_(
+        'id', [application['id'] for application in applications]
+    ).execute()
+
+    developer_ids = [application['developer_id'] for application in applications]
+    try:
+        names = get_display_names(supabase, developer_ids, default='Developer')
+        emails = get_emails(supabase, developer_ids)
+    except Exception:
+        logger.exception("Could not resolve rejected applicants of project %s", project['id'])
+        return len(applications)
+
+    notifications = []
+    for application in applications:
+        title, message = _compose_message(names.get(application['developer_id'], 'Developer'), project.get('title'))
+        notifications.append(build_notification(
+            emails.get(application['developer_id']),
+            'rejection',
+            title,
+            message,
+            source_id=application['id'],
+            data={'project_id': project['id'], 'project_title': project.get('title')}
+        ))
+    _send_rejections(project['id'], notifications)
+    return len(applications)
+
+
+def _send_rejections(project_id, notifications):
+    """Insert rejection inbox entries; the rejections themselves are already saved, so failures are only logged."""
+    try:
+        notify_many(notifications)
+    except Exception:
+        logger.exception("Could not send rejection notifications for project %s", project_id)
@@ -0,0 +1,169 @@
+"""
+Second-stage reranking of ranked applicants with a cross-encoder.
+
+Stage one is the matcher's own ranking: bi-encoder similarities plus
+component scores for every applicant. This stage re-scores only the top-K
+(project, proposal) pairs with a CPU cross-encoder, which reads both texts
+together. All K pairs go through the model in one predict() call.
+
+The cross-encoder logits are min-max rescaled onto the stage-one score range
+of the top-K block, blended with the stage-one scores, and only that block
+is re-sorted. It stays ahead of the rest of the list, so applicants below K
+never overtake a reranked one. Every result records the stage its score
+came from in 'ranking_stage'. The rest of each result dict is unchanged.
+
+K shrinks to fit RERANK_LATENCY_BUDGET_MS. The per-pair cost is a moving
+average of previous batches, and stage two is skipped when even one pair
+wouldn't fit the budget.
+"""
+
+import threading
+import time
+from typing import Dict, List
+
+from django.conf import settings
+
+from accounts.metrics import timed
+from projects.ml_imports import is_available, sentence_transformers
+
+CROSS_ENCODER_AVAILABLE = is_available('sentence_transformers')
+
+BI_ENCODER = 'bi_encoder'
+CROSS_ENCODER = 'cross_encoder'
+
+# Weight of the previous estimate in the per-pair latency moving average
+_LATENCY_SMOOTHING = 0.7
+
+
+def project_text(project) -> str:
+    """Query side of the (project, proposal) pairs."""
+    return f"{project.title}. {project.description} Required skills: {', '.join(project.tech_stack)}."
+
+
+class CrossEncoderReranker:
+    """Lazily loaded cross-encoder with a latency-budgeted top-K rerank."""
+
+    def __init__(self, model_name: str, top_k: int, latency_budget_ms: float, weight: float):
+        self.model_name = model_name
+        self.top_k = top_k
+        self.latency_budget_ms = latency_budget_ms
+        self.weight = weight
+        self.model = None
+        self.load_error = None
+        self.pair_ms = None  # moving average of predict() time per pair
+        self._lock = threading.Lock()
+
+    def load(self):
+        """Load the cross-encoder once; returns it, or None when unavailable."""
+        if self.model is not None or self.load_error:
+            return self.model
+        with self._lock:
+            if self.model is None and not self.load_error:
+                if not CROSS_ENCODER_AVAILABLE:
+                    self.load_error = 'sentence_transformers CrossEncoder not available'
+                else:
+                    try:
+                        self.model = sentence_transformers.CrossEncoder(self.model_name, device='cpu')
+                        print(f"✅ Cross-encoder loaded: {self.model_name}")
+                    except Exception as e:
+                        self.load_error = str(e)
+                if self.load_error:
+                    print(f"⚠️ Cross-encoder unavailable, keeping bi-encoder ranking: {self.load_error}")
+        return self.model
+
+    def budgeted_k(self) -> int:
+        """Top-K that should fit the latency budget, from the observed per-pair cost."""
+        pair_ms = self.pair_ms
+        if not pair_ms:
+            return self.top_k
+        return max(0, min(self.top_k, int(self.latency_budget_ms // pair_ms)))
+
+    def _plan_k(self, candidates: int) -> int:
+        """How many of candidates to rerank; decays the cost estimate when over budget."""
+        with self._lock:
+            k = min(self.budgeted_k(), candidates)
+            if k < 2 and self.pair_ms and candidates >= 2:
+                # Over budget: let the estimate decay so a slow outlier doesn't disable stage two for good
+                self.pair_ms *= _LATENCY_SMOOTHING
+            return k
+
+    def _record_pair_ms(self, per_pair: float):
+        """Fold one predict() timing into the moving average."""
+        with self._lock:
+            if self.pair_ms is None:
+                self.pair_ms = per_pair
+            else:
+                self.pair_ms = _LATENCY_SMOOTHING * self.pair_ms + (1 - _LATENCY_SMOOTHING) * per_pair
+
+    @timed('matcher_duration_seconds', matcher='cross_encoder', operation='rerank')
+    def rerank(self, query: str, results: List[Dict], proposals: Dict) -> List[Dict]:
+        """
+        Rerank stage-one results, best first. proposals maps application_id to
+        the proposal text. Returns the same dicts with overall_score updated
+        for the reranked ones and 'ranking_stage' set on all.
+        """
+        for result in results:
+            result['ranking_stage'] = BI_ENCODER
+
+        k = self._plan_k(len(results))
+        if k < 2 or self.load() is None:
+            return results
+
+        results = sorted(results, key=lambda r: r['overall_score'], reverse=True)
+        top, rest = results[:k], results[k:]
+        pairs = [(query, proposals.get(result['application_id']) or '') for result in top]
+        try:
+            start = time.perf_counter()
+            logits = self.model.predict(pairs, batch_size=len(pairs), show_progress_bar=False)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+        except Exception as e:
+            print(f"⚠️ Cross-encoder rerank failed, keeping bi-encoder ranking: {e}")
+            return results
+
+        self._record_pair_ms(elapsed_ms / len(pairs))
+
+        # Logits aren't on the 0-100 scale: map them onto the block's own score range
+        logits = [float(logit) for logit in logits]
+        low_logit, high_logit = min(logits), max(logits)
+        low_score, high_score = top[-1]['overall_score'], top[0]['overall_score']
+        for result, logit in zip(top, logits):
+            if high_logit > low_logit:
+                cross_score = low_score + (logit - low_logit) / (high_logit - low_logit) * (high_score - low_score)
+            else:
+                cross_score = result['overall_score']
+            result['overall_score'] = int(round(
+                result['overall_score'] * (1 - self.weight) + cross_score * self.weight
+            ))
+            result['ranking_stage'] = CROSS_ENCODER
+
+        top.sort(key=lambda r: r['overall_score'], reverse=True)
+        print(f"  🔁 Cross-encoder reranked top {k} in {elapsed_ms:.0f} ms")
+        return top + rest
+
+
+_reranker = None
+_reranker_lock = threading.Lock()
+
+
+def get_reranker() -> CrossEncoderReranker:
+    global _reranker
+    if _reranker is None:
+        with _reranker_lock:
+            if _reranker is None:
+                _reranker = CrossEncoderReranker(
+                    settings.RERANK_MODEL,
+                    settings.RERANK_TOP_K,
+                    settings.RERANK_LATENCY_BUDGET_MS,
+                    settings.RERANK_WEIGHT,
+                )
+    return _reranker
+
+
+def rerank_results(project, results: List[Dict], applications) -> List[Dict]:
+    """Apply stage two to a matcher's stage-one results when reranking is enabled."""
+    if not settings.RERANK_ENABLED:
+        for result in results:
+            result['ranking_stage'] = BI_ENCODER
+        return results
+    proposals = {application.id: application.cover_letter for application in applications}
+    return get_reranker().rerank(project_text(project), results, proposals)
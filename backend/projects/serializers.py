@@ -25,7 +25,7 @@ class ProjectSerializer(serializers.ModelSerializer):
     
     def get_applications_count(self, obj):
         """Get count of pending applications."""
-        return obj.applications.filter(status='pending').count()
+        return (obj.application_status_counts or {}).get('pending', 0)
 
 
 class DeveloperProfileSerializer(serializers.ModelSerializer):
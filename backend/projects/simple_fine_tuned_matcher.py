@@ -8,13 +8,15 @@ import numpy as np
 from typing import Dict
 from django.conf import settings
 
-# Try to import SentenceTransformer with graceful handling
-try:
-    from sentence_transformers import SentenceTransformer
-    SENTENCE_TRANSFORMERS_AVAILABLE = True
-except ImportError:
-    SentenceTransformer = None
-    SENTENCE_TRANSFORMERS_AVAILABLE = False
+from .component_scoring import score_supabase_application
+from .embedding_batcher import get_embedding_batcher
+from .ml_imports import is_available, sentence_transformers
+from .model_server import FINE_TUNED, get_model_client
+from accounts.metrics import timed
+from .past_projects import get_past_project_embeddings
+
+# sentence_transformers is imported when the model is first loaded
+SENTENCE_TRANSFORMERS_AVAILABLE = is_available('sentence_transformers')
 
 
 class SimpleMatcher:
@@ -32,8 +34,14 @@ class SimpleMatcher:
         self._load_model()
         self._load_scorer()
     
+    @timed('model_load_duration_seconds', model='simple_sbert')
     def _load_model(self):
         """Load the fine-tuned SBERT model."""
+        if settings.MODEL_SERVER_ENABLED:
+            # Served by run_model_server; nothing is loaded in this worker
+            self.model = get_model_client().encoder(FINE_TUNED)
+            return
+        
         if not SENTENCE_TRANSFORMERS_AVAILABLE:
             print("⚠️ SentenceTransformers not available, using component scoring")
             return
@@ -43,7 +51,11 @@ class SimpleMatcher:
             return
         
         try:
-            self.model = SentenceTransformer(self.model_dir)
+            if settings.EMBEDDING_BATCHER_ENABLED:
+                # Shared model; concurrent requests' encode calls are batched together
+                self.model = get_embedding_batcher(self.model_dir)
+            else:
+                self.model = sentence_transformers.SentenceTransformer(self.model_dir)
             print("✅ Fine-tuned SBERT model loaded successfully!")
         except Exception as e:
             print(f"⚠️ Failed to load fine-tuned model: {e}")
@@ -72,6 +84,7 @@ class SimpleMatcher:
             print(f"⚠️ Error loading custom scorer: {e}")
             self.scorer = None
     
+    @timed('matcher_duration_seconds', matcher='simple', operation='calculate_match_score')
     def calculate_match_score(self, project_data: Dict, application_data: Dict) -> Dict:
         """
         Calculate match score for a project and application.
@@ -79,6 +92,7 @@ class SimpleMatcher:
         Args:
             project_data: Dict with project info (title, description, tech_stack, budget, etc.)
             application_data: Dict with application info (cover_letter, proposed_rate, developer_profile, etc.)
+                and optionally past_projects, the developer's PastProjects from fetch_supabase_past_projects()
         
         Returns:
             Dict with overall_score, component_scores, and reasoning
@@ -139,12 +153,28 @@ class SimpleMatcher:
             (project_text, proposal_text),
         ]
         
+        # Past projects, embedded once per developer until their next selection
+        known_embeddings = {}
+        past = application_data.get('past_projects')
+        past_text = past.text(with_titles=True, separator='. ') if past else ''
+        if past_text:
+            try:
+                known_embeddings[past_text] = get_past_project_embeddings().embed(
+                    'simple_matcher', [(past, past_text)],
+                    lambda batch: self.model.encode(batch, convert_to_tensor=False, show_progress_bar=False)
+                )[0]
+            except Exception as e:
+                print(f"⚠️ Error embedding past projects: {e}")
+            text_pairs.append((project_text, past_text))
+        
         similarities = []
         for text1, text2 in text_pairs:
             if text1 and text2:
                 try:
                     emb1 = self.model.encode(text1, convert_to_tensor=False)
-                    emb2 = self.model.encode(text2, convert_to_tensor=False)
+                    emb2 = known_embeddings.get(text2)
+                    if emb2 is None:
+                        emb2 = self.model.encode(text2, convert_to_tensor=False)
                     similarity = np.dot(emb1, emb2) / (np.linalg.norm(emb1) * np.linalg.norm(emb2))
                     similarities.append(float(similarity))
                 except:
@@ -177,72 +207,7 @@ class SimpleMatcher:
     def _calculate_component_scores(self, project_data: Dict, developer_profile: Dict,
                                    application_data: Dict) -> Dict:
         """Calculate individual component scores."""
-        
-        # Skill match
-        tech_stack = project_data.get('tech_stack', [])
-        if isinstance(tech_stack, str):
-            tech_stack = [tech_stack]
-        required_skills = set(skill.strip().lower() for skill in tech_stack)
-        
-        dev_skills_str = developer_profile.get('skills', '')
-        developer_skills = set(skill.strip().lower() for skill in dev_skills_str.split(',') if skill.strip())
-        
-        if len(required_skills) > 0:
-            skill_overlap = len(required_skills & developer_skills) / len(required_skills)
-            skill_match = skill_overlap * 100
-        else:
-            skill_match = 50.0
-        
-        # Experience fit
-        years_exp = developer_profile.get('years_experience', 0) or 0
-        experience_fit = min(years_exp * 10, 100)
-        
-        # Portfolio quality
-        rating = float(developer_profile.get('rating', 0) or 0)
-        total_projects = developer_profile.get('total_projects', 0) or 0
-        success_rate = float(developer_profile.get('success_rate', 50) or 50)
-        
-        portfolio_quality = (
-            (rating / 5.0 * 100) * 0.5 +
-            success_rate * 0.3 +
-            min(total_projects * 5, 100) * 0.2
-        )
-        
-        # Proposal quality
-        cover_letter = application_data.get('cover_letter', '')
-        proposal_length = len(cover_letter.split())
-        if proposal_length < 50:
-            proposal_quality = proposal_length * 0.8
-        elif proposal_length < 100:
-            proposal_quality = 40 + (proposal_length - 50) * 0.8
-        else:
-            proposal_quality = min(80 + (proposal_length - 100) / 10, 100)
-        
-        # Rate fit
-        try:
-            proposed_rate = float(application_data.get('proposed_rate', 0) or 0)
-            budget_min = float(project_data.get('budget_min', 0) or 0)
-            budget_max = float(project_data.get('budget_max', 1000) or 1000)
-            budget_mid = (budget_min + budget_max) / 2 if budget_max > 0 else 1000
-            
-            if budget_mid > 0 and proposed_rate > 0:
-                if proposed_rate <= budget_mid:
-                    rate_fit = 100.0
-                else:
-                    overage_pct = (proposed_rate - budget_mid) / budget_mid
-                    rate_fit = max(0, 100 - (overage_pct * 100))
-            else:
-                rate_fit = 50.0
-        except:
-            rate_fit = 50.0
-        
-        return {
-            'skill_match': float(skill_match),
-            'experience_fit': float(experience_fit),
-            'portfolio_quality': float(portfolio_quality),
-            'proposal_quality': float(proposal_quality),
-            'rate_fit': float(rate_fit),
-        }
+        return score_supabase_application(project_data, developer_profile, application_data)
     
     def _generate_reasoning(self, overall_score: float, component_scores: Dict, method: str) -> str:
         """Generate human-readable reasoning for the match score."""
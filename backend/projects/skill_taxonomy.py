@@ -0,0 +1,259 @@
+"""
+Shared skill vocabulary and alias normalizer.
+
+Every canonical skill has a stable integer ID (its position in SKILLS) and a
+set of aliases. The aliases are spelling variants like "React.js", "reactjs"
+and "react js", plus short forms. They are compiled once into a single regex,
+so mapping free text to skill IDs is one scan with no per-call compiling.
+Scorers, matchers and team formation compare these IDs instead of raw strings,
+so "React.js" and "react" match.
+
+Skill lists (a profile's "React, Node.js, Solidity" or a project's tech_stack)
+are split on separators. Each item is looked up directly, which also accepts
+short aliases such as "js" or "go" that are too ambiguous to find in prose.
+Items the vocabulary doesn't know get an interned ID of their own, so two
+profiles listing "Solidity" still match. Results are cached on the input
+value: an edited profile misses the cache, an unchanged one is a dict lookup.
+
+No Django imports, so the standalone scorer can use it too.
+"""
+
+import re
+import threading
+from functools import lru_cache
+
+# (canonical key, display name, aliases). Keys are lowercase and stable.
+# IDs are list positions, so append new skills at the end.
+SKILLS = [
+    ('react', 'React', ['react', 'reactjs', 'react.js']),
+    ('typescript', 'TypeScript', ['typescript', 'type script']),
+    ('javascript', 'JavaScript', ['javascript', 'ecmascript', 'es6', 'vanilla js']),
+    ('node', 'Node.js', ['node', 'nodejs', 'node.js']),
+    ('d3', 'D3.js', ['d3', 'd3.js', 'd3js']),
+    ('mongodb', 'MongoDB', ['mongodb', 'mongo']),
+    ('express', 'Express', ['express', 'expressjs', 'express.js']),
+    ('jest', 'Jest', ['jest']),
+    ('tailwind', 'Tailwind CSS', ['tailwind', 'tailwindcss', 'tailwind css']),
+    ('websocket', 'WebSocket', ['websocket', 'websockets', 'web socket', 'socket.io']),
+    ('chart.js', 'Chart.js', ['chart.js', 'chartjs']),
+    ('html', 'HTML', ['html', 'html5']),
+    ('css', 'CSS', ['css', 'css3']),
+    ('sass', 'Sass', ['sass', 'scss']),
+    ('vue', 'Vue.js', ['vue', 'vuejs', 'vue.js']),
+    ('angular', 'Angular', ['angular', 'angularjs', 'angular.js']),
+    ('svelte', 'Svelte', ['svelte', 'sveltekit']),
+    ('next', 'Next.js', ['next.js', 'nextjs']),
+    ('redux', 'Redux', ['redux']),
+    ('react native', 'React Native', ['react native', 'react-native']),
+    ('flutter', 'Flutter', ['flutter']),
+    ('dart', 'Dart', ['dart']),
+    ('swift', 'Swift', ['swift', 'swiftui']),
+    ('kotlin', 'Kotlin', ['kotlin']),
+    ('android', 'Android', ['android']),
+    ('ios', 'iOS', ['ios']),
+    ('python', 'Python', ['python', 'python3']),
+    ('django', 'Django', ['django', 'django rest framework', 'drf']),
+    ('flask', 'Flask', ['flask']),
+    ('fastapi', 'FastAPI', ['fastapi', 'fast api']),
+    ('java', 'Java', ['java']),
+    ('spring', 'Spring', ['spring', 'spring boot', 'springboot']),
+    ('c#', 'C#', ['c#', 'csharp', 'c sharp']),
+    ('.net', '.NET', ['.net', 'dotnet', 'asp.net']),
+    ('c++', 'C++', ['c++', 'cpp']),
+    ('go', 'Go', ['golang', 'go']),
+    ('rust', 'Rust', ['rust']),
+    ('php', 'PHP', ['php']),
+    ('laravel', 'Laravel', ['laravel']),
+    ('ruby', 'Ruby', ['ruby']),
+    ('rails', 'Ruby on Rails', ['rails', 'ruby on rails', 'ror']),
+    ('sql', 'SQL', ['sql']),
+    ('postgresql', 'PostgreSQL', ['postgresql', 'postgres', 'psql']),
+    ('mysql', 'MySQL', ['mysql']),
+    ('sqlite', 'SQLite', ['sqlite']),
+    ('redis', 'Redis', ['redis']),
+    ('firebase', 'Firebase', ['firebase', 'firestore']),
+    ('supabase', 'Supabase', ['supabase']),
+    ('graphql', 'GraphQL', ['graphql', 'apollo']),
+    ('rest api', 'REST API', ['rest api', 'rest apis', 'restful', 'rest']),
+    ('docker', 'Docker', ['docker', 'docker compose', 'docker-compose']),
+    ('kubernetes', 'Kubernetes', ['kubernetes', 'k8s']),
+    ('aws', 'AWS', ['aws', 'amazon web services', 'ec2', 's3', 'lambda']),
+    ('gcp', 'Google Cloud', ['gcp', 'google cloud', 'google cloud platform']),
+    ('azure', 'Azure', ['azure', 'microsoft azure']),
+    ('ci/cd', 'CI/CD', ['ci/cd', 'cicd', 'github actions', 'jenkins']),
+    ('git', 'Git', ['git', 'github', 'gitlab']),
+    ('linux', 'Linux', ['linux', 'ubuntu']),
+    ('figma', 'Figma', ['figma']),
+    ('ui/ux', 'UI/UX Design', ['ui/ux', 'ux/ui', 'ui ux', 'ux design', 'ui design', 'user experience']),
+    ('machine learning', 'Machine Learning', ['machine learning', 'ml']),
+    ('deep learning', 'Deep Learning', ['deep learning', 'neural networks']),
+    ('tensorflow', 'TensorFlow', ['tensorflow', 'keras']),
+    ('pytorch', 'PyTorch', ['pytorch', 'torch']),
+    ('scikit-learn', 'scikit-learn', ['scikit-learn', 'sklearn', 'scikit learn']),
+    ('pandas', 'pandas', ['pandas']),
+    ('numpy', 'NumPy', ['numpy']),
+    ('nlp', 'NLP', ['nlp', 'natural language processing']),
+    ('data analysis', 'Data Analysis', ['data analysis', 'data analytics']),
+    ('blockchain', 'Blockchain', ['blockchain', 'web3']),
+    ('solidity', 'Solidity', ['solidity']),
+    ('testing', 'Testing', ['testing', 'unit testing', 'pytest', 'cypress', 'selenium']),
+    ('webpack', 'Webpack', ['webpack']),
+    ('vite', 'Vite', ['vite']),
+    ('jquery', 'jQuery', ['jquery']),
+    ('bootstrap', 'Bootstrap', ['bootstrap']),
+    ('material ui', 'Material UI', ['material ui', 'material-ui', 'mui']),
+    ('three.js', 'Three.js', ['three.js', 'threejs']),
+    ('unity', 'Unity', ['unity', 'unity3d']),
+]
+
+# Short aliases that are ordinary words or letters in prose ("ready to go",
+# "in ts"): only honoured when they are a whole skill-list item. Aliases in
+# AMBIGUOUS_IN_TEXT are likewise skipped when scanning prose.
+LIST_ONLY_ALIASES = {
+    'js': 'javascript',
+    'ts': 'typescript',
+    'go': 'go',
+    'py': 'python',
+    'rn': 'react native',
+    'pg': 'postgresql',
+    'ai': 'machine learning',
+    'ux': 'ui/ux',
+    'ui': 'ui/ux',
+}
+AMBIGUOUS_IN_TEXT = {'go', 'rest', 'spring', 'swift', 'unity', 'lambda', 'torch', 'next', 'apollo'}
+
+KEYS = [key for key, _, _ in SKILLS]
+DISPLAY_NAMES = [display for _, display, _ in SKILLS]
+SKILL_IDS = {key: skill_id for skill_id, key in enumerate(KEYS)}
+
+# Interned IDs for list items outside the vocabulary, capped so arbitrary
+# profile text can't grow the table without bound
+MAX_EXTRA_SKILLS = 50000
+_extra_ids = {}
+_extra_names = []
+_extra_lock = threading.Lock()
+
+_SPLIT = re.compile(r'[,;|\n]+|\s+/\s+|\s+(?:and|&)\s+')
+_SPACES = re.compile(r'\s+')
+
+
+def _variants(alias):
+    """Spelling variants of an alias: node.js -> nodejs, node js; react-native -> react native."""
+    variants = {alias}
+    for sep in ('.', '-'):
+        if sep in alias.strip(sep):
+            variants.add(alias.replace(sep, ''))
+            variants.add(alias.replace(sep, ' '))
+    if ' ' in alias:
+        variants.add(alias.replace(' ', '-'))
+    return variants
+
+
+def _build():
+    exact = {}
+    text = {}
+    for skill_id, (key, display, aliases) in enumerate(SKILLS):
+        for alias in [key, display.lower()] + aliases:
+            for variant in _variants(alias):
+                exact.setdefault(variant, skill_id)
+                if variant not in AMBIGUOUS_IN_TEXT:
+                    text.setdefault(variant, skill_id)
+    for alias, key in LIST_ONLY_ALIASES.items():
+        exact.setdefault(alias, SKILL_IDS[key])
+    # Longest first so "react native" wins over "react" and "node.js" over "node"
+    alternatives = sorted(text, key=len, reverse=True)
+    pattern = re.compile(
+        r'(?<![\w+#])(' + '|'.join(re.escape(alias) for alias in alternatives) + r')(?![\w+#])'
+    )
+    return exact, text, pattern
+
+
+_EXACT, _TEXT, _PATTERN = _build()
+
+
+def _clean(item):
+    return _SPACES.sub(' ', item.strip().rstrip('.').lower())
+
+
+def _intern(term):
+    skill_id = _extra_ids.get(term)
+    if skill_id is not None:
+        return skill_id
+    with _extra_lock:
+        skill_id = _extra_ids.get(term)
+        if skill_id is None:
+            if len(_extra_names) >= MAX_EXTRA_SKILLS:
+                return None
+            skill_id = len(SKILLS) + len(_extra_names)
+            _extra_names.append(term)
+            _extra_ids[term] = skill_id
+        return skill_id
+
+
+def _text_ids(text):
+    return {_TEXT[match] for match in _PATTERN.findall(text.lower())}
+
+
+@lru_cache(maxsize=32768)
+def skills_in_text(text):
+    """Skill IDs mentioned anywhere in free text (descriptions, proposals)."""
+    if not text:
+        return frozenset()
+    return frozenset(_text_ids(text))
+
+
+@lru_cache(maxsize=32768)
+def _list_ids(items):
+    ids = set()
+    for item in items:
+        term = _clean(item)
+        if not term:
+            continue
+        skill_id = _EXACT.get(term)
+        if skill_id is not None:
+            ids.add(skill_id)
+            continue
+        found = _text_ids(term)
+        if found:
+            ids.update(found)
+            continue
+        skill_id = _intern(term)
+        if skill_id is not None:
+            ids.add(skill_id)
+    return frozenset(ids)
+
+
+def skill_ids(value):
+    """
+    Skill IDs of a skill list: a separated string ("React, Node.js") or a list
+    of items (a tech_stack). Returns a frozenset.
+    """
+    if not value:
+        return frozenset()
+    if isinstance(value, str):
+        items = tuple(_SPLIT.split(value))
+    else:
+        items = tuple(str(item) for item in value if item)
+    return _list_ids(items)
+
+
+def skill_key(skill_id):
+    if skill_id < len(KEYS):
+        return KEYS[skill_id]
+    return _extra_names[skill_id - len(KEYS)]
+
+
+def skill_name(skill_id):
+    """Display name; items outside the vocabulary keep their (lowercased) text."""
+    if skill_id < len(DISPLAY_NAMES):
+        return DISPLAY_NAMES[skill_id]
+    return _extra_names[skill_id - len(KEYS)]
+
+
+def skill_names(ids):
+    return sorted((skill_name(skill_id) for skill_id in ids), key=str.lower)
+
+
+def normalize_skill_list(value):
+    """Canonical display names of a skill list, sorted."""
+    return skill_names(skill_ids(value))
@@ -0,0 +1,115 @@
+"""
+Measure what a cold worker pays before it can serve its first request.
+
+import_profile() runs `python -X importtime` in a fresh interpreter that sets
+up Django and imports the URLconf, like a worker boot. It parses the
+per-module timings that CPython writes to stderr. cold_start() runs a fresh
+interpreter through setup, URLconf import and one request, and timestamps
+each phase.
+
+Both run in subprocesses so the current process's already-imported modules
+don't hide anything. tests.ImportTimeBudgetTests and `python manage.py
+report_cold_start` are built on them.
+"""
+
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+from django.conf import settings
+
+# "import time:       665 |      41859 | numpy" (names indented by nesting depth)
+_IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)\s*$')
+
+_BOOT = """
+import django
+django.setup()
+import {urlconf}
+"""
+
+_COLD_START = """
+import json, time
+stamps = {{'interpreter': time.time()}}
+import django
+django.setup()
+stamps['setup'] = time.time()
+import {urlconf}
+stamps['urlconf'] = time.time()
+from django.test import Client
+response = Client(SERVER_NAME={host!r}).get({path!r})
+stamps['first_request'] = time.time()
+stamps['status'] = response.status_code
+print(json.dumps(stamps))
+"""
+
+
+class ImportProfile:
+    """Per-module import timings from one -X importtime run."""
+
+    def __init__(self, modules: Dict[str, Tuple[float, float]], total_ms: float):
+        self.modules = modules  # name -> (self ms, cumulative ms)
+        self.total_ms = total_ms
+
+    def slowest(self, count: int = 15) -> List[Tuple[str, float, float]]:
+        """Modules with the highest self time."""
+        ranked = sorted(self.modules.items(), key=lambda item: item[1][0], reverse=True)
+        return [(name, self_ms, cumulative_ms) for name, (self_ms, cumulative_ms) in ranked[:count]]
+
+    def loaded(self, packages) -> List[str]:
+        """Modules imported from any of the given top-level packages."""
+        packages = set(packages)
+        return sorted(name for name in self.modules if name.split('.')[0] in packages)
+
+
+def _run(code: str, importtime: bool = False) -> subprocess.CompletedProcess:
+    env = dict(os.environ)
+    env.setdefault('DJANGO_SETTINGS_MODULE', 'devconnect.settings')
+    # Startup side effects (schedulers, model preloads) are not part of the import cost
+    env['DEADLINE_SCHEDULER_ENABLED'] = 'False'
+    env['MODEL_PRELOAD_ENABLED'] = 'False'
+    args = [sys.executable] + (['-X', 'importtime'] if importtime else []) + ['-c', code]
+    return subprocess.run(args, cwd=str(settings.BASE_DIR), env=env, capture_output=True, text=True, timeout=300)
+
+
+def import_profile(urlconf: str = None) -> ImportProfile:
+    """Import timings of Django setup plus the URLconf in a fresh interpreter."""
+    result = _run(_BOOT.format(urlconf=urlconf or settings.ROOT_URLCONF), importtime=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"Boot failed:\n{result.stderr[-2000:]}")
+
+    modules = {}
+    total_us = 0
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        modules[name] = (int(self_us) / 1000, int(cumulative_us) / 1000)
+        if len(indent) == 1:  # top-level import: cumulative covers its whole subtree
+            total_us += int(cumulative_us)
+    return ImportProfile(modules, total_us / 1000)
+
+
+def cold_start(path: str = '/metrics/supabase/') -> Dict:
+    """Seconds from spawning an interpreter to each boot phase and the first served request."""
+    hosts = [host for host in settings.ALLOWED_HOSTS if host and not host.startswith(('*', '.'))]
+    code = _COLD_START.format(urlconf=settings.ROOT_URLCONF, host=hosts[0] if hosts else 'localhost', path=path)
+    spawned = time.time()
+    result = _run(code)
+    if result.returncode != 0:
+        raise RuntimeError(f"Cold start failed:\n{result.stderr[-2000:]}")
+
+    stamps = json.loads(result.stdout.strip().splitlines()[-1])
+    return {
+        'interpreter_start': stamps['interpreter'] - spawned,
+        'django_setup': stamps['setup'] - stamps['interpreter'],
+        'urlconf_import': stamps['urlconf'] - stamps['setup'],
+        'first_request': stamps['first_request'] - stamps['urlconf'],
+        'total': stamps['first_request'] - spawned,
+        'status': stamps['status'],
+        'path': path,
+    }
@@ -1,4 +1,5 @@
 from accounts.supabase_client import get_supabase_client
+from accounts.catalog_cache import invalidate_catalog
 from datetime import datetime, timedelta
 import uuid
 
@@ -10,6 +11,8 @@ class ProjectSupabaseService:
         """Create project in Supabase"""
         try:
             response = self.supabase.table('projects').insert(project_data).execute()
+            if response.data:
+                invalidate_catalog('project created')
             return response.data[0] if response.data else None
         except Exception as e:
             print(f"Error creating project: {e}")
@@ -4,11 +4,49 @@ Team Assignment Views - Handle team creation and project assignments
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from django.core.cache import cache
+from django.http import JsonResponse
 from django.utils import timezone
 from datetime import timedelta
+import logging
+import time
 
 from .supabase_service import ProjectSupabaseService
+from .notification_inbox import build_notification, notify_many
 from accounts.supabase_client import get_supabase_client
+from accounts.catalog_cache import invalidate_catalog
+from accounts.pagination import (
+    apply_keyset, apply_poll_window, decode_cursor, decode_poll_cursor, drop_seen, encode_cursor, parse_page_size,
+    poll_cursor,
+)
+from accounts.user_directory import display_name, get_display_names, get_emails, remember
+from accounts.chat_pubsub import publish_chat_message, team_chat_channel
+from accounts.supabase_async import execute_all, get_async_supabase_client, get_user_from_token, get_users_by_ids
+from .deadline_scheduler import TEAM, get_deadline_scheduler
+
+
+logger = logging.getLogger(__name__)
+
+CHAT_PAGE_SIZE = 50
+CHAT_MAX_PAGE_SIZE = 200
+
+# team_assignment_id -> team chat id, kept in the Django cache for this long
+TEAM_CHAT_ID_TTL = 3600
+
+# PostgREST error code for "function not found"
+RPC_NOT_FOUND = 'PGRST202'
+
+# After the create_team_assignment RPC is reported missing, requests use the
+# batched path for this long before trying it again (so applying the
+# migration takes effect without a restart)
+RPC_REPROBE_SECONDS = 300
+
+# time.monotonic() until which the RPC is treated as missing
+_team_assignment_rpc_missing_until = 0.0
+
+
+class ProjectAlreadyAssigned(Exception):
+    """Raised when the RPC finds the project already has a team assignment."""
 
 
 class TeamAssignmentViewSet(viewsets.ViewSet):
@@ -62,56 +100,26 @@ class TeamAssignmentViewSet(viewsets.ViewSet):
             figma_deadline = now + timedelta(days=7)
             submission_deadline = now + timedelta(days=30)
             
-            # Create team assignment
-            team_assignment_data = {
-                'project_id': project_id,
-                'company_id': company_id,
-                'team_name': team_name,
-                'figma_deadline': figma_deadline.isoformat(),
-                'submission_deadline': submission_deadline.isoformat(),
-                'is_team': True
-            }
+            welcome_text = f"Welcome to the team '{team_name}'! You have been selected for the project '{project['title']}'. Please submit Figma designs within 7 days and final project within 30 days."
             
-            team_assignment_response = self.supabase.table('team_assignments').insert(team_assignment_data).execute()
-            if not team_assignment_response.data:
+            # Assignment, members, application statuses, chat and welcome
+            # message in one transaction when the RPC is installed
+            team_assignment = self._create_team_assignment_rpc(
+                project_id, company_id, team_name, figma_deadline, submission_deadline, developer_ids, welcome_text
+            )
+            if team_assignment is None:
+                team_assignment = self._create_team_assignment_batched(
+                    project_id, company_id, team_name, figma_deadline, submission_deadline, developer_ids, welcome_text, now
+                )
+            if not team_assignment:
                 return Response({'error': 'Failed to create team assignment'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
             
-            team_assignment = team_assignment_response.data[0]
-            team_assignment_id = team_assignment['id']
-            
-            # Add team members
-            for developer_id in developer_ids:
-                member_data = {
-                    'team_assignment_id': team_assignment_id,
-                    'developer_id': developer_id
-                }
-                self.supabase.table('team_assignment_members').insert(member_data).execute()
-                
-                # Update application status to selected
-                self.supabase.table('project_applications').update({'status': 'selected'}).eq('project_id', project_id).eq('developer_id', developer_id).execute()
-            
-            # Create team chat group
-            chat_data = {
-                'team_assignment_id': team_assignment_id,
-                'created_at': now.isoformat()
-            }
-            chat_response = self.supabase.table('team_chats').insert(chat_data).execute()
-            
-            if chat_response.data:
-                chat_id = chat_response.data[0]['id']
-                
-                # Send welcome message
-                welcome_message = {
-                    'chat_id': chat_id,
-                    'sender_id': company_id,
-                    'message': f"Welcome to the team '{team_name}'! You have been selected for the project '{project['title']}'. Please submit Figma designs within 7 days and final project within 30 days.",
-                    'message_type': 'system',
-                    'created_at': now.isoformat()
-                }
-                self.supabase.table('team_chat_messages').insert(welcome_message).execute()
-            
-            # Update project status
-            self.supabase.table('projects').update({'status': 'in_progress'}).eq('id', project_id).execute()
+            get_deadline_scheduler().set_assignment_deadlines(TEAM, {
+                'id': team_assignment['id'],
+                'figma_deadline': figma_deadline,
+                'submission_deadline': submission_deadline
+            })
+            invalidate_catalog('project in_progress')
             
             return Response({
                 'success': True,
@@ -119,11 +127,86 @@ class TeamAssignmentViewSet(viewsets.ViewSet):
                 'message': f'Team "{team_name}" created and assigned successfully'
             }, status=status.HTTP_201_CREATED)
             
+        except ProjectAlreadyAssigned:
+            return Response({'error': 'Project already assigned'}, status=status.HTTP_400_BAD_REQUEST)
         except Exception as e:
             import traceback
             traceback.print_exc()
             return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
     
+    def _create_team_assignment_rpc(self, project_id, company_id, team_name, figma_deadline, submission_deadline, developer_ids, welcome_text):
+        """Create everything via the create_team_assignment RPC. Returns None if the RPC isn't available."""
+        global _team_assignment_rpc_missing_until
+        if time.monotonic() < _team_assignment_rpc_missing_until:
+            return None
+        try:
+            response = self.supabase.rpc('create_team_assignment', {
+                'p_project_id': project_id,
+                'p_company_id': company_id,
+                'p_team_name': team_name,
+                'p_figma_deadline': figma_deadline.isoformat(),
+                'p_submission_deadline': submission_deadline.isoformat(),
+                'p_developer_ids': list(developer_ids),
+                'p_welcome_message': welcome_text
+            }).execute()
+            return response.data
+        except Exception as e:
+            if getattr(e, 'code', None) == RPC_NOT_FOUND:
+                print(f"⚠️ create_team_assignment RPC not installed, using batched inserts for {RPC_REPROBE_SECONDS}s")
+                _team_assignment_rpc_missing_until = time.monotonic() + RPC_REPROBE_SECONDS
+                return None
+            if 'Project already assigned' in str(e):
+                raise ProjectAlreadyAssigned() from e
+            raise
+    
+    def _create_team_assignment_batched(self, project_id, company_id, team_name, figma_deadline, submission_deadline, developer_ids, welcome_text, now):
+        """Same writes as the RPC with a fixed number of round-trips, whatever the team size."""
+        team_assignment_data = {
+            'project_id': project_id,
+            'company_id': company_id,
+            'team_name': team_name,
+            'figma_deadline': figma_deadline.isoformat(),
+            'submission_deadline': submission_deadline.isoformat(),
+            'is_team': True
+        }
+        
+        team_assignment_response = self.supabase.table('team_assignments').insert(team_assignment_data).execute()
+        if not team_assignment_response.data:
+            return None
+        
+        team_assignment = team_assignment_response.data[0]
+        team_assignment_id = team_assignment['id']
+        
+        # Add team members in one multi-row insert
+        self.supabase.table('team_assignment_members').insert([
+            {'team_assignment_id': team_assignment_id, 'developer_id': developer_id}
+            for developer_id in developer_ids
+        ]).execute()
+        
+        # Update application statuses to selected in one statement
+        self.supabase.table('project_applications').update({'status': 'selected'}).eq('project_id', project_id).in_('developer_id', list(developer_ids)).execute()
+        
+        # Create team chat group
+        chat_response = self.supabase.table('team_chats').insert({
+            'team_assignment_id': team_assignment_id,
+            'created_at': now.isoformat()
+        }).execute()
+        
+        if chat_response.data:
+            # Send welcome message
+            self.supabase.table('team_chat_messages').insert({
+                'chat_id': chat_response.data[0]['id'],
+                'sender_id': company_id,
+                'message': welcome_text,
+                'message_type': 'system',
+                'created_at': now.isoformat()
+            }).execute()
+        
+        # Update project status
+        self.supabase.table('projects').update({'status': 'in_progress'}).eq('id', project_id).execute()
+        
+        return team_assignment
+    
     @action(detail=False, methods=['post'])
     def assign_single_developer(self, request):
         """Assign project to a single developer"""
@@ -183,6 +266,7 @@ class TeamAssignmentViewSet(viewsets.ViewSet):
             
             assignment = assignment_response.data[0]
             assignment_id = assignment['id']
+            get_deadline_scheduler().set_assignment_deadlines(TEAM, assignment)
             
             # Add developer as single member
             member_data = {
@@ -219,6 +303,7 @@ class TeamAssignmentViewSet(viewsets.ViewSet):
             
             # Update project status
             self.supabase.table('projects').update({'status': 'in_progress'}).eq('id', project_id).execute()
+            invalidate_catalog('project in_progress')
             
             return Response({
                 'success': True,
@@ -291,81 +376,6 @@ class TeamAssignmentViewSet(viewsets.ViewSet):
             traceback.print_exc()
             return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
     
-    @action(detail=False, methods=['get'])
-    def get_developer_team_assignments(self, request):
-        """Get all team assignments for a developer"""
-        try:
-            auth_header = request.META.get('HTTP_AUTHORIZATION')
-            if not auth_header:
-                return Response({'error': 'No authorization token'}, status=status.HTTP_401_UNAUTHORIZED)
-            
-            token = auth_header.replace('Bearer ', '')
-            user_response = self.supabase.auth.get_user(token)
-            if not user_response.user:
-                return Response({'error': 'Invalid token'}, status=status.HTTP_401_UNAUTHORIZED)
-            
-            developer_id = user_response.user.id
-            
-            # Get team memberships
-            members_response = self.supabase.table('team_assignment_members').select('*').eq('developer_id', developer_id).execute()
-            
-            if not members_response.data:
-                return Response([])
-            
-            assignments = []
-            for member in members_response.data:
-                # Get team assignment
-                assignment_response = self.supabase.table('team_assignments').select('*').eq('id', member['team_assignment_id']).execute()
-                if not assignment_response.data:
-                    continue
-                
-                assignment = assignment_response.data[0]
-                
-                # Get project details
-                project_response = self.supabase.table('projects').select('title, company_id').eq('id', assignment['project_id']).execute()
-                if not project_response.data:
-                    continue
-                
-                project = project_response.data[0]
-                
-                # Get company info
-                company_response = self.supabase.auth.admin.get_user_by_id(project['company_id'])
-                company_name = 'Unknown Company'
-                if company_response.user:
-                    user_meta = company_response.user.user_metadata or {}
-                    company_name = user_meta.get('company_name', 'Unknown Company')
-                
-                # Get all team members
-                all_members_response = self.supabase.table('team_assignment_members').select('*').eq('team_assignment_id', assignment['id']).execute()
-                team_members = []
-                for tm in all_members_response.data if all_members_response.data else []:
-                    dev_response = self.supabase.auth.admin.get_user_by_id(tm['developer_id'])
-                    if dev_response.user:
-                        user_meta = dev_response.user.user_metadata or {}
-                        team_members.append({
-                            'developer_id': tm['developer_id'],
-                            'name': f"{user_meta.get('first_name', '')} {user_meta.get('last_name', '')}".strip() or 'Developer',
-                            'email': dev_response.user.email
-                        })
-                
-                assignments.append({
-                    **assignment,
-                    'project_title': project['title'],
-                    'company_name': company_name,
-                    'team_members': team_members,
-                    'my_figma_submitted': member.get('figma_submitted', False),
-                    'my_project_submitted': member.get('project_submitted', False),
-                    'my_figma_url': member.get('figma_url'),
-                    'my_submission_links': member.get('submission_links', {})
-                })
-            
-            return Response(assignments)
-            
-        except Exception as e:
-            import traceback
-            traceback.print_exc()
-            return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-    
     @action(detail=True, methods=['post'])
     def submit_figma(self, request, pk=None):
         """Developer submits Figma design"""
@@ -400,9 +410,8 @@ class TeamAssignmentViewSet(viewsets.ViewSet):
                 return Response({'error': 'Failed to submit Figma'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
             
             # Send message to team chat
-            chat_response = self.supabase.table('team_chats').select('id').eq('team_assignment_id', pk).execute()
-            if chat_response.data:
-                chat_id = chat_response.data[0]['id']
+            chat_id = self._get_team_chat_id(pk)
+            if chat_id:
                 message = "📐 Figma design submitted!"
                 if figma_url:
                     message += f"\n🔗 Link: {figma_url}"
@@ -458,9 +467,8 @@ class TeamAssignmentViewSet(viewsets.ViewSet):
                 return Response({'error': 'Failed to submit project'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
             
             # Send message to team chat
-            chat_response = self.supabase.table('team_chats').select('id').eq('team_assignment_id', pk).execute()
-            if chat_response.data:
-                chat_id = chat_response.data[0]['id']
+            chat_id = self._get_team_chat_id(pk)
+            if chat_id:
                 message = "🚀 Project submitted for review!"
                 if submission_links.get('github'):
                     message += f"\n💻 GitHub: {submission_links['github']}"
@@ -489,39 +497,78 @@ class TeamAssignmentViewSet(viewsets.ViewSet):
     
     @action(detail=True, methods=['get'])
     def get_team_chat(self, request, pk=None):
-        """Get team chat messages"""
+        """
+        Get team chat messages, oldest first.
+
+        Query params:
+        - since: next_cursor from an earlier response; returns only messages not
+          delivered yet, including ones another worker committed late
+        - before: prev_cursor from an earlier response; returns the page before it
+        - limit: page size (default 50, max 200)
+        Without since/before the latest page is returned.
+        """
         try:
-            # Get chat
-            chat_response = self.supabase.table('team_chats').select('id').eq('team_assignment_id', pk).execute()
-            if not chat_response.data:
-                return Response({'messages': []})
+            page_size = parse_page_size(request.query_params.get('limit'), default=CHAT_PAGE_SIZE, maximum=CHAT_MAX_PAGE_SIZE)
+            since = request.query_params.get('since')
+            before = request.query_params.get('before')
+            cursor_values = decode_poll_cursor(since) if since else decode_cursor(before)
+            if (since or before) and cursor_values is None:
+                return Response({'error': 'Invalid cursor'}, status=status.HTTP_400_BAD_REQUEST)
+            
+            chat_id = self._get_team_chat_id(pk)
+            if not chat_id:
+                return Response({'messages': [], 'next_cursor': None, 'prev_cursor': None, 'has_more': False})
+            
+            query = self.supabase.table('team_chat_messages').select('*').eq('chat_id', chat_id)
+            if since:
+                # Incremental poll: re-read a window behind the cursor so
+                # messages committed late are not skipped, minus those
+                # already delivered
+                query = apply_poll_window(query, cursor_values)
+                response = query.order('created_at').order('id').limit(page_size + len(cursor_values[1]) + 1).execute()
+                rows = drop_seen(response.data or [], cursor_values)
+                has_more = len(rows) > page_size
+                rows = rows[:page_size]
+            else:
+                # Latest page, or the page before a cursor: fetch newest-first and flip
+                query = apply_keyset(query, cursor_values, descending=True)
+                response = query.order('created_at', desc=True).order('id', desc=True).limit(page_size + 1).execute()
+                rows = response.data or []
+                has_more = len(rows) > page_size
+                rows = list(reversed(rows[:page_size]))
             
-            chat_id = chat_response.data[0]['id']
+            sender_names = get_display_names(self.supabase, [msg['sender_id'] for msg in rows])
+            messages = [{**msg, 'sender_name': sender_names.get(msg['sender_id'], 'Unknown')} for msg in rows]
             
-            # Get messages
-            messages_response = self.supabase.table('team_chat_messages').select('*').eq('chat_id', chat_id).order('created_at').execute()
-            
-            messages = []
-            for msg in messages_response.data if messages_response.data else []:
-                # Get sender info
-                sender_response = self.supabase.auth.admin.get_user_by_id(msg['sender_id'])
-                sender_name = 'Unknown'
-                if sender_response.user:
-                    user_meta = sender_response.user.user_metadata or {}
-                    sender_name = f"{user_meta.get('first_name', '')} {user_meta.get('last_name', '')}".strip() or sender_response.user.email
-                
-                messages.append({
-                    **msg,
-                    'sender_name': sender_name
-                })
+            newest = poll_cursor(rows, previous=cursor_values if since else None)
+            oldest = encode_cursor(rows[0]['created_at'], rows[0]['id']) if rows else None
             
-            return Response({'messages': messages})
+            return Response({
+                'messages': messages,
+                # Poll with ?since=next_cursor
+                'next_cursor': newest,
+                # Page further back with ?before=prev_cursor
+                'prev_cursor': oldest if (has_more and not since) else None,
+                'has_more': has_more
+            })
             
         except Exception as e:
             import traceback
             traceback.print_exc()
             return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
     
+    def _get_team_chat_id(self, team_assignment_id):
+        """team_assignment_id -> team_chats.id, cached for TEAM_CHAT_ID_TTL seconds."""
+        key = f'team_chat_id:{team_assignment_id}'
+        chat_id = cache.get(key)
+        if chat_id is None:
+            chat_response = self.supabase.table('team_chats').select('id').eq('team_assignment_id', team_assignment_id).execute()
+            if not chat_response.data:
+                return None
+            chat_id = chat_response.data[0]['id']
+            cache.set(key, chat_id, TEAM_CHAT_ID_TTL)
+        return chat_id
+    
     @action(detail=True, methods=['post'])
     def send_team_message(self, request, pk=None):
         """Send message to team chat"""
@@ -541,13 +588,10 @@ class TeamAssignmentViewSet(viewsets.ViewSet):
             if not message:
                 return Response({'error': 'message is required'}, status=status.HTTP_400_BAD_REQUEST)
             
-            # Get chat
-            chat_response = self.supabase.table('team_chats').select('id').eq('team_assignment_id', pk).execute()
-            if not chat_response.data:
+            chat_id = self._get_team_chat_id(pk)
+            if not chat_id:
                 return Response({'error': 'Chat not found'}, status=status.HTTP_404_NOT_FOUND)
             
-            chat_id = chat_response.data[0]['id']
-            
             # Create message
             message_data = {
                 'chat_id': chat_id,
@@ -562,6 +606,11 @@ class TeamAssignmentViewSet(viewsets.ViewSet):
             if not response.data:
                 return Response({'error': 'Failed to send message'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
             
+            # Push to members with the chat stream open
+            remember(user_response.user)
+            sent = {**response.data[0], 'sender_name': display_name(user_response.user)}
+            publish_chat_message(team_chat_channel(pk), sent)
+            
             return Response({'success': True, 'message': response.data[0]})
             
         except Exception as e:
@@ -608,9 +657,8 @@ class TeamAssignmentViewSet(viewsets.ViewSet):
                 return Response({'error': 'Failed to update deadlines'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
             
             # Send message to team chat
-            chat_response = self.supabase.table('team_chats').select('id').eq('team_assignment_id', pk).execute()
-            if chat_response.data:
-                chat_id = chat_response.data[0]['id']
+            chat_id = self._get_team_chat_id(pk)
+            if chat_id:
                 message_data = {
                     'chat_id': chat_id,
                     'sender_id': company_id,
@@ -667,9 +715,8 @@ class TeamAssignmentViewSet(viewsets.ViewSet):
                 return Response({'error': 'Failed to update deadlines'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
             
             # Send notification to team chat
-            chat_response = self.supabase.table('team_chats').select('id').eq('team_assignment_id', pk).execute()
-            if chat_response.data:
-                chat_id = chat_response.data[0]['id']
+            chat_id = self._get_team_chat_id(pk)
+            if chat_id:
                 message = "⏰ Deadlines have been updated by the company."
                 if figma_deadline:
                     from datetime import datetime
@@ -687,7 +734,13 @@ class TeamAssignmentViewSet(viewsets.ViewSet):
                     'message_type': 'system',
                     'created_at': timezone.now().isoformat()
                 }
-                self.supabase.table('team_chat_messages').insert(message_data).execute()
+                message_response = self.supabase.table('team_chat_messages').insert(message_data).execute()
+                if message_response.data:
+                    sender_name = get_display_names(self.supabase, [company_id])[company_id]
+                    publish_chat_message(team_chat_channel(pk), {**message_response.data[0], 'sender_name': sender_name})
+            
+            self._notify_deadline_change(pk, response.data[0], figma_deadline, submission_deadline)
+            get_deadline_scheduler().set_assignment_deadlines(TEAM, response.data[0])
             
             return Response({'success': True, 'assignment': response.data[0]})
             
@@ -697,6 +750,36 @@ class TeamAssignmentViewSet(viewsets.ViewSet):
             return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
     
+    def _notify_deadline_change(self, team_assignment_id, assignment, figma_deadline, submission_deadline):
+        """Put a deadline_change entry in every team member's notification inbox."""
+        try:
+            members_response = self.supabase.table('team_assignment_members').select('developer_id').eq('team_assignment_id', team_assignment_id).execute()
+            emails = get_emails(self.supabase, [member['developer_id'] for member in members_response.data or []])
+            
+            changes = []
+            if figma_deadline:
+                changes.append(f"Figma: {figma_deadline[:10]}")
+            if submission_deadline:
+                changes.append(f"Final submission: {submission_deadline[:10]}")
+            
+            notify_many([
+                build_notification(
+                    email,
+                    'deadline_change',
+                    f"Deadlines updated for {assignment.get('team_name') or 'your team'}",
+                    ', '.join(changes),
+                    source_id=team_assignment_id,
+                    data={
+                        'team_assignment_id': team_assignment_id,
+                        'figma_deadline': figma_deadline,
+                        'submission_deadline': submission_deadline
+                    }
+                )
+                for email in emails.values()
+            ])
+        except Exception:
+            logger.exception("Could not send deadline notifications for team assignment %s", team_assignment_id)
+    
     @action(detail=True, methods=['post'])
     def share_file(self, request, pk=None):
         """Share a file with the team"""
@@ -775,26 +858,6 @@ class TeamAssignmentViewSet(viewsets.ViewSet):
         except Exception as e:
             return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
     
-    @action(detail=True, methods=['get'])
-    def get_shared_files(self, request, pk=None):
-        """Get all shared files and links for a team assignment"""
-        try:
-            assignment_id = pk
-            
-            # Get shared files
-            files_response = self.supabase.table('shared_files').select('*').eq('assignment_id', assignment_id).order('shared_at', desc=True).execute()
-            
-            # Get shared links
-            links_response = self.supabase.table('shared_links').select('*').eq('assignment_id', assignment_id).order('shared_at', desc=True).execute()
-            
-            return Response({
-                'files': files_response.data if files_response.data else [],
-                'links': links_response.data if links_response.data else []
-            })
-            
-        except Exception as e:
-            return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-    
     @action(detail=True, methods=['post'])
     def delete_shared_item(self, request, pk=None):
         """Delete a shared file or link"""
@@ -823,3 +886,123 @@ class TeamAssignmentViewSet(viewsets.ViewSet):
             
         except Exception as e:
             return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+# ---------------------------------------------------------------------------
+# Async views
+#
+# These endpoints fan out to several tables per request, so they run on the
+# async Supabase client and await independent queries together. They keep the
+# URLs and response shapes of the former TeamAssignmentViewSet actions.
+# ---------------------------------------------------------------------------
+
+async def load_developer_team_assignments(supabase, developer_id):
+    """Build the developer's team assignment list with concurrent round-trips."""
+    members_response = await supabase.table('team_assignment_members').select('*').eq('developer_id', developer_id).execute()
+    memberships = members_response.data or []
+    if not memberships:
+        return []
+
+    assignment_ids = [member['team_assignment_id'] for member in memberships]
+    assignments_response = await supabase.table('team_assignments').select('*').in_('id', assignment_ids).execute()
+    assignments_by_id = {assignment['id']: assignment for assignment in assignments_response.data or []}
+    if not assignments_by_id:
+        return []
+
+    # Projects and full member lists only depend on the assignments
+    project_ids = list({assignment['project_id'] for assignment in assignments_by_id.values()})
+    projects_response, team_members_response = await execute_all(
+        supabase.table('projects').select('id, title, company_id').in_('id', project_ids),
+        supabase.table('team_assignment_members').select('*').in_('team_assignment_id', list(assignments_by_id)),
+    )
+    projects_by_id = {project['id']: project for project in projects_response.data or []}
+
+    members_by_assignment = {}
+    for team_member in team_members_response.data or []:
+        members_by_assignment.setdefault(team_member['team_assignment_id'], []).append(team_member)
+
+    # Company owners and every team member resolved in one concurrent batch
+    user_ids = [project['company_id'] for project in projects_by_id.values()]
+    user_ids += [team_member['developer_id'] for team_member in team_members_response.data or []]
+    users = await get_users_by_ids(supabase, user_ids)
+
+    assignments = []
+    for member in memberships:
+        assignment = assignments_by_id.get(member['team_assignment_id'])
+        if not assignment:
+            continue
+        project = projects_by_id.get(assignment['project_id'])
+        if not project:
+            continue
+
+        company_user = users.get(project['company_id'])
+        company_name = 'Unknown Company'
+        if company_user:
+            company_name = (company_user.user_metadata or {}).get('company_name', 'Unknown Company')
+
+        team_members = []
+        for team_member in members_by_assignment.get(assignment['id'], []):
+            dev_user = users.get(team_member['developer_id'])
+            if dev_user:
+                user_meta = dev_user.user_metadata or {}
+                team_members.append({
+                    'developer_id': team_member['developer_id'],
+                    'name': f"{user_meta.get('first_name', '')} {user_meta.get('last_name', '')}".strip() or 'Developer',
+                    'email': dev_user.email
+                })
+
+        assignments.append({
+            **assignment,
+            'project_title': project['title'],
+            'company_name': company_name,
+            'team_members': team_members,
+            'my_figma_submitted': member.get('figma_submitted', False),
+            'my_project_submitted': member.get('project_submitted', False),
+            'my_figma_url': member.get('figma_url'),
+            'my_submission_links': member.get('submission_links', {})
+        })
+
+    return assignments
+
+
+async def get_developer_team_assignments(request):
+    """Get all team assignments for a developer"""
+    if request.method != 'GET':
+        return JsonResponse({'error': 'Method not allowed'}, status=405)
+    try:
+        auth_header = request.headers.get('Authorization')
+        if not auth_header:
+            return JsonResponse({'error': 'No authorization token'}, status=401)
+
+        supabase = await get_async_supabase_client()
+        user = await get_user_from_token(supabase, auth_header)
+        if not user:
+            return JsonResponse({'error': 'Invalid token'}, status=401)
+
+        assignments = await load_developer_team_assignments(supabase, user.id)
+        return JsonResponse(assignments, safe=False)
+
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        return JsonResponse({'error': str(e)}, status=500)
+
+
+async def get_shared_files(request, pk):
+    """Get all shared files and links for a team assignment"""
+    if request.method != 'GET':
+        return JsonResponse({'error': 'Method not allowed'}, status=405)
+    try:
+        supabase = await get_async_supabase_client()
+        files_response, links_response = await execute_all(
+            supabase.table('shared_files').select('*').eq('assignment_id', pk).order('shared_at', desc=True),
+            supabase.table('shared_links').select('*').eq('assignment_id', pk).order('shared_at', desc=True),
+        )
+
+        return JsonResponse({
+            'files': files_response.data if files_response.data else [],
+            'links': links_response.data if links_response.data else []
+        })
+
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=500)
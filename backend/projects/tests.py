@@ -1,3 +1,160 @@
-from django.test import TestCase
+from django.conf import settings
+from django.test import SimpleTestCase
 
-# Create your tests here.
+from projects.component_scoring import ApplicantColumns, score_supabase_application
+from projects.deadline_scheduler import TEAM, WHEEL_SIZE, DeadlineScheduler, TimerWheel
+from projects.ml_imports import HEAVY_MODULES
+from projects.skill_taxonomy import normalize_skill_list, skill_ids, skills_in_text
+from projects.startup_profile import import_profile
+
+
+class ImportTimeBudgetTests(SimpleTestCase):
+    """Booting Django and loading the URLconf must not pull in the ML stack."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.profile = import_profile()
+
+    def test_urlconf_does_not_import_heavy_ml_modules(self):
+        self.assertEqual(self.profile.loaded(HEAVY_MODULES), [])
+
+    def test_urlconf_import_time_within_budget(self):
+        slowest = ', '.join(f"{name} {self_ms:.0f} ms" for name, self_ms, _ in self.profile.slowest(5))
+        self.assertLessEqual(
+            self.profile.total_ms, settings.IMPORT_TIME_BUDGET_MS,
+            f"Boot imports took {self.profile.total_ms:.0f} ms (slowest: {slowest})"
+        )
+
+
+class TimerWheelTests(SimpleTestCase):
+    def fire_all(self, wheel, until):
+        """{key: tick it fired on} advancing one tick at a time up to `until`."""
+        fired = {}
+        for tick in range(wheel.current, until + 1):
+            for key, _ in wheel.advance(tick):
+                fired[key] = tick
+        return fired
+
+    def test_timers_fire_on_their_tick_across_level_rollovers(self):
+        wheel = TimerWheel(current_tick=10)
+        # Level 0, just past a level-0 wrap, on a higher level, and past a level-1 wrap
+        expiries = {'soon': 12, 'wrap': WHEEL_SIZE + 3, 'level1': 3 * WHEEL_SIZE + 7, 'level2': WHEEL_SIZE ** 2 + 5}
+        for key, expires in expiries.items():
+            wheel.schedule(key, expires)
+
+        self.assertEqual(self.fire_all(wheel, WHEEL_SIZE ** 2 + 10), expiries)
+        self.assertEqual(len(wheel), 0)
+
+    def test_cancel_and_reschedule(self):
+        wheel = TimerWheel(current_tick=0)
+        wheel.schedule('cancelled', 5 * WHEEL_SIZE)
+        wheel.schedule('moved', 3, payload='first')
+        wheel.schedule('moved', 2 * WHEEL_SIZE + 1, payload='second')
+
+        self.assertTrue(wheel.cancel('cancelled'))
+        self.assertFalse(wheel.cancel('cancelled'))
+        self.assertNotIn('cancelled', wheel)
+        self.assertEqual(wheel.advance(2 * WHEEL_SIZE), [])
+        self.assertEqual(wheel.advance(6 * WHEEL_SIZE), [('moved', 'second')])
+
+    def test_overdue_timer_fires_on_next_tick(self):
+        wheel = TimerWheel(current_tick=100)
+        wheel.schedule('late', 40)
+        self.assertEqual(wheel.advance(100), [('late', None)])
+
+
+class DeadlineSchedulerTests(SimpleTestCase):
+    NOW = 1_800_000_000
+
+    def test_scheduler_that_was_not_started_tracks_nothing(self):
+        scheduler = DeadlineScheduler(60, [24])
+        deadline = self.NOW + 3 * 86400 + 60
+        self.assertEqual(scheduler.days_remaining(TEAM, 'a1', 'figma_deadline', deadline, self.NOW), 3)
+        scheduler.set_assignment_deadlines(TEAM, {'id': 'a1', 'figma_deadline': deadline})
+        self.assertEqual(scheduler.snapshot()['tracked_deadlines'], 0)
+        self.assertEqual(scheduler.snapshot()['armed_timers'], 0)
+
+    def test_removed_assignment_is_evicted(self):
+        scheduler = DeadlineScheduler(60, [24])
+        scheduler.tracking = True
+        scheduler.days_remaining(TEAM, 'a1', 'figma_deadline', self.NOW + 5 * 86400, self.NOW)
+        scheduler.days_remaining(TEAM, 'a1', 'submission_deadline', self.NOW + 9 * 86400, self.NOW)
+        self.assertEqual(scheduler.snapshot()['tracked_deadlines'], 2)
+
+        scheduler.remove_assignment(TEAM, 'a1')
+        self.assertEqual(scheduler.snapshot()['tracked_deadlines'], 0)
+        self.assertEqual(scheduler.snapshot()['armed_timers'], 0)
+
+
+class SkillAliasTests(SimpleTestCase):
+    def test_spelling_variants_map_to_one_skill(self):
+        self.assertEqual(skill_ids('React.js, nodejs, Type Script'), skill_ids(['react', 'Node.js', 'typescript']))
+        self.assertEqual(skill_ids('react-native'), skill_ids(['React Native']))
+        self.assertEqual(normalize_skill_list('golang; K8S, postgres'), ['Go', 'Kubernetes', 'PostgreSQL'])
+
+    def test_longest_alias_wins_in_text(self):
+        self.assertEqual(skills_in_text('Built with React Native'), skill_ids(['react native']))
+
+    def test_unknown_items_match_each_other(self):
+        self.assertEqual(skill_ids('Solidity'), skill_ids(['solidity.']))
+        self.assertNotEqual(skill_ids('Solidity'), skill_ids('Vyper'))
+
+
+class VectorizedComponentScoreTests(SimpleTestCase):
+    """ApplicantColumns against values from the per-applicant formulas it replaced."""
+
+    PROJECT = {'tech_stack': ['React', 'Node.js', 'PostgreSQL', 'Docker'], 'budget_min': 40, 'budget_max': 80}
+    # (developer_profiles row, project_applications row, scores from the per-applicant loop)
+    CASES = [
+        (
+            {'skills': 'React, Node.js', 'years_experience': 4, 'rating': 4.5, 'success_rate': 90, 'total_projects': 12},
+            {'cover_letter': 'word ' * 30, 'proposed_rate': 55},
+            {'skill_match': 50.0, 'experience_fit': 40.0, 'portfolio_quality': 84.0, 'proposal_quality': 24.0,
+             'rate_fit': 100.0},
+        ),
+        # Aliases of every required skill, over the budget midpoint
+        (
+            {'skills': 'reactjs, postgres, docker, node', 'years_experience': 12, 'rating': 5, 'success_rate': 100,
+             'total_projects': 40},
+            {'cover_letter': 'word ' * 75, 'proposed_rate': 95},
+            {'skill_match': 100.0, 'experience_fit': 100.0, 'portfolio_quality': 100.0, 'proposal_quality': 60.0,
+             'rate_fit': 41.666666666666664},
+        ),
+        # Empty skills and no portfolio or proposal at all
+        (
+            {'skills': '', 'years_experience': None, 'rating': None, 'success_rate': None, 'total_projects': None},
+            {'cover_letter': '', 'proposed_rate': None},
+            {'skill_match': 0.0, 'experience_fit': 0.0, 'portfolio_quality': 15.0, 'proposal_quality': 0.0,
+             'rate_fit': 50.0},
+        ),
+        # Skills outside the taxonomy and an unparseable rate
+        (
+            {'skills': 'Solidity, Vyper', 'years_experience': 2, 'rating': 3, 'success_rate': 70, 'total_projects': 3},
+            {'cover_letter': 'word ' * 400, 'proposed_rate': 'negotiable'},
+            {'skill_match': 0.0, 'experience_fit': 20.0, 'portfolio_quality': 54.0, 'proposal_quality': 100.0,
+             'rate_fit': 50.0},
+        ),
+    ]
+
+    def test_pooled_scores_match_per_applicant_formulas(self):
+        columns = ApplicantColumns(self.PROJECT['tech_stack'], self.PROJECT['budget_min'], self.PROJECT['budget_max'])
+        for developer_profile, application, _ in self.CASES:
+            columns.add_supabase(developer_profile, application)
+        self.assertEqual(columns.score_dicts(), [expected for _, _, expected in self.CASES])
+
+    def test_single_row_matches_pool(self):
+        for developer_profile, application, expected in self.CASES:
+            self.assertEqual(score_supabase_application(self.PROJECT, developer_profile, application), expected)
+
+    def test_no_required_skills_and_zero_budget(self):
+        developer_profile, application, _ = self.CASES[0]
+        columns = ApplicantColumns([], 0, 0)
+        columns.add_supabase(developer_profile, application)
+        self.assertEqual(columns.score_dicts(), [
+            {'skill_match': 50.0, 'experience_fit': 40.0, 'portfolio_quality': 84.0, 'proposal_quality': 24.0,
+             'rate_fit': 100.0}
+        ])
+
+    def test_empty_pool(self):
+        self.assertEqual(ApplicantColumns(self.PROJECT['tech_stack'], 40, 80).score_dicts(), [])
@@ -8,6 +8,9 @@ from . import figma_views
 from . import feedback_views
 from . import chatbot_views
 from . import rejection_notifications
+from . import notification_views
+from . import team_assignment_views
+from . import chat_stream_views
 
 # Create router for REST API
 router = DefaultRouter()
@@ -17,6 +20,14 @@ router.register(r'assignments', ProjectAssignmentViewSet, basename='assignment')
 router.register(r'team-assignments', TeamAssignmentViewSet, basename='team-assignment')
 
 urlpatterns = [
+    # Async team endpoints (registered ahead of the router so they take precedence)
+    path('team-assignments/get_developer_team_assignments/', team_assignment_views.get_developer_team_assignments, name='team-assignment-get-developer-team-assignments'),
+    path('team-assignments/<str:pk>/get_shared_files/', team_assignment_views.get_shared_files, name='team-assignment-get-shared-files'),
+    
+    # Push delivery for chats (server-sent events, served over ASGI)
+    path('team-assignments/<str:pk>/chat/stream/', chat_stream_views.stream_team_chat, name='team-chat-stream'),
+    path('assignments/<str:pk>/chat/stream/', chat_stream_views.stream_assignment_chat, name='assignment-chat-stream'),
+    
     # REST API routes
     path('', include(router.urls)),
     
@@ -48,6 +59,11 @@ urlpatterns = [
     path('rejections/<int:notification_id>/mark-read/', rejection_notifications.mark_rejection_read, name='mark-rejection-read'),
     path('rejections/mark-all-read/<str:developer_email>/', rejection_notifications.mark_all_rejections_read, name='mark-all-rejections-read'),
     
+    # Unified notification inbox
+    path('notifications/<str:user_email>/', notification_views.get_notifications, name='get-notifications'),
+    path('notifications/<str:user_email>/unread-count/', notification_views.get_unread_count, name='notification-unread-count'),
+    path('notifications/<str:user_email>/mark-read/', notification_views.mark_notifications_read, name='mark-notifications-read'),
+    
     # Legacy routes (kept for backward compatibility)
     path('legacy/list/', views.project_list, name='project-list'),
     path('legacy/create/', views.project_create, name='project-create'),
@@ -4,6 +4,7 @@ Utility functions for project and freelancer matching.
 
 from typing import List, Dict, Optional
 from projects.models import Project, ProjectApplication
+from projects.application_counters import get_status_counts
 
 # Try to import fine-tuned matcher, fallback to original if issues
 try:
@@ -222,10 +223,8 @@ def get_project_stats(project_id: int) -> Optional[Dict]:
     try:
         project = Project.objects.get(id=project_id)
         
-        applications = project.applications.all()
-        pending_apps = applications.filter(status='pending').count()
-        shortlisted_apps = applications.filter(status='shortlisted').count()
-        rejected_apps = applications.filter(status='rejected').count()
+        # Counters are maintained on the project row; no per-status COUNT queries
+        status_counts = get_status_counts(project)
         
         return {
             'title': project.title,
@@ -235,10 +234,10 @@ def get_project_stats(project_id: int) -> Optional[Dict]:
             'budget_min': float(project.budget_min) if project.budget_min else None,
             'budget_max': float(project.budget_max) if project.budget_max else None,
             'status': project.status,
-            'total_applications': applications.count(),
-            'pending_applications': pending_apps,
-            'shortlisted_applications': shortlisted_apps,
-            'rejected_applications': rejected_apps,
+            'total_applications': project.applications_count,
+            'pending_applications': status_counts['pending'],
+            'shortlisted_applications': status_counts['shortlisted'],
+            'rejected_applications': status_counts['rejected'],
             'views_count': project.views_count,
             'created_at': project.created_at.isoformat(),
             'deadline': project.deadline.isoformat(),
@@ -11,6 +11,7 @@ django.setup()
 
 from accounts.supabase_client import get_supabase_client
 from projects.simple_fine_tuned_matcher import SimpleMatcher
+from projects.past_projects import fetch_supabase_past_projects
 
 def recalculate_all_scores():
     """Recalculate scores for all existing applications"""
@@ -34,6 +35,9 @@ def recalculate_all_scores():
         
         print(f"✅ Found {len(applications)} applications")
         
+        # Every applicant's past projects in one grouped query
+        past_projects = fetch_supabase_past_projects(supabase, [app['developer_id'] for app in applications])
+        
     except Exception as e:
         print(f"❌ Error fetching applications: {e}")
         return
@@ -70,7 +74,8 @@ def recalculate_all_scores():
                 'cover_letter': application.get('cover_letter', ''),
                 'proposed_rate': application.get('proposed_rate'),
                 'estimated_duration': application.get('estimated_duration'),
-                'developer_profile': developer_profile
+                'developer_profile': developer_profile,
+                'past_projects': past_projects.get(developer_id)
             }
             
             # Calculate new scores
@@ -149,6 +154,9 @@ def recalculate_project_scores(project_id):
         
         print(f"✅ Found {len(applications)} applications")
         
+        # Every applicant's past projects in one grouped query
+        past_projects = fetch_supabase_past_projects(supabase, [app['developer_id'] for app in applications])
+        
     except Exception as e:
         print(f"❌ Error fetching applications: {e}")
         return
@@ -174,7 +182,8 @@ def recalculate_project_scores(project_id):
                 'cover_letter': application.get('cover_letter', ''),
                 'proposed_rate': application.get('proposed_rate'),
                 'estimated_duration': application.get('estimated_duration'),
-                'developer_profile': developer_profile
+                'developer_profile': developer_profile,
+                'past_projects': past_projects.get(developer_id)
             }
             
             # Calculate new scores
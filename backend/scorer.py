@@ -2,36 +2,16 @@
 import numpy as np
 from sentence_transformers import SentenceTransformer
 
+from projects.skill_taxonomy import skill_key, skills_in_text
+
 def cos_sim(a, b):
     """Cosine similarity"""
     return np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b))
 
 def smart_normalize_tech(text):
     """Normalize tech text"""
-    import re
-    tech_variants = {
-        'react': ['react', 'reactjs', 'react.js'],
-        'typescript': ['typescript', 'ts', 'type script'],
-        'javascript': ['javascript', 'js', 'ecmascript'],
-        'node': ['node', 'nodejs', 'node.js'],
-        'd3': ['d3', 'd3.js', 'd3js'],
-        'mongodb': ['mongodb', 'mongo'],
-        'express': ['express', 'expressjs', 'express.js'],
-        'jest': ['jest'],
-        'tailwind': ['tailwind', 'tailwindcss'],
-        'websocket': ['websocket', 'websockets'],
-        'chart.js': ['chart.js', 'chartjs'],
-    }
-
-    found = set()
-    text_lower = text.lower()
-    for main_tech, variants in tech_variants.items():
-        for variant in variants:
-            if re.search(r'\b' + re.escape(variant) + r'\b', text_lower):
-                found.add(main_tech.capitalize())
-                break
-
-    return ', '.join(sorted(found)) if found else text
+    found = skills_in_text(text)
+    return ', '.join(sorted(skill_key(skill_id).capitalize() for skill_id in found)) if found else text
 
 class ApplicantScorer:
     """Main scoring class using your fine-tuned model"""
@@ -83,21 +63,19 @@ class ApplicantScorer:
         ) * 100
 
         # Add keyword bonus
-        import re
         def get_keyword_bonus(p_text, a_text):
-            techs = ['react', 'typescript', 'javascript', 'node', 'mongodb', 'd3', 'chart', 'express']
-            p_techs = set(re.findall(r'\b(' + '|'.join(techs) + r')\b', p_text.lower()))
-            a_techs = set(re.findall(r'\b(' + '|'.join(techs) + r')\b', a_text.lower()))
+            p_techs = skills_in_text(p_text)
+            a_techs = skills_in_text(a_text)
 
             if not p_techs:
                 return 1.0
 
-            match_ratio = len(p_techs.intersection(a_techs)) / len(p_techs)
+            match_ratio = len(p_techs & a_techs) / len(p_techs)
             return 1.0 + (match_ratio * 0.1)
 
         keyword_bonus = get_keyword_bonus(
-            project.get('description', '') + project.get('tech_stack', ''),
-            applicant.get('proposal', '') + applicant.get('skills', '') + applicant.get('portfolio', '')
+            ' '.join([project.get('description', ''), project.get('tech_stack', '')]),
+            ' '.join([applicant.get('proposal', ''), applicant.get('skills', ''), applicant.get('portfolio', '')])
         )
 
         final_score = final_score * keyword_bonus
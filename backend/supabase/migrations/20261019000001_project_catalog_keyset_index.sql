@@ -0,0 +1,9 @@
+-- Keyset pagination for the public project catalog (accounts.views.get_projects).
+-- Serves: status IN (...) ORDER BY created_at DESC, id DESC with a
+-- (created_at, id) cursor condition without scanning the whole table.
+create index if not exists projects_status_created_at_id_idx
+    on public.projects (status, created_at desc, id desc);
+
+-- Batched company-name lookup by user_id.
+create index if not exists company_profiles_user_id_idx
+    on public.company_profiles (user_id);
@@ -0,0 +1,64 @@
+-- Maintained application counters on projects (accounts.views.get_company_projects).
+-- applications_count is the total; application_status_counts is {status: count}.
+-- Both are kept current by a trigger on project_applications so the company
+-- dashboard reads them from the projects row instead of counting per project.
+alter table public.projects
+    add column if not exists applications_count integer not null default 0,
+    add column if not exists application_status_counts jsonb not null default '{}'::jsonb;
+
+create or replace function public.adjust_application_counts(
+    p_project_id uuid,
+    p_status text,
+    p_delta integer,
+    p_total_delta integer default 0
+) returns void
+language sql
+as $$
+    update public.projects
+       set applications_count = greatest(0, applications_count + p_total_delta),
+           application_status_counts = jsonb_set(
+               application_status_counts,
+               array[p_status],
+               to_jsonb(greatest(0, coalesce((application_status_counts ->> p_status)::integer, 0) + p_delta))
+           )
+     where id = p_project_id;
+$$;
+
+create or replace function public.project_applications_count_trigger()
+returns trigger
+language plpgsql
+as $$
+begin
+    if tg_op = 'INSERT' then
+        perform public.adjust_application_counts(new.project_id, new.status, 1, 1);
+    elsif tg_op = 'DELETE' then
+        perform public.adjust_application_counts(old.project_id, old.status, -1, -1);
+    elsif new.status is distinct from old.status or new.project_id is distinct from old.project_id then
+        perform public.adjust_application_counts(old.project_id, old.status, -1, -1);
+        perform public.adjust_application_counts(new.project_id, new.status, 1, 1);
+    end if;
+    return null;
+end;
+$$;
+
+drop trigger if exists project_applications_counts on public.project_applications;
+create trigger project_applications_counts
+    after insert or update of status, project_id or delete on public.project_applications
+    for each row execute function public.project_applications_count_trigger();
+
+-- Backfill from existing rows.
+update public.projects p
+   set applications_count = coalesce(c.total, 0),
+       application_status_counts = coalesce(c.by_status, '{}'::jsonb)
+  from (
+        select project_id,
+               sum(n)::integer as total,
+               jsonb_object_agg(status, n) as by_status
+          from (
+                select project_id, status, count(*) as n
+                  from public.project_applications
+                 group by project_id, status
+               ) s
+         group by project_id
+       ) c
+ where c.project_id = p.id;
@@ -0,0 +1,53 @@
+-- Atomic team creation (projects.team_assignment_views.create_team_assignment).
+-- Creates the assignment, all members, marks their applications selected,
+-- opens the team chat with its welcome message and moves the project to
+-- in_progress in a single transaction / single round-trip.
+create or replace function public.create_team_assignment(
+    p_project_id uuid,
+    p_company_id uuid,
+    p_team_name text,
+    p_figma_deadline timestamptz,
+    p_submission_deadline timestamptz,
+    p_developer_ids uuid[],
+    p_welcome_message text
+) returns jsonb
+language plpgsql
+as $$
+declare
+    v_assignment public.team_assignments;
+    v_chat_id uuid;
+begin
+    -- Serialise concurrent attempts for the same project
+    perform 1 from public.projects where id = p_project_id for update;
+
+    if exists (select 1 from public.team_assignments where project_id = p_project_id) then
+        raise exception 'Project already assigned';
+    end if;
+
+    insert into public.team_assignments
+        (project_id, company_id, team_name, figma_deadline, submission_deadline, is_team)
+    values
+        (p_project_id, p_company_id, p_team_name, p_figma_deadline, p_submission_deadline, true)
+    returning * into v_assignment;
+
+    insert into public.team_assignment_members (team_assignment_id, developer_id)
+    select v_assignment.id, developer_id
+      from unnest(p_developer_ids) as developer_id;
+
+    update public.project_applications
+       set status = 'selected'
+     where project_id = p_project_id
+       and developer_id = any(p_developer_ids);
+
+    insert into public.team_chats (team_assignment_id, created_at)
+    values (v_assignment.id, now())
+    returning id into v_chat_id;
+
+    insert into public.team_chat_messages (chat_id, sender_id, message, message_type, created_at)
+    values (v_chat_id, p_company_id, p_welcome_message, 'system', now());
+
+    update public.projects set status = 'in_progress' where id = p_project_id;
+
+    return to_jsonb(v_assignment);
+end;
+$$;
@@ -0,0 +1,4 @@
+-- Cursor paging for team chat (projects.team_assignment_views.get_team_chat).
+-- Serves chat_id = ? with (created_at, id) ranges in either direction.
+create index if not exists team_chat_messages_chat_created_at_id_idx
+    on public.team_chat_messages (chat_id, created_at, id);
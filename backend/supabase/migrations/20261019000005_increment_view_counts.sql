@@ -0,0 +1,23 @@
+-- Batched view counter flush (accounts/view_counters.py).
+-- p_counts is {"portfolio_projects": {"<id>": n, ...}, "projects": {"<id>": n, ...}};
+-- each delta is added in place, so concurrent flushes from several workers
+-- never overwrite each other.
+alter table public.projects
+    add column if not exists views_count integer not null default 0;
+alter table public.portfolio_projects
+    add column if not exists views_count integer not null default 0;
+
+create or replace function public.increment_view_counts(p_counts jsonb)
+returns void
+language sql
+as $$
+    update public.portfolio_projects p
+       set views_count = coalesce(p.views_count, 0) + c.value::integer
+      from jsonb_each_text(coalesce(p_counts -> 'portfolio_projects', '{}'::jsonb)) c
+     where p.id = c.key::uuid;
+
+    update public.projects p
+       set views_count = coalesce(p.views_count, 0) + c.value::integer
+      from jsonb_each_text(coalesce(p_counts -> 'projects', '{}'::jsonb)) c
+     where p.id = c.key::uuid;
+$$;
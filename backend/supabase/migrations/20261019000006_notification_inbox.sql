@@ -0,0 +1,61 @@
+-- Unified notification inbox (projects/notification_inbox.py).
+-- notification_counters holds the unread total per (recipient, kind). The
+-- trigger adjusts it in the same statement as every insert, delete or
+-- is_read change, so a badge poll reads a few counter rows, and a row that
+-- two concurrent mark-reads both target is only decremented once.
+create table if not exists public.notifications (
+    id bigint generated always as identity primary key,
+    recipient_email text not null,
+    kind text not null check (kind in (
+        'feedback', 'rejection', 'shortlist_invite', 'deadline_change', 'deadline_reminder'
+    )),
+    title text not null,
+    message text not null default '',
+    -- SubmissionFeedback / RejectionNotification id, or a Supabase id
+    source_id text not null default '',
+    data jsonb not null default '{}'::jsonb,
+    is_read boolean not null default false,
+    created_at timestamptz not null default now()
+);
+
+create index if not exists notifications_inbox_idx
+    on public.notifications (recipient_email, created_at desc, id desc);
+create index if not exists notifications_source_idx
+    on public.notifications (kind, source_id);
+
+create table if not exists public.notification_counters (
+    recipient_email text not null,
+    kind text not null,
+    unread_count integer not null default 0,
+    primary key (recipient_email, kind)
+);
+
+create or replace function public.adjust_notification_counter(p_email text, p_kind text, p_delta integer)
+returns void
+language sql
+as $$
+    insert into public.notification_counters (recipient_email, kind, unread_count)
+    values (p_email, p_kind, greatest(p_delta, 0))
+    on conflict (recipient_email, kind)
+    do update set unread_count = greatest(public.notification_counters.unread_count + p_delta, 0);
+$$;
+
+create or replace function public.notifications_count_unread()
+returns trigger
+language plpgsql
+as $$
+begin
+    if tg_op in ('UPDATE', 'DELETE') and not old.is_read then
+        perform public.adjust_notification_counter(old.recipient_email, old.kind, -1);
+    end if;
+    if tg_op in ('INSERT', 'UPDATE') and not new.is_read then
+        perform public.adjust_notification_counter(new.recipient_email, new.kind, 1);
+    end if;
+    return null;
+end;
+$$;
+
+drop trigger if exists notifications_count_unread on public.notifications;
+create trigger notifications_count_unread
+    after insert or delete or update of is_read, recipient_email, kind on public.notifications
+    for each row execute function public.notifications_count_unread();
@@ -4,6 +4,7 @@ import Navbar from './Navbar'
 import TalkJSChat from './TalkJSChat'
 import FileSharing from './FileSharing'
 import { getTeamConversationId } from '../utils/talkjsHelpers'
+import { openChatStream, appendMessage } from '../utils/chatStream'
 import './Dashboard.css'
 import './TeamChat.css'
 
@@ -38,6 +39,15 @@ const CompanyTeamAssignments = () => {
     fetchData()
   }, [])
 
+  // Messages for the open chat are pushed by the server instead of re-fetched
+  useEffect(() => {
+    if (!selectedAssignment) return
+    return openChatStream(
+      `/projects/team-assignments/${selectedAssignment.id}/chat/stream/`,
+      (message) => setChatMessages(prev => appendMessage(prev, message))
+    )
+  }, [selectedAssignment?.id])
+
   const fetchAssignments = async () => {
     try {
       const session = JSON.parse(localStorage.getItem('session') || '{}')
@@ -59,11 +69,13 @@ const CompanyTeamAssignments = () => {
     }
   }
 
-  const loadChat = async (assignmentId) => {
+  // With `since`, only messages newer than that cursor are fetched and appended
+  const loadChat = async (assignmentId, since = null) => {
     try {
       const session = JSON.parse(localStorage.getItem('session') || '{}')
+      const query = since ? `?since=${encodeURIComponent(since)}` : ''
       const response = await fetch(
-        `${API_BASE_URL}/projects/team-assignments/${assignmentId}/get_team_chat/`,
+        `${API_BASE_URL}/projects/team-assignments/${assignmentId}/get_team_chat/${query}`,
         {
           headers: {
             'Authorization': `Bearer ${session.access_token}`
@@ -73,7 +85,8 @@ const CompanyTeamAssignments = () => {
 
       if (response.ok) {
         const data = await response.json()
-        setChatMessages(data.messages || [])
+        const messages = data.messages || []
+        setChatMessages(prev => (since ? [...prev, ...messages] : messages))
       }
     } catch (error) {
       console.error('Failed to load chat:', error)
@@ -98,8 +111,8 @@ const CompanyTeamAssignments = () => {
       )
 
       if (response.ok) {
+        // The sent message arrives over the chat stream
         setNewMessage('')
-        loadChat(selectedAssignment.id)
       }
     } catch (error) {
       console.error('Failed to send message:', error)
@@ -4,6 +4,7 @@ import Navbar from './Navbar'
 import TalkJSChat from './TalkJSChat'
 import FileSharing from './FileSharing'
 import { getTeamConversationId } from '../utils/talkjsHelpers'
+import { openChatStream, appendMessage } from '../utils/chatStream'
 import './Dashboard.css'
 import './TeamChat.css'
 
@@ -53,6 +54,15 @@ const DeveloperTeamAssignments = () => {
     fetchData()
   }, [])
 
+  // Messages for the open chat are pushed by the server instead of re-fetched
+  useEffect(() => {
+    if (!selectedAssignment) return
+    return openChatStream(
+      `/projects/team-assignments/${selectedAssignment.id}/chat/stream/`,
+      (message) => setChatMessages(prev => appendMessage(prev, message))
+    )
+  }, [selectedAssignment?.id])
+
   const fetchAssignments = async () => {
     try {
       const session = JSON.parse(localStorage.getItem('session') || '{}')
@@ -74,11 +84,13 @@ const DeveloperTeamAssignments = () => {
     }
   }
 
-  const loadChat = async (assignmentId) => {
+  // With `since`, only messages newer than that cursor are fetched and appended
+  const loadChat = async (assignmentId, since = null) => {
     try {
       const session = JSON.parse(localStorage.getItem('session') || '{}')
+      const query = since ? `?since=${encodeURIComponent(since)}` : ''
       const response = await fetch(
-        `${API_BASE_URL}/projects/team-assignments/${assignmentId}/get_team_chat/`,
+        `${API_BASE_URL}/projects/team-assignments/${assignmentId}/get_team_chat/${query}`,
         {
           headers: {
             'Authorization': `Bearer ${session.access_token}`
@@ -88,7 +100,8 @@ const DeveloperTeamAssignments = () => {
 
       if (response.ok) {
         const data = await response.json()
-        setChatMessages(data.messages || [])
+        const messages = data.messages || []
+        setChatMessages(prev => (since ? [...prev, ...messages] : messages))
       }
     } catch (error) {
       console.error('Failed to load chat:', error)
@@ -113,8 +126,8 @@ const DeveloperTeamAssignments = () => {
       )
 
       if (response.ok) {
+        // The sent message arrives over the chat stream
         setNewMessage('')
-        loadChat(selectedAssignment.id)
       }
     } catch (error) {
       console.error('Failed to send message:', error)
@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import './FeedbackNotifications.css';
 
 const FeedbackNotifications = ({ developerEmail }) => {
@@ -11,12 +11,31 @@ const FeedbackNotifications = ({ developerEmail }) => {
   useEffect(() => {
     if (developerEmail) {
       fetchUnreadFeedback();
-      // Poll for new feedback every 30 seconds
-      const interval = setInterval(fetchUnreadFeedback, 30000);
+      // Poll the cheap badge counter every 30 seconds; the list is only
+      // re-fetched when the feedback count changes
+      const interval = setInterval(pollUnreadCount, 30000);
       return () => clearInterval(interval);
     }
   }, [developerEmail]);
 
+  const lastUnreadCount = useRef(null);
+
+  const pollUnreadCount = async () => {
+    try {
+      const response = await fetch(
+        `http://127.0.0.1:8000/api/projects/notifications/${developerEmail}/unread-count/`
+      );
+      const data = await response.json();
+      const count = data.by_kind?.feedback ?? 0;
+      if (count !== lastUnreadCount.current) {
+        lastUnreadCount.current = count;
+        fetchUnreadFeedback();
+      }
+    } catch (error) {
+      console.error('Error fetching unread count:', error);
+    }
+  };
+
   const fetchUnreadFeedback = async () => {
     try {
       const response = await fetch(
@@ -1,8 +1,21 @@
 import { useState, useEffect } from 'react'
-import { getUserProfile, getProjects, applyToProject } from '../services/api'
+import { getUserProfile, getProjects, applyToProject, recordProjectView } from '../services/api'
 import Navbar from './Navbar'
 import './Dashboard.css'
 
+// Extract all unique tech stacks
+const collectTechStacks = (projects) => {
+  const techStacks = new Set()
+  projects.forEach(project => {
+    if (project.tech_stack && Array.isArray(project.tech_stack)) {
+      project.tech_stack.forEach(tech => {
+        techStacks.add(tech)
+      })
+    }
+  })
+  return Array.from(techStacks).sort()
+}
+
 const ProjectBrowser = () => {
   const [user, setUser] = useState(null)
   const [projects, setProjects] = useState([])
@@ -13,6 +26,8 @@ const ProjectBrowser = () => {
   const [selectedTechStack, setSelectedTechStack] = useState('')
   const [sortOrder, setSortOrder] = useState('latest')
   const [allTechStacks, setAllTechStacks] = useState([])
+  const [nextCursor, setNextCursor] = useState(null)
+  const [loadingMore, setLoadingMore] = useState(false)
   const [applicationData, setApplicationData] = useState({
     coverLetter: '',
     proposedBudget: '',
@@ -30,17 +45,8 @@ const ProjectBrowser = () => {
         const projectsResult = await getProjects()
         if (projectsResult.projects) {
           setProjects(projectsResult.projects)
-          
-          // Extract all unique tech stacks
-          const techStacks = new Set()
-          projectsResult.projects.forEach(project => {
-            if (project.tech_stack && Array.isArray(project.tech_stack)) {
-              project.tech_stack.forEach(tech => {
-                techStacks.add(tech)
-              })
-            }
-          })
-          setAllTechStacks(Array.from(techStacks).sort())
+          setNextCursor(projectsResult.next_cursor || null)
+          setAllTechStacks(collectTechStacks(projectsResult.projects))
         }
         
         // Fetch user's applications
@@ -94,6 +100,24 @@ const ProjectBrowser = () => {
     setFilteredProjects(filtered)
   }, [projects, selectedTechStack, sortOrder])
 
+  const loadMoreProjects = async () => {
+    if (!nextCursor) return
+    setLoadingMore(true)
+    try {
+      const projectsResult = await getProjects(nextCursor)
+      if (projectsResult.projects) {
+        const merged = [...projects, ...projectsResult.projects]
+        setProjects(merged)
+        setNextCursor(projectsResult.next_cursor || null)
+        setAllTechStacks(collectTechStacks(merged))
+      }
+    } catch (error) {
+      console.error('Failed to load more projects:', error)
+    } finally {
+      setLoadingMore(false)
+    }
+  }
+
   const hasApplied = (projectId) => {
     return userApplications.some(app => app.project_id === projectId)
   }
@@ -111,6 +135,7 @@ const ProjectBrowser = () => {
 
   const handleApplyClick = (project) => {
     setSelectedProject(project)
+    recordProjectView(project.id).catch(error => console.error('Failed to record view:', error))
     setApplicationData({
       coverLetter: '',
       proposedBudget: project.budget_min || '',
@@ -321,6 +346,18 @@ const ProjectBrowser = () => {
           )}
         </div>
 
+        {nextCursor && (
+          <div style={{ textAlign: 'center', marginTop: '1.5rem' }}>
+            <button
+              className="btn btn-primary"
+              onClick={loadMoreProjects}
+              disabled={loadingMore}
+            >
+              {loadingMore ? 'Loading...' : 'Load More Projects'}
+            </button>
+          </div>
+        )}
+
         {/* Application Modal */}
         {selectedProject && (
           <div className="modal-overlay">
@@ -1,5 +1,6 @@
 import { useState, useEffect, useRef } from 'react'
 import { useParams, useNavigate } from 'react-router-dom'
+import { openChatStream, appendMessage } from '../utils/chatStream'
 
 const API_BASE_URL = 'http://127.0.0.1:8000/api'
 
@@ -15,8 +16,11 @@ const ProjectChatInterface = () => {
 
   useEffect(() => {
     fetchAssignment()
-    const interval = setInterval(fetchAssignment, 3000) // Poll every 3 seconds
-    return () => clearInterval(interval)
+    // New messages are pushed over the chat stream instead of polling
+    return openChatStream(
+      `/projects/assignments/${assignmentId}/chat/stream/`,
+      (message) => setMessages(prev => appendMessage(prev, message))
+    )
   }, [assignmentId])
 
   useEffect(() => {
@@ -87,7 +91,8 @@ const ProjectChatInterface = () => {
 
       if (response.ok) {
         setMessageText('')
-        await fetchAssignment()
+        const message = await response.json()
+        setMessages(prev => appendMessage(prev, message))
       }
     } catch (error) {
       console.error('Error sending message:', error)
@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import './RejectionNotifications.css';
 
 const RejectionNotifications = ({ developerEmail }) => {
@@ -10,20 +10,47 @@ const RejectionNotifications = ({ developerEmail }) => {
   useEffect(() => {
     if (developerEmail) {
       fetchUnreadRejections();
-      // Poll for new rejections every 30 seconds
-      const interval = setInterval(fetchUnreadRejections, 30000);
+      // Poll the cheap badge counter every 30 seconds; the list is only
+      // re-fetched when the rejection count changes
+      const interval = setInterval(pollUnreadCount, 30000);
       return () => clearInterval(interval);
     }
   }, [developerEmail]);
 
-  const fetchUnreadRejections = async () => {
+  const lastUnreadCount = useRef(null);
+
+  const pollUnreadCount = async () => {
     try {
       const response = await fetch(
-        `http://127.0.0.1:8000/api/projects/rejections/unread/${developerEmail}/`
+        `http://127.0.0.1:8000/api/projects/notifications/${developerEmail}/unread-count/`
       );
       const data = await response.json();
-      setNotifications(data.notifications || []);
-      setUnreadCount(data.unread_count || 0);
+      const count = data.by_kind?.rejection ?? 0;
+      if (count !== lastUnreadCount.current) {
+        lastUnreadCount.current = count;
+        fetchUnreadRejections();
+      }
+    } catch (error) {
+      console.error('Error fetching unread count:', error);
+    }
+  };
+
+  const inboxUrl = `http://127.0.0.1:8000/api/projects/notifications/${developerEmail}/`;
+
+  // Rejections from both the ORM and Supabase flows land in the notification inbox
+  const toRejection = (notification) => ({
+    ...notification,
+    project_title: notification.data?.project_title,
+    sent_at: notification.created_at
+  });
+
+  const fetchUnreadRejections = async () => {
+    try {
+      const response = await fetch(`${inboxUrl}?kind=rejection&unread=true&limit=100`);
+      const data = await response.json();
+      const unread = (data.notifications || []).map(toRejection);
+      setNotifications(unread);
+      setUnreadCount(unread.length);
     } catch (error) {
       console.error('Error fetching rejection notifications:', error);
     }
@@ -31,23 +58,24 @@ const RejectionNotifications = ({ developerEmail }) => {
 
   const fetchAllRejections = async () => {
     try {
-      const response = await fetch(
-        `http://127.0.0.1:8000/api/projects/rejections/developer/${developerEmail}/`
-      );
+      const response = await fetch(`${inboxUrl}?kind=rejection&limit=100`);
       const data = await response.json();
-      return data.notifications || [];
+      return (data.notifications || []).map(toRejection);
     } catch (error) {
       console.error('Error fetching all rejections:', error);
       return [];
     }
   };
 
+  const postMarkRead = (body) => fetch(`${inboxUrl}mark-read/`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify(body)
+  });
+
   const markAsRead = async (notificationId) => {
     try {
-      await fetch(
-        `http://127.0.0.1:8000/api/projects/rejections/${notificationId}/mark-read/`,
-        { method: 'POST' }
-      );
+      await postMarkRead({ ids: [notificationId] });
       fetchUnreadRejections();
     } catch (error) {
       console.error('Error marking rejection as read:', error);
@@ -56,10 +84,7 @@ const RejectionNotifications = ({ developerEmail }) => {
 
   const markAllAsRead = async () => {
     try {
-      await fetch(
-        `http://127.0.0.1:8000/api/projects/rejections/mark-all-read/${developerEmail}/`,
-        { method: 'POST' }
-      );
+      await postMarkRead({ kind: 'rejection' });
       fetchUnreadRejections();
     } catch (error) {
       console.error('Error marking all as read:', error);
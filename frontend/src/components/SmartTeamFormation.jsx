@@ -13,7 +13,8 @@ const SmartTeamFormation = ({ project }) => {
         project_id: project.id,
         required_skills: project.tech_stack || [],
         budget: project.budget_max || 5000,
-        team_size: 3
+        team_size: 3,
+        top_k: 3
       })
       
       if (result.success) {
@@ -43,7 +44,10 @@ const SmartTeamFormation = ({ project }) => {
         <div style={{display: 'grid', gap: '20px'}}>
           <div className="stat-card">
             <h4>💰 Estimated Cost: ₹{suggestions.total_cost.toLocaleString('en-IN')}</h4>
-            <h4>📊 Team Score: {suggestions.team_score.toFixed(1)}/5</h4>
+            <h4>📊 Team Score: {(suggestions.team_score * 100).toFixed(0)}%</h4>
+            {suggestions.missing_skills?.length > 0 && (
+              <p>⚠️ Not covered: {suggestions.missing_skills.join(', ')}</p>
+            )}
           </div>
 
           <div>
@@ -73,6 +77,19 @@ const SmartTeamFormation = ({ project }) => {
               ))}
             </div>
           </div>
+
+          {suggestions.alternatives?.length > 0 && (
+            <div>
+              <h4>🔁 Alternative Teams:</h4>
+              {suggestions.alternatives.map((alt, idx) => (
+                <div key={idx} className="stat-card">
+                  <p><strong>{alt.team.map(dev => dev.name).join(', ')}</strong></p>
+                  <p>💰 ₹{alt.total_cost.toLocaleString('en-IN')} · 📊 {(alt.team_score * 100).toFixed(0)}%</p>
+                  {alt.missing_skills.length > 0 && <p>⚠️ Not covered: {alt.missing_skills.join(', ')}</p>}
+                </div>
+              ))}
+            </div>
+          )}
         </div>
       )}
     </div>
@@ -108,6 +108,13 @@ export const applyToProject = async (projectId, applicationData) => {
   return response.json()
 }
 
+export const recordProjectView = async (projectId) => {
+  const response = await fetch(`${API_BASE_URL}/auth/projects/${projectId}/views/`, {
+    method: 'POST'
+  })
+  return response.json()
+}
+
 export const getProjectApplications = async (projectId) => {
   const session = JSON.parse(localStorage.getItem('session') || '{}')
   const response = await fetch(`${API_BASE_URL}/auth/company/projects/${projectId}/applications/`, {
@@ -132,9 +139,10 @@ export const getDevelopers = async () => {
   return response.json()
 }
 
-export const getProjects = async () => {
+export const getProjects = async (cursor = null) => {
   const session = JSON.parse(localStorage.getItem('session') || '{}')
-  const response = await fetch(`${API_BASE_URL}/auth/projects/`, {
+  const query = cursor ? `?cursor=${encodeURIComponent(cursor)}` : ''
+  const response = await fetch(`${API_BASE_URL}/auth/projects/${query}`, {
     method: 'GET',
     headers: {
       'Authorization': `Bearer ${session.access_token}`,
@@ -0,0 +1,36 @@
+/**
+ * Chat Stream Helper
+ *
+ * Opens a server-sent event stream for a chat and calls onMessage for every
+ * message pushed by the backend. The browser reconnects on its own and the
+ * backend replays anything missed since the last event id.
+ */
+
+const API_BASE_URL = 'http://127.0.0.1:8000/api'
+
+/**
+ * @param {string} path - e.g. `/projects/team-assignments/${id}/chat/stream/`
+ * @param {(message: object) => void} onMessage
+ * @returns {() => void} closes the stream (use as a useEffect cleanup)
+ */
+export const openChatStream = (path, onMessage) => {
+  const session = JSON.parse(localStorage.getItem('session') || '{}')
+  // EventSource can't send headers, so the token goes in the query string
+  const source = new EventSource(
+    `${API_BASE_URL}${path}?token=${encodeURIComponent(session.access_token || '')}`
+  )
+  source.addEventListener('message', (event) => {
+    try {
+      onMessage(JSON.parse(event.data))
+    } catch (error) {
+      console.error('Bad chat event:', error)
+    }
+  })
+  return () => source.close()
+}
+
+/**
+ * Append message unless a message with the same id is already in the list.
+ */
+export const appendMessage = (messages, message) =>
+  messages.some(existing => existing.id === message.id) ? messages : [...messages, message]